@@ -0,0 +1,82 @@
+import generate_pages_v1_v2 as v1_v2
+import generate_pages_v3 as v3
+from conftest import fresh_copy
+
+
+def bench_gen_v1(benchmark, pools_v1_v2, pages_folder):
+    benchmark.pedantic(v1_v2.gen_v1, setup=fresh_copy(pools_v1_v2), rounds=5)
+
+
+def bench_gen_v2(benchmark, pools_v1_v2, pages_folder):
+    benchmark.pedantic(v1_v2.gen_v2, setup=fresh_copy(pools_v1_v2), rounds=5)
+
+
+def bench_gen_v3(benchmark, pools_v3, pages_folder):
+    # gen_v3 is destructive, so every round needs its own copy
+    benchmark.pedantic(v3.gen_v3, setup=fresh_copy(pools_v3), rounds=10)
+
+
+def bench_write_ics_feeds_full(benchmark, pools_v3, tmp_path):
+    import pool_ics
+
+    rounds = iter(range(1000))
+
+    def setup():
+        return (pools_v3, str(tmp_path / f'ics-{next(rounds)}')), dict(workers=1)
+
+    benchmark.pedantic(pool_ics.write_ics_feeds, setup=setup, rounds=3)
+
+
+def bench_write_ics_feeds_unchanged(benchmark, pools_v3, tmp_path):
+    # the usual case: most feeds are already up to date
+    import pool_ics
+
+    folder = str(tmp_path / 'ics')
+    pool_ics.write_ics_feeds(pools_v3, folder, workers=1)
+    benchmark(pool_ics.write_ics_feeds, pools_v3, folder, workers=1)
+
+
+def bench_compress_schedules(benchmark, pools_v3):
+    benchmark.pedantic(v3.compress_schedules, setup=fresh_copy(pools_v3), rounds=5)
+
+
+def date_pages_of(pools_v3):
+    # the same cards gen_v3 renders for each date
+    date_pools = dict()
+    for pool in pools_v3:
+        for date, times in pool.availabilities.items():
+            date_pools.setdefault(date.strftime('%Y-%m-%d'), []).append((
+                pool.name, v3.classify_pool_name(pool.name),
+                sorted([(v3.to_minutes(start), v3.to_minutes(end), program) for start, end, program in times])))
+    return date_pools
+
+
+def bench_write_date_pages_full(benchmark, pools_v3, tmp_path):
+    import pool_static
+
+    date_pools = date_pages_of(pools_v3)
+    rounds = iter(range(1000))
+
+    def setup():
+        return (str(tmp_path / f'dates-{next(rounds)}'), '{{ date_links }}{{ holder_attributes }}{{ cards }}',
+                date_pools), dict(workers=1)
+
+    benchmark.pedantic(pool_static.write_date_pages, setup=setup, rounds=3)
+
+
+def bench_write_date_pages_unchanged(benchmark, pools_v3, tmp_path):
+    # the usual case: most dates look the same as last build
+    import pool_static
+
+    date_pools = date_pages_of(pools_v3)
+    folder = str(tmp_path / 'dates')
+    pool_static.write_date_pages(folder, '{{ date_links }}{{ holder_attributes }}{{ cards }}', date_pools, workers=1)
+    benchmark(pool_static.write_date_pages, folder, '{{ date_links }}{{ holder_attributes }}{{ cards }}', date_pools,
+              workers=1)
+
+
+def bench_coverage_tensor(benchmark, pools_v3):
+    from pool_coverage import Coverage
+
+    coverage = benchmark(Coverage.from_pools, pools_v3)
+    assert coverage.counts[0].sum() == sum(bin(mask).count('1') for pool in pools_v3 for mask in pool.slots.values())
@@ -0,0 +1,30 @@
+import generate_pages_v3 as v3
+import synthetic
+from pool_matching import NameIndex, match_pool_names
+
+
+def misspell(name):
+    # the kinds of differences seen between the schedule page and the facility pages
+    return name.replace('Centre', 'Center').replace('Collegiate Institute', 'C.I.').replace(' and ', ' & ')
+
+
+def bench_join_pool_info_recorded(benchmark, recorded_pages):
+    schedule_page, facility_pages = recorded_pages
+    pools = v3.parse_pool_schedules(schedule_page, synthetic.FIXTURES_REFERENCE_DATE)
+    addresses, pool_types, phone_numbers = v3.parse_pool_addresses_types_phones(facility_pages)
+
+    benchmark(v3.join_pool_info, pools, addresses, pool_types, phone_numbers)
+    assert all(pool.address is not None for pool in pools)
+
+
+def bench_build_name_index(benchmark, scale):
+    _, facilities = synthetic.synthetic_pools(scale)
+    benchmark(NameIndex, [facility['name'] for facility in facilities])
+
+
+def bench_match_pool_names_misspelled(benchmark, scale):
+    pools, facilities = synthetic.synthetic_pools(scale)
+    names = [misspell(pool['name']) for pool in pools]
+
+    matches, unresolved = benchmark(match_pool_names, names, [facility['name'] for facility in facilities])
+    assert len(unresolved) == 0
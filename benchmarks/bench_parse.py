@@ -0,0 +1,79 @@
+import copy
+from datetime import datetime
+
+import pytest
+
+import generate_pages_v3 as v3
+import synthetic
+from pool_enrich import enrich_pools, parse_facility_page
+from pool_fetch import Page, record_page
+
+
+def bench_parse_pool_schedules_recorded(benchmark, recorded_pages):
+    schedule_page, _ = recorded_pages
+    pools = benchmark(v3.parse_pool_schedules, schedule_page, synthetic.FIXTURES_REFERENCE_DATE)
+    assert len(pools) == 172
+
+
+def bench_parse_pool_schedules_synthetic(benchmark, synthetic_pages, scale):
+    schedule_page, _ = synthetic_pages
+    pools = benchmark.pedantic(v3.parse_pool_schedules, (schedule_page, datetime(2019, 6, 1)), rounds=3)
+    assert len(pools) == sum(synthetic.REAL_POOL_COUNTS.values()) * scale
+
+
+@pytest.mark.parametrize('workers', [2, 4])
+def bench_parse_pool_schedules_parallel(benchmark, synthetic_pages, scale, workers):
+    schedule_page, _ = synthetic_pages
+    pools = benchmark.pedantic(v3.parse_pool_schedules, (schedule_page, datetime(2019, 6, 1), workers), rounds=3)
+    assert len(pools) == sum(synthetic.REAL_POOL_COUNTS.values()) * scale
+
+
+def bench_split_pool_listings(benchmark, synthetic_pages, scale):
+    schedule_page, _ = synthetic_pages
+    listings = benchmark(v3.split_pool_listings, schedule_page)
+    assert len(listings) == sum(synthetic.REAL_POOL_COUNTS.values()) * scale
+
+
+def bench_parse_pool_addresses_types_phones_recorded(benchmark, recorded_pages):
+    _, facility_pages = recorded_pages
+    addresses, _, _ = benchmark(v3.parse_pool_addresses_types_phones, facility_pages)
+    assert len(addresses) == 172
+
+
+def bench_parse_pool_addresses_types_phones_synthetic(benchmark, synthetic_pages, scale):
+    _, facility_pages = synthetic_pages
+    benchmark.pedantic(v3.parse_pool_addresses_types_phones, (facility_pages,), rounds=3)
+
+
+def bench_read_timerange(benchmark, pools_v3):
+    # every session on the recorded page, formatted the way toronto.ca formats it
+    timeranges = [synthetic.timerange_text(int(start.total_seconds()) // 60, int(end.total_seconds()) // 60)
+                  for pool in pools_v3 for times in pool.availabilities.values() for start, end, _ in times]
+
+    def read_all():
+        for timerange in timeranges:
+            v3.read_timerange(timerange)
+
+    benchmark(read_all)
+
+
+# A facility page the way the enrichment parser expects them: a heading per section, with a list under it
+FACILITY_PAGE = (b"<html><body><h1>Pool</h1><h2>Amenities</h2><ul>" + b"<li>Sauna</li>" * 10 + b"</ul>"
+                 b"<h2>Accessibility</h2><p>Accessible change room</p><h2>Service Alerts</h2><div><p>Closed for "
+                 b"maintenance</p></div><h2>Hours</h2><ul><li>9am - 5pm</li></ul></body></html>")
+
+
+def bench_parse_facility_page(benchmark):
+    details = benchmark(parse_facility_page, FACILITY_PAGE)
+    assert details['amenities'] == ['Sauna'] * 10 and details['closures'] == ['Closed for maintenance']
+
+
+def bench_enrich_pools_cached(benchmark, pools_v3, tmp_path):
+    # a warm rerun: every facility page is cached and fresh, so nothing is downloaded
+    pools = [copy.copy(pool) for pool in pools_v3]
+    for i, pool in enumerate(pools):
+        pool.url = f'https://www.toronto.ca/data/parks/prd/facilities/complex/{i}/index.html'
+        record_page(str(tmp_path), Page(pool.url, 200, FACILITY_PAGE, {'ETag': f'"{i}"'}))
+
+    enriched = benchmark.pedantic(enrich_pools, (pools, str(tmp_path)), rounds=3)
+    assert enriched == len(pools)
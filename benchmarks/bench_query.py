@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+
+import copy
+import random
+
+import pools
+from pool_nearby import NearbyAlternatives, add_coordinates
+from pool_search import SearchIndex
+from pool_next import NextOpenings
+from pool_slots import SlotTable, window_mask
+
+
+def bench_find_pools_on(benchmark, pools_v3):
+    results = benchmark(pools.find_pools_on, '2019-06-05', pools_v3)
+    assert len(results) > 0
+
+
+def bench_find_pools_on_filtered(benchmark, pools_v3):
+    benchmark(pools.find_pools_on, 'June 5', pools_v3, from_time=pools.parse_clock('6pm'),
+              to_time=pools.parse_clock('8pm'), pool_type='indoor pool')
+
+
+def bench_slot_table_overlaps(benchmark, pools_v3):
+    date = datetime(2019, 6, 5)
+
+    def overlaps():
+        table = SlotTable.for_date(pools_v3, date)
+        return table.names[table.overlaps(timedelta(hours=18), timedelta(hours=20))]
+
+    assert len(benchmark(overlaps)) > 0
+
+
+def bench_window_mask_all_dates(benchmark, pools_v3):
+    window = window_mask(timedelta(hours=18), timedelta(hours=20))
+
+    def open_any_date():
+        return [pool for pool in pools_v3 for slots in pool.slots.values() if slots & window]
+
+    benchmark(open_any_date)
+
+
+def bench_next_openings_after(benchmark, pools_v3):
+    next_openings = NextOpenings(pools_v3)
+    date = datetime(2019, 6, 5)
+    next_openings.table(date)
+
+    results = benchmark(next_openings.after, date, 17 * 60)
+    assert len(results) > 0
+
+
+def bench_next_openings_table(benchmark, pools_v3):
+    benchmark(lambda: NextOpenings(pools_v3).table(datetime(2019, 6, 5)))
+
+
+def bench_search_index_build(benchmark, pools_v3):
+    benchmark(SearchIndex.from_pools, pools_v3)
+
+
+def bench_search_index_substring(benchmark, pools_v3):
+    index = SearchIndex.from_pools(pools_v3)
+    assert len(benchmark(index.search, 'york')) > 0
+
+
+def bench_search_index_fuzzy(benchmark, pools_v3):
+    index = SearchIndex.from_pools(pools_v3)
+    assert len(benchmark(index.search, 'wallace emmerson', fuzzy=True)) > 0
+
+
+def bench_find_pools_on_by_name(benchmark, pools_v3):
+    index = SearchIndex.from_pools(pools_v3)
+    benchmark(pools.find_pools_on, '2019-06-05', pools_v3, name='community', search_index=index)
+
+
+def located(pool_info):
+    # the fixtures have no coordinates, so scatter the pools around Toronto (the same way every time)
+    pool_info = copy.deepcopy(pool_info)
+    rng = random.Random(0)
+    add_coordinates(pool_info, {pool.name: (43.6 + rng.random() * 0.2, -79.6 + rng.random() * 0.4)
+                                for pool in pool_info})
+    return pool_info
+
+
+def bench_nearby_alternatives_table(benchmark, pools_v3):
+    pool_info = located(pools_v3)
+    date = datetime(2019, 6, 5)
+
+    table = benchmark(lambda: NearbyAlternatives(pool_info).table(date))
+    assert len(table) > 0
+
+
+def bench_nearby_alternatives_all_dates(benchmark, pools_v3):
+    # what gen_v3 does: every date of the season
+    pool_info = located(pools_v3)
+
+    def all_dates():
+        alternatives = NearbyAlternatives(pool_info)
+        return sum(len(alternatives.table(date)) for date in alternatives.dates())
+
+    assert benchmark.pedantic(all_dates, rounds=3) > 0
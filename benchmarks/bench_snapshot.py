@@ -0,0 +1,97 @@
+import copy
+from datetime import datetime, timedelta
+
+import generate_pages_v3 as v3
+from pool_archive import Archive
+from pool_export import export_sessions, load_sessions_npz
+
+
+def bench_save_pool_info(benchmark, pools_v3, tmp_path):
+    benchmark(v3.save_pool_info, pools_v3, str(tmp_path / v3.CACHE_FNAME))
+
+
+def bench_load_pool_info(benchmark, pools_v3, tmp_path):
+    fname = str(tmp_path / v3.CACHE_FNAME)
+    v3.save_pool_info(pools_v3, fname)
+
+    pools = benchmark(v3.load_pool_info, fname)
+    assert len(pools) == len(pools_v3)
+
+
+def bench_archive_add_unchanged(benchmark, pools_v3, tmp_path):
+    # every scrape after the first is mostly the same as the one before it
+    archive = Archive(str(tmp_path / 'archive'))
+    archive.add(pools_v3)
+
+    benchmark(archive.add, pools_v3)
+
+
+def bench_archive_add_script_pools(benchmark, script_pools_v3, tmp_path):
+    # what get_pool_info() archives after a scrape with `python generate_pages_v3.py --refresh`
+    rounds = iter(range(1000))
+
+    def setup():
+        return (Archive(str(tmp_path / f'archive-{next(rounds)}')), script_pools_v3), dict()
+
+    benchmark.pedantic(lambda archive, pools: archive.add(pools), setup=setup, rounds=3)
+
+    pools = Archive(str(tmp_path / 'archive-0')).snapshot()
+    assert [pool.type.value for pool in pools if pool.type is not None] == \
+        [pool.type.value for pool in script_pools_v3 if pool.type is not None]
+
+
+def bench_archive_snapshot(benchmark, pools_v3, tmp_path):
+    archive = Archive(str(tmp_path / 'archive'))
+    archive.add(pools_v3)
+
+    # a fresh Archive each time, so chunks come from disk rather than the cache
+    pools = benchmark(lambda: Archive(str(tmp_path / 'archive')).snapshot())
+    assert len(pools) == len(pools_v3)
+
+
+def bench_archive_history(benchmark, pools_v3, tmp_path):
+    archive = Archive(str(tmp_path / 'archive'))
+    for day in range(10):
+        archive.add(pools_v3, datetime(2019, 6, 1) + timedelta(days=day))
+
+    history = benchmark(lambda: Archive(str(tmp_path / 'archive')).history(pools_v3[0].name))
+    assert len(history) == 1
+
+
+def bench_export_sessions_csv(benchmark, pools_v3, tmp_path):
+    count = benchmark(export_sessions, pools_v3, str(tmp_path / 'sessions.csv'))
+    assert count == sum(len(times) for pool in pools_v3 for times in pool.availabilities.values())
+
+
+def bench_export_sessions_npz(benchmark, pools_v3, tmp_path):
+    count = benchmark(export_sessions, pools_v3, str(tmp_path / 'sessions.npz'))
+    assert count == sum(len(times) for pool in pools_v3 for times in pool.availabilities.values())
+
+
+def bench_load_sessions_npz(benchmark, pools_v3, tmp_path):
+    fname = str(tmp_path / 'sessions.npz')
+    count = export_sessions(pools_v3, fname)
+
+    columns = benchmark(load_sessions_npz, fname)
+    assert len(columns['pool']) == count
+
+
+def bench_merge_scrape(benchmark, pools_v3):
+    # a scrape a week later: everything from the second week on, merged into the cache's first week
+    from pool_window import merge_scrape
+
+    dates = sorted({date for pool in pools_v3 for date in pool.availabilities})
+    scrape_start = dates[0] + timedelta(days=7)
+    scraped = copy.deepcopy(pools_v3)
+    for pool in scraped:
+        pool.availabilities = {date: times for date, times in pool.availabilities.items() if date >= scrape_start}
+
+    merged = benchmark(merge_scrape, pools_v3, scraped, dates[0])
+    assert sum(len(pool.availabilities) for pool in merged) == sum(len(pool.availabilities) for pool in pools_v3)
+
+
+def bench_evict_past(benchmark, pools_v3):
+    from pool_window import evict_past
+
+    dates = sorted({date for pool in pools_v3 for date in pool.availabilities})
+    benchmark.pedantic(evict_past, setup=lambda: ((copy.deepcopy(pools_v3), dates[len(dates) // 2]), dict()), rounds=3)
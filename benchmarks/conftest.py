@@ -0,0 +1,115 @@
+import copy
+import importlib.util
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate_pages_v1_v2 as v1_v2  # noqa: E402
+import generate_pages_v3 as v3  # noqa: E402
+import synthetic  # noqa: E402
+
+
+def pytest_addoption(parser):
+    parser.addoption('--scales', default='1,10',
+                     help='synthetic page sizes to benchmark, as multiples of the real page (e.g. 1,10,100)')
+
+
+def pytest_generate_tests(metafunc):
+    if 'scale' in metafunc.fixturenames:
+        scales = [int(scale) for scale in metafunc.config.getoption('scales').split(',')]
+        metafunc.parametrize('scale', scales, ids=[f'{scale}x' for scale in scales])
+
+
+@pytest.fixture(scope='session')
+def recorded_pages():
+    """
+    (schedule page HTML, map of PoolType -> facility page HTML) as recorded from toronto.ca.
+    """
+
+    return synthetic.read_pages()
+
+
+_synthetic_pages = dict()
+
+
+@pytest.fixture
+def synthetic_pages(scale):
+    """
+    (schedule page HTML, map of PoolType -> facility page HTML) at `scale` times the real size.
+    Rendered once per scale, since rendering 100x takes a while.
+    """
+
+    if scale not in _synthetic_pages:
+        _synthetic_pages[scale] = synthetic.render_pages(*synthetic.synthetic_pools(scale))
+    return _synthetic_pages[scale]
+
+
+@pytest.fixture(scope='session')
+def pools_v3(recorded_pages):
+    """
+    The recorded pages parsed and joined the same way get_pool_info() does it.
+    Benchmarks that modify the pools (e.g. gen_v3) should copy them first.
+    """
+
+    schedule_page, facility_pages = recorded_pages
+    pools = v3.parse_pool_schedules(schedule_page, synthetic.FIXTURES_REFERENCE_DATE)
+    addresses, pool_types, phone_numbers = v3.parse_pool_addresses_types_phones(facility_pages)
+    v3.join_pool_info(pools, addresses, pool_types, phone_numbers)
+
+    return pools
+
+
+@pytest.fixture(scope='session')
+def script_pools_v3(recorded_pages):
+    """
+    pools_v3, but parsed by a second copy of generate_pages_v3, like when it's run as a script (`python
+    generate_pages_v3.py`): its Pool/PoolType are __main__'s, not the ones other modules import.
+    """
+
+    spec = importlib.util.spec_from_file_location('generate_pages_v3_script', v3.__file__)
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+
+    schedule_page, facility_pages = recorded_pages
+    facility_pages = {script.PoolType(pool_type.value): html for pool_type, html in facility_pages.items()}
+    pools = script.parse_pool_schedules(schedule_page, synthetic.FIXTURES_REFERENCE_DATE)
+    addresses, pool_types, phone_numbers = script.parse_pool_addresses_types_phones(facility_pages)
+    script.join_pool_info(pools, addresses, pool_types, phone_numbers)
+
+    return pools
+
+
+@pytest.fixture(scope='session')
+def pools_v1_v2(recorded_pages):
+    schedule_page, _ = recorded_pages
+    return v1_v2.parse_pool_schedules(schedule_page, synthetic.FIXTURES_REFERENCE_DATE)
+
+
+@pytest.fixture
+def pages_folder(tmp_path, monkeypatch):
+    """
+    Point the generators at a copy of pool-browser, so benchmarks don't overwrite the real pages.
+    """
+
+    folder = tmp_path / v3.PAGES_FOLDER
+    shutil.copytree(os.path.join(os.path.dirname(synthetic.FIXTURES_FOLDER), '..', v3.PAGES_FOLDER), folder)
+
+    monkeypatch.setattr(v3, 'PAGES_FOLDER', str(folder))
+    monkeypatch.setattr(v1_v2, 'PAGES_FOLDER', str(folder))
+
+    return folder
+
+
+def fresh_copy(pools):
+    """
+    For benchmark.pedantic(setup=...): give each round its own copy of the pools.
+    """
+
+    def setup():
+        return (copy.deepcopy(pools),), dict()
+
+    return setup
@@ -0,0 +1,343 @@
+"""
+Render pages in the same shape as toronto.ca's leisure schedule page and its four facility pages, so the scraper can be
+benchmarked offline and at sizes much bigger than the real thing.
+
+Pools are dicts in the same format as the v3 payload:
+    {"name": ..., "type": "indoor pool", "address": ..., "phone": ..., "href": ...,
+     "availabilities": {"2019-06-02": [{"start": 810, "end": 945, "program": "Leisure Swim"}, ...], ...}}
+(sessions without a program are rendered as the page's default program)
+
+Usage:
+    python benchmarks/synthetic.py --record pool-browser/v3/pools-v3.html   # rebuild benchmarks/fixtures from real data
+    python benchmarks/synthetic.py --scale 10 --out /tmp/pages              # write synthetic pages at 10x
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import sys
+from datetime import datetime, timedelta
+from html import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generate_pages_v3 import DATA_FOLDER, DEFAULT_PROGRAM, PoolType, POOL_ADDRESS_URLS, days_of_wk  # noqa: E402
+
+FIXTURES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+SCHEDULES_FIXTURE = 'leisure.html'
+
+# Date the recorded fixtures were scraped, for inferring the year of each row
+FIXTURES_REFERENCE_DATE = datetime(2019, 6, 1)
+
+# Real numbers of pools (by type) in the recorded fixtures, and how many weeks they cover
+REAL_POOL_COUNTS = {
+    PoolType.IndoorPool: 50,
+    PoolType.OutdoorPool: 45,
+    PoolType.SplashPad: 5,
+    PoolType.WadingPool: 72,
+}
+REAL_WEEKS = 8
+
+# The facility pages list some places that aren't on the schedule page
+EXTRA_FACILITIES_RATIO = 0.2
+
+NAME_WORDS = ['Albion', 'Agincourt', 'Bathurst', 'Beaches', 'Birchmount', 'Centennial', 'Don Mills', 'Dufferin',
+              'Etobicoke', 'Glen Long', 'Harbourfront', 'High Park', 'Humber', 'Jimmie Simpson', 'Keele', 'Leaside',
+              'Malvern', 'McGregor', 'North Toronto', 'Oakridge', 'Parkdale', 'Regent Park', 'Riverdale', 'Rouge',
+              'Scarborough Village', 'Swansea', 'Trinity', 'Wallace Emerson', 'Weston', 'Wychwood', 'York']
+NAME_SUFFIXES = {
+    PoolType.IndoorPool: ['Community Centre', 'Recreation Centre', 'Aquatic Centre', 'Collegiate Institute'],
+    PoolType.OutdoorPool: ['Park Pool', 'Outdoor Pool'],
+    PoolType.SplashPad: ['Park Splash Pad'],
+    PoolType.WadingPool: ['Park', 'Parkette'],
+}
+STREETS = ['QUEEN ST W', 'KING ST E', 'BLOOR ST W', 'DUNDAS ST W', 'EGLINTON AVE E', 'LAWRENCE AVE W', 'FINCH AVE E',
+           'SHEPPARD AVE W', 'DANFORTH AVE', 'JANE ST', 'BATHURST ST', 'KENNEDY RD']
+
+
+def facility_fixture_name(pool_type: PoolType):
+    """
+    e.g. PoolType.IndoorPool --> indoor-pools.html
+    """
+
+    return POOL_ADDRESS_URLS[pool_type].split('/')[-2] + '.html'
+
+
+def time_text(minutes: int, with_am_pm: bool):
+    """
+    e.g. 810 --> 1:30, 1200 --> 8pm (if with_am_pm)
+    """
+
+    hours, minutes = divmod(minutes, 60)
+    text = str(hours % 12 or 12)
+    if minutes != 0:
+        text += f':{minutes:02}'
+    if with_am_pm:
+        text += 'am' if hours < 12 else 'pm'
+    return text
+
+
+def timerange_text(start: int, end: int):
+    """
+    Format a session like toronto.ca does, e.g. "12:30 - 8pm", "10:30am - 12pm", "10:30 - 11:30am".
+    """
+
+    start_needs_am = start < 12 * 60 <= end
+    return f'{time_text(start, start_needs_am)} - {time_text(end, True)}'
+
+
+def daterange_text(start: datetime):
+    """
+    e.g. May 26 to June 1
+    """
+
+    end = start + timedelta(days=6)
+    return f'{start:%B} {start.day} to {end:%B} {end.day}'
+
+
+def pool_weeks(pool):
+    """
+    Group a pool's availabilities into Sun-Sat weeks. Returns a sorted list of (week start, {date: sessions}).
+    """
+
+    weeks = dict()
+    for date_str, sessions in pool['availabilities'].items():
+        date = datetime.strptime(date_str, '%Y-%m-%d')
+        # Python weeks start on Monday, toronto.ca weeks start on Sunday
+        week_start = date - timedelta(days=(date.weekday() + 1) % 7)
+        weeks.setdefault(week_start, dict())[date] = sessions
+    return sorted(weeks.items())
+
+
+def render_schedule_page(pools, program=DEFAULT_PROGRAM):
+    parts = ['<!doctype html><html><head><title>Drop-in Leisure Swim</title></head><body><div id="pfrBody">']
+
+    for pool in pools:
+        parts.append(f'<div class="pfrListing"><h2><a href="{escape(pool.get("href") or "#")}">{escape(pool["name"])}'
+                     f'</a></h2><table><thead><tr><th>Program</th>')
+        parts.extend(f'<th>{day}</th>' for day in days_of_wk)
+        parts.append('</tr></thead><tbody>')
+
+        for week_start, dates in pool_weeks(pool):
+            # one row per program that week
+            week_programs = dict.fromkeys(session.get('program', program)
+                                          for sessions in dates.values() for session in sessions)
+            for row_program in week_programs:
+                parts.append(f'<tr><td><strong>{daterange_text(week_start)}</strong>'
+                             f'<div class="coursenamemobiletable"><strong>{escape(row_program)}</strong></div></td>')
+                for i, day in enumerate(days_of_wk):
+                    sessions = dates.get(week_start + timedelta(days=i), [])
+                    times = ''.join(timerange_text(session['start'], session['end']) for session in sessions
+                                    if session.get('program', program) == row_program)
+                    parts.append(f'<td data-info="{day}">{times}</td>')
+                parts.append('</tr>')
+
+        parts.append('</tbody></table></div>')
+
+    parts.append('</div></body></html>')
+    return ''.join(parts)
+
+
+def render_facility_page(facilities, pool_type: PoolType):
+    # splash pads don't have a phone column
+    has_phone = pool_type != PoolType.SplashPad
+
+    parts = [f'<!doctype html><html><head><title>{pool_type.value.title()}s</title></head><body>'
+             f'<div class="pfrListing"><table><tr class="header"><th>Name</th><th>Address</th>']
+    if has_phone:
+        parts.append('<th>Phone</th>')
+    parts.append('</tr>')
+
+    for facility in facilities:
+        parts.append(f'<tr><td data-info="Name">{escape(facility["name"])}</td>'
+                     f'<td data-info="Address">{escape(facility["address"] or "")}</td>')
+        if has_phone:
+            parts.append(f'<td data-info="Phone">{escape(facility["phone"] or "")}</td>')
+        parts.append('</tr>')
+
+    parts.append('</table></div></body></html>')
+    return ''.join(parts)
+
+
+def render_pages(pools, facilities=None):
+    """
+    Returns (schedule page HTML, map of PoolType -> facility page HTML).
+    facilities defaults to the pools themselves.
+    """
+
+    facilities = pools if facilities is None else facilities
+
+    facility_pages = dict()
+    for pool_type in PoolType:
+        facility_pages[pool_type] = render_facility_page(
+            [facility for facility in facilities if facility['type'] == pool_type.value], pool_type)
+
+    return render_schedule_page(pools), facility_pages
+
+
+def random_weekly_pattern(rng: random.Random, pool_type: PoolType):
+    """
+    Pick up to 2 sessions per weekday. Indoor pools are open more often than wading pools and splash pads.
+    """
+
+    busy = 0.8 if pool_type == PoolType.IndoorPool else 0.6
+    pattern = dict()
+    for weekday in range(7):
+        sessions = []
+        for _ in range(2):
+            if rng.random() < busy / (len(sessions) + 1):
+                start = rng.randrange(6 * 60, 20 * 60, 15)
+                length = rng.randrange(45, 181, 5)
+                sessions.append({'start': start, 'end': min(start + length, 23 * 60 + 45)})
+        pattern[weekday] = sorted(sessions, key=lambda session: session['start'])
+    return pattern
+
+
+def synthetic_pools(scale=1, seed=0, weeks=REAL_WEEKS, first_sunday=datetime(2019, 6, 2)):
+    """
+    Make `scale` times as many pools as the real schedule page has, each with a mostly-weekly schedule.
+    Returns (pools on the schedule page, facilities on the facility pages).
+    """
+
+    rng = random.Random(seed)
+    pools = []
+    facilities = []
+
+    for pool_type, real_count in REAL_POOL_COUNTS.items():
+        count = real_count * scale
+        n_facilities = count + int(count * EXTRA_FACILITIES_RATIO)
+
+        for i in range(n_facilities):
+            word = NAME_WORDS[i % len(NAME_WORDS)]
+            suffix = NAME_SUFFIXES[pool_type][(i // len(NAME_WORDS)) % len(NAME_SUFFIXES[pool_type])]
+            # number pools once we run out of unique word/suffix combinations
+            repeat = i // (len(NAME_WORDS) * len(NAME_SUFFIXES[pool_type]))
+            name = f'{word} {suffix}' + (f' {repeat + 1}' if repeat > 0 else '')
+
+            facility = {
+                'name': name,
+                'type': pool_type.value,
+                'address': f'{rng.randrange(1, 3000)} {rng.choice(STREETS)}',
+                'phone': f'416 {rng.randrange(200, 999)}-{rng.randrange(1000, 9999)}',
+                'href': f'/data/parks/prd/facilities/complex/{1000 + len(facilities)}/index.html',
+                'availabilities': dict(),
+            }
+            facilities.append(facility)
+
+            if i >= count:
+                # only on the facility pages
+                continue
+
+            pattern = random_weekly_pattern(rng, pool_type)
+            for day in range(weeks * 7):
+                date = first_sunday + timedelta(days=day)
+                sessions = pattern[date.weekday()]
+                # every now and then the week differs from the usual pattern
+                if rng.random() < 0.1:
+                    sessions = random_weekly_pattern(rng, pool_type)[date.weekday()]
+                if len(sessions) > 0:
+                    facility['availabilities'][date.strftime('%Y-%m-%d')] = [dict(session) for session in sessions]
+
+            pools.append(facility)
+
+    pools.sort(key=lambda pool: pool['name'])
+    return pools, facilities
+
+
+def pools_from_v3_page(fname):
+    """
+    Read the pool info that gen_v3 inlined into pools-v3.html, along with the schedules in its month data files.
+    """
+
+    with open(fname, 'r') as f:
+        html = f.read()
+
+    match = re.search(r'const pool_info = (\{.*?\});</script>', html)
+    assert match is not None, f'cannot find pool_info in {fname}'
+    pools = json.loads(match.group(1))
+
+    data_folder = os.path.join(os.path.dirname(fname), DATA_FOLDER)
+    for data_fname in sorted(glob.glob(os.path.join(data_folder, '*.js'))):
+        with open(data_fname, 'r') as f:
+            match = re.fullmatch(r'onMonthData\("[\d-]+", (\{.*\})\);\s*', f.read(), re.DOTALL)
+        assert match is not None, f'cannot read month data in {data_fname}'
+
+        month_data = json.loads(match.group(1))
+
+        # expand the weekly rules, then put the exceptions over them (same as poolSessions() in pools-v3.js)
+        for name, rules in month_data['rules'].items():
+            availabilities = pools[name]['availabilities']
+            for weekday, start, end, program, first, last in rules:
+                date = datetime.strptime(first, '%Y-%m-%d')
+                while date <= datetime.strptime(last, '%Y-%m-%d'):
+                    availabilities.setdefault(date.strftime('%Y-%m-%d'), []).append(
+                        {'start': start, 'end': end, 'program': program})
+                    date += timedelta(weeks=1)
+            for times in availabilities.values():
+                times.sort(key=lambda time: (time['start'], time['end'], time['program']))
+
+        for name, dates in month_data['exceptions'].items():
+            availabilities = pools[name]['availabilities']
+            for date, times in dates.items():
+                if len(times) > 0:
+                    availabilities[date] = times
+                else:
+                    availabilities.pop(date, None)
+
+    for pool in pools.values():
+        pool['availabilities'] = dict(sorted(pool['availabilities'].items()))
+
+    return sorted(pools.values(), key=lambda pool: pool['name'])
+
+
+def write_pages(folder, schedule_page, facility_pages):
+    os.makedirs(folder, exist_ok=True)
+
+    with open(os.path.join(folder, SCHEDULES_FIXTURE), 'w') as f:
+        f.write(schedule_page)
+
+    for pool_type, page in facility_pages.items():
+        with open(os.path.join(folder, facility_fixture_name(pool_type)), 'w') as f:
+            f.write(page)
+
+
+def read_pages(folder=FIXTURES_FOLDER):
+    """
+    Returns (schedule page HTML, map of PoolType -> facility page HTML).
+    """
+
+    with open(os.path.join(folder, SCHEDULES_FIXTURE), 'rb') as f:
+        schedule_page = f.read()
+
+    facility_pages = dict()
+    for pool_type in PoolType:
+        with open(os.path.join(folder, facility_fixture_name(pool_type)), 'rb') as f:
+            facility_pages[pool_type] = f.read()
+
+    return schedule_page, facility_pages
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Write pages shaped like the toronto.ca pages the scraper reads.')
+    arg_parser.add_argument('--record', metavar='POOLS_V3_HTML',
+                            help='rebuild the fixtures from the data in a generated pools-v3.html')
+    arg_parser.add_argument('--scale', type=int, default=1, help='multiple of the real number of pools')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--out', default=FIXTURES_FOLDER)
+    args = arg_parser.parse_args()
+
+    if args.record:
+        pools = pools_from_v3_page(args.record)
+        write_pages(args.out, *render_pages(pools))
+        print(f'recorded {len(pools)} pools into {args.out}')
+    else:
+        pools, facilities = synthetic_pools(args.scale, args.seed)
+        write_pages(args.out, *render_pages(pools, facilities))
+        print(f'wrote {len(pools)} pools ({len(facilities)} facilities) into {args.out}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,19 @@
+import argparse
+import glob
 import json
+import os
 import pickle
 import re
 from datetime import datetime, timedelta
 from enum import Enum, unique
 from typing import Tuple, List
 
-import requests
 from bs4 import BeautifulSoup  # beautifulsoup4
-from dateutil import parser  # python-dateutil
+
+from pool_dates import DaterangeParser, month_ranges, response_date
+from pool_fetch import fetcher, FetchError
+from pool_matching import match_pool_names
+from pool_metrics import metrics
 
 # URL of leisure pool schedules
 POOL_SCHEDULES_URL = 'https://www.toronto.ca/data/parks/prd/swimming/dropin/leisure/index.html'
@@ -72,10 +78,33 @@ class Pool:
         self.availabilities.append((date, time))
 
 
-def main():
-    pool_info = get_pool_info()
-    gen_v1(pool_info)
-    gen_v2(pool_info)
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Scrape toronto.ca (unless cached) and generate the v1/v2 pages.')
+    arg_parser.add_argument('--metrics-json', help='write pipeline metrics to this JSON file')
+    arg_parser.add_argument('--metrics-prom', help='write pipeline metrics to this Prometheus textfile')
+    arg_parser.add_argument('--trace-memory', action='store_true', help='record peak memory of each stage (slower)')
+    arg_parser.add_argument('--refresh', action='store_true', help=f're-scrape even if {CACHE_FNAME} exists')
+    arg_parser.add_argument('--record', metavar='DIR', help='save every downloaded page into DIR (implies --refresh)')
+    arg_parser.add_argument('--replay', metavar='DIR', help='scrape pages saved by --record instead of toronto.ca, '
+                                                            'without touching the network (implies --refresh)')
+    arg_parser.add_argument('--timeout', type=float, help='connect/read timeout for each download, in seconds')
+    arg_parser.add_argument('--retries', type=int, help='how many times to retry a failed download')
+    args = arg_parser.parse_args(argv)
+
+    if args.trace_memory:
+        metrics.start_tracing_memory()
+
+    fetcher.configure(timeout=args.timeout, retries=args.retries, record_dir=args.record, replay_dir=args.replay)
+
+    pool_info = get_pool_info(refresh=args.refresh or args.record is not None or args.replay is not None)
+    with metrics.stage('generate'):
+        gen_v1(pool_info)
+        gen_v2(pool_info)
+
+    if args.metrics_json:
+        metrics.write_json(args.metrics_json)
+    if args.metrics_prom:
+        metrics.write_prometheus(args.metrics_prom)
 
 
 def print_weird_letters(pool_info):
@@ -184,8 +213,8 @@ def parse_time(time_str, type: TimeType):
 
 def get_earliest_latest_dates(pool_info: List[Pool]):
     # choose unrealistically late/early dates to ensure they get updated
-    earliest = parser.parse('2069')
-    latest = parser.parse('1969')
+    earliest = datetime(2069, 1, 1)
+    latest = datetime(1969, 1, 1)
 
     for pool in pool_info:
         for date, _ in pool.availabilities:
@@ -194,7 +223,7 @@ def get_earliest_latest_dates(pool_info: List[Pool]):
             if date > latest:
                 latest = date
 
-    assert earliest != parser.parse('2069') and latest != parser.parse('1969'), 'error: cannot find earliest/latest'
+    assert earliest != datetime(2069, 1, 1) and latest != datetime(1969, 1, 1), 'error: cannot find earliest/latest'
 
     return earliest, latest
 
@@ -230,6 +259,10 @@ def classify_pool_name(name):
 
 
 def gen_v1(pool_info: List[Pool]):
+    """
+    Writes one page per month (pools-v1-YYYY-MM.html), and a copy of the first month as pools-v1.html.
+    """
+
     version_name = 'v1'
 
     ##### SETUP #####
@@ -238,63 +271,64 @@ def gen_v1(pool_info: List[Pool]):
     earliest_date, latest_date = get_earliest_latest_dates(pool_info)
     assert earliest_date <= latest_date
 
-    # make sure they're not more than 6 months apart, since I doubt it'll work very well at that point
-    assert (latest_date - earliest_date) < timedelta(days=(6 * (365 / 12)))
+    # one page per month, so that a long schedule doesn't turn into one giant table
+    months = month_ranges(earliest_date, latest_date)
 
-    ##### GENERATE SELECT DROPDOWN #####
+    # group each pool's times by date once, instead of searching through all of them for every date
+    pool_times_by_date = [(pool, group_times_by_date(pool)) for pool in pool_info]
 
-    html_select = "<select label='date-select' id='date-select'>"
+    for month, first_date, last_date in months:
 
-    for date in date_range(earliest_date, latest_date):
-        html_select += f"<option value='{date.strftime('%Y-%m-%d')}'>{date.strftime('%Y-%m-%d')}</option>"
+        ##### GENERATE SELECT DROPDOWN #####
 
-    html_select += "</select>"
+        html_select = "<select label='date-select' id='date-select'>"
 
-    ##### GENERATE TABLE #####
+        for date in date_range(first_date, last_date):
+            html_select += f"<option value='{date.strftime('%Y-%m-%d')}'>{date.strftime('%Y-%m-%d')}</option>"
 
-    # TODO: do this all with a single f-string? https://docs.python.org/3/reference/lexical_analysis.html#f-strings
-    # html = ""
-    html_table = "<table>"
+        html_select += "</select>"
 
-    # make thead
-    html_table += "<thead><tr>"
+        ##### GENERATE TABLE #####
 
-    # add name slot
-    html_table += "<th>Name</th>"
+        # TODO: do this all with a single f-string? https://docs.python.org/3/reference/lexical_analysis.html#f-strings
+        # html = ""
+        html_table = "<table>"
 
-    # iterate over all dates between earliest and latest
-    for date in date_range(earliest_date, latest_date):
-        html_table += f"<th class='date-{date.strftime('%Y-%m-%d')} pool-date'>{date.strftime('%Y-%m-%d')}</th>"
-        date += timedelta(days=1)
+        # make thead
+        html_table += "<thead><tr>"
 
-    html_table += "</tr></thead>"
+        # add name slot
+        html_table += "<th>Name</th>"
 
-    # make tbody
-    html_table += "<tbody>"
-    for pool in pool_info:
-        html_table += f"<tr class='{classify_pool_name(pool.name)} pool-row'><th class='pool-name' class-name='" \
-            f"{classify_pool_name(pool.name)}'>{pool.name}</th>"
-        for date in date_range(earliest_date, latest_date):
-            todays_times = [time2 for date2, time2 in pool.availabilities if date2 == date]
-            todays_times.sort(key=timerange_sorter_start_time)
-            if len(todays_times) > 0:
-                html_table += f"<td class='date-{date.strftime('%Y-%m-%d')} pool-time'>{'<br>'.join(todays_times)}</td>"
-            else:
-                html_table += f"<td class='date-{date.strftime('%Y-%m-%d')} pool-time'>&nbsp;</td>"
+        # iterate over all dates in this month
+        for date in date_range(first_date, last_date):
+            html_table += f"<th class='date-{date.strftime('%Y-%m-%d')} pool-date'>{date.strftime('%Y-%m-%d')}</th>"
 
-        html_table += "</tr>"
-    html_table += "</tbody>"
+        html_table += "</tr></thead>"
 
-    html_table += "</table>"
+        # make tbody
+        html_table += "<tbody>"
+        for pool, times_by_date in pool_times_by_date:
+            html_table += f"<tr class='{classify_pool_name(pool.name)} pool-row'><th class='pool-name' class-name='" \
+                f"{classify_pool_name(pool.name)}'>{pool.name}</th>"
+            for date in date_range(first_date, last_date):
+                todays_times = sorted(times_by_date.get(date, []), key=timerange_sorter_start_time)
+                if len(todays_times) > 0:
+                    html_table += f"<td class='date-{date.strftime('%Y-%m-%d')} pool-time'>{'<br>'.join(todays_times)}</td>"
+                else:
+                    html_table += f"<td class='date-{date.strftime('%Y-%m-%d')} pool-time'>&nbsp;</td>"
 
-    with open(f'{PAGES_FOLDER}/{version_name}/pools-{version_name}_template.html', 'r') as template:
-        with open(f'{PAGES_FOLDER}/{version_name}/pools-{version_name}.html', 'w') as result:
-            html_template = template.read()
+            html_table += "</tr>"
+        html_table += "</tbody>"
 
-            html_template = html_template.replace("{{ data_table }}", html_table)
-            html_template = html_template.replace("{{ date_select }}", html_select)
+        html_table += "</table>"
 
-            result.write(html_template)
+        write_month_page(version_name, month, months, {
+            "{{ data_table }}": html_table,
+            "{{ date_select }}": html_select,
+        })
+
+    delete_old_month_pages(version_name, months)
 
     # with open('out.html', 'w') as f:
     #     f.write("<link rel='stylesheet' type='text/css' href='out.css'>" + html)
@@ -341,70 +375,139 @@ def gen_v2(pool_info: List[Pool]):
     earliest_date, latest_date = get_earliest_latest_dates(pool_info)
     assert earliest_date <= latest_date
 
-    # make sure they're not more than 6 months apart, since I doubt it'll work very well at that point
-    assert (latest_date - earliest_date) < timedelta(days=(6 * (365 / 12)))
+    # one page per month, so that a long schedule doesn't turn into one giant page
+    months = month_ranges(earliest_date, latest_date)
 
-    ##### GENERATE SELECT DROPDOWN #####
+    # group each pool's times by date once, so every month only looks at its own dates
+    pool_times_by_date = [(pool, group_times_by_date(pool)) for pool in pool_info]
 
-    html_select = "<select label='date-select' id='date-select'>"
+    for month, first_date, last_date in months:
 
-    for date in date_range(earliest_date, latest_date):
-        html_select += f"<option value='{date.strftime('%Y-%m-%d')}'>{date.strftime('%Y-%m-%d')}</option>"
+        ##### GENERATE SELECT DROPDOWN #####
 
-    html_select += "</select>"
+        html_select = "<select label='date-select' id='date-select'>"
 
-    ##### GENERATE POOL CARDS #####
+        for date in date_range(first_date, last_date):
+            html_select += f"<option value='{date.strftime('%Y-%m-%d')}'>{date.strftime('%Y-%m-%d')}</option>"
 
-    # TODO: do this all with a single f-string? https://docs.python.org/3/reference/lexical_analysis.html#f-strings
-    # html = ""
-    html_pool_cards = "<div class='pool-card-holder'>"
+        html_select += "</select>"
 
-    # make tbody
-    for pool in pool_info:
-        # pool.name
-        # classify_pool_name(pool.name)
-        # date.strftime('%Y-%m-%d')
-
-        """
-        <div class="pool-card Albert-Campbell-Collegiate-Institute">
-            <div class="pool-name">Albert Campbell Collegiate Institute</div>
-            <div class="pool-time date-2019-05-26">1 - 2pm</div>
-            <div class="pool-time date-2019-05-27">5 - 6pm</div>
-            <div class="pool-time date-2019-06-01">2 - 5pm</div>
-        </div>
-        """
+        ##### GENERATE POOL CARDS #####
 
-        html_pool_cards += f"<div class='pool-card {classify_pool_name(pool.name)}' " \
-            f"data-address='{pool.address or ''}' " \
-            f"data-type='{pool.type or ''}'>"
+        # TODO: do this all with a single f-string? https://docs.python.org/3/reference/lexical_analysis.html#f-strings
+        # html = ""
+        html_pool_cards = "<div class='pool-card-holder'>"
 
-        # pool name and google maps link
-        html_pool_cards += f"<span class='pool-name'>"
-        html_pool_cards += f"<a href={gmaps_search_url(pool.name)} target='_blank' rel='noopener noreferrer'>"
-        html_pool_cards += f"<img src='../img/GoogleMaps_logo.svg'>"
-        html_pool_cards += f"</img></a> {pool.name}</span>"
+        # make tbody
+        for pool, times_by_date in pool_times_by_date:
+            # pool.name
+            # classify_pool_name(pool.name)
+            # date.strftime('%Y-%m-%d')
 
-        # sort availabilities by time first, so that times are sorted under each date
-        pool.availabilities.sort(key=lambda date_n_time: timerange_sorter_start_time(date_n_time[1]))
+            """
+            <div class="pool-card Albert-Campbell-Collegiate-Institute">
+                <div class="pool-name">Albert Campbell Collegiate Institute</div>
+                <div class="pool-time date-2019-05-26">1 - 2pm</div>
+                <div class="pool-time date-2019-05-27">5 - 6pm</div>
+                <div class="pool-time date-2019-06-01">2 - 5pm</div>
+            </div>
+            """
+
+            html_pool_cards += f"<div class='pool-card {classify_pool_name(pool.name)}' " \
+                f"data-address='{pool.address or ''}' " \
+                f"data-type='{pool.type or ''}'>"
+
+            # pool name and google maps link
+            html_pool_cards += f"<span class='pool-name'>"
+            html_pool_cards += f"<a href={gmaps_search_url(pool.name)} target='_blank' rel='noopener noreferrer'>"
+            html_pool_cards += f"<img src='../img/GoogleMaps_logo.svg'>"
+            html_pool_cards += f"</img></a> {pool.name}</span>"
 
-        for date2, time2 in pool.availabilities:
-            html_pool_cards += f"<div pool-name='{classify_pool_name(pool.name)}' class='pool-time " \
-                f"date-{date2.strftime('%Y-%m-%d')}'>{time2}</div>"
+            # sort times under each date
+            for date2 in date_range(first_date, last_date):
+                for time2 in sorted(times_by_date.get(date2, []), key=timerange_sorter_start_time):
+                    html_pool_cards += f"<div pool-name='{classify_pool_name(pool.name)}' class='pool-time " \
+                        f"date-{date2.strftime('%Y-%m-%d')}'>{time2}</div>"
+
+            html_pool_cards += "</div>"
 
         html_pool_cards += "</div>"
 
-    html_pool_cards += "</div>"
+        write_month_page(version_name, month, months, {
+            "{{ pool_cards }}": html_pool_cards,
+            "{{ date_select }}": html_select,
+        })
+
+    delete_old_month_pages(version_name, months)
+
+
+def group_times_by_date(pool: Pool):
+    """
+    Map date -> list of timeranges for that date.
+    """
+
+    times_by_date = dict()
+    for date, time in pool.availabilities:
+        times_by_date.setdefault(date, []).append(time)
+    return times_by_date
+
+
+def month_page_fname(version_name, month):
+    return f'{PAGES_FOLDER}/{version_name}/pools-{version_name}-{month}.html'
+
+
+def write_month_page(version_name, month, months, replacements):
+    """
+    Fill in the template for one month, and write it to pools-vN-YYYY-MM.html (and pools-vN.html if it's the first
+    month). Pages that didn't change aren't rewritten.
+    """
+
+    # links to every month's page
+    html_month_nav = "<div id='month-nav'>"
+    for other_month, first_date, _ in months:
+        if other_month == month:
+            html_month_nav += f"<strong>{first_date.strftime('%B %Y')}</strong> "
+        else:
+            html_month_nav += f"<a href='pools-{version_name}-{other_month}.html'>{first_date.strftime('%B %Y')}</a> "
+    html_month_nav += "</div>"
 
     with open(f'{PAGES_FOLDER}/{version_name}/pools-{version_name}_template.html', 'r') as template:
-        with open(f'{PAGES_FOLDER}/{version_name}/pools-{version_name}.html', 'w') as result:
-            html_template = template.read()
+        html_template = template.read()
+
+    replacements = dict(replacements, **{"{{ month_nav }}": html_month_nav})
+    for placeholder, html in replacements.items():
+        assert placeholder in html_template
+        html_template = html_template.replace(placeholder, html)
+
+    fnames = [month_page_fname(version_name, month)]
+    if month == months[0][0]:
+        fnames.append(f'{PAGES_FOLDER}/{version_name}/pools-{version_name}.html')
+
+    for fname in fnames:
+        metrics.set('pools_generate_bytes', len(html_template.encode()), output=fname)
 
-            html_template = html_template.replace("{{ pool_cards }}", html_pool_cards)
-            html_template = html_template.replace("{{ date_select }}", html_select)
+        try:
+            with open(fname, 'r') as f:
+                if f.read() == html_template:
+                    continue
+        except FileNotFoundError:
+            pass
 
+        with open(fname, 'w') as result:
             result.write(html_template)
 
 
+def delete_old_month_pages(version_name, months):
+    """
+    Delete pages for months that aren't in the schedule anymore.
+    """
+
+    current = {month_page_fname(version_name, month) for month, _, _ in months}
+    for fname in glob.glob(month_page_fname(version_name, '[0-9][0-9][0-9][0-9]-[0-9][0-9]')):
+        if fname not in current:
+            os.remove(fname)
+
+
 def gmaps_search_url(query):
     query = re.sub(r"\s+", "+", query)
     return f"https://www.google.ca/maps/search/{query}/"
@@ -429,23 +532,31 @@ def save_pool_info(pool_info):
         pickle.dump(pool_info, p)
 
 
-def get_pool_info():
+def get_pool_info(refresh=False):
     # cache
-    try:
-        return load_pool_info()
-    except:
-        pass
+    if not refresh:
+        try:
+            return load_pool_info()
+        except:
+            pass
 
     pools = get_pool_schedules()
     addresses, pool_types, phone_numbers = get_pool_addresses_types_phones()
 
+    # names aren't always spelled the same on the schedule and facility pages
+    matches, unresolved = match_pool_names([pool.name for pool in pools], addresses.keys())
+
+    metrics.set('pools_join_mismatches', len(unresolved))
+    for name, score in unresolved:
+        print(f'WARNING: Cannot find {name} in addresses (closest match is only {score:.0%} similar).')
+        metrics.add_detail('join_mismatches', name)
+
     for pool in pools:
-        if pool.name not in addresses:
-            print(f'WARNING: Cannot find {pool.name} in addresses.')
-        else:
-            pool.address = addresses[pool.name]
-            pool.type = pool_types[pool.name]
-            pool.phone = phone_numbers[pool.name]
+        if pool.name in matches:
+            facility_name, _ = matches[pool.name]
+            pool.address = addresses[facility_name]
+            pool.type = pool_types[facility_name]
+            pool.phone = phone_numbers[facility_name]
 
     save_pool_info(pools)
 
@@ -458,33 +569,53 @@ def get_pool_schedules():
     Returns Pool objects with just pool name and schedule filled in.
     """
 
-    pool_info_response = requests.get(POOL_SCHEDULES_URL)
+    with metrics.stage('fetch'):
+        pool_info_response = fetcher.get(POOL_SCHEDULES_URL)
 
+    # nothing to parse without the schedules, so there's no point carrying on
     if pool_info_response.status_code != 200:
-        print(f"Error: Not 200, but {pool_info_response.status_code} instead.")
+        metrics.inc('pools_fetch_failures', url=POOL_SCHEDULES_URL)
+        raise FetchError(f"Error: Not 200, but {pool_info_response.status_code} instead.")
+
+    # ranges like "Dec 29 to Jan 4" have no year, so infer it from when the page was served
+    with metrics.stage('parse'):
+        return parse_pool_schedules(pool_info_response.content, response_date(pool_info_response))
+
 
-    soup = BeautifulSoup(pool_info_response.content)
+def parse_pool_schedules(html, reference_date: datetime = None):
+    """
+    Parse the pool schedules page (HTML from POOL_SCHEDULES_URL).
+    reference_date is when the page was served, and is used to figure out what year each row is in.
+    """
+
+    soup = BeautifulSoup(html)
+    daterange_parser = DaterangeParser(reference_date)
 
     pools = soup.select('div.pfrListing')
     pool_objs = []
+    counts = {'rows': 0, 'skipped_rows': 0, 'sessions': 0, 'duplicate_time_fixes': 0}
 
     for pool in pools:
         name = pool.h2.a.text
         pool_obj = Pool(name)
 
+        # each pool's rows start from this week again
+        daterange_parser.start_listing()
+
         rows = pool.select('table tbody tr')
+        counts['rows'] += len(rows)
         for row in rows:
             # Make sure it's for Leisure Swim
             sched_type = row.select_one('.coursenamemobiletable > strong').text
             if 'leisure' not in sched_type.lower():
+                counts['skipped_rows'] += 1
                 continue
 
             # Find the daterange (ex: May 26 to June 1) (Goes Sun-Sat)
             daterange = row.select_one('td > strong').text
 
-            # Find start date
-            from_date = daterange[:daterange.index(' to ')]
-            date = parser.parse(from_date)
+            # Find start date (and its year, which isn't on the page)
+            date, _ = daterange_parser.parse(daterange)
 
             # See if any day within 7 days of start date has time scheduled.
             for day in days_of_wk:
@@ -501,8 +632,25 @@ def get_pool_schedules():
                 # add 1 day so our day of wk matches up in next loop
                 date += timedelta(days=1)
 
+        # Some pools (i.e. Douglas Snow Aquatic Centre and Jimmie Simpson Recreation Centre) have duplicate times
+        #   because of a mistake on toronto.ca.
+        seen = set()
+        duplicate_dates = set()
+        for date, time in pool_obj.availabilities:
+            if (date, time) in seen and date not in duplicate_dates:
+                print(f'WARN: pool {pool_obj.name} has duplicate times on {date}.')
+                duplicate_dates.add(date)
+            seen.add((date, time))
+        counts['duplicate_time_fixes'] += len(duplicate_dates)
+        pool_obj.availabilities = list(dict.fromkeys(pool_obj.availabilities))
+        counts['sessions'] += len(pool_obj.availabilities)
+
         pool_objs.append(pool_obj)
 
+    metrics.set('pools_parse_pools', len(pool_objs))
+    for name, count in counts.items():
+        metrics.set(f'pools_parse_{name}', count)
+
     return pool_objs
 
 
@@ -516,12 +664,20 @@ def get_pool_addresses_types_phones():
     pages = dict()
 
     # download pages and convert them to soups
+    # if one of them fails, keep the rest: those pools just won't have an address/type/phone until next time
     for pool_type, url in POOL_ADDRESS_URLS.items():
-        pool_addresses_response = requests.get(url)
+        with metrics.stage('fetch'):
+            try:
+                pool_addresses_response = fetcher.get(url)
+            except FetchError as e:
+                print(f'WARNING: {e}. Skipping {pool_type.value}s...')
+                metrics.inc('pools_fetch_failures', url=url)
+                continue
 
         if pool_addresses_response.status_code != 200:
-            print(f"Error: Not 200, but {pool_addresses_response.status_code} instead. Pre-emptively quitting...")
-            exit(-1)
+            print(f"WARNING: Not 200, but {pool_addresses_response.status_code} instead. Skipping {pool_type.value}s...")
+            metrics.inc('pools_fetch_failures', url=url)
+            continue
 
         soup = BeautifulSoup(pool_addresses_response.content)
 
@@ -1,17 +1,39 @@
+import argparse
+import hashlib
 import json
+import os
 import pickle
 import re
+import traceback
 from datetime import datetime, timedelta
 from enum import Enum, unique
+from html import escape
 from typing import Tuple, List
+from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup  # beautifulsoup4
-from dateutil import parser  # python-dateutil
+from pool_dates import DaterangeParser, month_ranges, response_date
+from pool_fetch import fetcher, FetchError
+from pool_matching import MATCH_THRESHOLD, classify_pool_name, match_pool_names
+from pool_metrics import metrics
+from pool_nearby import ALTERNATIVES_K, COORDINATES_FNAME
+from pool_next import NextOpenings
+from pool_recurrence import DEFAULT_PROGRAM, RecurringSchedule, Session
+from pool_search import SearchIndex
+from pool_slots import pool_slots, sessions_mask, to_minutes, to_words, window_mask
+
+# NOTE: requests (in pool_fetch) and bs4 are only imported when scraping toronto.ca, so that reading the cache
+#   (e.g. from pools.py) doesn't pay for importing the whole scraping stack.
 
 # URL of leisure pool schedules
 POOL_SCHEDULES_URL = 'https://www.toronto.ca/data/parks/prd/swimming/dropin/leisure/index.html'
 
+# Drop-in program schedules to scrape. Each page lists every pool's schedule for that program, and they're all
+#   downloaded at the same time and merged into one list of pools.
+PROGRAM_SCHEDULE_URLS = {
+    'leisure': POOL_SCHEDULES_URL,
+    'lane': 'https://www.toronto.ca/data/parks/prd/swimming/dropin/lane/index.html',
+    'aquafit': 'https://www.toronto.ca/data/parks/prd/swimming/dropin/aquafit/index.html',
+}
 
 @unique
 class PoolType(Enum):
@@ -49,8 +71,54 @@ days_of_wk = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
 
 # Where to cache website results after first get
 CACHE_FNAME = 'pools-v3.pkl'
+
+# Where to keep every scrape (see pool_archive.py), since the cache only has the latest one
+ARCHIVE_FOLDER = 'archive'
+
+# Where to checkpoint each scrape as it goes, so it can be resumed (see pool_checkpoint.py)
+RUNS_FOLDER = 'runs'
 PAGES_FOLDER = 'pool-browser'
 
+# Where (inside the version's folder) to put the per-month data files, and the hashes of what's in them
+DATA_FOLDER = 'data'
+DATA_MANIFEST_FNAME = 'manifest.json'
+
+# Map month -> where its data file is, for the date pages (which would otherwise change whenever any month did)
+MONTHS_FNAME = 'months.js'
+
+# Change this whenever what goes into the month data files or date pages changes, so that every month is rebuilt
+#   (otherwise only the months whose schedules changed are, see month_inputs())
+MONTH_DATA_VERSION = 1
+
+# Where (inside the version's folder) to put the .ics feeds (see pool_ics.py)
+ICS_FOLDER = 'ics'
+
+# Where (inside the version's folder) to put each date's static page, and the pool info those pages load after their
+#   cards (see pool_static.py)
+DATES_FOLDER = 'dates'
+POOL_INFO_FNAME = 'pool-info.js'
+
+# Search index over pool names/addresses/types, for the page's name filter and pools.py --name (see pool_search.py)
+SEARCH_INDEX_FNAME = 'search-index.json'
+
+# Coverage heatmap page, which shows the tensor written by pool_coverage.py
+COVERAGE_PAGE_FNAME = 'coverage.html'
+COVERAGE_SCRIPT_FNAME = 'coverage.js'
+
+# Web Worker that downloads, caches (in IndexedDB) and ranks the distances to each pool, for the page's distance sorts
+DISTANCE_WORKER_FNAME = 'distance-worker.js'
+
+# Service worker (and the list of what it caches) that lets the page load from the cache, even offline
+#   (see sw_template.js)
+SERVICE_WORKER_FNAME = 'sw.js'
+PRECACHE_MANIFEST_FNAME = 'precache-manifest.json'
+
+# How many processes to parse the schedules page with (0 means one per CPU)
+PARSE_WORKERS = 1
+
+# Where each pool's listing starts on the schedules page
+LISTING_START_REGEX = re.compile(r'<div\b[^>]*\bclass\s*=\s*["\'][^"\']*\bpfrListing\b', re.IGNORECASE)
+
 
 @unique
 class TimeType(Enum):
@@ -64,23 +132,134 @@ class Pool:
         self.name = name
         self.classified_name = None  # used for js
 
-        # Map dates to lists of start/end times
+        # Map dates to lists of Sessions. Once scraped, it's a RecurringSchedule (see compress_schedule()).
         self.availabilities = dict()
 
+        # Map dates to which 15-minute slots have sessions in them (see pool_slots.py). Update with update_slots().
+        self.slots = dict()
+
         self.address = None  # TODO
         self.type = None  # Type of pool (indoor/outdoor/wading/etc)
         self.phone = None  # TODO
+        self.coordinates = None  # (latitude, longitude), from pool-coordinates.json (see pool_nearby.py)
+
+        # From its facility page, with --enrich (see pool_enrich.py)
+        self.url = None  # facility page, linked from its name on the schedule page
+        self.amenities = []
+        self.accessibility = []
+        self.closures = []
 
-    def add_availability(self, date, time):
+    def add_availability(self, date, time, program=DEFAULT_PROGRAM):
         if date not in self.availabilities:
             self.availabilities[date] = []
         start, end = read_timerange(time)
-        self.availabilities[date].append((start, end))
-
-
-def main():
-    pool_info = get_pool_info()
-    gen_v3(pool_info)  # DESTRUCTIVE function
+        self.availabilities[date].append(Session(start, end, program))
+
+    def update_slots(self):
+        self.slots = pool_slots(self.availabilities)
+
+    def compress_schedule(self):
+        # store the schedule as weekly rules plus exceptions (see pool_recurrence.py), it still works like a dict
+        self.availabilities = RecurringSchedule.from_dates(self.availabilities)
+
+
+def main(argv=None):
+    # asyncio and the download pool are only worth importing when generating, not when e.g. pools.py queries the cache
+    from pool_enrich import ENRICH_CACHE_FOLDER, ENRICH_CONCURRENCY
+
+    arg_parser = argparse.ArgumentParser(description='Scrape toronto.ca (unless cached) and generate the v3 page.')
+    arg_parser.add_argument('--metrics-json', help='write pipeline metrics to this JSON file')
+    arg_parser.add_argument('--metrics-prom', help='write pipeline metrics to this Prometheus textfile')
+    arg_parser.add_argument('--trace-memory', action='store_true', help='record peak memory of each stage (slower)')
+    arg_parser.add_argument('--refresh', action='store_true', help=f're-scrape even if {CACHE_FNAME} exists')
+    arg_parser.add_argument('--record', metavar='DIR', help='save every downloaded page into DIR (implies --refresh)')
+    arg_parser.add_argument('--replay', metavar='DIR', help='scrape pages saved by --record instead of toronto.ca, '
+                                                            'without touching the network (implies --refresh)')
+    arg_parser.add_argument('--timeout', type=float, help='connect/read timeout for each download, in seconds')
+    arg_parser.add_argument('--retries', type=int, help='how many times to retry a failed download')
+    arg_parser.add_argument('--parse-workers', type=int, default=PARSE_WORKERS,
+                            help='processes to parse the schedules page with (0 = one per CPU, default: %(default)s)')
+    arg_parser.add_argument('--match-threshold', type=float, default=MATCH_THRESHOLD,
+                            help='how similar (0-1) a facility name must be to a pool name to be joined to it '
+                                 '(default: %(default)s)')
+    arg_parser.add_argument('--program', action='append', dest='programs',
+                            help='only put this program on the page, e.g. "lane" (can be repeated, default: all)')
+    arg_parser.add_argument('--archive', metavar='DIR', default=ARCHIVE_FOLDER,
+                            help='where to archive each scrape (default: %(default)s)')
+    arg_parser.add_argument('--no-archive', action='store_const', const=None, dest='archive',
+                            help="don't archive this scrape")
+    arg_parser.add_argument('--ics-workers', type=int, default=0,
+                            help='processes to write changed .ics feeds with (0 = one per CPU, default: %(default)s)')
+    arg_parser.add_argument('--static-workers', type=int, default=0,
+                            help='processes to render the static date pages with (0 = one per CPU, default: '
+                                 '%(default)s)')
+    arg_parser.add_argument('--coordinates', default=COORDINATES_FNAME,
+                            help='pool coordinates, to list the nearest pools open at the same time as each session '
+                                 '(default: %(default)s, see pool_nearby.py)')
+    arg_parser.add_argument('--nearby', type=int, default=ALTERNATIVES_K,
+                            help='how many nearby pools to list for each session (0 = none, default: %(default)s)')
+    arg_parser.add_argument('--enrich', action='store_true',
+                            help="add amenities, accessibility and closures from each pool's facility page")
+    arg_parser.add_argument('--enrich-concurrency', type=int, default=ENRICH_CONCURRENCY,
+                            help='how many facility pages to download at once (default: %(default)s)')
+    arg_parser.add_argument('--enrich-cache', metavar='DIR', default=ENRICH_CACHE_FOLDER,
+                            help='where to cache facility pages between runs (default: %(default)s)')
+    arg_parser.add_argument('--keep-days', type=int, metavar='N',
+                            help="drop dates older than N days, and merge each scrape into the cache's recent dates "
+                                 "instead of replacing it (default: keep every date, see pool_window.py)")
+    arg_parser.add_argument('--runs', metavar='DIR', default=RUNS_FOLDER,
+                            help='where to checkpoint each scrape (default: %(default)s)')
+    arg_parser.add_argument('--no-checkpoint', action='store_const', const=None, dest='runs',
+                            help="don't checkpoint this scrape")
+    arg_parser.add_argument('--resume', metavar='RUN_ID', nargs='?', const='latest',
+                            help='pick up a scrape where it left off (the latest one, or RUN_ID), '
+                                 'e.g. after fixing a row the parser quarantined (implies --refresh)')
+    args = arg_parser.parse_args(argv)
+
+    if args.trace_memory:
+        metrics.start_tracing_memory()
+
+    fetcher.configure(timeout=args.timeout, retries=args.retries, record_dir=args.record, replay_dir=args.replay)
+
+    refresh = args.refresh or args.record is not None or args.replay is not None or args.resume is not None
+
+    run = None
+    if refresh and args.runs is not None:
+        from pool_checkpoint import ScrapeRun, prune_runs
+
+        if args.resume is not None:
+            run = ScrapeRun.resume(args.runs, None if args.resume == 'latest' else args.resume)
+        else:
+            run = ScrapeRun(args.runs)
+
+    pool_info = get_pool_info(refresh=refresh, parse_workers=args.parse_workers, match_threshold=args.match_threshold,
+                              archive_folder=args.archive, run=run, keep_days=args.keep_days)
+
+    if run is not None:
+        quarantined = run.quarantined_rows()
+        if len(quarantined) > 0:
+            print(f'WARNING: {len(quarantined)} rows could not be parsed, see {run.path("quarantine")}. '
+                  f'Once the parser is fixed, rerun with --resume {run.run_id} to add them.')
+        prune_runs(args.runs)
+    if args.keep_days is not None and not any(len(pool.availabilities) > 0 for pool in pool_info):
+        print(f'WARNING: No dates from the last {args.keep_days} days on. Re-scrape with --refresh, or leave out '
+              f'--keep-days to use the old ones.')
+        return
+    if args.enrich:
+        from pool_enrich import enrich_pools
+
+        enriched = enrich_pools(pool_info, args.enrich_cache, args.enrich_concurrency)
+        print(f'INFO: Enriched {enriched} pools from their facility pages.')
+        save_enrichment(pool_info)
+    add_pool_coordinates(pool_info, args.coordinates)
+    write_ics(pool_info, workers=args.ics_workers)
+    gen_v3(pool_info, programs=args.programs, nearby=args.nearby,
+           static_workers=args.static_workers)  # DESTRUCTIVE function
+
+    if args.metrics_json:
+        metrics.write_json(args.metrics_json)
+    if args.metrics_prom:
+        metrics.write_prometheus(args.metrics_prom)
 
 
 def print_weird_letters(pool_info):
@@ -189,8 +368,8 @@ def parse_time(time_str, type: TimeType):
 
 def get_earliest_latest_dates(pool_info: List[Pool]):
     # choose unrealistically late/early dates to ensure they get updated
-    earliest = parser.parse('2069')
-    latest = parser.parse('1969')
+    earliest = datetime(2069, 1, 1)
+    latest = datetime(1969, 1, 1)
 
     for pool in pool_info:
         for date in pool.availabilities:
@@ -199,7 +378,7 @@ def get_earliest_latest_dates(pool_info: List[Pool]):
             if date > latest:
                 latest = date
 
-    assert earliest != parser.parse('2069') and latest != parser.parse('1969'), 'error: cannot find earliest/latest'
+    assert earliest != datetime(2069, 1, 1) and latest != datetime(1969, 1, 1), 'error: cannot find earliest/latest'
 
     return earliest, latest
 
@@ -212,34 +391,91 @@ def date_range(start: datetime, end: datetime):
         date += oneday
 
 
-def classify_pool_name(name):
+def add_pool_coordinates(pool_info: List[Pool], fname=COORDINATES_FNAME):
+    """
+    Set each pool's coordinates from the coordinates file. They aren't cached with the rest of the pool info, so that
+    filling in the file doesn't need a rescrape.
+    """
+
+    from pool_nearby import add_coordinates, load_coordinates
+
+    located = add_coordinates(pool_info, load_coordinates(fname))
+    if located < len(pool_info):
+        print(f'INFO: {len(pool_info) - located} of {len(pool_info)} pools have no coordinates in {fname}, '
+              f'so they won\'t be listed as nearby pools (see pool_nearby.py).')
+    metrics.set('pools_nearby_located', located)
+
+
+def write_ics(pool_info: List[Pool], workers=0):
+    """
+    Write .ics feeds (per pool, pool type and program) next to the v3 page. Only changed feeds are rewritten.
+    """
+
+    from pool_ics import write_ics_feeds
+
+    with metrics.stage('ics'):
+        write_ics_feeds(pool_info, f'{PAGES_FOLDER}/v3/{ICS_FOLDER}', workers)
+
+
+def gen_v3(pool_info: List[Pool], programs=None, nearby=ALTERNATIVES_K, static_workers=0):
     """
-    Sanitize pool name so that it can be a class.
+    WARN: Destructive function.
+
+    programs: only put sessions of these programs on the page (e.g. ['leisure', 'lane']). Defaults to all of them.
+    nearby: how many of the nearest pools open at the same time to list for each session (see pool_nearby.py).
+    static_workers: processes to render each date's static page with (0 means one per CPU, see pool_static.py).
+
+    The page only has pool names/addresses/etc. inlined. Availabilities are split into one data file per month
+    (data/YYYY-MM.js), and the page loads only the month being viewed. Each date also gets a static page with its
+    cards already in it (dates/YYYY-MM-DD.html). Only the months whose schedules changed since the last run (see
+    data/manifest.json) are rebuilt, along with their date pages.
     """
 
-    name = name.lower()
+    with metrics.stage('generate'):
+        if programs:
+            filter_programs(pool_info, programs)
+        _gen_v3(pool_info, nearby, static_workers)
 
-    replace = {
-        ' ': '-',
-        "'": "",
-        ',': "",
-        '-': "-",
-        '.': ""
-    }
 
-    for c in set(name):
-        if c in replace:
-            name = name.replace(c, replace[c])
+def program_matches(program: str, programs):
+    """
+    Whether a session's program is one of the programs asked for. Matches parts of names, ignoring case,
+    e.g. "lane" matches "Lane Swim".
+    """
 
-    return name
+    return any(wanted.lower() in program.lower() for wanted in programs)
 
 
-def gen_v3(pool_info: List[Pool]):
+def filter_programs(pool_info: List[Pool], programs):
     """
     WARN: Destructive function.
+
+    Drop every session that isn't one of these programs (and dates left without any sessions).
     """
 
+    for pool in pool_info:
+        availabilities = dict()
+        for date, times in pool.availabilities.items():
+            times = [time for time in times if program_matches(time.program, programs)]
+            if len(times) > 0:
+                availabilities[date] = times
+        pool.availabilities = availabilities
+        pool.compress_schedule()
+        pool.update_slots()
+
+
+def get_programs(pool_info: List[Pool]):
+    """
+    Every program that any pool has a session of, sorted.
+    """
+
+    return sorted({time.program for pool in pool_info for times in pool.availabilities.values() for time in times})
+
+
+def _gen_v3(pool_info: List[Pool], nearby=ALTERNATIVES_K, static_workers=0):
     version_name = 'v3'
+    version_folder = f'{PAGES_FOLDER}/{version_name}'
+    data_folder = f'{version_folder}/{DATA_FOLDER}'
 
     ##### SETUP #####
 
@@ -247,47 +483,117 @@ def gen_v3(pool_info: List[Pool]):
     earliest_date, latest_date = get_earliest_latest_dates(pool_info)
     assert earliest_date <= latest_date
 
-    # make sure they're not more than 6 months apart, since I doubt it'll work very well at that point
-    assert (latest_date - earliest_date) < timedelta(days=(6 * (365 / 12)))
+    # split into months, so that the page doesn't have to load (or show) every date at once
+    months = month_ranges(earliest_date, latest_date)
 
-    ##### GENERATE SELECT DROPDOWN #####
+    # every pool's schedule as weekly rules plus exceptions (see pool_recurrence.py)
+    schedules = [pool.availabilities if isinstance(pool.availabilities, RecurringSchedule)
+                 else RecurringSchedule.from_dates(pool.availabilities) for pool in pool_info]
 
-    html_select = "<select id='date-select'>"
+    # only the months whose inputs changed since last time are rebuilt (their data files, next-opening and nearby
+    #   tables, coverage and date pages), the rest are left as they are
+    manifest = read_data_manifest(data_folder)
+    inputs = month_inputs(pool_info, schedules, months, nearby)
+    changed_months = {month for month, _, _ in months
+                      if manifest['months'].get(month, dict()).get('inputs') != inputs[month] or
+                      not os.path.exists(f'{data_folder}/{month}.js')}
+    changed_dates = {date for month, first_date, last_date in months if month in changed_months
+                     for date in date_range(first_date, last_date)}
+    metrics.set('pools_generate_months_rebuilt', len(changed_months))
+    metrics.set('pools_generate_months_unchanged', len(months) - len(changed_months))
 
-    for date in date_range(earliest_date, latest_date):
-        html_select += f"<option value='{date.strftime('%Y-%m-%d')}'>{date.strftime('%Y-%m-%d')}</option>"
+    ##### GENERATE SELECT DROPDOWNS #####
 
-    html_select += "</select>"
+    # months are filled in here, dates are filled in by the page for whichever month is selected
+    html_select = "<select id='month-select'>"
+
+    for month, first_date, _ in months:
+        html_select += f"<option value='{month}'>{first_date.strftime('%B %Y')}</option>"
+
+    html_select += "</select> <select id='date-select'></select>"
+
+    # programs are filtered by the page, so that switching between them doesn't need another download
+    html_program_select = "<select id='program-select'><option value=''>All programs</option>"
+    for program in get_programs(pool_info):
+        html_program_select += f"<option value='{escape(program, quote=True)}'>{escape(program)}</option>"
+    html_program_select += "</select>"
 
     ##### GENERATE JS OBJECT CONTAINING ALL POOL INFO #####
 
     # prep pool info so it's easier for frontend to use
     # map pool name -> cleaned pool info
     cleaned_pool_info = dict()
-    for pool in pool_info:
+
+    # map month -> {'rules': pool name -> weekly rules that happen that month,
+    #               'exceptions': pool name -> formatted date -> times,
+    #               'slots': pool name -> formatted date -> 32-bit words of slot mask, for the exceptions,
+    #               'next_openings': {'pools': names of the pools listed, 'programs': programs listed,
+    #                                 'tables': next-opening tables, 'dates': formatted date -> index in 'tables'},
+    #               'alternatives': {'pools': names of the pools listed, 'sessions': pool name -> formatted date ->
+    #                                nearest pools open at the same time as each session}}
+    # for the months being rebuilt
+    # the page picks each date's sessions out of the rules (see poolSessions() in pools-v3.js), and ORs together the
+    #   rules' slot words, but never has to sort anything
+    month_data = {month: {'rules': dict(), 'exceptions': dict(), 'slots': dict(),
+                          'next_openings': {'pools': [], 'programs': [], 'tables': [], 'dates': dict()},
+                          'alternatives': {'pools': [], 'sessions': dict()}}
+                  for month, _, _ in months if month in changed_months}
+
+    # so the page can find what opens next without sorting every pool (see soonestRanks() in pools-v3.js)
+    month_next_openings(pool_info, month_data, months)
+
+    # precomputed, since it needs every pool's schedule and coordinates at once. Each session's alternatives are
+    #   [start time, end time, program, [[index in 'pools', start time, end time, km], ...]], nearest first.
+    if nearby > 0:
+        month_alternatives(pool_info, month_data, nearby)
+
+    # so the page can filter pools by name as you type, without scanning every pool (see pool_search.py)
+    SearchIndex.from_pools(pool_info).save(f'{version_folder}/{SEARCH_INDEX_FNAME}')
+
+    # how many pools are open in each slot of each date, by type and area, for the coverage heatmap (coverage.html, see
+    #   pool_coverage.py)
+    coverage_src = write_coverage(version_folder, pool_info,
+                                  changed_dates if len(changed_months) < len(months) else None)
+
+    for pool, schedule in zip(pool_info, schedules):
         # make sure all enums are serializable
         if pool.type is not None:
             pool.type = pool.type.value
-        # instead of mapping availabilities as date->[(start time, end time), ...], map as formatted_date_string->
-        #   [{start time (in minutes since midnight), end time (in minutes since midnight)}, ...]
-
-        new_availabilities = dict()
 
-        # for each date, fix up the date and its start/end times and store in new availabilities
-        dates = set(pool.availabilities.keys())
-        for date in dates:
+        # instead of mapping availabilities as date->[(start time, end time, program), ...], send weekly rules as
+        #   [weekday (Monday is 0), start time (in minutes since midnight), end time, program, first date, last date,
+        #   slot words], and the dates that don't follow them as formatted_date_string->[{start time, end time,
+        #   program}, ...] (plus their slot words)
+        # and store them in the data file for their month. Both are already sorted by start, then end, then program.
+        for rule in schedule.rules:
+            for month, first_date, last_date in months:
+                if month not in month_data:
+                    continue
+                clipped = rule.clip(first_date, last_date)
+                if clipped is not None:
+                    month_data[month]['rules'].setdefault(pool.name, []).append([
+                        rule.weekday, to_minutes(rule.start), to_minutes(rule.end), rule.program,
+                        clipped.first.strftime('%Y-%m-%d'), clipped.last.strftime('%Y-%m-%d'),
+                        to_words(window_mask(rule.start, rule.end))])
+
+        for date, times in schedule.exceptions.items():
             formatted_date = date.strftime('%Y-%m-%d')
+            if formatted_date[:7] not in month_data:
+                continue
+            month = month_data[formatted_date[:7]]
 
-            new_availabilities[formatted_date] = []
-
-            for start, end in pool.availabilities[date]:
-                start_mins = int(start.total_seconds()) // 60
-                end_mins = int(end.total_seconds()) // 60
-
-                new_availabilities[formatted_date].append({'start': start_mins, 'end': end_mins})
-                new_availabilities[formatted_date].sort(key=lambda time: time['start'])
+            month['exceptions'].setdefault(pool.name, dict())[formatted_date] = [
+                {'start': to_minutes(start), 'end': to_minutes(end), 'program': program}
+                for start, end, program in times]
+            # so the page can check for open times with bitwise operations (see poolOpenDuring() in pools-v3.js)
+            month['slots'].setdefault(pool.name, dict())[formatted_date] = to_words(sessions_mask(times))
 
-        pool.availabilities = new_availabilities
+        # filled in by the page as it loads each month
+        pool.availabilities = dict()
+        pool.slots = dict()
+        pool.rules = []
+        pool.exceptions = dict()
+        pool.alternatives = dict()
 
         # store classified pool name so we don't have to generate it every time we use it on frontend
         #   (debateable usefulness...)
@@ -299,18 +605,355 @@ def gen_v3(pool_info: List[Pool]):
     # convert our final pool info object into json
     js_pool_info = json.dumps(cleaned_pool_info)
 
+    ##### WRITE MONTH DATA FILES #####
+
+    pool_months = write_month_data_files(data_folder, month_data, months, manifest, inputs)
+    js_pool_months = json.dumps(pool_months)
+
+    # for the date pages, so that they don't change whenever another month does
+    with open(f'{data_folder}/{MONTHS_FNAME}', 'w') as f:
+        f.write(f'const pool_months = {js_pool_months};\n')
+
     ##### INJECT #####
 
-    with open(f'{PAGES_FOLDER}/{version_name}/pools-{version_name}_template.html', 'r') as template:
+    with open(f'{version_folder}/pools-{version_name}_template.html', 'r') as template:
         html_template = template.read()
 
-    with open(f'{PAGES_FOLDER}/{version_name}/pools-{version_name}.html', 'w') as result:
-        assert "{{ pool_info }}" in html_template
-        html_template = html_template.replace("{{ pool_info }}", js_pool_info)
-        assert "{{ date_select }}" in html_template
-        html_template = html_template.replace("{{ date_select }}", html_select)
+    # what every page has
+    html_template = fill_template(html_template, {
+        "{{ date_select }}": html_select,
+        "{{ program_select }}": html_program_select,
+    })
+
+    # the main page has the data up front, and pools-v3.js makes the cards
+    result_fname = f'{version_folder}/pools-{version_name}.html'
+    with open(result_fname, 'w') as result:
+        html = fill_template(html_template, {
+            "{{ base }}": '',
+            "{{ scripts }}": f'    <script type="text/javascript">const pool_info = {js_pool_info};</script>\n'
+                             f'    <script type="text/javascript">const pool_months = {js_pool_months};</script>\n'
+                             f'    <script type="text/javascript" src=\'pools-{version_name}.js\'></script>',
+            "{{ date_links }}": '',
+            "{{ holder_attributes }}": '',
+            "{{ cards }}": '',
+            "{{ deferred_scripts }}": '',
+        })
+
+        result.write(html)
+        metrics.set('pools_generate_bytes', len(html.encode()), output=result_fname)
+
+    ##### STATIC DATE PAGES #####
+
+    from pool_static import write_date_pages
+
+    # the data is in its own file, so that the date pages can show their cards before it's loaded and parsed
+    js_pool_info_file = f'const pool_info = {js_pool_info};\n'
+    with open(f'{version_folder}/{POOL_INFO_FNAME}', 'w') as f:
+        f.write(js_pool_info_file)
+    pool_info_src = f'{POOL_INFO_FNAME}?v={hashlib.sha1(js_pool_info_file.encode()).hexdigest()[:12]}'
+
+    # the date pages are a folder down, so everything is relative to the version's folder. The cards (and the links to
+    #   the dates either side) are filled in for each date by write_date_pages()
+    months_src = f'{DATA_FOLDER}/{MONTHS_FNAME}'
+    date_template = fill_template(html_template, {
+        "{{ base }}": "    <base href='../'>",
+        "{{ scripts }}": '',
+        "{{ deferred_scripts }}": f'<script type="text/javascript" src=\'{pool_info_src}\' defer></script>\n'
+                                  f'<script type="text/javascript" src=\'{months_src}\' defer></script>\n'
+                                  f'<script type="text/javascript" src=\'pools-{version_name}.js\' defer></script>',
+    })
+    pages_hash = hashlib.sha1(date_template.encode()).hexdigest()[:12]
+
+    # every page has the same template, so if it changed (e.g. a new month in the select), they all have to be
+    #   rendered again
+    dates_folder = f'{version_folder}/{DATES_FOLDER}'
+    render_months = changed_months if manifest['pages'] == pages_hash else {month for month, _, _ in months}
+    dates = sorted({date.strftime('%Y-%m-%d') for schedule in schedules for date in schedule})
+    render_dates = changed_date_pages(dates, months, render_months, dates_folder)
+
+    # map formatted date -> [(pool name, classified pool name, [(start time, end time, program), ...]), ...], the cards
+    #   for each date's static page, in the same order as the page shows them (see pool_static.py)
+    date_pools = dict()
+    for formatted_date in render_dates:
+        date = datetime.strptime(formatted_date, '%Y-%m-%d')
+        for pool, schedule in zip(pool_info, schedules):
+            times = schedule.get(date)
+            if times is not None:
+                date_pools.setdefault(formatted_date, []).append((
+                    pool.name, pool.classified_name,
+                    [(to_minutes(start), to_minutes(end), program) for start, end, program in times]))
+
+    write_date_pages(dates_folder, date_template, date_pools, static_workers, dates)
+
+    ##### SERVICE WORKER #####
+
+    write_service_worker(version_folder, version_name, pool_months, coverage_src)
+
+    # only once everything's written, so that a run that didn't finish is picked up by the next one
+    write_data_manifest(data_folder, {
+        'months': {month: {'hash': pool_months[month]['src'].rsplit('=', 1)[-1], 'inputs': inputs[month]}
+                   for month in pool_months},
+        'pages': pages_hash,
+    })
+
+
+def month_inputs(pool_info: List[Pool], schedules, months, nearby=ALTERNATIVES_K):
+    """
+    Hash of everything that goes into each month's data file, coverage and date pages: every pool's schedule that
+    month, and the pools themselves (their order, type and coordinates, for the next-opening tables, coverage and
+    nearby pools). Only a pool's rules/exceptions that month are hashed, not every date's sessions, so it's cheap.
+    Returns map of month -> hash.
+    """
+
+    pools_hash = hashlib.sha1(repr((MONTH_DATA_VERSION, nearby, [
+        (pool.name, getattr(pool.type, 'value', pool.type), getattr(pool, 'coordinates', None)) for pool in pool_info
+    ])).encode())
+
+    inputs = dict()
+    for month, first_date, last_date in months:
+        month_hash = pools_hash.copy()
+        for schedule in schedules:
+            clipped = schedule.clip(first_date, last_date)
+            month_hash.update(repr((clipped.rules, sorted(clipped.exceptions.items()))).encode())
+        inputs[month] = month_hash.hexdigest()[:12]
+
+    return inputs
+
+
+def changed_date_pages(dates, months, render_months, dates_folder):
+    """
+    Which of the dates (formatted, sorted) to render a page for: the ones in render_months, and the ones either side of
+    those months (and of the whole schedule), since their links to the next/previous date might have changed. Dates
+    whose page is missing are rendered too.
+    """
+
+    import bisect
+
+    render_dates = {date for date in dates if date[:7] in render_months or
+                    not os.path.exists(f'{dates_folder}/{date}.html')}
+
+    if len(dates) > 0:
+        render_dates.update((dates[0], dates[-1]))
+    for month, first_date, last_date in months:
+        if month in render_months:
+            before = bisect.bisect_left(dates, first_date.strftime('%Y-%m-%d')) - 1
+            after = bisect.bisect_right(dates, last_date.strftime('%Y-%m-%d'))
+            render_dates.update(dates[i] for i in (before, after) if 0 <= i < len(dates))
+
+    return sorted(render_dates)
+
+
+def fill_template(html_template, replacements):
+    for placeholder, value in replacements.items():
+        assert placeholder in html_template
+        html_template = html_template.replace(placeholder, value)
+    return html_template
+
+
+def write_coverage(version_folder, pool_info: List[Pool], changed_dates=None):
+    """
+    Write the coverage tensor and its description (see pool_coverage.py). Returns the URL of its data, with its hash.
+    changed_dates: only count these dates again, and copy the rest from the coverage that's already there.
+    """
+
+    from pool_coverage import COVERAGE_DATA_FNAME, COVERAGE_FNAME, Coverage
+
+    previous = Coverage.load(version_folder) if changed_dates is not None else None
+    coverage = Coverage.from_pools(pool_info, previous, changed_dates)
+    size = coverage.save(version_folder)
+    metrics.set('pools_generate_bytes', size, output=f'{version_folder}/{COVERAGE_DATA_FNAME}')
+    metrics.set('pools_coverage_max_open', int(coverage.counts[0].max(initial=0)))
+
+    with open(f'{version_folder}/{COVERAGE_FNAME}', 'r') as f:
+        return json.load(f)['src']
+
+
+def month_next_openings(pool_info: List[Pool], month_data, months):
+    """
+    Put each date's next-opening table (see pool_next.py) into month_data (see _gen_v3()), for the months in it. Dates
+    with the same sessions (e.g. every Monday, in most weeks) have the same table, so each month only has each table
+    once.
+    """
+
+    # map month -> {name of a pool/program -> its index in that month's list, table (as JSON) -> its index}, since the
+    #   same pools and programs are in every table
+    indexes = {month: {'pools': dict(), 'programs': dict(), 'tables': dict()} for month in month_data}
+
+    def index(month, kind, key, value=None):
+        if key not in indexes[month][kind]:
+            indexes[month][kind][key] = len(indexes[month][kind])
+            month_data[month]['next_openings'][kind].append(key if value is None else value)
+        return indexes[month][kind][key]
+
+    next_openings = NextOpenings(pool_info)
+    dates = [date for month, first_date, last_date in months if month in month_data
+             for date in date_range(first_date, last_date)]
+    for date in dates:
+        order, buckets = next_openings.table(date)
+        if len(order) == 0:
+            continue
+
+        formatted_date = date.strftime('%Y-%m-%d')
+        month = formatted_date[:7]
+        table = {
+            # [index in 'pools', start (minutes since midnight), index in 'programs'], sorted by start
+            'order': [[index(month, 'pools', pool.name), start, index(month, 'programs', session.program)]
+                      for start, pool, session in order],
+            # where each 15-minute bucket starts in order
+            'buckets': buckets,
+        }
+        month_data[month]['next_openings']['dates'][formatted_date] = index(
+            month, 'tables', json.dumps(table, sort_keys=True), table)
+
+
+def month_alternatives(pool_info: List[Pool], month_data, k=ALTERNATIVES_K):
+    """
+    Put the nearest pools open at the same time as each session into month_data (see _gen_v3()), for the months in it.
+    """
+
+    from pool_nearby import NearbyAlternatives
+
+    alternatives = NearbyAlternatives(pool_info, k)
+
+    # map month -> pool name -> its index in that month's list of pools, since the same few pools come up as
+    #   alternatives over and over
+    pool_indexes = {month: dict() for month in month_data}
+
+    def pool_index(month, name):
+        if name not in pool_indexes[month]:
+            pool_indexes[month][name] = len(pool_indexes[month])
+            month_data[month]['alternatives']['pools'].append(name)
+        return pool_indexes[month][name]
+
+    sessions = 0
+    for date in alternatives.dates():
+        formatted_date = date.strftime('%Y-%m-%d')
+        month = formatted_date[:7]
+        if month not in month_data:
+            continue
+        month_sessions = month_data[month]['alternatives']['sessions']
+
+        for (name, (start, end, program)), others in sorted(alternatives.table(date).items()):
+            month_sessions.setdefault(name, dict()).setdefault(formatted_date, []).append([
+                to_minutes(start), to_minutes(end), program,
+                [[pool_index(month, other.name), to_minutes(session.start), to_minutes(session.end), round(km, 1)]
+                 for other, session, km, _ in others]])
+            sessions += 1
+
+    metrics.set('pools_nearby_sessions', sessions)
+
+
+def read_data_manifest(data_folder):
+    """
+    What was generated last time (see write_data_manifest()), or nothing if it's missing or from before months were
+    only rebuilt when they changed.
+    """
+
+    try:
+        with open(f'{data_folder}/{DATA_MANIFEST_FNAME}', 'r') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        manifest = dict()
+
+    if not isinstance(manifest.get('months'), dict):
+        return {'months': dict(), 'pages': None}
+    return manifest
+
+
+def write_data_manifest(data_folder, manifest):
+    """
+    manifest: {'months': month -> {'hash': hash of its data file, 'inputs': hash of what went into it (see
+    month_inputs())}, 'pages': hash of the date pages' template}
+    """
+
+    with open(f'{data_folder}/{DATA_MANIFEST_FNAME}', 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def write_month_data_files(data_folder, month_data, months, manifest, inputs):
+    """
+    Write one JS file per month, which hands its data (availabilities, etc.) to the page (see loadMonth() in pools-v3.js).
+    Only the months in month_data are written (the ones whose inputs changed, see _gen_v3()), the rest are kept as they
+    are, and months that are gone are deleted.
+    Returns map of month -> {first date, last date, src}, for the page to know what it can load.
+    """
+
+    os.makedirs(data_folder, exist_ok=True)
+
+    pool_months = dict()
+
+    for month, first_date, last_date in months:
+        fname = f'{month}.js'
+
+        if month in month_data:
+            js_month = f'onMonthData({json.dumps(month)}, {json.dumps(month_data[month], sort_keys=True)});\n'
+            month_hash = hashlib.sha1(js_month.encode()).hexdigest()[:12]
+
+            if manifest['months'].get(month, dict()).get('hash') != month_hash or \
+                    not os.path.exists(f'{data_folder}/{fname}'):
+                with open(f'{data_folder}/{fname}', 'w') as f:
+                    f.write(js_month)
+            metrics.set('pools_generate_bytes', len(js_month.encode()), output=f'{data_folder}/{fname}')
+        else:
+            month_hash = manifest['months'][month]['hash']
 
-        result.write(html_template)
+        pool_months[month] = {
+            'first': first_date.strftime('%Y-%m-%d'),
+            'last': last_date.strftime('%Y-%m-%d'),
+            # bust the browser's cache only when the month changes
+            'src': f'{DATA_FOLDER}/{fname}?v={month_hash}'
+        }
+
+    # delete months that aren't in the schedule anymore
+    for month in set(manifest['months']) - set(pool_months):
+        try:
+            os.remove(f'{data_folder}/{month}.js')
+        except FileNotFoundError:
+            pass
+
+    return pool_months
+
+
+def write_service_worker(version_folder, version_name, pool_months, coverage_src=None):
+    """
+    Write the page's service worker, with the list of everything it should cache (page, CSS, JS, distance worker,
+    search index, month data files and coverage heatmap), each with a hash of its contents. The list is also written
+    to precache-manifest.json.
+    """
+
+    def file_hash(fname):
+        with open(f'{version_folder}/{fname}', 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()[:12]
+
+    precache = [{'url': fname, 'revision': file_hash(fname)}
+                for fname in (f'pools-{version_name}.html', f'pools-{version_name}.css', f'pools-{version_name}.js',
+                              DISTANCE_WORKER_FNAME, SEARCH_INDEX_FNAME, f'{DATA_FOLDER}/{MONTHS_FNAME}')]
+    if coverage_src is not None:
+        from pool_coverage import COVERAGE_FNAME
+
+        precache += [{'url': fname, 'revision': file_hash(fname)}
+                     for fname in (COVERAGE_PAGE_FNAME, COVERAGE_SCRIPT_FNAME, COVERAGE_FNAME)]
+    # month data (and coverage data) URLs already have their hash in them (see write_month_data_files())
+    srcs = [pool_months[month]['src'] for month in sorted(pool_months)]
+    if coverage_src is not None:
+        srcs.append(coverage_src)
+    for src in srcs:
+        precache.append({'url': src, 'revision': src.rsplit('=', 1)[-1]})
+
+    with open(f'{version_folder}/{PRECACHE_MANIFEST_FNAME}', 'w') as f:
+        json.dump(precache, f, indent=2)
+
+    with open(f'{version_folder}/sw_template.js', 'r') as template:
+        sw_template = template.read()
+
+    # the worker changes whenever any hash does, which is how the browser knows to install it again
+    assert "{{ precache }}" in sw_template
+    sw = sw_template.replace("{{ precache }}", json.dumps(precache, indent=4))
+
+    sw_fname = f'{version_folder}/{SERVICE_WORKER_FNAME}'
+    with open(sw_fname, 'w') as f:
+        f.write(sw)
+    metrics.set('pools_generate_bytes', len(sw.encode()), output=sw_fname)
 
 
 def gmaps_search_url(query):
@@ -325,103 +968,457 @@ def split_timeranges(timeranges: str):
     return re.findall(r".*?-.*?(?:am|pm)", timeranges)
 
 
+class PoolUnpickler(pickle.Unpickler):
+    """
+    Running this file as a script pickles pools as `__main__.Pool`, so look those classes up in this module instead.
+    That way the cache can be loaded from anywhere (e.g. pools.py).
+    """
+
+    def find_class(self, module, name):
+        if module == '__main__':
+            module = __name__
+        return super().find_class(module, name)
+
+
 # Caching
-def load_pool_info():
-    with open(CACHE_FNAME, 'rb') as p:
-        return pickle.load(p)
+def load_pool_info(fname=CACHE_FNAME):
+    with open(fname, 'rb') as p:
+        pool_info = PoolUnpickler(p).load()
+
+    # snapshots from before sessions had a program store them as (start, end), and don't have slots
+    for pool in pool_info:
+        for date, times in pool.availabilities.items():
+            if any(getattr(time, 'program', None) is None for time in times):
+                pool.availabilities[date] = [Session(*time) for time in times]
+        if getattr(pool, 'slots', None) is None:
+            pool.update_slots()
+        # and from before schedules were compressed
+        if not isinstance(pool.availabilities, RecurringSchedule):
+            pool.compress_schedule()
+
+    return pool_info
 
 
 # Caching
-def save_pool_info(pool_info):
-    with open(CACHE_FNAME, 'wb') as p:
+def save_pool_info(pool_info, fname=CACHE_FNAME):
+    with open(fname, 'wb') as p:
         pickle.dump(pool_info, p)
 
 
-def get_pool_info():
-    # cache
-    try:
-        return load_pool_info()
-    except:
-        pass
+def save_enrichment(pool_info, fname=CACHE_FNAME):
+    """
+    Store each pool's amenities, accessibility and closures (see pool_enrich.py) in the cache, leaving its schedules
+    alone. pool_info may have had dates evicted (see pool_window.py) that the cache should keep.
+    """
 
-    pools = get_pool_schedules()
-    addresses, pool_types, phone_numbers = get_pool_addresses_types_phones()
+    from pool_enrich import SECTION_KEYWORDS
 
-    for pool in pools:
-        if pool.name not in addresses:
-            print(f'WARNING: Cannot find {pool.name} in addresses.')
+    try:
+        cached = load_pool_info(fname)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        print(f'WARN: Could not read {fname}, so the enrichment was not cached.')
+        return
+
+    enriched = {pool.name: pool for pool in pool_info}
+    for pool in cached:
+        if pool.name in enriched:
+            for attribute in SECTION_KEYWORDS:
+                if hasattr(enriched[pool.name], attribute):
+                    setattr(pool, attribute, getattr(enriched[pool.name], attribute))
+    save_pool_info(cached, fname)
+
+
+def get_pool_info(refresh=False, parse_workers=PARSE_WORKERS, match_threshold=MATCH_THRESHOLD,
+                  archive_folder=ARCHIVE_FOLDER, run=None, keep_days=None):
+    """
+    run: a ScrapeRun (see pool_checkpoint.py) to checkpoint each stage into, and resume from.
+    keep_days: only keep dates from this many days ago on, and merge each scrape into the cache instead of replacing it
+        (see pool_window.py). None keeps every date, and each scrape replaces the cache.
+    """
+
+    # cache
+    if not refresh:
+        try:
+            pools = load_pool_info()
+        except:
+            pass
         else:
-            pool.address = addresses[pool.name]
-            pool.type = pool_types[pool.name]
-            pool.phone = phone_numbers[pool.name]
+            if keep_days is not None:
+                from pool_window import evict_past, window_start
+
+                # the cache itself is only trimmed by the next scrape, so leaving out --keep-days still gets the old dates back
+                evict_past(pools, window_start(keep_days))
+            return pools
+
+    pools = run.load_joined() if run is not None else None
+    if pools is None:
+        pools = get_pool_schedules(parse_workers, run=run)
+        addresses, pool_types, phone_numbers = get_pool_addresses_types_phones(run)
+
+        with metrics.stage('join'):
+            join_pool_info(pools, addresses, pool_types, phone_numbers, match_threshold)
+
+        with metrics.stage('compress'):
+            compress_schedules(pools)
+
+        if run is not None:
+            run.save_joined(pools)
+
+    if keep_days is not None:
+        from pool_window import evict_past, merge_scrape, window_start
+
+        try:
+            cached = load_pool_info()
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            cached = []
+
+        with metrics.stage('window'):
+            since = window_start(keep_days)
+            pools = merge_scrape(cached, pools, since)
+            evict_past(pools, since)
 
     save_pool_info(pools)
 
+    if archive_folder is not None:
+        from pool_archive import Archive
+
+        with metrics.stage('archive'):
+            archive = Archive(archive_folder)
+            archive.add(pools)
+        metrics.set('pools_archive_bytes', archive.size())
+
     return pools
 
 
-def get_pool_schedules():
+def compress_schedules(pools: List[Pool]):
     """
-    Download pool schedules from toronto.ca.
-    Returns Pool objects with just pool name and schedule filled in.
+    Turn every pool's schedule into weekly rules plus exceptions (see pool_recurrence.py).
     """
 
-    pool_info_response = requests.get(POOL_SCHEDULES_URL)
+    for pool in pools:
+        pool.compress_schedule()
 
-    if pool_info_response.status_code != 200:
-        print(f"Error: Not 200, but {pool_info_response.status_code} instead.")
+    metrics.set('pools_schedule_rules', sum(len(pool.availabilities.rules) for pool in pools))
+    metrics.set('pools_schedule_exceptions', sum(len(pool.availabilities.exceptions) for pool in pools))
 
-    soup = BeautifulSoup(pool_info_response.content)
 
-    pools = soup.select('div.pfrListing')
-    pool_objs = []
+def join_pool_info(pools: List[Pool], addresses, pool_types, phone_numbers, match_threshold=MATCH_THRESHOLD):
+    """
+    Fill in each pool's address/type/phone from the facility pages.
+    Names that aren't spelled exactly the same on both pages are matched by similarity (see pool_matching.py).
+    """
+
+    matches, unresolved = match_pool_names([pool.name for pool in pools], addresses.keys(), match_threshold)
+
+    metrics.set('pools_join_mismatches', len(unresolved))
+    metrics.set('pools_join_fuzzy_matches', 0)
+
+    for name, score in unresolved:
+        print(f'WARNING: Cannot find {name} in addresses (closest match is only {score:.0%} similar).')
+        metrics.add_detail('join_mismatches', name)
 
     for pool in pools:
-        name = pool.h2.a.text
-        pool_obj = Pool(name)
-
-        rows = pool.select('table tbody tr')
-        for row in rows:
-            # Make sure it's for Leisure Swim
-            sched_type = row.select_one('.coursenamemobiletable > strong').text
-            if 'leisure' not in sched_type.lower():
+        if pool.name not in matches:
+            continue
+
+        facility_name, score = matches[pool.name]
+        if facility_name != pool.name:
+            print(f'INFO: Matched {pool.name} to {facility_name} ({score:.0%} similar).')
+            metrics.inc('pools_join_fuzzy_matches')
+            metrics.add_detail('join_fuzzy_matches', {'name': pool.name, 'facility': facility_name, 'score': score})
+
+        pool.address = addresses[facility_name]
+        pool.type = pool_types[facility_name]
+        pool.phone = phone_numbers[facility_name]
+
+
+def get_pool_schedules(parse_workers=PARSE_WORKERS, program_urls=None, run=None):
+    """
+    Download every program's pool schedules from toronto.ca (all at once).
+    Returns Pool objects with just pool name and schedule filled in, with sessions from every program merged together.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    program_urls = program_urls or PROGRAM_SCHEDULE_URLS
+    get = run.get_page if run is not None else fetcher.get
+
+    def fetch(url):
+        try:
+            return get(url)
+        except FetchError as e:
+            return e
+
+    with metrics.stage('fetch'):
+        with ThreadPoolExecutor(max_workers=len(program_urls)) as executor:
+            responses = dict(zip(program_urls, executor.map(fetch, program_urls.values())))
+
+    program_pools = []
+    for program, response in responses.items():
+        url = program_urls[program]
+        if isinstance(response, FetchError):
+            print(f'WARNING: {response}. Skipping {program} schedules...')
+            metrics.inc('pools_fetch_failures', url=url)
+            continue
+        if response.status_code != 200:
+            print(f"WARNING: Not 200, but {response.status_code} instead. Skipping {program} schedules...")
+            metrics.inc('pools_fetch_failures', url=url)
+            continue
+
+        # ranges like "Dec 29 to Jan 4" have no year, so infer it from when the page was served
+        program_pools.append(parse_pool_schedules(response.content, response_date(response), parse_workers, run=run))
+
+    # nothing to generate without any schedules, so there's no point carrying on
+    if len(program_pools) == 0:
+        raise FetchError('Error: could not download any pool schedules.')
+
+    pools = merge_pools(program_pools)
+
+    for program, count in count_program_sessions(pools).items():
+        metrics.set('pools_parse_program_sessions', count, program=program)
+
+    return pools
+
+
+def merge_pools(program_pools: List[List[Pool]]):
+    """
+    Merge pools that are on more than one program's schedule page into one Pool each (matched by name).
+    Pools stay in the order they're first seen.
+    """
+
+    merged = dict()
+    for pools in program_pools:
+        for pool in pools:
+            if pool.name not in merged:
+                merged[pool.name] = pool
                 continue
 
-            # Find the daterange (ex: May 26 to June 1) (Goes Sun-Sat)
-            daterange = row.select_one('td > strong').text
+            merged[pool.name].url = merged[pool.name].url or pool.url
+
+            availabilities = merged[pool.name].availabilities
+            for date, times in pool.availabilities.items():
+                # the same session can be listed under more than one program page
+                availabilities[date] = sorted(set(availabilities.get(date, [])) | set(times))
+            merged[pool.name].update_slots()
+
+    return list(merged.values())
+
+
+def count_program_sessions(pools: List[Pool]):
+    counts = dict()
+    for pool in pools:
+        for times in pool.availabilities.values():
+            for time in times:
+                counts[time.program] = counts.get(time.program, 0) + 1
+    return counts
 
-            # Find start date
-            from_date = daterange[:daterange.index(' to ')]
-            date = parser.parse(from_date)
 
-            # See if any day within 7 days of start date has time scheduled.
-            for day in days_of_wk:
-                timeranges = row.find("td", {"data-info": day}).text.strip()
+def parse_pool_schedules(html, reference_date: datetime = None, workers=PARSE_WORKERS, chunksize=None, run=None):
+    """
+    Parse a pool schedules page (HTML from one of PROGRAM_SCHEDULE_URLS). Every row is kept, along with its program.
+    reference_date is when the page was served, and is used to figure out what year each row is in.
 
-                # if time scheduled on that day, add to our Pool's info
-                if len(timeranges) > 0:
-                    # split timeranges apart, then add each one! Trust, it's good for later.
-                    # e.g. if the time is 5-7pm,      it'll just add that
-                    #  but if it's        3-5pm6-8pm, it'll add 3-5pm and 6-8pm separately
-                    for timerange in split_timeranges(timeranges):
-                        pool_obj.add_availability(date, timerange)
+    Every pool (div.pfrListing) is independent, so with workers > 1 the page is split up into one piece of HTML per pool,
+    and those are parsed in a process pool (chunksize pools at a time). Pools are returned in page order either way.
+    workers=0 means one per CPU.
 
-                # add 1 day so our day of wk matches up in next loop
-                date += timedelta(days=1)
+    Rows that can't be parsed are left out (and warned about), instead of failing the whole page. With a run (see
+    pool_checkpoint.py), each pool's results are checkpointed, and the rows that couldn't be parsed are quarantined.
+    """
 
-        # Some pools (i.e. Douglas Snow Aquatic Centre and Jimmie Simpson Recreation Centre) have duplicate times
-        #   because of a mistake on toronto.ca.
-        for date in pool_obj.availabilities:
-            if len(pool_obj.availabilities[date]) > len(set(pool_obj.availabilities[date])):
-                print(f'WARN: pool {pool_obj.name} has duplicate times on {date}.')
-                pool_obj.availabilities[date] = list(set(pool_obj.availabilities[date]))
+    with metrics.stage('parse'):
+        if run is not None:
+            pool_objs, counts, quarantined = _parse_pool_listings_checkpointed(html, reference_date,
+                                                                               workers or os.cpu_count(), run)
+        elif workers == 1:
+            pool_objs, counts, quarantined = _parse_pool_listings(html, reference_date)
+        else:
+            pool_objs, counts, quarantined = _parse_pool_listings_in_parallel(html, reference_date,
+                                                                              workers or os.cpu_count(), chunksize)
 
-        pool_objs.append(pool_obj)
+        metrics.inc('pools_parse_pools', len(pool_objs))
+        for name, count in counts.items():
+            metrics.inc(f'pools_parse_{name}', count)
+        metrics.inc('pools_parse_quarantined_rows', len(quarantined))
+        for row in quarantined:
+            metrics.add_detail('parse_quarantined_rows', {'pool': row['pool'], 'error': row['error'].splitlines()[-1]})
 
-    return pool_objs
+        return pool_objs
 
 
-def get_pool_addresses_types_phones():
+def _parse_pool_listings(html, reference_date: datetime = None):
+    """
+    Parse every div.pfrListing in the HTML.
+    Returns (list of Pool, map of what was counted -> count, list of rows that couldn't be parsed).
+    """
+
+    from bs4 import BeautifulSoup  # beautifulsoup4
+
+    soup = BeautifulSoup(html)
+    daterange_parser = DaterangeParser(reference_date)
+
+    pool_objs = []
+    counts = {'rows': 0, 'sessions': 0, 'duplicate_time_fixes': 0}
+    quarantined = []
+
+    for pool in soup.select('div.pfrListing'):
+        pool_objs.append(parse_pool_listing(pool, daterange_parser, counts, quarantined))
+
+    return pool_objs, counts, quarantined
+
+
+def _parse_listings(listings, reference_date: datetime, workers: int, chunksize=None):
+    """
+    Parse pieces of HTML from split_pool_listings(), in a process pool.
+    Returns a list of _parse_pool_listings() results, in the same order as the listings.
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    if workers == 1 or len(listings) < 2:
+        return [_parse_pool_listings(listing, reference_date) for listing in listings]
+
+    # a few chunks per worker, so that one slow chunk doesn't hold everyone up
+    if chunksize is None:
+        chunksize = max(1, len(listings) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() hands back results in the same order as the listings, i.e. page order
+        return list(executor.map(_parse_pool_listings, listings, [reference_date] * len(listings), chunksize=chunksize))
+
+
+def _combine_results(results):
+    pool_objs = []
+    counts = dict()
+    quarantined = []
+
+    for listing_pools, listing_counts, listing_quarantined in results:
+        pool_objs.extend(listing_pools)
+        for name, count in listing_counts.items():
+            counts[name] = counts.get(name, 0) + count
+        quarantined.extend(listing_quarantined)
+
+    return pool_objs, counts, quarantined
+
+
+def _parse_pool_listings_in_parallel(html, reference_date: datetime, workers: int, chunksize=None):
+    return _combine_results(_parse_listings(split_pool_listings(html), reference_date, workers, chunksize))
+
+
+def _parse_pool_listings_checkpointed(html, reference_date: datetime, workers: int, run):
+    listings = split_pool_listings(html)
+    keys = [run.listing_key(listing, reference_date) for listing in listings]
+
+    # listings that were already parsed cleanly (e.g. before a crash, or before one of the others hit a bad row) are
+    #   loaded, and the rest are parsed
+    results = {key: run.load_listing(key) for key in keys}
+    todo = [(key, listing) for key, listing in zip(keys, listings) if results[key] is None]
+
+    for (key, _), (listing_pools, listing_counts, quarantined) in zip(
+            todo, _parse_listings([listing for _, listing in todo], reference_date, workers)):
+        run.save_listing(key, listing_pools, listing_counts, quarantined)
+        results[key] = (listing_pools, listing_counts, quarantined)
+
+    return _combine_results([results[key] for key in keys])
+
+
+def split_pool_listings(html):
+    """
+    Cut the page into one piece of HTML per div.pfrListing, without parsing it.
+    Each piece runs from the start of one listing to the start of the next one, so it can have some stray closing tags
+    at the end (or, for the last one, the rest of the page), which BeautifulSoup doesn't mind.
+    """
+
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+
+    starts = [match.start() for match in LISTING_START_REGEX.finditer(html)]
+    return [html[start:end] for start, end in zip(starts, starts[1:] + [len(html)])]
+
+
+def parse_pool_listing(pool, daterange_parser: DaterangeParser, counts, quarantined):
+    """
+    Parse a single div.pfrListing (one pool) into a Pool. Adds to the counts as it goes.
+    Rows that can't be parsed are skipped, and added to quarantined (as dicts of pool name, row HTML and error).
+    """
+
+    name = pool.h2.a.text
+    pool_obj = Pool(name)
+
+    # each pool's rows start from this week again
+    daterange_parser.start_listing()
+
+    href = pool.h2.a.get('href', '')
+    if href != '' and not href.startswith('#'):
+        pool_obj.url = urljoin(POOL_SCHEDULES_URL, href)
+
+    rows = pool.select('table tbody tr')
+    counts['rows'] += len(rows)
+    for row in rows:
+        try:
+            sessions = parse_pool_row(row, daterange_parser)
+        except Exception as e:
+            # one odd row (e.g. a new time format) shouldn't take the whole scrape down with it
+            error = traceback.format_exception_only(type(e), e)[-1].strip()
+            print(f'WARN: cannot parse a row of {name} ({error}). Skipping it...')
+            quarantined.append({'pool': name, 'row': str(row), 'error': traceback.format_exc()})
+            continue
+
+        for date, session in sessions:
+            pool_obj.availabilities.setdefault(date, []).append(session)
+        counts['sessions'] += len(sessions)
+
+    # Some pools (i.e. Douglas Snow Aquatic Centre and Jimmie Simpson Recreation Centre) have duplicate times
+    #   because of a mistake on toronto.ca.
+    for date, times in pool_obj.availabilities.items():
+        if len(times) > len(set(times)):
+            print(f'WARN: pool {pool_obj.name} has duplicate times on {date}.')
+            counts['duplicate_time_fixes'] += 1
+        # rows go program by program, so put each date's sessions in order (by start, then end), without duplicates
+        pool_obj.availabilities[date] = sorted(set(times))
+
+    pool_obj.update_slots()
+
+    return pool_obj
+
+
+def parse_pool_row(row, daterange_parser: DaterangeParser):
+    """
+    Parse one row (one program, one week) of a pool's schedule.
+    Returns list of (date, Session). Raises if anything about the row is off, before anything is added to the pool.
+    """
+
+    sessions = []
+
+    # Which program it's for (e.g. Leisure Swim, Lane Swim)
+    program = ' '.join(row.select_one('.coursenamemobiletable > strong').text.split()) or DEFAULT_PROGRAM
+
+    # Find the daterange (ex: May 26 to June 1) (Goes Sun-Sat)
+    daterange = row.select_one('td > strong').text
+
+    # Find start date (and its year, which isn't on the page)
+    date, _ = daterange_parser.parse(daterange)
+
+    # See if any day within 7 days of start date has time scheduled.
+    for day in days_of_wk:
+        timeranges = row.find("td", {"data-info": day}).text.strip()
+
+        # if time scheduled on that day, add to our Pool's info
+        if len(timeranges) > 0:
+            # split timeranges apart, then add each one! Trust, it's good for later.
+            # e.g. if the time is 5-7pm,      it'll just add that
+            #  but if it's        3-5pm6-8pm, it'll add 3-5pm and 6-8pm separately
+            for timerange in split_timeranges(timeranges):
+                start, end = read_timerange(timerange)
+                sessions.append((date, Session(start, end, program)))
+
+        # add 1 day so our day of wk matches up in next loop
+        date += timedelta(days=1)
+
+    return sessions
+
+
+def get_pool_addresses_types_phones(run=None):
     """
     Get map of pool name -> pool address.
     """
@@ -430,17 +1427,42 @@ def get_pool_addresses_types_phones():
 
     pages = dict()
 
-    # download pages and convert them to soups
+    # download pages
+    # if one of them fails, keep the rest: those pools just won't have an address/type/phone until next time
     for pool_type, url in POOL_ADDRESS_URLS.items():
-        pool_addresses_response = requests.get(url)
+        with metrics.stage('fetch'):
+            try:
+                pool_addresses_response = run.get_page(url) if run is not None else fetcher.get(url)
+            except FetchError as e:
+                print(f'WARNING: {e}. Skipping {pool_type.value}s...')
+                metrics.inc('pools_fetch_failures', url=url)
+                continue
 
         if pool_addresses_response.status_code != 200:
-            print(f"Error: Not 200, but {pool_addresses_response.status_code} instead. Pre-emptively quitting...")
-            exit(-1)
+            print(f"WARNING: Not 200, but {pool_addresses_response.status_code} instead. Skipping {pool_type.value}s...")
+            metrics.inc('pools_fetch_failures', url=url)
+            continue
+
+        pages[pool_type] = pool_addresses_response.content
+
+    return parse_pool_addresses_types_phones(pages)
+
+
+def parse_pool_addresses_types_phones(pages):
+    """
+    Parse the facility pages (map of PoolType -> HTML from POOL_ADDRESS_URLS).
+    Returns maps of pool name -> address, pool name -> PoolType and pool name -> phone.
+    """
+
+    with metrics.stage('parse'):
+        return _parse_pool_addresses_types_phones(pages)
+
 
-        soup = BeautifulSoup(pool_addresses_response.content)
+def _parse_pool_addresses_types_phones(pages):
+    from bs4 import BeautifulSoup  # beautifulsoup4
 
-        pages[pool_type] = soup
+    # convert pages to soups
+    pages = {pool_type: BeautifulSoup(html) for pool_type, html in pages.items()}
 
     addresses = dict()
     pool_types = dict()
@@ -449,6 +1471,7 @@ def get_pool_addresses_types_phones():
     for pool_type, page in pages.items():
         location_rows = page.select('.pfrListing table tr:not([class=header])')
         print(f'found {len(location_rows)} locations...')
+        metrics.set('pools_parse_facilities', len(location_rows), type=pool_type.value)
         for row in location_rows:
             # td data-info=Name/Address/Phone
             name = row.select_one('td[data-info="Name"]').text.strip()
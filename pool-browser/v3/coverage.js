@@ -0,0 +1,134 @@
+// the tensor's description, and the tensor itself is at its src (see pool_coverage.py)
+const coverageURL = 'coverage.json';
+const weekdays = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+
+// coverage.json, and counts[area, date, slot, type] as a flat typed array
+let coverage;
+let counts;
+
+let elSelectArea;
+let elSelectType;
+let elStatus;
+let elHeatmap;
+
+function loadCoverage() {
+    return fetch(coverageURL)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`Couldn't load ${coverageURL}: ${response.status}`);
+            }
+            return response.json();
+        })
+        .then(description => {
+            coverage = description;
+            return fetch(coverage.src);
+        })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`Couldn't load ${coverage.src}: ${response.status}`);
+            }
+            return response.arrayBuffer();
+        })
+        .then(buffer => {
+            counts = coverage.dtype === 'uint8' ? new Uint8Array(buffer) : new Uint16Array(buffer);
+        });
+}
+
+function slotText(slot) {
+    let minutes = slot * coverage.slot_minutes;
+    let hours = Math.floor(minutes / 60);
+    return `${(hours + 11) % 12 + 1}:${String(minutes % 60).padStart(2, '0')}${hours < 12 ? 'am' : 'pm'}`;
+}
+
+function dateText(day) {
+    let date = new Date(`${coverage.first_date}T00:00:00Z`);
+    date.setUTCDate(date.getUTCDate() + day);
+    return `${weekdays[date.getUTCDay()]} ${date.toISOString().slice(0, 10)}`;
+}
+
+// how many pools of a type (or of every type, if type is -1) are open in each slot of a date
+function openCounts(area, day, type) {
+    let [, dates, slots, types] = coverage.shape;
+    let offset = (area * dates + day) * slots * types;
+    let result = new Array(slots).fill(0);
+    for (let slot = 0; slot < slots; slot++) {
+        for (let t = 0; t < types; t++) {
+            if (type === -1 || type === t) {
+                result[slot] += counts[offset + slot * types + t];
+            }
+        }
+    }
+    return result;
+}
+
+function renderHeatmap() {
+    let area = Number(elSelectArea.value);
+    let type = elSelectType.value === '' ? -1 : Number(elSelectType.value);
+    let [, dates, slots] = coverage.shape;
+
+    let rows = [];
+    for (let day = 0; day < dates; day++) {
+        rows.push(openCounts(area, day, type));
+    }
+
+    // only the hours that anything is open
+    let open = rows.flat();
+    let max = Math.max(1, ...open);
+    let firstSlot = slots;
+    let lastSlot = -1;
+    for (let row of rows) {
+        for (let slot = 0; slot < slots; slot++) {
+            if (row[slot] > 0) {
+                firstSlot = Math.min(firstSlot, slot);
+                lastSlot = Math.max(lastSlot, slot);
+            }
+        }
+    }
+    if (lastSlot < 0) {
+        elStatus.textContent = 'Nothing is open.';
+        elHeatmap.innerHTML = '';
+        return;
+    }
+    firstSlot -= firstSlot % 4;
+
+    let html = '<tr><th></th>';
+    for (let slot = firstSlot; slot <= lastSlot; slot += 4) {
+        html += `<th colspan='4'>${slotText(slot)}</th>`;
+    }
+    html += '</tr>';
+
+    rows.forEach((row, day) => {
+        let date = dateText(day);
+        html += `<tr><th>${date}</th>`;
+        for (let slot = firstSlot; slot <= lastSlot; slot++) {
+            let alpha = (row[slot] / max).toFixed(2);
+            html += `<td style='background-color: rgba(0, 100, 255, ${alpha})' title='${date} ${slotText(slot)}: ` +
+                `${row[slot]} open'></td>`;
+        }
+        html += '</tr>';
+    });
+
+    elStatus.textContent = `Darkest is ${max} pools open at once.`;
+    elHeatmap.innerHTML = html;
+}
+
+window.addEventListener('load', (event) => {
+    elSelectArea = document.querySelector('#coverage-area');
+    elSelectType = document.querySelector('#coverage-type');
+    elStatus = document.querySelector('#coverage-status');
+    elHeatmap = document.querySelector('#coverage-heatmap');
+
+    loadCoverage()
+        .then(() => {
+            coverage.areas.forEach((area, i) => elSelectArea.add(new Option(area, i)));
+            coverage.types.forEach((type, i) => elSelectType.add(new Option(type, i)));
+
+            elSelectArea.addEventListener('change', renderHeatmap);
+            elSelectType.addEventListener('change', renderHeatmap);
+            renderHeatmap();
+        })
+        .catch(err => {
+            elStatus.textContent = `${err}`;
+            elStatus.classList.add('err-msg');
+        });
+});
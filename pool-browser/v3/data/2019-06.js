@@ -0,0 +1 @@
+onMonthData("2019-06", {"alternatives": {"pools": [], "sessions": {}}, "exceptions": {"Albion Pool and Health Club": {"2019-06-09": [], "2019-06-15": []}, "Alderwood Centre": {"2019-06-09": [], "2019-06-23": []}, "Alex Duff Memorial Pool": {"2019-06-21": [{"end": 1200, "program": "Leisure Swim", "start": 960}]}, "Alexandra Park": {"2019-06-24": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-27": [{"end": 1200, "program": "Leisure Swim", "start": 960}]}, "Birchmount Community Centre": {"2019-06-02": [{"end": 1170, "program": "Leisure Swim", "start": 1020}], "2019-06-03": [{"end": 1230, "program": "Leisure Swim", "start": 1155}], "2019-06-07": [{"end": 1230, "program": "Leisure Swim", "start": 1050}]}, "Blantyre Park": {"2019-06-24": [{"end": 1200, "program": "Leisure Swim", "start": 1020}], "2019-06-25": [{"end": 1200, "program": "Leisure Swim", "start": 1020}], "2019-06-26": [{"end": 1200, "program": "Leisure Swim", "start": 1020}], "2019-06-27": [{"end": 1200, "program": "Leisure Swim", "start": 1020}]}, "Cummer Park Community Centre": {"2019-06-09": [], "2019-06-28": []}, "Donald D. Summerville Olympic Pools": {"2019-06-21": [{"end": 1200, "program": "Leisure Swim", "start": 960}]}, "Douglas Snow Aquatic Centre": {"2019-06-09": [], "2019-06-15": [{"end": 960, "program": "Leisure Swim", "start": 840}]}, "Driftwood Community Recreation Centre": {"2019-06-24": [{"end": 1165, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1165, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1165, "program": "Leisure Swim", "start": 960}], "2019-06-27": [{"end": 1165, "program": "Leisure Swim", "start": 960}]}, "East York Community Centre": {"2019-06-30": []}, "Fairbank Memorial Park": {"2019-06-22": [{"end": 1165, "program": "Leisure Swim", "start": 960}], "2019-06-23": [{"end": 1165, "program": "Leisure Swim", "start": 960}], "2019-06-24": [{"end": 1165, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1165, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1165, "program": "Leisure Swim", "start": 960}], "2019-06-27": [{"end": 1165, "program": "Leisure Swim", "start": 960}]}, "Giovanni Caboto Rink, Pool and Tennis Courts": {"2019-06-24": [{"end": 1170, "program": "Leisure Swim", "start": 1020}], "2019-06-25": [{"end": 1170, "program": "Leisure Swim", "start": 1020}], "2019-06-26": [{"end": 1170, "program": "Leisure Swim", "start": 1020}], "2019-06-27": [{"end": 1170, "program": "Leisure Swim", "start": 1020}]}, "Glen Long Community Centre": {"2019-06-24": [{"end": 1165, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1165, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1165, "program": "Leisure Swim", "start": 960}], "2019-06-27": [{"end": 1165, "program": "Leisure Swim", "start": 960}]}, "Greenwood Park": {"2019-06-24": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-27": [{"end": 1200, "program": "Leisure Swim", "start": 960}]}, "Halbert Park": {"2019-06-24": [{"end": 1200, "program": "Leisure Swim", "start": 1020}], "2019-06-25": [{"end": 1200, "program": "Leisure Swim", "start": 1020}], "2019-06-26": [{"end": 1200, "program": "Leisure Swim", "start": 1020}], "2019-06-27": [{"end": 1200, "program": "Leisure Swim", "start": 1020}]}, "Heron Park Community Centre": {"2019-06-21": [{"end": 1140, "program": "Leisure Swim", "start": 1020}]}, "Kidstown - Water Park": {"2019-06-24": [{"end": 1170, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1170, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1170, "program": "Leisure Swim", "start": 960}], "2019-06-27": [{"end": 1170, "program": "Leisure Swim", "start": 960}]}, "Kiwanis Outdoor Pool": {"2019-06-24": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-27": [{"end": 1200, "program": "Leisure Swim", "start": 960}]}, "Lawrence Heights Community Centre": {"2019-06-24": [{"end": 985, "program": "Leisure Swim", "start": 780}, {"end": 1135, "program": "Leisure Swim", "start": 985}], "2019-06-25": [{"end": 985, "program": "Leisure Swim", "start": 780}, {"end": 1135, "program": "Leisure Swim", "start": 985}], "2019-06-26": [{"end": 985, "program": "Leisure Swim", "start": 780}, {"end": 1135, "program": "Leisure Swim", "start": 985}], "2019-06-27": [{"end": 985, "program": "Leisure Swim", "start": 780}, {"end": 1135, "program": "Leisure Swim", "start": 985}]}, "Leaside Outdoor Pool": {"2019-06-24": [{"end": 1170, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1170, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1170, "program": "Leisure Swim", "start": 960}], "2019-06-27": [{"end": 1170, "program": "Leisure Swim", "start": 960}]}, "Main Square Community Centre": {"2019-06-07": [{"end": 1230, "program": "Leisure Swim", "start": 1140}], "2019-06-08": [{"end": 930, "program": "Leisure Swim", "start": 810}]}, "Mary McCormick Recreation Centre": {"2019-06-03": [{"end": 585, "program": "Leisure Swim", "start": 540}, {"end": 1140, "program": "Leisure Swim", "start": 1080}], "2019-06-08": [{"end": 975, "program": "Leisure Swim", "start": 885}]}, "Maryvale Park Outdoor Pool": {"2019-06-24": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-27": [{"end": 1200, "program": "Leisure Swim", "start": 960}]}, "Matty Eckler Recreation Centre": {"2019-06-26": [], "2019-06-28": []}, "McGregor Park Community Centre": {"2019-06-21": [{"end": 1200, "program": "Leisure Swim", "start": 960}]}, "Memorial Pool and Health Club": {"2019-06-07": [{"end": 955, "program": "Leisure Swim", "start": 915}, {"end": 1270, "program": "Leisure Swim", "start": 1200}], "2019-06-24": [{"end": 1275, "program": "Leisure Swim", "start": 1200}], "2019-06-26": [{"end": 1215, "program": "Leisure Swim", "start": 1095}], "2019-06-28": [{"end": 955, "program": "Leisure Swim", "start": 915}, {"end": 1270, "program": "Leisure Swim", "start": 1200}]}, "Monarch Park": {"2019-06-24": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-27": [{"end": 1200, "program": "Leisure Swim", "start": 960}]}, "Norseman Community School And Pool": {"2019-06-03": [{"end": 1225, "program": "Leisure Swim", "start": 1170}], "2019-06-04": [{"end": 1225, "program": "Leisure Swim", "start": 1170}], "2019-06-07": [{"end": 1255, "program": "Leisure Swim", "start": 1205}]}, "Oakdale Community Centre": {"2019-06-24": [{"end": 1135, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1135, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1135, "program": "Leisure Swim", "start": 960}], "2019-06-27": [{"end": 1135, "program": "Leisure Swim", "start": 960}]}, "Pam McConnell Aquatic Centre": {"2019-06-14": [], "2019-06-16": []}, "Parkdale Community Recreation Centre": {"2019-06-08": [{"end": 960, "program": "Leisure Swim", "start": 900}]}, "Parkway Forest Outdoor Pool": {"2019-06-21": [{"end": 1110, "program": "Leisure Swim", "start": 960}]}, "Pleasantview Community Centre": {"2019-06-24": [{"end": 1135, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1135, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1135, "program": "Leisure Swim", "start": 960}, {"end": 1170, "program": "Leisure Swim", "start": 1110}], "2019-06-27": [{"end": 1105, "program": "Leisure Swim", "start": 960}]}, "Riverdale Park East": {"2019-06-21": [{"end": 1200, "program": "Leisure Swim", "start": 960}]}, "Scadding Court Community Centre": {"2019-06-02": [{"end": 950, "program": "Leisure Swim", "start": 840}], "2019-06-07": [{"end": 1080, "program": "Leisure Swim", "start": 1020}]}, "Stanley Park South - Toronto": {"2019-06-24": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-25": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-26": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-27": [{"end": 1200, "program": "Leisure Swim", "start": 960}], "2019-06-29": [{"end": 960, "program": "Leisure Swim", "start": 720}, {"end": 1200, "program": "Leisure Swim", "start": 720}, {"end": 1200, "program": "Leisure Swim", "start": 1005}], "2019-06-30": [{"end": 960, "program": "Leisure Swim", "start": 720}, {"end": 1200, "program": "Leisure Swim", "start": 720}, {"end": 1200, "program": "Leisure Swim", "start": 1005}]}, "The Elms Pool and Community School": {"2019-06-07": [{"end": 925, "program": "Leisure Swim", "start": 810}]}, "Wallace Emerson Community Centre": {"2019-06-28": [{"end": 1200, "program": "Leisure Swim", "start": 1080}]}}, "next_openings": {"dates": {"2019-06-02": 0, "2019-06-03": 1, "2019-06-04": 2, "2019-06-05": 3, "2019-06-06": 4, "2019-06-07": 5, "2019-06-08": 6, "2019-06-09": 7, "2019-06-10": 8, "2019-06-11": 9, "2019-06-12": 10, "2019-06-13": 11, "2019-06-14": 12, "2019-06-15": 13, "2019-06-16": 14, "2019-06-17": 15, "2019-06-18": 16, "2019-06-19": 17, "2019-06-20": 18, "2019-06-21": 19, "2019-06-22": 20, "2019-06-23": 21, "2019-06-24": 22, "2019-06-25": 23, "2019-06-26": 24, "2019-06-27": 25, "2019-06-28": 26, "2019-06-29": 27, "2019-06-30": 28}, "pools": ["Harrison Pool", "Dennis R. Timbrell Resource Centre", "Gus Ryder Pool and Health Club", "Joseph J. Piccininni Community Centre", "Wallace Emerson Community Centre", "Alderwood Centre", "Annette Community Recreation Centre", "Main Square Community Centre", "Pam McConnell Aquatic Centre", "The Elms Pool and Community School", "York Recreation Centre", "Norseman Community School And Pool", "Swansea Community Recreation Centre", "Albion Pool and Health Club", "Beaches Recreation Centre", "Cummer Park Community Centre", "Douglas Snow Aquatic Centre", "Humber Community Pool", "John Innes Community Recreation Centre", "Leaside Memorial Gardens Swimming Pool - Indoor Pool", "North Toronto Memorial Community Centre", "Scadding Court Community Centre", "Trinity Community Recreation Centre", "Memorial Pool and Health Club", "East York Community Centre", "Jimmie Simpson Recreation Centre", "Toronto Pan Am Sports Centre", "Antibes Community Centre", "Matty Eckler Recreation Centre", "Parkdale Community Recreation Centre", "Birchmount Community Centre", "Centennial Recreation Centre - Scarborough", "Mary McCormick Recreation Centre", "Vaughan Road Academy", "Earl Beatty Community Centre", "Etobicoke Olympium", "Donald D. Summerville Olympic Pools", "Sunnyside Gus Ryder Outdoor Pool", "Alex Duff Memorial Pool", "Grandravine Community Recreation Centre", "McGregor Park Community Centre", "Riverdale Park East", "Heron Park Community Centre", "Parkway Forest Outdoor Pool", "Pine Point Park Outdoor Pool", "West Mall Outdoor Pool", "Kidstown - Water Park", "Giovanni Caboto Rink, Pool and Tennis Courts", "Alexandra Park", "Broadlands Community Centre", "Greenwood Park", "High Park", "Irving W. Chapley Community Centre", "Kiwanis Outdoor Pool", "Knob Hill Park", "Leaside Outdoor Pool", "Monarch Park", "Oakdale Community Centre", "Pleasantview Community Centre", "Roding Community Centre", "Smythe Park", "Weston Lions Park", "Blantyre Park", "Driftwood Community Recreation Centre", "Halbert Park", "Maryvale Park Outdoor Pool", "Glen Long Community Centre", "Lawrence Heights Community Centre", "Fairhaven Park Outdoor Pool", "Smithfield Park Outdoor Pool", "Gord and Irene Risk Community Centre", "Westgrove Park Outdoor Pool", "Amesbury Sports Complex", "Amos Waites Park Outdoor Pool", "Domenico Di Luca Community Recreation Centre", "Eringate Park Outdoor Pool", "Lambton - Kingsway Park Outdoor Pool", "Ourland Park Outdoor Pool", "Park Lawn Park", "Rotary Peace Park Outdoor Pool", "Wedgewood Park  Outdoor Pool", "West Deane Park Outdoor Pool", "Westmount Park Outdoor Pool", "Gihon Spring Park Outdoor Pool", "Richmond Gardens Pool", "Fairbank Memorial Park", "Stanley Park South - Toronto"], "programs": ["Leisure Swim"], "tables": [{"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 5, 6, 12, 13, 24, 27, 29, 29, 30, 30, 30, 30, 30, 30, 30, 30, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32], "order": [[0, 720, 0], [1, 750, 0], [2, 780, 0], [3, 780, 0], [4, 780, 0], [5, 795, 0], [6, 810, 0], [7, 810, 0], [8, 810, 0], [9, 810, 0], [10, 810, 0], [11, 820, 0], [12, 825, 0], [13, 840, 0], [14, 840, 0], [15, 840, 0], [16, 840, 0], [17, 840, 0], [18, 840, 0], [19, 840, 0], [20, 840, 0], [21, 840, 0], [22, 840, 0], [23, 845, 0], [24, 855, 0], [25, 855, 0], [26, 855, 0], [27, 870, 0], [28, 870, 0], [29, 900, 0], [30, 1020, 0], [31, 1080, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 6, 6, 8, 8, 8, 9, 10, 10, 11, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12], "order": [[32, 540, 0], [28, 690, 0], [31, 825, 0], [18, 840, 0], [23, 915, 0], [32, 1080, 0], [24, 1110, 0], [7, 1110, 0], [30, 1155, 0], [11, 1170, 0], [13, 1200, 0], [23, 1215, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 4, 4, 4, 4, 4, 4, 4, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 8, 8, 8, 8, 8, 8, 10, 10, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12], "order": [[4, 545, 0], [32, 605, 0], [28, 700, 0], [5, 720, 0], [31, 825, 0], [25, 825, 0], [32, 1080, 0], [4, 1080, 0], [11, 1170, 0], [10, 1170, 0], [9, 1200, 0], [33, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 6, 6, 6, 6, 7, 7, 7, 7, 8, 8, 8, 8, 9, 9, 9, 9, 10, 10, 10, 10, 12, 14, 14, 14, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15], "order": [[32, 540, 0], [20, 585, 0], [26, 630, 0], [28, 690, 0], [31, 825, 0], [18, 840, 0], [23, 900, 0], [7, 960, 0], [25, 1020, 0], [8, 1080, 0], [27, 1140, 0], [17, 1140, 0], [5, 1155, 0], [6, 1155, 0], [13, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 4, 4, 4, 4, 5, 5, 5, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 8, 8, 10, 10, 10, 10, 11, 11, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13], "order": [[4, 545, 0], [26, 570, 0], [28, 700, 0], [5, 720, 0], [4, 780, 0], [31, 825, 0], [25, 825, 0], [4, 1080, 0], [34, 1110, 0], [24, 1110, 0], [10, 1170, 0], [9, 1200, 0], [33, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 4, 6, 7, 7, 7, 7, 7, 8, 8, 8, 9, 9, 10, 10, 12, 12, 13, 13, 18, 19, 21, 21, 24, 24, 27, 27, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31], "order": [[4, 600, 0], [32, 605, 0], [28, 690, 0], [9, 810, 0], [31, 825, 0], [25, 825, 0], [18, 840, 0], [23, 915, 0], [18, 960, 0], [22, 990, 0], [25, 1020, 0], [21, 1020, 0], [30, 1050, 0], [5, 1080, 0], [6, 1080, 0], [32, 1080, 0], [8, 1080, 0], [4, 1080, 0], [27, 1095, 0], [20, 1110, 0], [26, 1110, 0], [31, 1140, 0], [7, 1140, 0], [16, 1145, 0], [13, 1170, 0], [15, 1170, 0], [10, 1170, 0], [35, 1200, 0], [23, 1200, 0], [11, 1205, 0], [2, 1215, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 3, 4, 10, 10, 21, 23, 25, 26, 28, 28, 28, 28, 28, 28, 29, 29, 29, 29, 29, 29, 30, 30, 30, 30, 30, 30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31], "order": [[0, 720, 0], [1, 750, 0], [21, 780, 0], [24, 795, 0], [6, 810, 0], [3, 810, 0], [7, 810, 0], [8, 810, 0], [9, 810, 0], [10, 810, 0], [13, 840, 0], [14, 840, 0], [31, 840, 0], [15, 840, 0], [2, 840, 0], [17, 840, 0], [18, 840, 0], [19, 840, 0], [20, 840, 0], [22, 840, 0], [23, 845, 0], [25, 855, 0], [26, 855, 0], [5, 870, 0], [27, 870, 0], [32, 885, 0], [35, 900, 0], [29, 900, 0], [33, 990, 0], [31, 1080, 0], [8, 1185, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 6, 6, 12, 13, 21, 24, 26, 26, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28], "order": [[0, 720, 0], [1, 750, 0], [2, 780, 0], [3, 780, 0], [21, 780, 0], [4, 780, 0], [6, 810, 0], [7, 810, 0], [8, 810, 0], [9, 810, 0], [10, 810, 0], [11, 820, 0], [12, 825, 0], [14, 840, 0], [35, 840, 0], [17, 840, 0], [18, 840, 0], [19, 840, 0], [20, 840, 0], [22, 840, 0], [23, 845, 0], [24, 855, 0], [25, 855, 0], [26, 855, 0], [27, 870, 0], [28, 870, 0], [29, 900, 0], [31, 1080, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 6, 6, 8, 8, 8, 8, 8, 8, 9, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10], "order": [[32, 540, 0], [28, 690, 0], [31, 825, 0], [18, 840, 0], [23, 915, 0], [32, 1080, 0], [24, 1110, 0], [7, 1110, 0], [13, 1200, 0], [23, 1215, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 4, 4, 4, 4, 4, 4, 4, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 8, 8, 8, 8, 8, 8, 9, 9, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11], "order": [[4, 545, 0], [32, 605, 0], [28, 700, 0], [5, 720, 0], [31, 825, 0], [25, 825, 0], [32, 1080, 0], [4, 1080, 0], [10, 1170, 0], [9, 1200, 0], [33, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 6, 6, 6, 6, 7, 7, 7, 7, 8, 8, 8, 8, 9, 9, 9, 10, 11, 11, 11, 11, 13, 15, 15, 15, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16], "order": [[32, 540, 0], [20, 585, 0], [26, 630, 0], [28, 690, 0], [31, 825, 0], [18, 840, 0], [23, 900, 0], [7, 960, 0], [25, 1020, 0], [32, 1065, 0], [8, 1080, 0], [27, 1140, 0], [17, 1140, 0], [5, 1155, 0], [6, 1155, 0], [13, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 4, 4, 4, 4, 5, 5, 5, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 9, 9, 11, 11, 11, 11, 12, 12, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14], "order": [[4, 545, 0], [26, 570, 0], [28, 700, 0], [5, 720, 0], [4, 780, 0], [31, 825, 0], [25, 825, 0], [32, 1080, 0], [4, 1080, 0], [34, 1110, 0], [24, 1110, 0], [10, 1170, 0], [9, 1200, 0], [33, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 5, 6, 6, 6, 6, 6, 7, 7, 7, 8, 8, 9, 9, 11, 11, 11, 11, 15, 16, 19, 19, 21, 21, 24, 24, 25, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26], "order": [[4, 600, 0], [32, 605, 0], [28, 690, 0], [31, 825, 0], [25, 825, 0], [18, 840, 0], [23, 915, 0], [18, 960, 0], [22, 990, 0], [25, 1020, 0], [21, 1020, 0], [5, 1080, 0], [6, 1080, 0], [32, 1080, 0], [4, 1080, 0], [27, 1095, 0], [3, 1110, 0], [20, 1110, 0], [26, 1110, 0], [31, 1140, 0], [16, 1145, 0], [13, 1170, 0], [15, 1170, 0], [10, 1170, 0], [35, 1200, 0], [2, 1215, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 2, 2, 2, 2, 7, 7, 8, 8, 12, 13, 18, 18, 31, 33, 36, 36, 37, 37, 37, 37, 37, 37, 39, 39, 42, 42, 42, 42, 43, 43, 43, 43, 44, 44, 44, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45], "order": [[36, 600, 0], [37, 600, 0], [38, 720, 0], [39, 720, 0], [0, 720, 0], [40, 720, 0], [41, 720, 0], [1, 750, 0], [42, 780, 0], [43, 780, 0], [44, 780, 0], [21, 780, 0], [24, 795, 0], [6, 810, 0], [3, 810, 0], [8, 810, 0], [9, 810, 0], [10, 810, 0], [14, 840, 0], [31, 840, 0], [15, 840, 0], [16, 840, 0], [2, 840, 0], [17, 840, 0], [18, 840, 0], [19, 840, 0], [32, 840, 0], [20, 840, 0], [22, 840, 0], [45, 840, 0], [23, 845, 0], [25, 855, 0], [26, 855, 0], [5, 870, 0], [27, 870, 0], [28, 870, 0], [35, 900, 0], [39, 990, 0], [33, 990, 0], [36, 1020, 0], [44, 1020, 0], [37, 1020, 0], [31, 1080, 0], [45, 1140, 0], [8, 1185, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 2, 2, 2, 2, 7, 7, 8, 8, 15, 16, 19, 20, 32, 35, 37, 37, 37, 37, 37, 37, 37, 37, 38, 38, 41, 41, 41, 41, 42, 42, 42, 42, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43], "order": [[36, 600, 0], [37, 600, 0], [38, 720, 0], [39, 720, 0], [0, 720, 0], [40, 720, 0], [41, 720, 0], [1, 750, 0], [2, 780, 0], [42, 780, 0], [3, 780, 0], [43, 780, 0], [44, 780, 0], [21, 780, 0], [4, 780, 0], [5, 795, 0], [6, 810, 0], [9, 810, 0], [10, 810, 0], [12, 825, 0], [13, 840, 0], [14, 840, 0], [15, 840, 0], [16, 840, 0], [35, 840, 0], [17, 840, 0], [18, 840, 0], [19, 840, 0], [20, 840, 0], [22, 840, 0], [45, 840, 0], [23, 845, 0], [24, 855, 0], [25, 855, 0], [26, 855, 0], [27, 870, 0], [28, 870, 0], [39, 990, 0], [36, 1020, 0], [44, 1020, 0], [37, 1020, 0], [31, 1080, 0], [45, 1140, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 3, 3, 3, 3, 3, 3, 3, 4, 5, 5, 5, 5, 5, 6, 6, 6, 11, 11, 12, 12, 15, 15, 15, 15, 16, 16, 17, 17, 18, 18, 18, 18, 19, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20], "order": [[32, 540, 0], [28, 690, 0], [39, 720, 0], [31, 825, 0], [18, 840, 0], [23, 915, 0], [38, 960, 0], [36, 960, 0], [40, 960, 0], [43, 960, 0], [41, 960, 0], [39, 990, 0], [42, 1020, 0], [44, 1020, 0], [37, 1020, 0], [32, 1080, 0], [24, 1110, 0], [45, 1140, 0], [13, 1200, 0], [23, 1215, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 5, 5, 5, 5, 5, 5, 5, 7, 7, 7, 7, 7, 7, 7, 7, 7, 12, 12, 13, 13, 16, 16, 16, 16, 18, 18, 18, 18, 19, 19, 20, 20, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21], "order": [[4, 545, 0], [32, 605, 0], [28, 700, 0], [5, 720, 0], [39, 720, 0], [31, 825, 0], [25, 825, 0], [38, 960, 0], [36, 960, 0], [40, 960, 0], [43, 960, 0], [41, 960, 0], [39, 990, 0], [42, 1020, 0], [44, 1020, 0], [37, 1020, 0], [32, 1080, 0], [4, 1080, 0], [45, 1140, 0], [10, 1170, 0], [9, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3, 4, 4, 5, 5, 5, 5, 5, 5, 5, 6, 7, 7, 7, 7, 8, 8, 8, 8, 13, 13, 14, 14, 18, 18, 18, 19, 19, 19, 19, 19, 22, 24, 24, 24, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25], "order": [[32, 540, 0], [20, 585, 0], [26, 630, 0], [28, 690, 0], [39, 720, 0], [31, 825, 0], [18, 840, 0], [23, 900, 0], [38, 960, 0], [36, 960, 0], [40, 960, 0], [43, 960, 0], [41, 960, 0], [39, 990, 0], [42, 1020, 0], [25, 1020, 0], [44, 1020, 0], [37, 1020, 0], [32, 1065, 0], [27, 1140, 0], [17, 1140, 0], [45, 1140, 0], [5, 1155, 0], [6, 1155, 0], [13, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 5, 5, 5, 5, 6, 6, 6, 8, 8, 8, 8, 8, 8, 8, 8, 8, 13, 13, 14, 14, 17, 17, 17, 17, 19, 19, 21, 21, 22, 22, 23, 23, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24], "order": [[4, 545, 0], [26, 570, 0], [28, 700, 0], [5, 720, 0], [39, 720, 0], [4, 780, 0], [31, 825, 0], [25, 825, 0], [38, 960, 0], [36, 960, 0], [40, 960, 0], [43, 960, 0], [41, 960, 0], [39, 990, 0], [42, 1020, 0], [44, 1020, 0], [37, 1020, 0], [32, 1080, 0], [4, 1080, 0], [34, 1110, 0], [24, 1110, 0], [45, 1140, 0], [10, 1170, 0], [9, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 2, 2, 3, 3, 4, 4, 4, 4, 4, 4, 4, 6, 7, 7, 7, 7, 7, 8, 8, 8, 14, 14, 16, 16, 21, 21, 21, 21, 26, 26, 29, 29, 31, 31, 34, 34, 35, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36], "order": [[4, 600, 0], [32, 605, 0], [28, 690, 0], [39, 720, 0], [31, 825, 0], [25, 825, 0], [18, 840, 0], [23, 915, 0], [38, 960, 0], [36, 960, 0], [18, 960, 0], [40, 960, 0], [43, 960, 0], [41, 960, 0], [39, 990, 0], [22, 990, 0], [42, 1020, 0], [25, 1020, 0], [44, 1020, 0], [21, 1020, 0], [37, 1020, 0], [5, 1080, 0], [6, 1080, 0], [32, 1080, 0], [8, 1080, 0], [4, 1080, 0], [3, 1110, 0], [20, 1110, 0], [26, 1110, 0], [31, 1140, 0], [45, 1140, 0], [13, 1170, 0], [15, 1170, 0], [10, 1170, 0], [35, 1200, 0], [2, 1215, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 3, 3, 3, 4, 23, 23, 27, 27, 33, 35, 41, 43, 65, 68, 72, 72, 73, 73, 73, 73, 74, 74, 77, 77, 88, 88, 88, 90, 92, 93, 93, 93, 103, 104, 104, 105, 105, 105, 105, 105, 105, 105, 105, 105, 105, 105, 105, 105, 105, 105, 105], "order": [[36, 600, 0], [37, 600, 0], [46, 630, 0], [47, 705, 0], [38, 720, 0], [48, 720, 0], [49, 720, 0], [39, 720, 0], [50, 720, 0], [0, 720, 0], [51, 720, 0], [52, 720, 0], [53, 720, 0], [54, 720, 0], [55, 720, 0], [40, 720, 0], [56, 720, 0], [57, 720, 0], [58, 720, 0], [41, 720, 0], [59, 720, 0], [60, 720, 0], [61, 720, 0], [62, 750, 0], [63, 750, 0], [64, 750, 0], [65, 750, 0], [66, 780, 0], [42, 780, 0], [67, 780, 0], [43, 780, 0], [44, 780, 0], [21, 780, 0], [24, 795, 0], [68, 795, 0], [6, 810, 0], [3, 810, 0], [8, 810, 0], [69, 810, 0], [9, 810, 0], [10, 810, 0], [70, 825, 0], [71, 825, 0], [13, 840, 0], [72, 840, 0], [73, 840, 0], [14, 840, 0], [31, 840, 0], [74, 840, 0], [75, 840, 0], [2, 840, 0], [17, 840, 0], [18, 840, 0], [76, 840, 0], [19, 840, 0], [32, 840, 0], [20, 840, 0], [77, 840, 0], [78, 840, 0], [79, 840, 0], [22, 840, 0], [80, 840, 0], [81, 840, 0], [45, 840, 0], [23, 845, 0], [25, 855, 0], [26, 855, 0], [82, 855, 0], [5, 870, 0], [83, 870, 0], [28, 870, 0], [84, 870, 0], [35, 900, 0], [85, 960, 0], [39, 990, 0], [57, 990, 0], [59, 990, 0], [49, 1020, 0], [74, 1020, 0], [36, 1020, 0], [63, 1020, 0], [51, 1020, 0], [52, 1020, 0], [67, 1020, 0], [44, 1020, 0], [60, 1020, 0], [37, 1020, 0], [61, 1020, 0], [72, 1065, 0], [70, 1065, 0], [31, 1080, 0], [68, 1080, 0], [71, 1095, 0], [73, 1140, 0], [75, 1140, 0], [76, 1140, 0], [77, 1140, 0], [78, 1140, 0], [84, 1140, 0], [79, 1140, 0], [80, 1140, 0], [81, 1140, 0], [45, 1140, 0], [82, 1155, 0], [8, 1185, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 3, 3, 3, 4, 23, 23, 27, 27, 36, 37, 42, 45, 65, 69, 72, 72, 72, 72, 72, 72, 73, 73, 76, 76, 87, 87, 87, 89, 91, 92, 93, 93, 103, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104], "order": [[36, 600, 0], [37, 600, 0], [46, 630, 0], [47, 705, 0], [38, 720, 0], [48, 720, 0], [49, 720, 0], [39, 720, 0], [50, 720, 0], [0, 720, 0], [51, 720, 0], [52, 720, 0], [53, 720, 0], [54, 720, 0], [55, 720, 0], [40, 720, 0], [56, 720, 0], [57, 720, 0], [58, 720, 0], [41, 720, 0], [59, 720, 0], [60, 720, 0], [61, 720, 0], [62, 750, 0], [63, 750, 0], [64, 750, 0], [65, 750, 0], [66, 780, 0], [2, 780, 0], [42, 780, 0], [3, 780, 0], [67, 780, 0], [43, 780, 0], [44, 780, 0], [21, 780, 0], [4, 780, 0], [68, 795, 0], [6, 810, 0], [8, 810, 0], [69, 810, 0], [9, 810, 0], [10, 810, 0], [70, 825, 0], [12, 825, 0], [71, 825, 0], [13, 840, 0], [72, 840, 0], [73, 840, 0], [14, 840, 0], [74, 840, 0], [75, 840, 0], [35, 840, 0], [17, 840, 0], [18, 840, 0], [76, 840, 0], [19, 840, 0], [20, 840, 0], [77, 840, 0], [78, 840, 0], [79, 840, 0], [22, 840, 0], [80, 840, 0], [81, 840, 0], [45, 840, 0], [23, 845, 0], [24, 855, 0], [25, 855, 0], [26, 855, 0], [82, 855, 0], [83, 870, 0], [28, 870, 0], [84, 870, 0], [85, 960, 0], [39, 990, 0], [57, 990, 0], [59, 990, 0], [49, 1020, 0], [74, 1020, 0], [36, 1020, 0], [63, 1020, 0], [51, 1020, 0], [52, 1020, 0], [67, 1020, 0], [44, 1020, 0], [60, 1020, 0], [37, 1020, 0], [61, 1020, 0], [72, 1065, 0], [70, 1065, 0], [31, 1080, 0], [68, 1080, 0], [71, 1095, 0], [58, 1110, 0], [73, 1140, 0], [75, 1140, 0], [76, 1140, 0], [77, 1140, 0], [78, 1140, 0], [84, 1140, 0], [79, 1140, 0], [80, 1140, 0], [81, 1140, 0], [45, 1140, 0], [82, 1155, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 4, 4, 4, 4, 6, 6, 7, 9, 11, 11, 12, 12, 13, 13, 13, 13, 31, 32, 34, 34, 46, 46, 46, 48, 49, 50, 51, 51, 61, 62, 62, 62, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64], "order": [[32, 540, 0], [49, 720, 0], [39, 720, 0], [52, 720, 0], [54, 780, 0], [67, 780, 0], [69, 810, 0], [31, 825, 0], [70, 825, 0], [74, 840, 0], [18, 840, 0], [83, 870, 0], [30, 900, 0], [38, 960, 0], [48, 960, 0], [36, 960, 0], [63, 960, 0], [85, 960, 0], [66, 960, 0], [50, 960, 0], [46, 960, 0], [53, 960, 0], [55, 960, 0], [65, 960, 0], [40, 960, 0], [56, 960, 0], [57, 960, 0], [43, 960, 0], [58, 960, 0], [41, 960, 0], [86, 960, 0], [67, 985, 0], [39, 990, 0], [59, 990, 0], [62, 1020, 0], [49, 1020, 0], [74, 1020, 0], [47, 1020, 0], [64, 1020, 0], [42, 1020, 0], [51, 1020, 0], [52, 1020, 0], [44, 1020, 0], [60, 1020, 0], [37, 1020, 0], [61, 1020, 0], [72, 1065, 0], [70, 1065, 0], [32, 1080, 0], [71, 1095, 0], [24, 1110, 0], [73, 1140, 0], [75, 1140, 0], [76, 1140, 0], [77, 1140, 0], [78, 1140, 0], [84, 1140, 0], [79, 1140, 0], [80, 1140, 0], [81, 1140, 0], [45, 1140, 0], [82, 1155, 0], [13, 1200, 0], [23, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 6, 6, 6, 6, 8, 8, 9, 12, 13, 14, 15, 15, 15, 15, 15, 15, 33, 34, 36, 36, 48, 48, 48, 50, 52, 53, 53, 53, 63, 64, 65, 65, 66, 66, 66, 66, 66, 66, 66, 66, 66, 66, 66, 66, 66, 66, 66], "order": [[4, 545, 0], [32, 605, 0], [5, 720, 0], [49, 720, 0], [39, 720, 0], [52, 720, 0], [54, 780, 0], [67, 780, 0], [69, 810, 0], [31, 825, 0], [70, 825, 0], [25, 825, 0], [74, 840, 0], [30, 855, 0], [83, 870, 0], [38, 960, 0], [48, 960, 0], [36, 960, 0], [63, 960, 0], [85, 960, 0], [66, 960, 0], [50, 960, 0], [46, 960, 0], [53, 960, 0], [55, 960, 0], [65, 960, 0], [40, 960, 0], [56, 960, 0], [57, 960, 0], [43, 960, 0], [58, 960, 0], [41, 960, 0], [86, 960, 0], [67, 985, 0], [39, 990, 0], [59, 990, 0], [62, 1020, 0], [49, 1020, 0], [74, 1020, 0], [47, 1020, 0], [64, 1020, 0], [42, 1020, 0], [51, 1020, 0], [52, 1020, 0], [44, 1020, 0], [60, 1020, 0], [37, 1020, 0], [61, 1020, 0], [72, 1065, 0], [70, 1065, 0], [32, 1080, 0], [4, 1080, 0], [71, 1095, 0], [73, 1140, 0], [75, 1140, 0], [76, 1140, 0], [77, 1140, 0], [78, 1140, 0], [84, 1140, 0], [79, 1140, 0], [80, 1140, 0], [81, 1140, 0], [45, 1140, 0], [82, 1155, 0], [10, 1170, 0], [9, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3, 3, 3, 6, 6, 6, 6, 8, 8, 8, 10, 12, 12, 14, 14, 15, 15, 15, 15, 33, 34, 36, 36, 49, 49, 49, 52, 52, 54, 55, 55, 66, 69, 69, 69, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70], "order": [[32, 540, 0], [20, 585, 0], [26, 630, 0], [49, 720, 0], [39, 720, 0], [52, 720, 0], [54, 780, 0], [67, 780, 0], [31, 825, 0], [70, 825, 0], [74, 840, 0], [18, 840, 0], [83, 870, 0], [69, 870, 0], [30, 900, 0], [38, 960, 0], [48, 960, 0], [36, 960, 0], [63, 960, 0], [85, 960, 0], [66, 960, 0], [50, 960, 0], [46, 960, 0], [53, 960, 0], [55, 960, 0], [65, 960, 0], [40, 960, 0], [56, 960, 0], [57, 960, 0], [43, 960, 0], [58, 960, 0], [41, 960, 0], [86, 960, 0], [67, 985, 0], [39, 990, 0], [59, 990, 0], [62, 1020, 0], [49, 1020, 0], [74, 1020, 0], [47, 1020, 0], [64, 1020, 0], [42, 1020, 0], [51, 1020, 0], [52, 1020, 0], [25, 1020, 0], [44, 1020, 0], [60, 1020, 0], [37, 1020, 0], [61, 1020, 0], [72, 1065, 0], [70, 1065, 0], [32, 1065, 0], [23, 1095, 0], [71, 1095, 0], [58, 1110, 0], [73, 1140, 0], [75, 1140, 0], [17, 1140, 0], [76, 1140, 0], [77, 1140, 0], [78, 1140, 0], [84, 1140, 0], [79, 1140, 0], [80, 1140, 0], [81, 1140, 0], [45, 1140, 0], [5, 1155, 0], [6, 1155, 0], [82, 1155, 0], [13, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 6, 6, 6, 6, 9, 9, 10, 13, 14, 15, 16, 16, 16, 16, 16, 16, 34, 35, 37, 37, 49, 49, 49, 51, 53, 54, 56, 56, 66, 67, 68, 68, 69, 69, 69, 69, 69, 69, 69, 69, 69, 69, 69, 69, 69, 69, 69], "order": [[4, 545, 0], [26, 570, 0], [5, 720, 0], [49, 720, 0], [39, 720, 0], [52, 720, 0], [54, 780, 0], [67, 780, 0], [4, 780, 0], [69, 810, 0], [31, 825, 0], [70, 825, 0], [25, 825, 0], [74, 840, 0], [30, 855, 0], [83, 870, 0], [38, 960, 0], [48, 960, 0], [36, 960, 0], [63, 960, 0], [85, 960, 0], [66, 960, 0], [50, 960, 0], [46, 960, 0], [53, 960, 0], [55, 960, 0], [65, 960, 0], [40, 960, 0], [56, 960, 0], [57, 960, 0], [43, 960, 0], [58, 960, 0], [41, 960, 0], [86, 960, 0], [67, 985, 0], [39, 990, 0], [59, 990, 0], [62, 1020, 0], [49, 1020, 0], [74, 1020, 0], [47, 1020, 0], [64, 1020, 0], [42, 1020, 0], [51, 1020, 0], [52, 1020, 0], [44, 1020, 0], [60, 1020, 0], [37, 1020, 0], [61, 1020, 0], [72, 1065, 0], [70, 1065, 0], [32, 1080, 0], [4, 1080, 0], [71, 1095, 0], [34, 1110, 0], [24, 1110, 0], [73, 1140, 0], [75, 1140, 0], [76, 1140, 0], [77, 1140, 0], [78, 1140, 0], [84, 1140, 0], [79, 1140, 0], [80, 1140, 0], [81, 1140, 0], [45, 1140, 0], [82, 1155, 0], [10, 1170, 0], [9, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 4, 5, 5, 5, 5, 5, 6, 24, 24, 28, 28, 32, 32, 32, 36, 48, 50, 54, 54, 55, 56, 56, 56, 57, 57, 61, 61, 74, 74, 74, 76, 79, 80, 83, 83, 94, 95, 97, 97, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99], "order": [[38, 600, 0], [36, 600, 0], [37, 600, 0], [32, 605, 0], [46, 630, 0], [47, 705, 0], [48, 720, 0], [49, 720, 0], [85, 720, 0], [66, 720, 0], [39, 720, 0], [50, 720, 0], [51, 720, 0], [52, 720, 0], [53, 720, 0], [55, 720, 0], [56, 720, 0], [57, 720, 0], [58, 720, 0], [41, 720, 0], [59, 720, 0], [60, 720, 0], [86, 720, 0], [61, 720, 0], [62, 750, 0], [63, 750, 0], [64, 750, 0], [65, 750, 0], [54, 780, 0], [67, 780, 0], [43, 780, 0], [44, 780, 0], [31, 825, 0], [70, 825, 0], [25, 825, 0], [71, 825, 0], [72, 840, 0], [73, 840, 0], [74, 840, 0], [75, 840, 0], [18, 840, 0], [76, 840, 0], [77, 840, 0], [78, 840, 0], [79, 840, 0], [80, 840, 0], [81, 840, 0], [45, 840, 0], [40, 855, 0], [82, 855, 0], [83, 870, 0], [42, 870, 0], [84, 870, 0], [69, 870, 0], [30, 900, 0], [23, 915, 0], [18, 960, 0], [39, 990, 0], [57, 990, 0], [59, 990, 0], [22, 990, 0], [49, 1020, 0], [74, 1020, 0], [36, 1020, 0], [63, 1020, 0], [51, 1020, 0], [52, 1020, 0], [25, 1020, 0], [67, 1020, 0], [44, 1020, 0], [21, 1020, 0], [60, 1020, 0], [37, 1020, 0], [61, 1020, 0], [72, 1065, 0], [70, 1065, 0], [5, 1080, 0], [32, 1080, 0], [4, 1080, 0], [71, 1095, 0], [3, 1110, 0], [20, 1110, 0], [26, 1110, 0], [73, 1140, 0], [31, 1140, 0], [75, 1140, 0], [76, 1140, 0], [77, 1140, 0], [78, 1140, 0], [84, 1140, 0], [79, 1140, 0], [80, 1140, 0], [81, 1140, 0], [45, 1140, 0], [82, 1155, 0], [13, 1170, 0], [10, 1170, 0], [35, 1200, 0], [23, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 3, 3, 3, 4, 26, 26, 30, 30, 36, 38, 44, 46, 67, 70, 75, 75, 76, 76, 76, 76, 76, 76, 79, 80, 91, 91, 91, 93, 95, 96, 96, 96, 106, 107, 107, 108, 108, 108, 108, 108, 108, 108, 108, 108, 108, 108, 108, 108, 108, 108, 108], "order": [[36, 600, 0], [37, 600, 0], [46, 630, 0], [47, 705, 0], [38, 720, 0], [48, 720, 0], [49, 720, 0], [85, 720, 0], [39, 720, 0], [50, 720, 0], [0, 720, 0], [51, 720, 0], [52, 720, 0], [53, 720, 0], [54, 720, 0], [55, 720, 0], [40, 720, 0], [56, 720, 0], [57, 720, 0], [58, 720, 0], [41, 720, 0], [59, 720, 0], [60, 720, 0], [86, 720, 0], [86, 720, 0], [61, 720, 0], [62, 750, 0], [63, 750, 0], [64, 750, 0], [65, 750, 0], [66, 780, 0], [42, 780, 0], [67, 780, 0], [43, 780, 0], [44, 780, 0], [21, 780, 0], [24, 795, 0], [68, 795, 0], [6, 810, 0], [3, 810, 0], [8, 810, 0], [69, 810, 0], [9, 810, 0], [10, 810, 0], [70, 825, 0], [71, 825, 0], [13, 840, 0], [72, 840, 0], [73, 840, 0], [14, 840, 0], [31, 840, 0], [74, 840, 0], [75, 840, 0], [2, 840, 0], [17, 840, 0], [18, 840, 0], [76, 840, 0], [32, 840, 0], [20, 840, 0], [77, 840, 0], [78, 840, 0], [79, 840, 0], [22, 840, 0], [80, 840, 0], [81, 840, 0], [45, 840, 0], [23, 845, 0], [25, 855, 0], [26, 855, 0], [82, 855, 0], [5, 870, 0], [30, 870, 0], [83, 870, 0], [28, 870, 0], [84, 870, 0], [35, 900, 0], [39, 990, 0], [57, 990, 0], [59, 990, 0], [86, 1005, 0], [49, 1020, 0], [74, 1020, 0], [36, 1020, 0], [63, 1020, 0], [51, 1020, 0], [52, 1020, 0], [67, 1020, 0], [44, 1020, 0], [60, 1020, 0], [37, 1020, 0], [61, 1020, 0], [72, 1065, 0], [70, 1065, 0], [31, 1080, 0], [68, 1080, 0], [71, 1095, 0], [73, 1140, 0], [75, 1140, 0], [76, 1140, 0], [77, 1140, 0], [78, 1140, 0], [84, 1140, 0], [79, 1140, 0], [80, 1140, 0], [81, 1140, 0], [45, 1140, 0], [82, 1155, 0], [8, 1185, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 3, 3, 3, 4, 26, 26, 30, 30, 38, 40, 45, 48, 67, 70, 74, 74, 74, 74, 74, 74, 74, 74, 77, 78, 89, 89, 89, 91, 93, 94, 95, 95, 105, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106], "order": [[36, 600, 0], [37, 600, 0], [46, 630, 0], [47, 705, 0], [38, 720, 0], [48, 720, 0], [49, 720, 0], [85, 720, 0], [39, 720, 0], [50, 720, 0], [0, 720, 0], [51, 720, 0], [52, 720, 0], [53, 720, 0], [54, 720, 0], [55, 720, 0], [40, 720, 0], [56, 720, 0], [57, 720, 0], [58, 720, 0], [41, 720, 0], [59, 720, 0], [60, 720, 0], [86, 720, 0], [86, 720, 0], [61, 720, 0], [62, 750, 0], [63, 750, 0], [64, 750, 0], [65, 750, 0], [66, 780, 0], [2, 780, 0], [42, 780, 0], [3, 780, 0], [67, 780, 0], [43, 780, 0], [44, 780, 0], [21, 780, 0], [5, 795, 0], [68, 795, 0], [6, 810, 0], [8, 810, 0], [69, 810, 0], [9, 810, 0], [10, 810, 0], [70, 825, 0], [12, 825, 0], [71, 825, 0], [13, 840, 0], [72, 840, 0], [73, 840, 0], [14, 840, 0], [74, 840, 0], [75, 840, 0], [35, 840, 0], [17, 840, 0], [18, 840, 0], [76, 840, 0], [20, 840, 0], [77, 840, 0], [78, 840, 0], [79, 840, 0], [22, 840, 0], [80, 840, 0], [81, 840, 0], [45, 840, 0], [23, 845, 0], [25, 855, 0], [26, 855, 0], [82, 855, 0], [30, 870, 0], [83, 870, 0], [28, 870, 0], [84, 870, 0], [39, 990, 0], [57, 990, 0], [59, 990, 0], [86, 1005, 0], [49, 1020, 0], [74, 1020, 0], [36, 1020, 0], [63, 1020, 0], [51, 1020, 0], [52, 1020, 0], [67, 1020, 0], [44, 1020, 0], [60, 1020, 0], [37, 1020, 0], [61, 1020, 0], [72, 1065, 0], [70, 1065, 0], [31, 1080, 0], [68, 1080, 0], [71, 1095, 0], [58, 1110, 0], [73, 1140, 0], [75, 1140, 0], [76, 1140, 0], [77, 1140, 0], [78, 1140, 0], [84, 1140, 0], [79, 1140, 0], [80, 1140, 0], [81, 1140, 0], [45, 1140, 0], [82, 1155, 0]]}]}, "rules": {"Albion Pool and Health Club": [[0, 1200, 1260, "Leisure Swim", "2019-06-03", "2019-06-24", [0, 0, 983040]], [2, 1200, 1260, "Leisure Swim", "2019-06-05", "2019-06-26", [0, 0, 983040]], [4, 1170, 1230, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 245760]], [5, 840, 900, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 251658240, 0]], [6, 840, 900, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 251658240, 0]]], "Alderwood Centre": [[1, 720, 775, "Leisure Swim", "2019-06-04", "2019-06-25", [0, 983040, 0]], [2, 1155, 1210, "Leisure Swim", "2019-06-05", "2019-06-26", [0, 0, 122880]], [3, 720, 805, "Leisure Swim", "2019-06-06", "2019-06-27", [0, 4128768, 0]], [4, 1080, 1165, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 16128]], [5, 870, 955, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 4227858432, 0]], [6, 795, 955, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 4292870144, 0]]], "Alex Duff Memorial Pool": [[0, 960, 1200, "Leisure Swim", "2019-06-17", "2019-06-24", [0, 0, 65535]], [1, 960, 1200, "Leisure Swim", "2019-06-18", "2019-06-25", [0, 0, 65535]], [2, 960, 1200, "Leisure Swim", "2019-06-19", "2019-06-26", [0, 0, 65535]], [3, 960, 1200, "Leisure Swim", "2019-06-20", "2019-06-27", [0, 0, 65535]], [4, 600, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294967040, 65535]], [5, 720, 1200, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 4294901760, 65535]]], "Alexandra Park": [[4, 720, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 65535]], [5, 720, 1200, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 65535]]], "Amesbury Sports Complex": [[0, 1065, 1135, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 3968]], [1, 1065, 1135, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 3968]], [2, 1065, 1135, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 3968]], [3, 1065, 1135, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 3968]], [4, 840, 975, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4278190080, 1]], [4, 1065, 1135, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 3968]], [5, 840, 975, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4278190080, 1]], [5, 1065, 1135, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 3968]], [6, 840, 975, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4278190080, 1]], [6, 1065, 1135, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 3968]]], "Amos Waites Park Outdoor Pool": [[0, 1140, 1195, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 61440]], [1, 1140, 1195, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 61440]], [2, 1140, 1195, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 61440]], [3, 1140, 1195, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 61440]], [5, 840, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4278190080, 0]], [5, 1140, 1195, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 61440]]], "Annette Community Recreation Centre": [[2, 1155, 1210, "Leisure Swim", "2019-06-05", "2019-06-26", [0, 0, 122880]], [4, 1080, 1195, "Leisure Swim", "2019-06-07", "2019-06-21", [0, 0, 65280]], [5, 810, 895, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 264241152, 0]], [6, 810, 895, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 264241152, 0]]], "Antibes Community Centre": [[2, 1140, 1215, "Leisure Swim", "2019-06-05", "2019-06-19", [0, 0, 126976]], [4, 1095, 1195, "Leisure Swim", "2019-06-07", "2019-06-14", [0, 0, 65024]], [5, 870, 955, "Leisure Swim", "2019-06-08", "2019-06-15", [0, 4227858432, 0]], [6, 870, 955, "Leisure Swim", "2019-06-02", "2019-06-16", [0, 4227858432, 0]]], "Beaches Recreation Centre": [[5, 840, 930, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 1056964608, 0]], [6, 840, 930, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 1056964608, 0]]], "Birchmount Community Centre": [[0, 900, 1170, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 4026531840, 16383]], [1, 855, 975, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 4261412864, 1]], [2, 900, 1110, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 4026531840, 1023]], [3, 855, 975, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 4261412864, 1]], [4, 900, 1170, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4026531840, 16383]], [5, 870, 1140, "Leisure Swim", "2019-06-29", "2019-06-29", [0, 4227858432, 4095]], [6, 870, 1200, "Leisure Swim", "2019-06-30", "2019-06-30", [0, 4227858432, 65535]]], "Blantyre Park": [[4, 750, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294705152, 65535]], [5, 750, 1200, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294705152, 65535]], [6, 750, 1200, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294705152, 65535]]], "Broadlands Community Centre": [[0, 720, 955, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 4294901760, 0]], [0, 1020, 1165, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 16368]], [1, 720, 955, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 4294901760, 0]], [1, 1020, 1165, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 16368]], [2, 720, 955, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 4294901760, 0]], [2, 1020, 1165, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 16368]], [3, 720, 955, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 4294901760, 0]], [3, 1020, 1165, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 16368]], [4, 720, 955, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 0]], [4, 1020, 1165, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 16368]], [5, 720, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 0]], [5, 1020, 1165, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 16368]], [6, 720, 955, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 0]], [6, 1020, 1165, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 16368]]], "Centennial Recreation Centre - Scarborough": [[0, 825, 885, "Leisure Swim", "2019-06-03", "2019-06-24", [0, 125829120, 0]], [1, 825, 885, "Leisure Swim", "2019-06-04", "2019-06-25", [0, 125829120, 0]], [2, 825, 885, "Leisure Swim", "2019-06-05", "2019-06-26", [0, 125829120, 0]], [3, 825, 885, "Leisure Swim", "2019-06-06", "2019-06-27", [0, 125829120, 0]], [4, 825, 885, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 125829120, 0]], [4, 1140, 1260, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 1044480]], [5, 840, 960, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 4278190080, 0]], [5, 1080, 1200, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 0, 65280]], [6, 1080, 1200, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 0, 65280]]], "Cummer Park Community Centre": [[4, 1170, 1255, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 1032192]], [5, 840, 955, "Leisure Swim", "2019-06-08", "2019-06-15", [0, 4278190080, 0]], [6, 840, 955, "Leisure Swim", "2019-06-02", "2019-06-16", [0, 4278190080, 0]]], "Dennis R. Timbrell Resource Centre": [[5, 750, 835, "Leisure Swim", "2019-06-08", "2019-06-15", [0, 16515072, 0]], [6, 750, 835, "Leisure Swim", "2019-06-02", "2019-06-16", [0, 16515072, 0]]], "Domenico Di Luca Community Recreation Centre": [[0, 840, 945, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 2130706432, 0]], [0, 1020, 1135, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 4080]], [1, 840, 945, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 2130706432, 0]], [1, 1020, 1135, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 4080]], [2, 840, 945, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 2130706432, 0]], [2, 1020, 1135, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 4080]], [3, 840, 945, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 2130706432, 0]], [3, 1020, 1135, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 4080]], [4, 840, 945, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 2130706432, 0]], [4, 1020, 1135, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 4080]], [5, 840, 945, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 2130706432, 0]], [5, 1020, 1135, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 4080]], [6, 840, 945, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 2130706432, 0]], [6, 1020, 1135, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 4080]]], "Donald D. Summerville Olympic Pools": [[0, 960, 1200, "Leisure Swim", "2019-06-17", "2019-06-24", [0, 0, 65535]], [1, 960, 1200, "Leisure Swim", "2019-06-18", "2019-06-25", [0, 0, 65535]], [2, 960, 1200, "Leisure Swim", "2019-06-19", "2019-06-26", [0, 0, 65535]], [3, 960, 1200, "Leisure Swim", "2019-06-20", "2019-06-27", [0, 0, 65535]], [4, 600, 960, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294967040, 0]], [4, 1020, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 65520]], [5, 600, 960, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 4294967040, 0]], [5, 1020, 1200, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 0, 65520]], [6, 600, 960, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 4294967040, 0]], [6, 1020, 1200, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 0, 65520]]], "Douglas Snow Aquatic Centre": [[4, 1145, 1260, "Leisure Swim", "2019-06-07", "2019-06-14", [0, 0, 1044480]], [6, 840, 960, "Leisure Swim", "2019-06-02", "2019-06-16", [0, 4278190080, 0]]], "Driftwood Community Recreation Centre": [[4, 750, 985, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294705152, 3]], [4, 1020, 1165, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 16368]], [5, 750, 985, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294705152, 3]], [5, 1020, 1165, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 16368]], [6, 750, 985, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294705152, 3]], [6, 1020, 1165, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 16368]]], "Earl Beatty Community Centre": [[3, 1110, 1170, "Leisure Swim", "2019-06-06", "2019-06-27", [0, 0, 15360]]], "East York Community Centre": [[0, 1110, 1170, "Leisure Swim", "2019-06-03", "2019-06-24", [0, 0, 15360]], [3, 1110, 1200, "Leisure Swim", "2019-06-06", "2019-06-27", [0, 0, 64512]], [5, 795, 930, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 1071644672, 0]], [6, 855, 930, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 1040187392, 0]]], "Eringate Park Outdoor Pool": [[0, 1140, 1195, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 61440]], [1, 1140, 1195, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 61440]], [2, 1140, 1195, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 61440]], [3, 1140, 1195, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 61440]], [5, 840, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4278190080, 0]], [5, 1140, 1195, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 61440]]], "Etobicoke Olympium": [[4, 1200, 1255, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 983040]], [5, 900, 955, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 4026531840, 0]], [6, 840, 895, "Leisure Swim", "2019-06-09", "2019-06-30", [0, 251658240, 0]]], "Fairbank Memorial Park": [[4, 720, 1165, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 16383]], [5, 720, 1165, "Leisure Swim", "2019-06-29", "2019-06-29", [0, 4294901760, 16383]], [6, 720, 1165, "Leisure Swim", "2019-06-30", "2019-06-30", [0, 4294901760, 16383]]], "Fairhaven Park Outdoor Pool": [[5, 795, 945, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 2145386496, 0]], [5, 1080, 1135, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 3840]], [6, 795, 945, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 2145386496, 0]], [6, 1080, 1135, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 3840]]], "Gihon Spring Park Outdoor Pool": [[0, 870, 1125, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 4227858432, 2047]], [1, 870, 1125, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 4227858432, 2047]], [2, 870, 1125, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 4227858432, 2047]], [3, 870, 1125, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 4227858432, 2047]], [4, 870, 1125, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4227858432, 2047]], [5, 870, 1125, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4227858432, 2047]], [6, 870, 1125, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4227858432, 2047]]], "Giovanni Caboto Rink, Pool and Tennis Courts": [[4, 705, 1170, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294934528, 16383]], [5, 705, 1170, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294934528, 16383]], [6, 705, 1170, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294934528, 16383]]], "Glen Long Community Centre": [[4, 720, 1165, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 16383]], [5, 780, 1165, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4293918720, 16383]], [6, 780, 1165, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4293918720, 16383]]], "Gord and Irene Risk Community Centre": [[0, 825, 955, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 4286578688, 0]], [0, 1065, 1135, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 3968]], [1, 825, 955, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 4286578688, 0]], [1, 1065, 1135, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 3968]], [2, 825, 955, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 4286578688, 0]], [2, 1065, 1135, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 3968]], [3, 825, 955, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 4286578688, 0]], [3, 1065, 1135, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 3968]], [4, 825, 955, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4286578688, 0]], [4, 1065, 1135, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 3968]], [5, 825, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4286578688, 0]], [5, 1065, 1135, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 3968]], [6, 825, 955, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4286578688, 0]], [6, 1065, 1135, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 3968]]], "Grandravine Community Recreation Centre": [[0, 720, 955, "Leisure Swim", "2019-06-17", "2019-06-24", [0, 4294901760, 0]], [0, 990, 1135, "Leisure Swim", "2019-06-17", "2019-06-24", [0, 0, 4092]], [1, 720, 955, "Leisure Swim", "2019-06-18", "2019-06-25", [0, 4294901760, 0]], [1, 990, 1135, "Leisure Swim", "2019-06-18", "2019-06-25", [0, 0, 4092]], [2, 720, 955, "Leisure Swim", "2019-06-19", "2019-06-26", [0, 4294901760, 0]], [2, 990, 1135, "Leisure Swim", "2019-06-19", "2019-06-26", [0, 0, 4092]], [3, 720, 955, "Leisure Swim", "2019-06-20", "2019-06-27", [0, 4294901760, 0]], [3, 990, 1135, "Leisure Swim", "2019-06-20", "2019-06-27", [0, 0, 4092]], [4, 720, 955, "Leisure Swim", "2019-06-21", "2019-06-28", [0, 4294901760, 0]], [4, 990, 1135, "Leisure Swim", "2019-06-21", "2019-06-28", [0, 0, 4092]], [5, 720, 955, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 4294901760, 0]], [5, 990, 1075, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 0, 252]], [6, 720, 955, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 4294901760, 0]], [6, 990, 1075, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 0, 252]]], "Greenwood Park": [[4, 720, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 65535]], [5, 720, 1200, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 65535]]], "Gus Ryder Pool and Health Club": [[4, 1215, 1255, "Leisure Swim", "2019-06-07", "2019-06-21", [0, 0, 917504]], [5, 840, 925, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 1056964608, 0]], [6, 780, 865, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 66060288, 0]]], "Halbert Park": [[4, 750, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294705152, 65535]], [5, 750, 1200, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294705152, 65535]], [6, 750, 1200, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294705152, 65535]]], "Harrison Pool": [[5, 720, 870, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 67043328, 0]], [6, 720, 960, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 4294901760, 0]]], "Heron Park Community Centre": [[0, 1020, 1140, "Leisure Swim", "2019-06-17", "2019-06-24", [0, 0, 4080]], [1, 1020, 1140, "Leisure Swim", "2019-06-18", "2019-06-25", [0, 0, 4080]], [2, 1020, 1140, "Leisure Swim", "2019-06-19", "2019-06-26", [0, 0, 4080]], [3, 1020, 1140, "Leisure Swim", "2019-06-20", "2019-06-27", [0, 0, 4080]], [4, 870, 1140, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4227858432, 4095]], [5, 780, 1140, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 4293918720, 4095]], [6, 780, 1140, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 4293918720, 4095]]], "High Park": [[0, 1020, 1135, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 4080]], [1, 1020, 1135, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 4080]], [2, 1020, 1135, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 4080]], [3, 1020, 1135, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 4080]], [4, 720, 960, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 0]], [4, 1020, 1135, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 4080]], [5, 720, 960, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 0]], [5, 1020, 1135, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 4080]], [6, 720, 960, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 0]], [6, 1020, 1135, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 4080]]], "Humber Community Pool": [[2, 1140, 1195, "Leisure Swim", "2019-06-05", "2019-06-26", [0, 0, 61440]], [5, 840, 895, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 251658240, 0]], [6, 840, 895, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 251658240, 0]]], "Irving W. Chapley Community Centre": [[0, 720, 955, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 4294901760, 0]], [0, 1020, 1075, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 240]], [1, 720, 955, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 4294901760, 0]], [1, 1020, 1165, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 16368]], [2, 720, 955, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 4294901760, 0]], [2, 1020, 1075, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 240]], [3, 720, 955, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 4294901760, 0]], [3, 1020, 1165, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 16368]], [4, 720, 955, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 0]], [4, 1020, 1165, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 16368]], [5, 720, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 0]], [5, 1020, 1165, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 16368]], [6, 720, 955, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 0]], [6, 1020, 1165, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 16368]]], "Jimmie Simpson Recreation Centre": [[1, 825, 885, "Leisure Swim", "2019-06-04", "2019-06-25", [0, 125829120, 0]], [2, 1020, 1080, "Leisure Swim", "2019-06-05", "2019-06-26", [0, 0, 240]], [3, 825, 885, "Leisure Swim", "2019-06-06", "2019-06-27", [0, 125829120, 0]], [4, 825, 885, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 125829120, 0]], [4, 1020, 1140, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 4080]], [5, 855, 960, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 4261412864, 0]], [6, 855, 960, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 4261412864, 0]]], "John Innes Community Recreation Centre": [[0, 840, 900, "Leisure Swim", "2019-06-03", "2019-06-24", [0, 251658240, 0]], [2, 840, 900, "Leisure Swim", "2019-06-05", "2019-06-26", [0, 251658240, 0]], [4, 840, 900, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 251658240, 0]], [4, 960, 1020, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 15]], [5, 840, 900, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 251658240, 0]], [6, 840, 900, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 251658240, 0]]], "Joseph J. Piccininni Community Centre": [[4, 1110, 1230, "Leisure Swim", "2019-06-14", "2019-06-28", [0, 0, 261120]], [5, 810, 945, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 2143289344, 0]], [6, 780, 945, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 2146435072, 0]]], "Kidstown - Water Park": [[4, 630, 1170, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294966272, 16383]], [5, 630, 1170, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294966272, 16383]], [6, 630, 1170, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294966272, 16383]]], "Kiwanis Outdoor Pool": [[4, 720, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 65535]], [5, 720, 1200, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 65535]]], "Knob Hill Park": [[0, 780, 1200, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 4293918720, 65535]], [1, 780, 1200, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 4293918720, 65535]], [2, 780, 1200, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 4293918720, 65535]], [3, 780, 1200, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 4293918720, 65535]], [4, 780, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4293918720, 65535]], [5, 720, 1200, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 65535]]], "Lambton - Kingsway Park Outdoor Pool": [[0, 1140, 1195, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 61440]], [1, 1140, 1195, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 61440]], [2, 1140, 1195, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 61440]], [3, 1140, 1195, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 61440]], [5, 840, 985, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4278190080, 3]], [5, 1140, 1195, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 61440]]], "Lawrence Heights Community Centre": [[0, 780, 985, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 4293918720, 3]], [1, 780, 985, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 4293918720, 3]], [2, 780, 985, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 4293918720, 3]], [3, 780, 985, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 4293918720, 3]], [4, 780, 985, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4293918720, 3]], [4, 1020, 1135, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 4080]], [5, 780, 985, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4293918720, 3]], [5, 1020, 1135, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 4080]], [6, 780, 985, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4293918720, 3]], [6, 1020, 1135, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 4080]]], "Leaside Memorial Gardens Swimming Pool - Indoor Pool": [[5, 840, 930, "Leisure Swim", "2019-06-08", "2019-06-22", [0, 1056964608, 0]], [6, 840, 930, "Leisure Swim", "2019-06-02", "2019-06-23", [0, 1056964608, 0]]], "Leaside Outdoor Pool": [[4, 720, 1170, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 16383]], [5, 720, 1170, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 16383]], [6, 720, 1170, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 16383]]], "Main Square Community Centre": [[0, 1110, 1200, "Leisure Swim", "2019-06-03", "2019-06-10", [0, 0, 64512]], [2, 960, 1050, "Leisure Swim", "2019-06-05", "2019-06-12", [0, 0, 63]], [6, 810, 930, "Leisure Swim", "2019-06-02", "2019-06-09", [0, 1069547520, 0]]], "Mary McCormick Recreation Centre": [[0, 540, 585, "Leisure Swim", "2019-06-03", "2019-06-24", [0, 112, 0]], [0, 1080, 1200, "Leisure Swim", "2019-06-10", "2019-06-24", [0, 0, 65280]], [1, 605, 660, "Leisure Swim", "2019-06-04", "2019-06-25", [0, 3840, 0]], [1, 1080, 1200, "Leisure Swim", "2019-06-04", "2019-06-25", [0, 0, 65280]], [2, 540, 585, "Leisure Swim", "2019-06-05", "2019-06-26", [0, 112, 0]], [2, 1065, 1200, "Leisure Swim", "2019-06-12", "2019-06-26", [0, 0, 65408]], [3, 1080, 1200, "Leisure Swim", "2019-06-13", "2019-06-27", [0, 0, 65280]], [4, 605, 660, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 3840, 0]], [4, 1080, 1200, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 65280]], [5, 840, 975, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 4278190080, 1]]], "Maryvale Park Outdoor Pool": [[4, 750, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294705152, 65535]], [5, 750, 1200, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294705152, 65535]], [6, 750, 1200, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294705152, 65535]]], "Matty Eckler Recreation Centre": [[0, 690, 750, "Leisure Swim", "2019-06-03", "2019-06-17", [0, 245760, 0]], [1, 700, 750, "Leisure Swim", "2019-06-04", "2019-06-18", [0, 245760, 0]], [2, 690, 750, "Leisure Swim", "2019-06-05", "2019-06-26", [0, 245760, 0]], [3, 700, 750, "Leisure Swim", "2019-06-06", "2019-06-20", [0, 245760, 0]], [4, 690, 750, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 245760, 0]], [5, 870, 960, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 4227858432, 0]], [6, 870, 960, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 4227858432, 0]]], "McGregor Park Community Centre": [[0, 960, 1200, "Leisure Swim", "2019-06-17", "2019-06-24", [0, 0, 65535]], [1, 960, 1200, "Leisure Swim", "2019-06-18", "2019-06-25", [0, 0, 65535]], [2, 960, 1200, "Leisure Swim", "2019-06-19", "2019-06-26", [0, 0, 65535]], [3, 960, 1200, "Leisure Swim", "2019-06-20", "2019-06-27", [0, 0, 65535]], [4, 855, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4261412864, 65535]], [5, 720, 1200, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 4294901760, 65535]]], "Memorial Pool and Health Club": [[0, 915, 955, "Leisure Swim", "2019-06-03", "2019-06-17", [0, 3758096384, 0]], [0, 1215, 1270, "Leisure Swim", "2019-06-03", "2019-06-17", [0, 0, 1966080]], [2, 900, 955, "Leisure Swim", "2019-06-05", "2019-06-19", [0, 4026531840, 0]], [4, 915, 955, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 3758096384, 0]], [5, 845, 895, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 251658240, 0]], [6, 845, 895, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 251658240, 0]]], "Monarch Park": [[4, 720, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 65535]], [5, 720, 1200, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 65535]]], "Norseman Community School And Pool": [[6, 820, 945, "Leisure Swim", "2019-06-02", "2019-06-09", [0, 2143289344, 0]]], "North Toronto Memorial Community Centre": [[2, 585, 645, "Leisure Swim", "2019-06-05", "2019-06-26", [0, 1920, 0]], [4, 1110, 1185, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 31744]], [5, 840, 930, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 1056964608, 0]], [6, 840, 930, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 1056964608, 0]]], "Oakdale Community Centre": [[4, 720, 955, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 0]], [4, 990, 1135, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 4092]], [5, 720, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 0]], [5, 990, 1075, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 252]], [6, 720, 955, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 0]], [6, 990, 1075, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 252]]], "Ourland Park Outdoor Pool": [[0, 1140, 1195, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 61440]], [1, 1140, 1195, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 61440]], [2, 1140, 1195, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 61440]], [3, 1140, 1195, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 61440]], [5, 840, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4278190080, 0]], [5, 1140, 1195, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 61440]]], "Pam McConnell Aquatic Centre": [[2, 1080, 1195, "Leisure Swim", "2019-06-05", "2019-06-12", [0, 0, 65280]], [4, 1080, 1195, "Leisure Swim", "2019-06-07", "2019-06-21", [0, 0, 65280]], [5, 810, 1015, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 4290772992, 15]], [5, 1185, 1270, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 0, 2064384]], [6, 810, 1015, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 4290772992, 15]]], "Park Lawn Park": [[0, 1140, 1195, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 61440]], [1, 1140, 1195, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 61440]], [2, 1140, 1195, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 61440]], [3, 1140, 1195, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 61440]], [5, 840, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4278190080, 0]], [5, 1140, 1195, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 61440]]], "Parkdale Community Recreation Centre": [[6, 900, 960, "Leisure Swim", "2019-06-02", "2019-06-09", [0, 4026531840, 0]]], "Parkway Forest Outdoor Pool": [[0, 960, 1110, "Leisure Swim", "2019-06-17", "2019-06-24", [0, 0, 1023]], [1, 960, 1110, "Leisure Swim", "2019-06-18", "2019-06-25", [0, 0, 1023]], [2, 960, 1110, "Leisure Swim", "2019-06-19", "2019-06-26", [0, 0, 1023]], [3, 960, 1110, "Leisure Swim", "2019-06-20", "2019-06-27", [0, 0, 1023]], [4, 780, 1110, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4293918720, 1023]], [5, 780, 1110, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 4293918720, 1023]], [6, 780, 1110, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 4293918720, 1023]]], "Pine Point Park Outdoor Pool": [[0, 1020, 1195, "Leisure Swim", "2019-06-17", "2019-06-24", [0, 0, 65520]], [1, 1020, 1195, "Leisure Swim", "2019-06-18", "2019-06-25", [0, 0, 65520]], [2, 1020, 1195, "Leisure Swim", "2019-06-19", "2019-06-26", [0, 0, 65520]], [3, 1020, 1195, "Leisure Swim", "2019-06-20", "2019-06-27", [0, 0, 65520]], [4, 780, 955, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4293918720, 0]], [4, 1020, 1195, "Leisure Swim", "2019-06-21", "2019-06-28", [0, 0, 65520]], [5, 780, 955, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 4293918720, 0]], [5, 1020, 1195, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 0, 65520]], [6, 780, 955, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 4293918720, 0]], [6, 1020, 1195, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 0, 65520]]], "Pleasantview Community Centre": [[2, 1110, 1170, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 15360]], [4, 720, 1135, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 4095]], [5, 720, 1135, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 4095]], [6, 720, 1105, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 1023]], [6, 1110, 1170, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 15360]]], "Richmond Gardens Pool": [[0, 1140, 1195, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 61440]], [1, 1140, 1195, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 61440]], [2, 1140, 1195, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 61440]], [3, 1140, 1195, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 61440]], [4, 870, 985, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4227858432, 3]], [4, 1140, 1195, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 61440]], [5, 870, 985, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4227858432, 3]], [5, 1140, 1195, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 61440]], [6, 870, 985, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4227858432, 3]], [6, 1140, 1195, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 61440]]], "Riverdale Park East": [[0, 960, 1200, "Leisure Swim", "2019-06-17", "2019-06-24", [0, 0, 65535]], [1, 960, 1200, "Leisure Swim", "2019-06-18", "2019-06-25", [0, 0, 65535]], [2, 960, 1200, "Leisure Swim", "2019-06-19", "2019-06-26", [0, 0, 65535]], [3, 960, 1200, "Leisure Swim", "2019-06-20", "2019-06-27", [0, 0, 65535]], [4, 720, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 65535]], [5, 720, 1200, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 4294901760, 65535]]], "Roding Community Centre": [[0, 990, 1135, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 4092]], [1, 990, 1135, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 4092]], [2, 990, 1135, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 4092]], [3, 990, 1135, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 4092]], [4, 720, 955, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 0]], [4, 990, 1135, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 4092]], [5, 720, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 0]], [5, 990, 1135, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 4092]], [6, 720, 955, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 0]], [6, 990, 1135, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 4092]]], "Rotary Peace Park Outdoor Pool": [[0, 1140, 1195, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 61440]], [1, 1140, 1195, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 61440]], [2, 1140, 1195, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 61440]], [3, 1140, 1195, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 61440]], [4, 840, 955, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4278190080, 0]], [4, 1140, 1195, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 61440]], [5, 840, 985, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4278190080, 3]], [5, 1140, 1195, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 61440]]], "Scadding Court Community Centre": [[4, 1020, 1130, "Leisure Swim", "2019-06-14", "2019-06-28", [0, 0, 4080]], [5, 780, 950, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 4293918720, 0]], [6, 780, 950, "Leisure Swim", "2019-06-09", "2019-06-30", [0, 4293918720, 0]]], "Smithfield Park Outdoor Pool": [[0, 810, 1185, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 4290772992, 32767]], [1, 810, 1185, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 4290772992, 32767]], [2, 870, 1185, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 4227858432, 32767]], [3, 810, 1185, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 4290772992, 32767]], [4, 870, 1185, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4227858432, 32767]], [5, 810, 1185, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4290772992, 32767]], [6, 810, 1005, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4290772992, 7]]], "Smythe Park": [[0, 1020, 1135, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 4080]], [1, 1020, 1135, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 4080]], [2, 1020, 1135, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 4080]], [3, 1020, 1135, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 4080]], [4, 720, 955, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 0]], [4, 1020, 1135, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 4080]], [5, 720, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 0]], [5, 1020, 1135, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 4080]], [6, 720, 955, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 0]], [6, 1020, 1135, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 4080]]], "Stanley Park South - Toronto": [[4, 720, 1200, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 65535]], [5, 720, 1200, "Leisure Swim", "2019-06-29", "2019-06-29", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-06-30", "2019-06-30", [0, 4294901760, 65535]]], "Sunnyside Gus Ryder Outdoor Pool": [[0, 1020, 1200, "Leisure Swim", "2019-06-17", "2019-06-24", [0, 0, 65520]], [1, 1020, 1200, "Leisure Swim", "2019-06-18", "2019-06-25", [0, 0, 65520]], [2, 1020, 1200, "Leisure Swim", "2019-06-19", "2019-06-26", [0, 0, 65520]], [3, 1020, 1200, "Leisure Swim", "2019-06-20", "2019-06-27", [0, 0, 65520]], [4, 600, 945, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 2147483392, 0]], [4, 1020, 1200, "Leisure Swim", "2019-06-21", "2019-06-28", [0, 0, 65520]], [5, 600, 945, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 2147483392, 0]], [5, 1020, 1200, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 0, 65520]], [6, 600, 945, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 2147483392, 0]], [6, 1020, 1200, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 0, 65520]]], "Swansea Community Recreation Centre": [[6, 825, 945, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 2139095040, 0]]], "The Elms Pool and Community School": [[1, 1200, 1255, "Leisure Swim", "2019-06-04", "2019-06-25", [0, 0, 983040]], [3, 1200, 1255, "Leisure Swim", "2019-06-06", "2019-06-27", [0, 0, 983040]], [5, 810, 925, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 1069547520, 0]], [6, 810, 925, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 1069547520, 0]]], "Toronto Pan Am Sports Centre": [[2, 630, 720, "Leisure Swim", "2019-06-05", "2019-06-26", [0, 64512, 0]], [3, 570, 690, "Leisure Swim", "2019-06-06", "2019-06-27", [0, 16320, 0]], [4, 1110, 1230, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 261120]], [5, 855, 960, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 4261412864, 0]], [6, 855, 960, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 4261412864, 0]]], "Trinity Community Recreation Centre": [[4, 990, 1075, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 252]], [5, 840, 955, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 4278190080, 0]], [6, 840, 955, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 4278190080, 0]]], "Vaughan Road Academy": [[1, 1200, 1260, "Leisure Swim", "2019-06-04", "2019-06-11", [0, 0, 983040]], [3, 1200, 1260, "Leisure Swim", "2019-06-06", "2019-06-13", [0, 0, 983040]], [5, 990, 1110, "Leisure Swim", "2019-06-08", "2019-06-15", [0, 0, 1020]]], "Wallace Emerson Community Centre": [[1, 545, 600, "Leisure Swim", "2019-06-04", "2019-06-25", [0, 240, 0]], [1, 1080, 1140, "Leisure Swim", "2019-06-04", "2019-06-25", [0, 0, 3840]], [3, 545, 600, "Leisure Swim", "2019-06-06", "2019-06-27", [0, 240, 0]], [3, 780, 900, "Leisure Swim", "2019-06-06", "2019-06-27", [0, 267386880, 0]], [3, 1080, 1140, "Leisure Swim", "2019-06-06", "2019-06-27", [0, 0, 3840]], [4, 600, 660, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 3840, 0]], [4, 1080, 1200, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 65280]], [6, 780, 990, "Leisure Swim", "2019-06-02", "2019-06-23", [0, 4293918720, 3]]], "Wedgewood Park  Outdoor Pool": [[0, 1140, 1195, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 61440]], [1, 1140, 1195, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 61440]], [2, 1140, 1195, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 61440]], [3, 1140, 1195, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 61440]], [5, 840, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4278190080, 0]], [5, 1140, 1195, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 61440]]], "West Deane Park Outdoor Pool": [[0, 1140, 1195, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 61440]], [1, 1140, 1195, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 61440]], [2, 1140, 1195, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 61440]], [3, 1140, 1195, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 61440]], [5, 840, 985, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4278190080, 3]], [5, 1140, 1195, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 61440]]], "West Mall Outdoor Pool": [[0, 1140, 1195, "Leisure Swim", "2019-06-17", "2019-06-24", [0, 0, 61440]], [1, 1140, 1195, "Leisure Swim", "2019-06-18", "2019-06-25", [0, 0, 61440]], [2, 1140, 1195, "Leisure Swim", "2019-06-19", "2019-06-26", [0, 0, 61440]], [3, 1140, 1195, "Leisure Swim", "2019-06-20", "2019-06-27", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-06-21", "2019-06-28", [0, 0, 61440]], [5, 840, 955, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 4278190080, 0]], [5, 1140, 1195, "Leisure Swim", "2019-06-15", "2019-06-29", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-06-16", "2019-06-30", [0, 0, 61440]]], "Westgrove Park Outdoor Pool": [[0, 1095, 1165, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 15872]], [1, 1095, 1165, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 15872]], [2, 1095, 1165, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 15872]], [3, 1095, 1165, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 15872]], [4, 825, 955, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4286578688, 0]], [4, 1095, 1165, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 15872]], [5, 825, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4286578688, 0]], [5, 1095, 1165, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 15872]], [6, 825, 955, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4286578688, 0]], [6, 1095, 1165, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 15872]]], "Westmount Park Outdoor Pool": [[0, 1155, 1195, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 57344]], [1, 1155, 1195, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 57344]], [2, 1155, 1195, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 57344]], [3, 1155, 1195, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 57344]], [4, 855, 975, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4261412864, 1]], [4, 1155, 1195, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 57344]], [5, 855, 975, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4261412864, 1]], [5, 1155, 1195, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 57344]], [6, 855, 975, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4261412864, 1]], [6, 1155, 1195, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 57344]]], "Weston Lions Park": [[0, 1020, 1170, "Leisure Swim", "2019-06-24", "2019-06-24", [0, 0, 16368]], [1, 1020, 1170, "Leisure Swim", "2019-06-25", "2019-06-25", [0, 0, 16368]], [2, 1020, 1170, "Leisure Swim", "2019-06-26", "2019-06-26", [0, 0, 16368]], [3, 1020, 1170, "Leisure Swim", "2019-06-27", "2019-06-27", [0, 0, 16368]], [4, 720, 955, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 4294901760, 0]], [4, 1020, 1170, "Leisure Swim", "2019-06-28", "2019-06-28", [0, 0, 16368]], [5, 720, 955, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 4294901760, 0]], [5, 1020, 1170, "Leisure Swim", "2019-06-22", "2019-06-29", [0, 0, 16368]], [6, 720, 955, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 4294901760, 0]], [6, 1020, 1170, "Leisure Swim", "2019-06-23", "2019-06-30", [0, 0, 16368]]], "York Recreation Centre": [[1, 1170, 1245, "Leisure Swim", "2019-06-04", "2019-06-25", [0, 0, 507904]], [3, 1170, 1245, "Leisure Swim", "2019-06-06", "2019-06-27", [0, 0, 507904]], [4, 1170, 1290, "Leisure Swim", "2019-06-07", "2019-06-28", [0, 0, 4177920]], [5, 810, 945, "Leisure Swim", "2019-06-08", "2019-06-29", [0, 2143289344, 0]], [6, 810, 945, "Leisure Swim", "2019-06-02", "2019-06-30", [0, 2143289344, 0]]]}, "slots": {"Albion Pool and Health Club": {"2019-06-09": [0, 0, 0], "2019-06-15": [0, 0, 0]}, "Alderwood Centre": {"2019-06-09": [0, 0, 0], "2019-06-23": [0, 0, 0]}, "Alex Duff Memorial Pool": {"2019-06-21": [0, 0, 65535]}, "Alexandra Park": {"2019-06-24": [0, 0, 65535], "2019-06-25": [0, 0, 65535], "2019-06-26": [0, 0, 65535], "2019-06-27": [0, 0, 65535]}, "Birchmount Community Centre": {"2019-06-02": [0, 0, 16368], "2019-06-03": [0, 0, 253952], "2019-06-07": [0, 0, 262080]}, "Blantyre Park": {"2019-06-24": [0, 0, 65520], "2019-06-25": [0, 0, 65520], "2019-06-26": [0, 0, 65520], "2019-06-27": [0, 0, 65520]}, "Cummer Park Community Centre": {"2019-06-09": [0, 0, 0], "2019-06-28": [0, 0, 0]}, "Donald D. Summerville Olympic Pools": {"2019-06-21": [0, 0, 65535]}, "Douglas Snow Aquatic Centre": {"2019-06-09": [0, 0, 0], "2019-06-15": [0, 4278190080, 0]}, "Driftwood Community Recreation Centre": {"2019-06-24": [0, 0, 16383], "2019-06-25": [0, 0, 16383], "2019-06-26": [0, 0, 16383], "2019-06-27": [0, 0, 16383]}, "East York Community Centre": {"2019-06-30": [0, 0, 0]}, "Fairbank Memorial Park": {"2019-06-22": [0, 0, 16383], "2019-06-23": [0, 0, 16383], "2019-06-24": [0, 0, 16383], "2019-06-25": [0, 0, 16383], "2019-06-26": [0, 0, 16383], "2019-06-27": [0, 0, 16383]}, "Giovanni Caboto Rink, Pool and Tennis Courts": {"2019-06-24": [0, 0, 16368], "2019-06-25": [0, 0, 16368], "2019-06-26": [0, 0, 16368], "2019-06-27": [0, 0, 16368]}, "Glen Long Community Centre": {"2019-06-24": [0, 0, 16383], "2019-06-25": [0, 0, 16383], "2019-06-26": [0, 0, 16383], "2019-06-27": [0, 0, 16383]}, "Greenwood Park": {"2019-06-24": [0, 0, 65535], "2019-06-25": [0, 0, 65535], "2019-06-26": [0, 0, 65535], "2019-06-27": [0, 0, 65535]}, "Halbert Park": {"2019-06-24": [0, 0, 65520], "2019-06-25": [0, 0, 65520], "2019-06-26": [0, 0, 65520], "2019-06-27": [0, 0, 65520]}, "Heron Park Community Centre": {"2019-06-21": [0, 0, 4080]}, "Kidstown - Water Park": {"2019-06-24": [0, 0, 16383], "2019-06-25": [0, 0, 16383], "2019-06-26": [0, 0, 16383], "2019-06-27": [0, 0, 16383]}, "Kiwanis Outdoor Pool": {"2019-06-24": [0, 0, 65535], "2019-06-25": [0, 0, 65535], "2019-06-26": [0, 0, 65535], "2019-06-27": [0, 0, 65535]}, "Lawrence Heights Community Centre": {"2019-06-24": [0, 4293918720, 4095], "2019-06-25": [0, 4293918720, 4095], "2019-06-26": [0, 4293918720, 4095], "2019-06-27": [0, 4293918720, 4095]}, "Leaside Outdoor Pool": {"2019-06-24": [0, 0, 16383], "2019-06-25": [0, 0, 16383], "2019-06-26": [0, 0, 16383], "2019-06-27": [0, 0, 16383]}, "Main Square Community Centre": {"2019-06-07": [0, 0, 258048], "2019-06-08": [0, 1069547520, 0]}, "Mary McCormick Recreation Centre": {"2019-06-03": [0, 112, 3840], "2019-06-08": [0, 4160749568, 1]}, "Maryvale Park Outdoor Pool": {"2019-06-24": [0, 0, 65535], "2019-06-25": [0, 0, 65535], "2019-06-26": [0, 0, 65535], "2019-06-27": [0, 0, 65535]}, "Matty Eckler Recreation Centre": {"2019-06-26": [0, 0, 0], "2019-06-28": [0, 0, 0]}, "McGregor Park Community Centre": {"2019-06-21": [0, 0, 65535]}, "Memorial Pool and Health Club": {"2019-06-07": [0, 3758096384, 2031616], "2019-06-24": [0, 0, 2031616], "2019-06-26": [0, 0, 130560], "2019-06-28": [0, 3758096384, 2031616]}, "Monarch Park": {"2019-06-24": [0, 0, 65535], "2019-06-25": [0, 0, 65535], "2019-06-26": [0, 0, 65535], "2019-06-27": [0, 0, 65535]}, "Norseman Community School And Pool": {"2019-06-03": [0, 0, 245760], "2019-06-04": [0, 0, 245760], "2019-06-07": [0, 0, 983040]}, "Oakdale Community Centre": {"2019-06-24": [0, 0, 4095], "2019-06-25": [0, 0, 4095], "2019-06-26": [0, 0, 4095], "2019-06-27": [0, 0, 4095]}, "Pam McConnell Aquatic Centre": {"2019-06-14": [0, 0, 0], "2019-06-16": [0, 0, 0]}, "Parkdale Community Recreation Centre": {"2019-06-08": [0, 4026531840, 0]}, "Parkway Forest Outdoor Pool": {"2019-06-21": [0, 0, 1023]}, "Pleasantview Community Centre": {"2019-06-24": [0, 0, 4095], "2019-06-25": [0, 0, 4095], "2019-06-26": [0, 0, 16383], "2019-06-27": [0, 0, 1023]}, "Riverdale Park East": {"2019-06-21": [0, 0, 65535]}, "Scadding Court Community Centre": {"2019-06-02": [0, 4278190080, 0], "2019-06-07": [0, 0, 240]}, "Stanley Park South - Toronto": {"2019-06-24": [0, 0, 65535], "2019-06-25": [0, 0, 65535], "2019-06-26": [0, 0, 65535], "2019-06-27": [0, 0, 65535], "2019-06-29": [0, 4294901760, 65535], "2019-06-30": [0, 4294901760, 65535]}, "The Elms Pool and Community School": {"2019-06-07": [0, 1069547520, 0]}, "Wallace Emerson Community Centre": {"2019-06-28": [0, 0, 65280]}}});
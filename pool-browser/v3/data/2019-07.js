@@ -0,0 +1 @@
+onMonthData("2019-07", {"alternatives": {"pools": [], "sessions": {}}, "exceptions": {"Birchmount Community Centre": {"2019-07-01": []}, "Broadlands Community Centre": {"2019-07-01": []}, "East York Community Centre": {"2019-07-01": []}, "Grandravine Community Recreation Centre": {"2019-07-01": []}, "Harrison Pool": {"2019-07-07": []}, "Irving W. Chapley Community Centre": {"2019-07-01": []}, "Lawrence Heights Community Centre": {"2019-07-01": []}, "Roding Community Centre": {"2019-07-01": []}, "Scadding Court Community Centre": {"2019-07-06": []}}, "next_openings": {"dates": {"2019-07-01": 0, "2019-07-02": 1, "2019-07-03": 2, "2019-07-04": 3, "2019-07-05": 4, "2019-07-06": 5, "2019-07-07": 6, "2019-07-08": 7, "2019-07-09": 8, "2019-07-10": 9, "2019-07-11": 10, "2019-07-12": 11, "2019-07-13": 12, "2019-07-14": 13, "2019-07-15": 7, "2019-07-16": 8, "2019-07-17": 14, "2019-07-18": 10, "2019-07-19": 15, "2019-07-20": 16, "2019-07-21": 13, "2019-07-22": 7, "2019-07-23": 8, "2019-07-24": 14, "2019-07-25": 10, "2019-07-26": 15, "2019-07-27": 16}, "pools": ["Alex Duff Memorial Pool", "Donald D. Summerville Olympic Pools", "Sunnyside Gus Ryder Outdoor Pool", "Kidstown - Water Park", "Giovanni Caboto Rink, Pool and Tennis Courts", "Alexandra Park", "Fairbank Memorial Park", "Greenwood Park", "High Park", "Kiwanis Outdoor Pool", "Leaside Outdoor Pool", "Monarch Park", "Riverdale Park East", "Smythe Park", "Stanley Park South - Toronto", "Weston Lions Park", "Blantyre Park", "Halbert Park", "Maryvale Park Outdoor Pool", "Knob Hill Park", "Parkway Forest Outdoor Pool", "Pine Point Park Outdoor Pool", "Fairhaven Park Outdoor Pool", "Smithfield Park Outdoor Pool", "Gord and Irene Risk Community Centre", "Westgrove Park Outdoor Pool", "Amesbury Sports Complex", "Amos Waites Park Outdoor Pool", "Domenico Di Luca Community Recreation Centre", "Eringate Park Outdoor Pool", "Lambton - Kingsway Park Outdoor Pool", "Ourland Park Outdoor Pool", "Park Lawn Park", "Rotary Peace Park Outdoor Pool", "Wedgewood Park  Outdoor Pool", "West Deane Park Outdoor Pool", "West Mall Outdoor Pool", "McGregor Park Community Centre", "Westmount Park Outdoor Pool", "Gihon Spring Park Outdoor Pool", "Richmond Gardens Pool", "Jimmie Simpson Recreation Centre", "Matty Eckler Recreation Centre", "Broadlands Community Centre", "Glen Long Community Centre", "Grandravine Community Recreation Centre", "Irving W. Chapley Community Centre", "Oakdale Community Centre", "Pleasantview Community Centre", "Roding Community Centre", "Alderwood Centre", "Beaches Recreation Centre", "Driftwood Community Recreation Centre", "Bedford Park Community Centre", "Hillcrest Community Centre", "Lawrence Heights Community Centre", "East York Community Centre", "Cedarbrae Collegiate Institute", "Cummer Park Community Centre", "Dennis R. Timbrell Resource Centre", "Leaside Memorial Gardens Swimming Pool - Indoor Pool", "Douglas Snow Aquatic Centre", "Etobicoke Olympium", "Pam McConnell Aquatic Centre", "Sir Oliver Mowat Collegiate Institute", "St. Lawrence Community Recreation Centre", "Birchmount Community Centre", "Swansea Community Recreation Centre", "Annette Community Recreation Centre", "Antibes Community Centre", "Earl Beatty Community Centre", "Heron Park Community Centre", "L'Amoreaux Collegiate Institute", "York Recreation Centre", "Centennial Recreation Centre - Scarborough", "Norseman Community School And Pool", "Toronto Pan Am Sports Centre", "Albion Pool and Health Club", "CW Jefferys Collegiate Institute", "Gus Ryder Pool and Health Club", "Wexford Collegiate Institute", "Trinity Community Recreation Centre", "Main Square Community Centre", "Parkdale Community Recreation Centre", "Wallace Emerson Community Centre", "The Elms Pool and Community School", "Mary McCormick Recreation Centre", "Frankland Community Centre", "Runnymede Collegiate Institute", "Lester B. Pearson Collegiate Institute", "The New Generation Youth Recreation Centre", "West Hill Collegiate Institute", "Humber Community Pool", "Fairmount Park Community Centre", "North Toronto Memorial Community Centre", "Scadding Court Community Centre", "S.H. Armstrong Community Centre", "Harrison Pool"], "programs": ["Leisure Swim"], "tables": [{"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 4, 4, 4, 4, 4, 5, 16, 16, 19, 19, 22, 23, 24, 26, 37, 39, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 48, 48, 48, 50, 51, 52, 52, 52, 62, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63], "order": [[0, 600, 0], [1, 600, 0], [2, 600, 0], [3, 630, 0], [4, 705, 0], [5, 720, 0], [6, 720, 0], [7, 720, 0], [8, 720, 0], [9, 720, 0], [10, 720, 0], [11, 720, 0], [12, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [16, 750, 0], [17, 750, 0], [18, 750, 0], [19, 780, 0], [20, 780, 0], [21, 780, 0], [22, 795, 0], [23, 810, 0], [24, 825, 0], [25, 825, 0], [26, 840, 0], [27, 840, 0], [28, 840, 0], [29, 840, 0], [30, 840, 0], [31, 840, 0], [32, 840, 0], [33, 840, 0], [34, 840, 0], [35, 840, 0], [36, 840, 0], [37, 855, 0], [38, 855, 0], [39, 870, 0], [40, 870, 0], [28, 1020, 0], [1, 1020, 0], [8, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [22, 1080, 0], [25, 1095, 0], [27, 1140, 0], [29, 1140, 0], [30, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [38, 1155, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 5, 5, 6, 6, 7, 8, 26, 27, 32, 32, 38, 40, 46, 48, 64, 70, 78, 81, 84, 84, 86, 86, 87, 87, 90, 90, 100, 100, 100, 102, 109, 110, 110, 110, 121, 123, 125, 125, 126, 126, 126, 126, 126, 126, 126, 126, 126, 126, 126, 126, 126, 126, 126], "order": [[0, 600, 0], [1, 600, 0], [2, 600, 0], [41, 630, 0], [3, 630, 0], [9, 660, 0], [42, 690, 0], [4, 705, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [44, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [10, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [50, 735, 0], [51, 750, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [53, 780, 0], [54, 780, 0], [19, 780, 0], [55, 780, 0], [20, 780, 0], [21, 780, 0], [56, 795, 0], [22, 795, 0], [57, 810, 0], [58, 810, 0], [59, 810, 0], [41, 810, 0], [60, 810, 0], [23, 810, 0], [24, 825, 0], [25, 825, 0], [26, 840, 0], [27, 840, 0], [28, 840, 0], [61, 840, 0], [29, 840, 0], [62, 840, 0], [30, 840, 0], [31, 840, 0], [63, 840, 0], [32, 840, 0], [33, 840, 0], [64, 840, 0], [65, 840, 0], [34, 840, 0], [35, 840, 0], [36, 840, 0], [50, 855, 0], [66, 855, 0], [56, 855, 0], [37, 855, 0], [67, 855, 0], [38, 855, 0], [68, 870, 0], [69, 870, 0], [70, 870, 0], [39, 870, 0], [71, 870, 0], [72, 870, 0], [40, 870, 0], [73, 870, 0], [74, 885, 0], [75, 885, 0], [76, 885, 0], [77, 900, 0], [78, 900, 0], [79, 900, 0], [41, 930, 0], [80, 930, 0], [81, 960, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [54, 1080, 0], [41, 1080, 0], [82, 1080, 0], [83, 1080, 0], [84, 1080, 0], [25, 1095, 0], [27, 1140, 0], [68, 1140, 0], [29, 1140, 0], [30, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [76, 1155, 0], [38, 1155, 0], [69, 1170, 0], [62, 1170, 0], [85, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 4, 4, 5, 5, 5, 5, 6, 7, 26, 26, 31, 32, 38, 40, 46, 48, 66, 70, 79, 82, 87, 87, 89, 89, 91, 91, 94, 94, 106, 106, 107, 109, 114, 115, 116, 116, 128, 129, 131, 131, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132], "order": [[86, 540, 0], [0, 600, 0], [1, 600, 0], [2, 600, 0], [3, 630, 0], [42, 690, 0], [4, 705, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [87, 720, 0], [44, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [10, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [51, 750, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [85, 765, 0], [53, 780, 0], [54, 780, 0], [19, 780, 0], [55, 780, 0], [20, 780, 0], [21, 780, 0], [22, 795, 0], [88, 795, 0], [58, 810, 0], [59, 810, 0], [41, 810, 0], [60, 810, 0], [42, 810, 0], [73, 810, 0], [24, 825, 0], [25, 825, 0], [26, 840, 0], [27, 840, 0], [28, 840, 0], [61, 840, 0], [29, 840, 0], [62, 840, 0], [30, 840, 0], [89, 840, 0], [31, 840, 0], [63, 840, 0], [32, 840, 0], [33, 840, 0], [65, 840, 0], [90, 840, 0], [34, 840, 0], [35, 840, 0], [91, 840, 0], [36, 840, 0], [50, 855, 0], [37, 855, 0], [67, 855, 0], [38, 855, 0], [68, 870, 0], [69, 870, 0], [57, 870, 0], [70, 870, 0], [39, 870, 0], [71, 870, 0], [72, 870, 0], [40, 870, 0], [23, 870, 0], [74, 885, 0], [75, 885, 0], [76, 885, 0], [77, 900, 0], [66, 900, 0], [78, 900, 0], [79, 900, 0], [92, 900, 0], [41, 930, 0], [80, 930, 0], [82, 960, 0], [81, 960, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [41, 1020, 0], [55, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [93, 1050, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [54, 1080, 0], [41, 1080, 0], [83, 1080, 0], [25, 1095, 0], [48, 1110, 0], [27, 1140, 0], [29, 1140, 0], [30, 1140, 0], [42, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [75, 1145, 0], [38, 1155, 0], [69, 1170, 0], [62, 1170, 0], [92, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 4, 4, 6, 6, 6, 6, 7, 8, 26, 27, 33, 33, 40, 42, 50, 52, 68, 75, 83, 86, 89, 89, 91, 91, 91, 91, 94, 94, 104, 104, 104, 106, 113, 114, 115, 115, 126, 128, 130, 130, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131], "order": [[84, 540, 0], [0, 600, 0], [1, 600, 0], [2, 600, 0], [41, 630, 0], [3, 630, 0], [42, 690, 0], [4, 705, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [44, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [10, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [50, 735, 0], [51, 750, 0], [16, 750, 0], [74, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [53, 780, 0], [54, 780, 0], [19, 780, 0], [55, 780, 0], [82, 780, 0], [20, 780, 0], [21, 780, 0], [56, 795, 0], [22, 795, 0], [58, 810, 0], [59, 810, 0], [60, 810, 0], [86, 810, 0], [42, 810, 0], [23, 810, 0], [84, 810, 0], [73, 810, 0], [24, 825, 0], [25, 825, 0], [26, 840, 0], [27, 840, 0], [28, 840, 0], [61, 840, 0], [29, 840, 0], [62, 840, 0], [30, 840, 0], [31, 840, 0], [63, 840, 0], [32, 840, 0], [33, 840, 0], [64, 840, 0], [65, 840, 0], [34, 840, 0], [35, 840, 0], [36, 840, 0], [50, 855, 0], [66, 855, 0], [56, 855, 0], [37, 855, 0], [67, 855, 0], [81, 855, 0], [38, 855, 0], [68, 870, 0], [69, 870, 0], [57, 870, 0], [70, 870, 0], [39, 870, 0], [71, 870, 0], [72, 870, 0], [40, 870, 0], [74, 885, 0], [75, 885, 0], [76, 885, 0], [77, 900, 0], [78, 900, 0], [79, 900, 0], [41, 930, 0], [80, 930, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [51, 1080, 0], [74, 1080, 0], [22, 1080, 0], [54, 1080, 0], [41, 1080, 0], [83, 1080, 0], [84, 1080, 0], [25, 1095, 0], [56, 1110, 0], [27, 1140, 0], [68, 1140, 0], [29, 1140, 0], [30, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [76, 1155, 0], [38, 1155, 0], [69, 1170, 0], [62, 1170, 0], [85, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5, 5, 7, 7, 8, 8, 9, 10, 28, 28, 33, 33, 39, 41, 46, 48, 64, 67, 75, 78, 84, 84, 85, 85, 87, 87, 90, 90, 104, 104, 104, 106, 110, 111, 112, 112, 126, 127, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131], "order": [[0, 600, 0], [1, 600, 0], [86, 600, 0], [2, 600, 0], [84, 600, 0], [41, 630, 0], [3, 630, 0], [9, 660, 0], [42, 690, 0], [4, 705, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [44, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [10, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [51, 750, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [53, 780, 0], [54, 780, 0], [19, 780, 0], [55, 780, 0], [20, 780, 0], [21, 780, 0], [22, 795, 0], [88, 795, 0], [58, 810, 0], [59, 810, 0], [60, 810, 0], [42, 810, 0], [85, 810, 0], [24, 825, 0], [25, 825, 0], [26, 840, 0], [27, 840, 0], [28, 840, 0], [61, 840, 0], [29, 840, 0], [62, 840, 0], [30, 840, 0], [89, 840, 0], [31, 840, 0], [63, 840, 0], [32, 840, 0], [33, 840, 0], [65, 840, 0], [34, 840, 0], [35, 840, 0], [36, 840, 0], [37, 855, 0], [67, 855, 0], [38, 855, 0], [68, 870, 0], [69, 870, 0], [39, 870, 0], [71, 870, 0], [41, 870, 0], [72, 870, 0], [40, 870, 0], [23, 870, 0], [74, 885, 0], [75, 885, 0], [76, 885, 0], [77, 900, 0], [50, 900, 0], [66, 900, 0], [79, 900, 0], [92, 900, 0], [73, 900, 0], [80, 930, 0], [86, 960, 0], [81, 960, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [50, 1020, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [41, 1020, 0], [55, 1020, 0], [63, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [41, 1080, 0], [84, 1080, 0], [25, 1095, 0], [56, 1110, 0], [27, 1140, 0], [29, 1140, 0], [79, 1140, 0], [30, 1140, 0], [82, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [67, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [61, 1145, 0], [38, 1155, 0], [69, 1170, 0], [58, 1170, 0], [62, 1170, 0], [73, 1170, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 3, 3, 3, 4, 24, 24, 28, 28, 35, 40, 49, 52, 73, 76, 81, 81, 81, 81, 81, 81, 81, 81, 84, 84, 95, 95, 95, 97, 99, 100, 100, 100, 110, 111, 111, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112], "order": [[1, 600, 0], [2, 600, 0], [3, 630, 0], [4, 705, 0], [0, 720, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [19, 720, 0], [10, 720, 0], [37, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [53, 780, 0], [44, 780, 0], [71, 780, 0], [55, 780, 0], [86, 780, 0], [20, 780, 0], [21, 780, 0], [50, 795, 0], [68, 795, 0], [56, 795, 0], [22, 795, 0], [54, 795, 0], [59, 810, 0], [61, 810, 0], [82, 810, 0], [94, 810, 0], [63, 810, 0], [23, 810, 0], [85, 810, 0], [73, 810, 0], [75, 820, 0], [24, 825, 0], [67, 825, 0], [25, 825, 0], [77, 840, 0], [26, 840, 0], [27, 840, 0], [74, 840, 0], [58, 840, 0], [28, 840, 0], [70, 840, 0], [29, 840, 0], [62, 840, 0], [92, 840, 0], [72, 840, 0], [30, 840, 0], [31, 840, 0], [32, 840, 0], [33, 840, 0], [64, 840, 0], [65, 840, 0], [81, 840, 0], [34, 840, 0], [35, 840, 0], [36, 840, 0], [41, 855, 0], [76, 855, 0], [38, 855, 0], [69, 870, 0], [66, 870, 0], [39, 870, 0], [60, 870, 0], [40, 870, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [55, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [25, 1095, 0], [27, 1140, 0], [29, 1140, 0], [30, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [38, 1155, 0], [63, 1185, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 3, 3, 3, 4, 24, 24, 28, 28, 35, 39, 49, 52, 71, 75, 80, 80, 80, 80, 80, 80, 80, 80, 83, 83, 94, 94, 94, 96, 98, 99, 100, 100, 110, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111], "order": [[1, 600, 0], [2, 600, 0], [3, 630, 0], [4, 705, 0], [0, 720, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [19, 720, 0], [10, 720, 0], [37, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [62, 780, 0], [44, 780, 0], [71, 780, 0], [72, 780, 0], [55, 780, 0], [20, 780, 0], [21, 780, 0], [50, 795, 0], [68, 795, 0], [22, 795, 0], [54, 795, 0], [59, 810, 0], [61, 810, 0], [82, 810, 0], [94, 810, 0], [63, 810, 0], [23, 810, 0], [85, 810, 0], [84, 810, 0], [73, 810, 0], [75, 820, 0], [24, 825, 0], [67, 825, 0], [25, 825, 0], [77, 840, 0], [26, 840, 0], [27, 840, 0], [58, 840, 0], [28, 840, 0], [29, 840, 0], [92, 840, 0], [30, 840, 0], [89, 840, 0], [31, 840, 0], [32, 840, 0], [33, 840, 0], [95, 840, 0], [65, 840, 0], [81, 840, 0], [34, 840, 0], [35, 840, 0], [91, 840, 0], [36, 840, 0], [56, 855, 0], [41, 855, 0], [76, 855, 0], [38, 855, 0], [69, 870, 0], [66, 870, 0], [39, 870, 0], [60, 870, 0], [40, 870, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [55, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [25, 1095, 0], [48, 1110, 0], [27, 1140, 0], [29, 1140, 0], [30, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [38, 1155, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 4, 4, 5, 5, 6, 6, 7, 8, 26, 26, 33, 33, 41, 43, 49, 51, 68, 74, 82, 85, 90, 90, 92, 92, 92, 92, 95, 95, 106, 106, 107, 109, 113, 114, 116, 116, 128, 129, 131, 131, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132], "order": [[86, 540, 0], [0, 600, 0], [1, 600, 0], [2, 600, 0], [3, 630, 0], [9, 660, 0], [42, 690, 0], [4, 705, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [44, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [10, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [51, 750, 0], [16, 750, 0], [74, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [96, 750, 0], [53, 780, 0], [54, 780, 0], [19, 780, 0], [55, 780, 0], [82, 780, 0], [20, 780, 0], [21, 780, 0], [85, 780, 0], [22, 795, 0], [88, 795, 0], [58, 810, 0], [59, 810, 0], [60, 810, 0], [42, 810, 0], [23, 810, 0], [73, 810, 0], [24, 825, 0], [25, 825, 0], [26, 840, 0], [27, 840, 0], [28, 840, 0], [61, 840, 0], [29, 840, 0], [62, 840, 0], [30, 840, 0], [31, 840, 0], [63, 840, 0], [32, 840, 0], [33, 840, 0], [65, 840, 0], [90, 840, 0], [34, 840, 0], [35, 840, 0], [91, 840, 0], [36, 840, 0], [50, 855, 0], [56, 855, 0], [37, 855, 0], [67, 855, 0], [81, 855, 0], [38, 855, 0], [68, 870, 0], [69, 870, 0], [57, 870, 0], [70, 870, 0], [39, 870, 0], [71, 870, 0], [72, 870, 0], [40, 870, 0], [74, 885, 0], [75, 885, 0], [76, 885, 0], [77, 900, 0], [66, 900, 0], [78, 900, 0], [79, 900, 0], [92, 900, 0], [41, 930, 0], [80, 930, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [55, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [93, 1050, 0], [26, 1065, 0], [24, 1065, 0], [22, 1080, 0], [54, 1080, 0], [41, 1080, 0], [83, 1080, 0], [25, 1095, 0], [56, 1110, 0], [63, 1110, 0], [27, 1140, 0], [29, 1140, 0], [30, 1140, 0], [42, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [75, 1145, 0], [38, 1155, 0], [69, 1170, 0], [62, 1170, 0], [92, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 4, 4, 6, 6, 7, 7, 8, 9, 27, 28, 34, 34, 40, 42, 49, 51, 67, 73, 81, 84, 87, 87, 89, 89, 90, 90, 93, 93, 103, 103, 103, 105, 112, 113, 113, 113, 124, 126, 128, 128, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129], "order": [[84, 540, 0], [0, 600, 0], [1, 600, 0], [2, 600, 0], [41, 630, 0], [3, 630, 0], [9, 660, 0], [42, 690, 0], [4, 705, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [44, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [10, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [50, 735, 0], [51, 750, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [96, 750, 0], [53, 780, 0], [54, 780, 0], [19, 780, 0], [55, 780, 0], [20, 780, 0], [21, 780, 0], [56, 795, 0], [22, 795, 0], [57, 810, 0], [58, 810, 0], [59, 810, 0], [41, 810, 0], [60, 810, 0], [42, 810, 0], [23, 810, 0], [24, 825, 0], [25, 825, 0], [26, 840, 0], [27, 840, 0], [28, 840, 0], [61, 840, 0], [29, 840, 0], [62, 840, 0], [30, 840, 0], [31, 840, 0], [63, 840, 0], [32, 840, 0], [33, 840, 0], [64, 840, 0], [65, 840, 0], [34, 840, 0], [35, 840, 0], [36, 840, 0], [50, 855, 0], [66, 855, 0], [56, 855, 0], [37, 855, 0], [67, 855, 0], [38, 855, 0], [68, 870, 0], [69, 870, 0], [70, 870, 0], [39, 870, 0], [71, 870, 0], [72, 870, 0], [40, 870, 0], [73, 870, 0], [74, 885, 0], [75, 885, 0], [76, 885, 0], [77, 900, 0], [78, 900, 0], [79, 900, 0], [41, 930, 0], [80, 930, 0], [81, 960, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [54, 1080, 0], [41, 1080, 0], [82, 1080, 0], [83, 1080, 0], [84, 1080, 0], [25, 1095, 0], [27, 1140, 0], [68, 1140, 0], [29, 1140, 0], [30, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [76, 1155, 0], [38, 1155, 0], [69, 1170, 0], [62, 1170, 0], [85, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 4, 4, 5, 5, 5, 5, 6, 7, 26, 26, 32, 33, 39, 41, 47, 49, 67, 71, 80, 83, 88, 88, 90, 90, 92, 92, 95, 95, 107, 107, 108, 110, 115, 116, 117, 117, 129, 130, 132, 132, 133, 133, 133, 133, 133, 133, 133, 133, 133, 133, 133, 133, 133, 133, 133], "order": [[86, 540, 0], [0, 600, 0], [1, 600, 0], [2, 600, 0], [3, 630, 0], [42, 690, 0], [4, 705, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [87, 720, 0], [44, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [10, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [51, 750, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [96, 750, 0], [85, 765, 0], [53, 780, 0], [54, 780, 0], [19, 780, 0], [55, 780, 0], [20, 780, 0], [21, 780, 0], [22, 795, 0], [88, 795, 0], [58, 810, 0], [59, 810, 0], [41, 810, 0], [60, 810, 0], [42, 810, 0], [73, 810, 0], [24, 825, 0], [25, 825, 0], [26, 840, 0], [27, 840, 0], [28, 840, 0], [61, 840, 0], [29, 840, 0], [62, 840, 0], [30, 840, 0], [89, 840, 0], [31, 840, 0], [63, 840, 0], [32, 840, 0], [33, 840, 0], [65, 840, 0], [90, 840, 0], [34, 840, 0], [35, 840, 0], [91, 840, 0], [36, 840, 0], [50, 855, 0], [37, 855, 0], [67, 855, 0], [38, 855, 0], [68, 870, 0], [69, 870, 0], [57, 870, 0], [70, 870, 0], [39, 870, 0], [71, 870, 0], [72, 870, 0], [40, 870, 0], [23, 870, 0], [74, 885, 0], [75, 885, 0], [76, 885, 0], [77, 900, 0], [66, 900, 0], [78, 900, 0], [79, 900, 0], [92, 900, 0], [41, 930, 0], [80, 930, 0], [82, 960, 0], [81, 960, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [41, 1020, 0], [55, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [93, 1050, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [54, 1080, 0], [41, 1080, 0], [83, 1080, 0], [25, 1095, 0], [48, 1110, 0], [27, 1140, 0], [29, 1140, 0], [30, 1140, 0], [42, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [75, 1145, 0], [38, 1155, 0], [69, 1170, 0], [62, 1170, 0], [92, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 4, 4, 6, 6, 6, 6, 7, 8, 26, 27, 34, 34, 41, 43, 51, 53, 69, 76, 84, 87, 90, 90, 92, 92, 92, 92, 95, 95, 105, 105, 105, 107, 114, 115, 116, 116, 127, 129, 131, 131, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132], "order": [[84, 540, 0], [0, 600, 0], [1, 600, 0], [2, 600, 0], [41, 630, 0], [3, 630, 0], [42, 690, 0], [4, 705, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [44, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [10, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [50, 735, 0], [51, 750, 0], [16, 750, 0], [74, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [96, 750, 0], [53, 780, 0], [54, 780, 0], [19, 780, 0], [55, 780, 0], [82, 780, 0], [20, 780, 0], [21, 780, 0], [56, 795, 0], [22, 795, 0], [58, 810, 0], [59, 810, 0], [60, 810, 0], [86, 810, 0], [42, 810, 0], [23, 810, 0], [84, 810, 0], [73, 810, 0], [24, 825, 0], [25, 825, 0], [26, 840, 0], [27, 840, 0], [28, 840, 0], [61, 840, 0], [29, 840, 0], [62, 840, 0], [30, 840, 0], [31, 840, 0], [63, 840, 0], [32, 840, 0], [33, 840, 0], [64, 840, 0], [65, 840, 0], [34, 840, 0], [35, 840, 0], [36, 840, 0], [50, 855, 0], [66, 855, 0], [56, 855, 0], [37, 855, 0], [67, 855, 0], [81, 855, 0], [38, 855, 0], [68, 870, 0], [69, 870, 0], [57, 870, 0], [70, 870, 0], [39, 870, 0], [71, 870, 0], [72, 870, 0], [40, 870, 0], [74, 885, 0], [75, 885, 0], [76, 885, 0], [77, 900, 0], [78, 900, 0], [79, 900, 0], [41, 930, 0], [80, 930, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [51, 1080, 0], [74, 1080, 0], [22, 1080, 0], [54, 1080, 0], [41, 1080, 0], [83, 1080, 0], [84, 1080, 0], [25, 1095, 0], [56, 1110, 0], [27, 1140, 0], [68, 1140, 0], [29, 1140, 0], [30, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [76, 1155, 0], [38, 1155, 0], [69, 1170, 0], [62, 1170, 0], [85, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5, 5, 7, 7, 8, 8, 9, 10, 28, 28, 34, 34, 40, 42, 47, 49, 65, 68, 76, 79, 85, 85, 86, 86, 88, 88, 91, 91, 105, 105, 105, 107, 111, 112, 113, 113, 127, 128, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132], "order": [[0, 600, 0], [1, 600, 0], [86, 600, 0], [2, 600, 0], [84, 600, 0], [41, 630, 0], [3, 630, 0], [9, 660, 0], [42, 690, 0], [4, 705, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [44, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [10, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [51, 750, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [96, 750, 0], [53, 780, 0], [54, 780, 0], [19, 780, 0], [55, 780, 0], [20, 780, 0], [21, 780, 0], [22, 795, 0], [88, 795, 0], [58, 810, 0], [59, 810, 0], [60, 810, 0], [42, 810, 0], [85, 810, 0], [24, 825, 0], [25, 825, 0], [26, 840, 0], [27, 840, 0], [28, 840, 0], [61, 840, 0], [29, 840, 0], [62, 840, 0], [30, 840, 0], [89, 840, 0], [31, 840, 0], [63, 840, 0], [32, 840, 0], [33, 840, 0], [65, 840, 0], [34, 840, 0], [35, 840, 0], [36, 840, 0], [37, 855, 0], [67, 855, 0], [38, 855, 0], [68, 870, 0], [69, 870, 0], [39, 870, 0], [71, 870, 0], [41, 870, 0], [72, 870, 0], [40, 870, 0], [23, 870, 0], [74, 885, 0], [75, 885, 0], [76, 885, 0], [77, 900, 0], [50, 900, 0], [66, 900, 0], [79, 900, 0], [92, 900, 0], [73, 900, 0], [80, 930, 0], [86, 960, 0], [81, 960, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [50, 1020, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [41, 1020, 0], [55, 1020, 0], [63, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [41, 1080, 0], [84, 1080, 0], [25, 1095, 0], [56, 1110, 0], [27, 1140, 0], [29, 1140, 0], [79, 1140, 0], [30, 1140, 0], [82, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [67, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [61, 1145, 0], [38, 1155, 0], [69, 1170, 0], [58, 1170, 0], [62, 1170, 0], [73, 1170, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 3, 3, 3, 4, 24, 24, 28, 28, 36, 41, 50, 53, 74, 77, 82, 82, 82, 82, 82, 82, 82, 82, 85, 85, 96, 96, 96, 98, 100, 101, 101, 101, 111, 112, 112, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113], "order": [[1, 600, 0], [2, 600, 0], [3, 630, 0], [4, 705, 0], [0, 720, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [19, 720, 0], [10, 720, 0], [37, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [53, 780, 0], [44, 780, 0], [71, 780, 0], [55, 780, 0], [86, 780, 0], [20, 780, 0], [21, 780, 0], [95, 780, 0], [50, 795, 0], [68, 795, 0], [56, 795, 0], [22, 795, 0], [54, 795, 0], [59, 810, 0], [61, 810, 0], [82, 810, 0], [94, 810, 0], [63, 810, 0], [23, 810, 0], [85, 810, 0], [73, 810, 0], [75, 820, 0], [24, 825, 0], [67, 825, 0], [25, 825, 0], [77, 840, 0], [26, 840, 0], [27, 840, 0], [74, 840, 0], [58, 840, 0], [28, 840, 0], [70, 840, 0], [29, 840, 0], [62, 840, 0], [92, 840, 0], [72, 840, 0], [30, 840, 0], [31, 840, 0], [32, 840, 0], [33, 840, 0], [64, 840, 0], [65, 840, 0], [81, 840, 0], [34, 840, 0], [35, 840, 0], [36, 840, 0], [41, 855, 0], [76, 855, 0], [38, 855, 0], [69, 870, 0], [66, 870, 0], [39, 870, 0], [60, 870, 0], [40, 870, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [55, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [25, 1095, 0], [27, 1140, 0], [29, 1140, 0], [30, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [38, 1155, 0], [63, 1185, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 3, 3, 3, 4, 25, 25, 29, 29, 36, 40, 50, 53, 72, 76, 81, 81, 81, 81, 81, 81, 81, 81, 84, 84, 95, 95, 95, 97, 99, 100, 101, 101, 111, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112], "order": [[1, 600, 0], [2, 600, 0], [3, 630, 0], [4, 705, 0], [0, 720, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [45, 720, 0], [7, 720, 0], [97, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [19, 720, 0], [10, 720, 0], [37, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [62, 780, 0], [44, 780, 0], [71, 780, 0], [72, 780, 0], [55, 780, 0], [20, 780, 0], [21, 780, 0], [50, 795, 0], [68, 795, 0], [22, 795, 0], [54, 795, 0], [59, 810, 0], [61, 810, 0], [82, 810, 0], [94, 810, 0], [63, 810, 0], [23, 810, 0], [85, 810, 0], [84, 810, 0], [73, 810, 0], [75, 820, 0], [24, 825, 0], [67, 825, 0], [25, 825, 0], [77, 840, 0], [26, 840, 0], [27, 840, 0], [58, 840, 0], [28, 840, 0], [29, 840, 0], [92, 840, 0], [30, 840, 0], [89, 840, 0], [31, 840, 0], [32, 840, 0], [33, 840, 0], [95, 840, 0], [65, 840, 0], [81, 840, 0], [34, 840, 0], [35, 840, 0], [91, 840, 0], [36, 840, 0], [56, 855, 0], [41, 855, 0], [76, 855, 0], [38, 855, 0], [69, 870, 0], [66, 870, 0], [39, 870, 0], [60, 870, 0], [40, 870, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [55, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [25, 1095, 0], [48, 1110, 0], [27, 1140, 0], [29, 1140, 0], [30, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [38, 1155, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 4, 4, 5, 5, 5, 5, 6, 7, 26, 26, 32, 33, 39, 41, 47, 49, 67, 71, 80, 83, 88, 88, 90, 90, 92, 92, 95, 95, 106, 106, 107, 109, 114, 115, 116, 116, 128, 129, 131, 131, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132, 132], "order": [[86, 540, 0], [0, 600, 0], [1, 600, 0], [2, 600, 0], [3, 630, 0], [42, 690, 0], [4, 705, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [87, 720, 0], [44, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [10, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [51, 750, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [96, 750, 0], [85, 765, 0], [53, 780, 0], [54, 780, 0], [19, 780, 0], [55, 780, 0], [20, 780, 0], [21, 780, 0], [22, 795, 0], [88, 795, 0], [58, 810, 0], [59, 810, 0], [41, 810, 0], [60, 810, 0], [42, 810, 0], [73, 810, 0], [24, 825, 0], [25, 825, 0], [26, 840, 0], [27, 840, 0], [28, 840, 0], [61, 840, 0], [29, 840, 0], [62, 840, 0], [30, 840, 0], [89, 840, 0], [31, 840, 0], [63, 840, 0], [32, 840, 0], [33, 840, 0], [65, 840, 0], [90, 840, 0], [34, 840, 0], [35, 840, 0], [91, 840, 0], [36, 840, 0], [50, 855, 0], [37, 855, 0], [67, 855, 0], [38, 855, 0], [68, 870, 0], [69, 870, 0], [57, 870, 0], [70, 870, 0], [39, 870, 0], [71, 870, 0], [72, 870, 0], [40, 870, 0], [23, 870, 0], [74, 885, 0], [75, 885, 0], [76, 885, 0], [77, 900, 0], [66, 900, 0], [78, 900, 0], [79, 900, 0], [92, 900, 0], [41, 930, 0], [80, 930, 0], [82, 960, 0], [81, 960, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [55, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [93, 1050, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [54, 1080, 0], [41, 1080, 0], [83, 1080, 0], [25, 1095, 0], [48, 1110, 0], [27, 1140, 0], [29, 1140, 0], [30, 1140, 0], [42, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [75, 1145, 0], [38, 1155, 0], [69, 1170, 0], [62, 1170, 0], [92, 1200, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5, 5, 7, 7, 8, 8, 9, 10, 28, 28, 34, 34, 40, 42, 47, 49, 65, 68, 76, 79, 85, 85, 86, 86, 88, 88, 91, 91, 104, 104, 104, 106, 110, 111, 112, 112, 126, 127, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131], "order": [[0, 600, 0], [1, 600, 0], [86, 600, 0], [2, 600, 0], [84, 600, 0], [41, 630, 0], [3, 630, 0], [9, 660, 0], [42, 690, 0], [4, 705, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [44, 720, 0], [45, 720, 0], [7, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [10, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [51, 750, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [96, 750, 0], [53, 780, 0], [54, 780, 0], [19, 780, 0], [55, 780, 0], [20, 780, 0], [21, 780, 0], [22, 795, 0], [88, 795, 0], [58, 810, 0], [59, 810, 0], [60, 810, 0], [42, 810, 0], [85, 810, 0], [24, 825, 0], [25, 825, 0], [26, 840, 0], [27, 840, 0], [28, 840, 0], [61, 840, 0], [29, 840, 0], [62, 840, 0], [30, 840, 0], [89, 840, 0], [31, 840, 0], [63, 840, 0], [32, 840, 0], [33, 840, 0], [65, 840, 0], [34, 840, 0], [35, 840, 0], [36, 840, 0], [37, 855, 0], [67, 855, 0], [38, 855, 0], [68, 870, 0], [69, 870, 0], [39, 870, 0], [71, 870, 0], [41, 870, 0], [72, 870, 0], [40, 870, 0], [23, 870, 0], [74, 885, 0], [75, 885, 0], [76, 885, 0], [77, 900, 0], [50, 900, 0], [66, 900, 0], [79, 900, 0], [92, 900, 0], [73, 900, 0], [80, 930, 0], [86, 960, 0], [81, 960, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [50, 1020, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [55, 1020, 0], [63, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [41, 1080, 0], [84, 1080, 0], [25, 1095, 0], [56, 1110, 0], [27, 1140, 0], [29, 1140, 0], [79, 1140, 0], [30, 1140, 0], [82, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [67, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [61, 1145, 0], [38, 1155, 0], [69, 1170, 0], [58, 1170, 0], [62, 1170, 0], [73, 1170, 0]]}, {"buckets": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 3, 3, 3, 4, 25, 25, 29, 29, 37, 42, 51, 54, 75, 78, 83, 83, 83, 83, 83, 83, 83, 83, 86, 86, 97, 97, 97, 99, 101, 102, 102, 102, 112, 113, 113, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114], "order": [[1, 600, 0], [2, 600, 0], [3, 630, 0], [4, 705, 0], [0, 720, 0], [5, 720, 0], [43, 720, 0], [6, 720, 0], [45, 720, 0], [7, 720, 0], [97, 720, 0], [8, 720, 0], [46, 720, 0], [9, 720, 0], [19, 720, 0], [10, 720, 0], [37, 720, 0], [11, 720, 0], [47, 720, 0], [48, 720, 0], [12, 720, 0], [49, 720, 0], [13, 720, 0], [14, 720, 0], [15, 720, 0], [16, 750, 0], [52, 750, 0], [17, 750, 0], [18, 750, 0], [53, 780, 0], [44, 780, 0], [71, 780, 0], [55, 780, 0], [86, 780, 0], [20, 780, 0], [21, 780, 0], [95, 780, 0], [50, 795, 0], [68, 795, 0], [56, 795, 0], [22, 795, 0], [54, 795, 0], [59, 810, 0], [61, 810, 0], [82, 810, 0], [94, 810, 0], [63, 810, 0], [23, 810, 0], [85, 810, 0], [73, 810, 0], [75, 820, 0], [24, 825, 0], [67, 825, 0], [25, 825, 0], [77, 840, 0], [26, 840, 0], [27, 840, 0], [74, 840, 0], [58, 840, 0], [28, 840, 0], [70, 840, 0], [29, 840, 0], [62, 840, 0], [92, 840, 0], [72, 840, 0], [30, 840, 0], [31, 840, 0], [32, 840, 0], [33, 840, 0], [64, 840, 0], [65, 840, 0], [81, 840, 0], [34, 840, 0], [35, 840, 0], [36, 840, 0], [41, 855, 0], [76, 855, 0], [38, 855, 0], [69, 870, 0], [66, 870, 0], [39, 870, 0], [60, 870, 0], [40, 870, 0], [45, 990, 0], [47, 990, 0], [49, 990, 0], [43, 1020, 0], [28, 1020, 0], [1, 1020, 0], [52, 1020, 0], [8, 1020, 0], [46, 1020, 0], [55, 1020, 0], [21, 1020, 0], [13, 1020, 0], [2, 1020, 0], [15, 1020, 0], [26, 1065, 0], [24, 1065, 0], [74, 1080, 0], [22, 1080, 0], [25, 1095, 0], [27, 1140, 0], [29, 1140, 0], [30, 1140, 0], [31, 1140, 0], [32, 1140, 0], [40, 1140, 0], [33, 1140, 0], [34, 1140, 0], [35, 1140, 0], [36, 1140, 0], [38, 1155, 0], [63, 1185, 0]]}]}, "rules": {"Albion Pool and Health Club": [[0, 900, 955, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4026531840, 0]], [1, 900, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4026531840, 0]], [2, 900, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4026531840, 0]], [3, 900, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4026531840, 0]], [4, 900, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4026531840, 0]], [5, 840, 895, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 251658240, 0]], [6, 840, 895, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 251658240, 0]]], "Alderwood Centre": [[0, 855, 925, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 1040187392, 0]], [1, 735, 780, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 917504, 0]], [1, 855, 925, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 1040187392, 0]], [2, 855, 925, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 1040187392, 0]], [3, 735, 780, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 917504, 0]], [3, 855, 925, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 1040187392, 0]], [4, 900, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4026531840, 0]], [4, 1020, 1125, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 2032]], [5, 795, 945, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 2145386496, 0]], [6, 795, 945, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 2145386496, 0]]], "Alex Duff Memorial Pool": [[0, 600, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294967040, 65535]], [1, 600, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294967040, 65535]], [2, 600, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294967040, 65535]], [3, 600, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294967040, 65535]], [4, 600, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294967040, 65535]], [5, 720, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 65535]]], "Alexandra Park": [[0, 720, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 65535]], [1, 720, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 65535]], [2, 720, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 65535]], [3, 720, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 65535]], [4, 720, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 65535]], [5, 720, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 65535]]], "Amesbury Sports Complex": [[0, 840, 975, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4278190080, 1]], [0, 1065, 1135, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 3968]], [1, 840, 975, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 1]], [1, 1065, 1135, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 3968]], [2, 840, 975, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 1]], [2, 1065, 1135, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 3968]], [3, 840, 975, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 1]], [3, 1065, 1135, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 3968]], [4, 840, 975, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 1]], [4, 1065, 1135, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 3968]], [5, 840, 975, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 1]], [5, 1065, 1135, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 3968]], [6, 840, 975, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 1]], [6, 1065, 1135, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 3968]]], "Amos Waites Park Outdoor Pool": [[0, 840, 985, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4278190080, 3]], [0, 1140, 1195, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 61440]], [1, 840, 985, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 3]], [1, 1140, 1195, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 61440]], [2, 840, 985, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 3]], [2, 1140, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 61440]], [3, 840, 985, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 3]], [3, 1140, 1195, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 61440]], [5, 840, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 0]], [5, 1140, 1195, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 61440]]], "Annette Community Recreation Centre": [[0, 870, 925, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 1006632960, 0]], [1, 870, 925, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 1006632960, 0]], [1, 1140, 1255, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 1044480]], [2, 870, 925, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 1006632960, 0]], [3, 870, 925, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 1006632960, 0]], [3, 1140, 1255, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 1044480]], [4, 870, 935, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 2080374784, 0]], [5, 795, 895, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 266338304, 0]], [6, 795, 895, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 266338304, 0]]], "Antibes Community Centre": [[0, 870, 960, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4227858432, 0]], [0, 1170, 1230, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 245760]], [1, 870, 960, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4227858432, 0]], [1, 1170, 1230, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 245760]], [2, 870, 960, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4227858432, 0]], [2, 1170, 1230, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 245760]], [3, 870, 960, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4227858432, 0]], [3, 1170, 1230, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 245760]], [4, 870, 960, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4227858432, 0]], [4, 1170, 1230, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 245760]], [5, 870, 960, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4227858432, 0]], [6, 870, 960, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4227858432, 0]]], "Beaches Recreation Centre": [[0, 750, 840, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 16515072, 0]], [1, 750, 840, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 16515072, 0]], [2, 750, 840, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 16515072, 0]], [3, 750, 840, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 16515072, 0]], [3, 1080, 1230, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 261888]], [4, 750, 840, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 16515072, 0]]], "Bedford Park Community Centre": [[0, 780, 960, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4293918720, 0]], [1, 780, 960, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4293918720, 0]], [2, 780, 960, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4293918720, 0]], [3, 780, 960, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4293918720, 0]], [4, 780, 960, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4293918720, 0]], [5, 780, 960, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4293918720, 0]]], "Birchmount Community Centre": [[0, 900, 1170, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4026531840, 16383]], [1, 855, 975, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4261412864, 1]], [2, 900, 1110, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4026531840, 1023]], [3, 855, 975, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4261412864, 1]], [4, 900, 1170, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4026531840, 16383]], [5, 870, 1140, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4227858432, 4095]], [6, 870, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4227858432, 65535]]], "Blantyre Park": [[0, 750, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294705152, 65535]], [1, 750, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294705152, 65535]], [2, 750, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294705152, 65535]], [3, 750, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294705152, 65535]], [4, 750, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294705152, 65535]], [5, 750, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294705152, 65535]], [6, 750, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294705152, 65535]]], "Broadlands Community Centre": [[0, 720, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 0]], [0, 1020, 1165, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 16368]], [1, 720, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 0]], [1, 1020, 1165, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 16368]], [2, 720, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 0]], [2, 1020, 1165, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 16368]], [3, 720, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 0]], [3, 1020, 1165, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 16368]], [4, 720, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 0]], [4, 1020, 1165, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 16368]], [5, 720, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 0]], [5, 1020, 1165, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 16368]], [6, 720, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 0]], [6, 1020, 1165, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 16368]]], "CW Jefferys Collegiate Institute": [[0, 900, 955, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4026531840, 0]], [1, 900, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4026531840, 0]], [2, 900, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4026531840, 0]], [3, 900, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4026531840, 0]]], "Cedarbrae Collegiate Institute": [[0, 870, 960, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4227858432, 0]], [1, 810, 960, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4290772992, 0]], [2, 870, 960, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4227858432, 0]], [3, 870, 960, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4227858432, 0]]], "Centennial Recreation Centre - Scarborough": [[0, 750, 810, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 3932160, 0]], [0, 885, 1020, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4160749568, 15]], [1, 885, 1020, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4160749568, 15]], [1, 1080, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 65280]], [2, 885, 1020, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4160749568, 15]], [2, 1080, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 65280]], [3, 750, 810, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 3932160, 0]], [3, 885, 1020, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4160749568, 15]], [3, 1080, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 65280]], [4, 885, 1020, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4160749568, 15]], [4, 1080, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 65280]], [5, 840, 1020, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 15]], [5, 1080, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 65280]], [6, 1080, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 65280]]], "Cummer Park Community Centre": [[0, 810, 925, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 1069547520, 0]], [1, 810, 925, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 1069547520, 0]], [2, 810, 925, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 1069547520, 0]], [3, 810, 925, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 1069547520, 0]], [4, 810, 925, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 1069547520, 0]], [4, 1170, 1255, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 1032192]], [5, 840, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 0]], [6, 840, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 0]]], "Dennis R. Timbrell Resource Centre": [[0, 810, 990, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4290772992, 3]], [1, 810, 990, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4290772992, 3]], [2, 810, 990, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4290772992, 3]], [3, 810, 990, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4290772992, 3]], [4, 810, 990, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4290772992, 3]], [5, 810, 930, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 1069547520, 0]], [6, 810, 930, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 1069547520, 0]]], "Domenico Di Luca Community Recreation Centre": [[0, 840, 945, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 2130706432, 0]], [0, 1020, 1135, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 4080]], [1, 840, 945, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 2130706432, 0]], [1, 1020, 1135, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 4080]], [2, 840, 945, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 2130706432, 0]], [2, 1020, 1135, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 4080]], [3, 840, 945, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 2130706432, 0]], [3, 1020, 1135, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 4080]], [4, 840, 945, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 2130706432, 0]], [4, 1020, 1135, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 4080]], [5, 840, 945, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 2130706432, 0]], [5, 1020, 1135, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 4080]], [6, 840, 945, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 2130706432, 0]], [6, 1020, 1135, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 4080]]], "Donald D. Summerville Olympic Pools": [[0, 600, 960, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294967040, 0]], [0, 1020, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 65520]], [1, 600, 960, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294967040, 0]], [1, 1020, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 65520]], [2, 600, 960, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294967040, 0]], [2, 1020, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 65520]], [3, 600, 960, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294967040, 0]], [3, 1020, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 65520]], [4, 600, 960, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294967040, 0]], [4, 1020, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 65520]], [5, 600, 960, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294967040, 0]], [5, 1020, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 65520]], [6, 600, 960, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294967040, 0]], [6, 1020, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 65520]]], "Douglas Snow Aquatic Centre": [[0, 840, 930, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 1056964608, 0]], [1, 840, 930, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 1056964608, 0]], [2, 840, 930, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 1056964608, 0]], [3, 840, 930, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 1056964608, 0]], [4, 840, 930, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 1056964608, 0]], [4, 1145, 1260, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 1044480]], [5, 810, 930, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 1069547520, 0]], [6, 810, 930, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 1069547520, 0]]], "Driftwood Community Recreation Centre": [[0, 750, 985, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4294705152, 3]], [0, 1020, 1165, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 16368]], [1, 750, 985, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294705152, 3]], [1, 1020, 1165, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 16368]], [2, 750, 985, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294705152, 3]], [2, 1020, 1165, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 16368]], [3, 750, 985, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294705152, 3]], [3, 1020, 1165, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 16368]], [4, 750, 985, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294705152, 3]], [4, 1020, 1165, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 16368]], [5, 750, 985, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294705152, 3]], [5, 1020, 1165, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 16368]], [6, 750, 985, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294705152, 3]], [6, 1020, 1165, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 16368]]], "Earl Beatty Community Centre": [[0, 870, 975, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4227858432, 1]], [1, 870, 975, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4227858432, 1]], [2, 870, 975, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4227858432, 1]], [3, 870, 975, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4227858432, 1]], [5, 840, 915, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 520093696, 0]]], "East York Community Centre": [[0, 855, 930, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 1040187392, 0]], [0, 1110, 1170, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 15360]], [1, 795, 855, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 31457280, 0]], [1, 855, 930, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 1040187392, 0]], [3, 795, 855, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 31457280, 0]], [3, 855, 930, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 1040187392, 0]], [3, 1110, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 64512]], [4, 1110, 1170, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 15360]], [5, 795, 930, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 1071644672, 0]], [6, 855, 930, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 1040187392, 0]]], "Eringate Park Outdoor Pool": [[0, 840, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4278190080, 0]], [0, 1140, 1195, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 61440]], [1, 840, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 0]], [1, 1140, 1195, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 61440]], [2, 840, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 0]], [2, 1140, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 61440]], [3, 840, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 0]], [3, 1140, 1195, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 61440]], [5, 840, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 0]], [5, 1140, 1195, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 61440]]], "Etobicoke Olympium": [[0, 840, 955, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4278190080, 0]], [0, 1170, 1230, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 245760]], [1, 840, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 0]], [1, 1170, 1230, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 245760]], [2, 840, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 0]], [2, 1170, 1230, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 245760]], [3, 840, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 0]], [3, 1170, 1230, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 245760]], [4, 840, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 0]], [4, 1170, 1230, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 245760]], [5, 840, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 0]], [6, 780, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4293918720, 0]]], "Fairbank Memorial Park": [[0, 720, 1165, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 16383]], [1, 720, 1165, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 16383]], [2, 720, 1165, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 16383]], [3, 720, 1165, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 16383]], [4, 720, 1165, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 16383]], [5, 720, 1165, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 16383]], [6, 720, 1165, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 16383]]], "Fairhaven Park Outdoor Pool": [[0, 795, 945, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 2145386496, 0]], [0, 1080, 1135, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 3840]], [1, 795, 945, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 2145386496, 0]], [1, 1080, 1135, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 3840]], [2, 795, 945, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 2145386496, 0]], [2, 1080, 1135, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 3840]], [3, 795, 945, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 2145386496, 0]], [3, 1080, 1135, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 3840]], [4, 795, 945, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 2145386496, 0]], [4, 1080, 1135, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 3840]], [5, 795, 945, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 2145386496, 0]], [5, 1080, 1135, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 3840]], [6, 795, 945, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 2145386496, 0]], [6, 1080, 1135, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 3840]]], "Fairmount Park Community Centre": [[0, 1050, 1110, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 960]], [2, 1050, 1110, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 960]]], "Frankland Community Centre": [[2, 720, 900, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 268369920, 0]]], "Gihon Spring Park Outdoor Pool": [[0, 870, 1125, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4227858432, 2047]], [1, 870, 1125, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4227858432, 2047]], [2, 870, 1125, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4227858432, 2047]], [3, 870, 1125, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4227858432, 2047]], [4, 870, 1125, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4227858432, 2047]], [5, 870, 1125, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4227858432, 2047]], [6, 870, 1125, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4227858432, 2047]]], "Giovanni Caboto Rink, Pool and Tennis Courts": [[0, 705, 1170, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294934528, 16383]], [1, 705, 1170, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294934528, 16383]], [2, 705, 1170, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294934528, 16383]], [3, 705, 1170, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294934528, 16383]], [4, 705, 1170, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294934528, 16383]], [5, 705, 1170, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294934528, 16383]], [6, 705, 1170, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294934528, 16383]]], "Glen Long Community Centre": [[0, 720, 1165, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4294901760, 16383]], [1, 720, 1165, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 16383]], [2, 720, 1165, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 16383]], [3, 720, 1165, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 16383]], [4, 720, 1165, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 16383]], [5, 780, 1165, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4293918720, 16383]], [6, 780, 1165, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4293918720, 16383]]], "Gord and Irene Risk Community Centre": [[0, 825, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4286578688, 0]], [0, 1065, 1135, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 3968]], [1, 825, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4286578688, 0]], [1, 1065, 1135, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 3968]], [2, 825, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4286578688, 0]], [2, 1065, 1135, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 3968]], [3, 825, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4286578688, 0]], [3, 1065, 1135, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 3968]], [4, 825, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4286578688, 0]], [4, 1065, 1135, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 3968]], [5, 825, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4286578688, 0]], [5, 1065, 1135, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 3968]], [6, 825, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4286578688, 0]], [6, 1065, 1135, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 3968]]], "Grandravine Community Recreation Centre": [[0, 720, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 0]], [0, 990, 1135, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 4092]], [1, 720, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 0]], [1, 990, 1135, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 4092]], [2, 720, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 0]], [2, 990, 1135, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 4092]], [3, 720, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 0]], [3, 990, 1135, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 4092]], [4, 720, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 0]], [4, 990, 1135, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 4092]], [5, 720, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 0]], [5, 990, 1075, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 252]], [6, 720, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 0]], [6, 990, 1075, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 252]]], "Greenwood Park": [[0, 720, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 65535]], [1, 720, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 65535]], [2, 720, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 65535]], [3, 720, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 65535]], [4, 720, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 65535]], [5, 720, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 65535]]], "Gus Ryder Pool and Health Club": [[0, 900, 975, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4026531840, 1]], [1, 900, 975, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4026531840, 1]], [2, 900, 975, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4026531840, 1]], [3, 900, 975, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4026531840, 1]], [4, 900, 975, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4026531840, 1]], [4, 1140, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 61440]]], "Halbert Park": [[0, 750, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294705152, 65535]], [1, 750, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294705152, 65535]], [2, 750, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294705152, 65535]], [3, 750, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294705152, 65535]], [4, 750, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294705152, 65535]], [5, 750, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294705152, 65535]], [6, 750, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294705152, 65535]]], "Harrison Pool": [[5, 720, 870, "Leisure Swim", "2019-07-20", "2019-07-27", [0, 67043328, 0]], [6, 720, 960, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 0]]], "Heron Park Community Centre": [[0, 870, 1140, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4227858432, 4095]], [1, 870, 1140, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4227858432, 4095]], [2, 870, 1140, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4227858432, 4095]], [3, 870, 1140, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4227858432, 4095]], [4, 870, 1140, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4227858432, 4095]], [5, 780, 1140, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4293918720, 4095]], [6, 780, 1140, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4293918720, 4095]]], "High Park": [[0, 720, 960, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 0]], [0, 1020, 1135, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 4080]], [1, 720, 960, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 0]], [1, 1020, 1135, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 4080]], [2, 720, 960, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 0]], [2, 1020, 1135, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 4080]], [3, 720, 960, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 0]], [3, 1020, 1135, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 4080]], [4, 720, 960, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 0]], [4, 1020, 1135, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 4080]], [5, 720, 960, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 0]], [5, 1020, 1135, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 4080]], [6, 720, 960, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 0]], [6, 1020, 1135, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 4080]]], "Hillcrest Community Centre": [[0, 780, 870, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 66060288, 0]], [0, 1080, 1200, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 65280]], [1, 780, 870, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 66060288, 0]], [1, 1080, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 65280]], [2, 780, 870, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 66060288, 0]], [2, 1080, 1140, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 3840]], [3, 780, 870, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 66060288, 0]], [3, 1080, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 65280]], [4, 780, 870, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 66060288, 0]], [5, 795, 900, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 266338304, 0]], [6, 795, 900, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 266338304, 0]]], "Humber Community Pool": [[0, 900, 955, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4026531840, 0]], [0, 1200, 1255, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 983040]], [2, 900, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4026531840, 0]], [2, 1200, 1255, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 983040]], [4, 900, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4026531840, 0]], [5, 840, 895, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 251658240, 0]], [6, 840, 895, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 251658240, 0]]], "Irving W. Chapley Community Centre": [[0, 720, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 0]], [0, 1020, 1075, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 240]], [1, 720, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 0]], [1, 1020, 1165, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 16368]], [2, 720, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 0]], [2, 1020, 1075, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 240]], [3, 720, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 0]], [3, 1020, 1165, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 16368]], [4, 720, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 0]], [4, 1020, 1165, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 16368]], [5, 720, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 0]], [5, 1020, 1165, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 16368]], [6, 720, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 0]], [6, 1020, 1165, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 16368]]], "Jimmie Simpson Recreation Centre": [[0, 930, 1050, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 3221225472, 63]], [0, 1080, 1140, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 3840]], [1, 630, 690, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 15360, 0]], [1, 810, 900, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 264241152, 0]], [1, 930, 1050, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 3221225472, 63]], [1, 1080, 1140, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 3840]], [2, 810, 900, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 264241152, 0]], [2, 930, 1050, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 3221225472, 63]], [2, 1020, 1080, "Leisure Swim", "2019-07-03", "2019-07-10", [0, 0, 240]], [2, 1080, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 65280]], [3, 630, 690, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 15360, 0]], [3, 930, 1050, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 3221225472, 63]], [3, 1080, 1140, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 3840]], [4, 630, 690, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 15360, 0]], [4, 870, 1050, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4227858432, 63]], [4, 1020, 1140, "Leisure Swim", "2019-07-05", "2019-07-12", [0, 0, 4080]], [4, 1080, 1140, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 3840]], [5, 855, 960, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4261412864, 0]], [6, 855, 960, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4261412864, 0]]], "Kidstown - Water Park": [[0, 630, 1170, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294966272, 16383]], [1, 630, 1170, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294966272, 16383]], [2, 630, 1170, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294966272, 16383]], [3, 630, 1170, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294966272, 16383]], [4, 630, 1170, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294966272, 16383]], [5, 630, 1170, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294966272, 16383]], [6, 630, 1170, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294966272, 16383]]], "Kiwanis Outdoor Pool": [[0, 660, 720, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 61440, 0]], [0, 720, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 65535]], [1, 660, 720, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 61440, 0]], [1, 720, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 65535]], [2, 720, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 65535]], [3, 720, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 65535]], [4, 660, 720, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 61440, 0]], [4, 720, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 65535]], [5, 720, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 65535]]], "Knob Hill Park": [[0, 780, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4293918720, 65535]], [1, 780, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4293918720, 65535]], [2, 780, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4293918720, 65535]], [3, 780, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4293918720, 65535]], [4, 780, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4293918720, 65535]], [5, 720, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 65535]]], "L'Amoreaux Collegiate Institute": [[0, 870, 1020, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4227858432, 15]], [1, 870, 1020, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4227858432, 15]], [2, 870, 1020, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4227858432, 15]], [3, 870, 1020, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4227858432, 15]], [4, 870, 1020, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4227858432, 15]], [5, 840, 1020, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 15]], [6, 780, 960, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4293918720, 0]]], "Lambton - Kingsway Park Outdoor Pool": [[0, 840, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4278190080, 0]], [0, 1140, 1195, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 61440]], [1, 840, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 0]], [1, 1140, 1195, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 61440]], [2, 840, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 0]], [2, 1140, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 61440]], [3, 840, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 0]], [3, 1140, 1195, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 61440]], [5, 840, 985, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 3]], [5, 1140, 1195, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 61440]]], "Lawrence Heights Community Centre": [[0, 780, 985, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4293918720, 3]], [0, 1020, 1135, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 4080]], [1, 780, 985, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4293918720, 3]], [2, 780, 985, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4293918720, 3]], [2, 1020, 1135, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 4080]], [3, 780, 985, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4293918720, 3]], [4, 780, 985, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4293918720, 3]], [4, 1020, 1135, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 4080]], [5, 780, 985, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4293918720, 3]], [5, 1020, 1135, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 4080]], [6, 780, 985, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4293918720, 3]], [6, 1020, 1135, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 4080]]], "Leaside Memorial Gardens Swimming Pool - Indoor Pool": [[0, 810, 930, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 1069547520, 0]], [1, 810, 930, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 1069547520, 0]], [2, 810, 930, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 1069547520, 0]], [3, 810, 930, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 1069547520, 0]], [4, 810, 930, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 1069547520, 0]], [5, 870, 960, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4227858432, 0]], [6, 870, 960, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4227858432, 0]]], "Leaside Outdoor Pool": [[0, 720, 1170, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 16383]], [1, 720, 1170, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 16383]], [2, 720, 1170, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 16383]], [3, 720, 1170, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 16383]], [4, 720, 1170, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 16383]], [5, 720, 1170, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 16383]], [6, 720, 1170, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 16383]]], "Lester B. Pearson Collegiate Institute": [[2, 840, 960, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 0]], [4, 840, 960, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 0]], [6, 840, 960, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 0]]], "Main Square Community Centre": [[0, 780, 870, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 66060288, 0]], [1, 1080, 1230, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 261888]], [2, 960, 1050, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 63]], [3, 780, 900, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 267386880, 0]], [4, 1140, 1230, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 258048]], [5, 810, 930, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 1069547520, 0]], [6, 810, 930, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 1069547520, 0]]], "Mary McCormick Recreation Centre": [[0, 540, 580, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 112, 0]], [2, 540, 580, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 112, 0]], [3, 810, 925, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 1069547520, 0]], [4, 600, 655, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 3840, 0]], [4, 960, 1185, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 32767]], [5, 780, 985, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4293918720, 3]]], "Maryvale Park Outdoor Pool": [[0, 750, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294705152, 65535]], [1, 750, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294705152, 65535]], [2, 750, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294705152, 65535]], [3, 750, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294705152, 65535]], [4, 750, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294705152, 65535]], [5, 750, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294705152, 65535]], [6, 750, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294705152, 65535]]], "Matty Eckler Recreation Centre": [[0, 690, 750, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 245760, 0]], [0, 810, 930, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 1069547520, 0]], [0, 1140, 1200, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 61440]], [1, 690, 750, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 245760, 0]], [1, 810, 930, "Leisure Swim", "2019-07-09", "2019-07-23", [0, 1069547520, 0]], [2, 690, 750, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 245760, 0]], [2, 810, 930, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 1069547520, 0]], [2, 1140, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 61440]], [3, 690, 750, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 245760, 0]], [3, 810, 930, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 1069547520, 0]], [4, 690, 750, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 245760, 0]], [4, 810, 930, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 1069547520, 0]]], "McGregor Park Community Centre": [[0, 855, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4261412864, 65535]], [1, 855, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4261412864, 65535]], [2, 855, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4261412864, 65535]], [3, 855, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4261412864, 65535]], [4, 855, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4261412864, 65535]], [5, 720, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 65535]]], "Monarch Park": [[0, 720, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 65535]], [1, 720, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 65535]], [2, 720, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 65535]], [3, 720, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 65535]], [4, 720, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 65535]], [5, 720, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 65535]]], "Norseman Community School And Pool": [[0, 885, 945, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 2013265920, 0]], [0, 1145, 1195, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 61440]], [1, 885, 945, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 2013265920, 0]], [2, 885, 945, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 2013265920, 0]], [2, 1145, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 61440]], [3, 885, 945, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 2013265920, 0]], [4, 885, 1015, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4160749568, 15]], [5, 820, 945, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 2143289344, 0]], [6, 820, 945, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 2143289344, 0]]], "North Toronto Memorial Community Centre": [[5, 810, 930, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 1069547520, 0]], [6, 810, 930, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 1069547520, 0]]], "Oakdale Community Centre": [[0, 720, 955, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4294901760, 0]], [0, 990, 1135, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 4092]], [1, 720, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 0]], [1, 990, 1135, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 4092]], [2, 720, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 0]], [2, 990, 1135, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 4092]], [3, 720, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 0]], [3, 990, 1135, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 4092]], [4, 720, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 0]], [4, 990, 1135, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 4092]], [5, 720, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 0]], [5, 990, 1075, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 252]], [6, 720, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 0]], [6, 990, 1075, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 252]]], "Ourland Park Outdoor Pool": [[0, 840, 985, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4278190080, 3]], [0, 1140, 1195, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 61440]], [1, 840, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 0]], [1, 1140, 1195, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 61440]], [2, 840, 985, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 3]], [2, 1140, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 61440]], [3, 840, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 0]], [3, 1140, 1195, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 61440]], [5, 840, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 0]], [5, 1140, 1195, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 61440]]], "Pam McConnell Aquatic Centre": [[0, 840, 955, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4278190080, 0]], [0, 1110, 1225, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 261120]], [1, 840, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 0]], [2, 840, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 0]], [3, 840, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 0]], [4, 840, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 0]], [4, 1020, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 65520]], [5, 810, 1015, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4290772992, 15]], [5, 1185, 1270, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 2064384]], [6, 810, 1015, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4290772992, 15]]], "Park Lawn Park": [[0, 840, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4278190080, 0]], [0, 1140, 1195, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 61440]], [1, 840, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 0]], [1, 1140, 1195, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 61440]], [2, 840, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 0]], [2, 1140, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 61440]], [3, 840, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 0]], [3, 1140, 1195, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 61440]], [5, 840, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 0]], [5, 1140, 1195, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 61440]]], "Parkdale Community Recreation Centre": [[0, 1080, 1200, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 0, 65280]], [1, 1080, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 65280]], [2, 1080, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 65280]], [3, 1080, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 65280]]], "Parkway Forest Outdoor Pool": [[0, 780, 1110, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4293918720, 1023]], [1, 780, 1110, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4293918720, 1023]], [2, 780, 1110, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4293918720, 1023]], [3, 780, 1110, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4293918720, 1023]], [4, 780, 1110, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4293918720, 1023]], [5, 780, 1110, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4293918720, 1023]], [6, 780, 1110, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4293918720, 1023]]], "Pine Point Park Outdoor Pool": [[0, 780, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4293918720, 0]], [0, 1020, 1195, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 65520]], [1, 780, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4293918720, 0]], [1, 1020, 1195, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 65520]], [2, 780, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4293918720, 0]], [2, 1020, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 65520]], [3, 780, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4293918720, 0]], [3, 1020, 1195, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 65520]], [4, 780, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4293918720, 0]], [4, 1020, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 65520]], [5, 780, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4293918720, 0]], [5, 1020, 1195, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 65520]], [6, 780, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4293918720, 0]], [6, 1020, 1195, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 65520]]], "Pleasantview Community Centre": [[0, 720, 1135, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4294901760, 4095]], [1, 720, 1135, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 4095]], [2, 720, 1135, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 4095]], [2, 1110, 1170, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 15360]], [3, 720, 1105, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 1023]], [4, 720, 1135, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 4095]], [5, 720, 1135, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 4095]], [6, 720, 1105, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 1023]], [6, 1110, 1170, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 15360]]], "Richmond Gardens Pool": [[0, 870, 985, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4227858432, 3]], [0, 1140, 1195, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 61440]], [1, 870, 985, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4227858432, 3]], [1, 1140, 1195, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 61440]], [2, 870, 985, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4227858432, 3]], [2, 1140, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 61440]], [3, 870, 985, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4227858432, 3]], [3, 1140, 1195, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 61440]], [4, 870, 985, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4227858432, 3]], [4, 1140, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 61440]], [5, 870, 985, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4227858432, 3]], [5, 1140, 1195, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 61440]], [6, 870, 985, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4227858432, 3]], [6, 1140, 1195, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 61440]]], "Riverdale Park East": [[0, 720, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 65535]], [1, 720, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 65535]], [2, 720, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 65535]], [3, 720, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 65535]], [4, 720, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 65535]], [5, 720, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 65535]]], "Roding Community Centre": [[0, 720, 955, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4294901760, 0]], [0, 990, 1135, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 4092]], [1, 720, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 0]], [1, 990, 1135, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 4092]], [2, 720, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 0]], [2, 990, 1135, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 4092]], [3, 720, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 0]], [3, 990, 1135, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 4092]], [4, 720, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 0]], [4, 990, 1135, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 4092]], [5, 720, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 0]], [5, 990, 1135, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 4092]], [6, 720, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 0]], [6, 990, 1135, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 4092]]], "Rotary Peace Park Outdoor Pool": [[0, 840, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4278190080, 0]], [0, 1140, 1195, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 61440]], [1, 840, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 0]], [1, 1140, 1195, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 61440]], [2, 840, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 0]], [2, 1140, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 61440]], [3, 840, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 0]], [3, 1140, 1195, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 61440]], [4, 840, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 0]], [4, 1140, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 61440]], [5, 840, 985, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 3]], [5, 1140, 1195, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 61440]]], "Runnymede Collegiate Institute": [[0, 795, 870, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 65011712, 0]], [2, 795, 870, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 65011712, 0]], [4, 795, 870, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 65011712, 0]]], "S.H. Armstrong Community Centre": [[0, 750, 840, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 16515072, 0]], [1, 750, 840, "Leisure Swim", "2019-07-09", "2019-07-23", [0, 16515072, 0]], [2, 750, 840, "Leisure Swim", "2019-07-10", "2019-07-24", [0, 16515072, 0]], [3, 750, 840, "Leisure Swim", "2019-07-11", "2019-07-25", [0, 16515072, 0]], [4, 750, 840, "Leisure Swim", "2019-07-12", "2019-07-26", [0, 16515072, 0]]], "Scadding Court Community Centre": [[5, 780, 950, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4293918720, 0]], [6, 840, 950, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 0]]], "Sir Oliver Mowat Collegiate Institute": [[1, 840, 960, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 0]], [3, 840, 960, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 0]], [5, 840, 960, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 0]]], "Smithfield Park Outdoor Pool": [[0, 810, 1185, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4290772992, 32767]], [1, 810, 1185, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4290772992, 32767]], [2, 870, 1185, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4227858432, 32767]], [3, 810, 1185, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4290772992, 32767]], [4, 870, 1185, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4227858432, 32767]], [5, 810, 1185, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4290772992, 32767]], [6, 810, 1005, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4290772992, 7]]], "Smythe Park": [[0, 720, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 0]], [0, 1020, 1135, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 4080]], [1, 720, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 0]], [1, 1020, 1135, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 4080]], [2, 720, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 0]], [2, 1020, 1135, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 4080]], [3, 720, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 0]], [3, 1020, 1135, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 4080]], [4, 720, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 0]], [4, 1020, 1135, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 4080]], [5, 720, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 0]], [5, 1020, 1135, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 4080]], [6, 720, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 0]], [6, 1020, 1135, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 4080]]], "St. Lawrence Community Recreation Centre": [[0, 840, 960, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4278190080, 0]], [1, 840, 960, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 0]], [2, 840, 960, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 0]], [3, 840, 960, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 0]], [4, 840, 960, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 0]], [5, 840, 960, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 0]], [6, 840, 960, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 0]]], "Stanley Park South - Toronto": [[0, 720, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 65535]], [1, 720, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 65535]], [2, 720, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 65535]], [3, 720, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 65535]], [4, 720, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 65535]], [5, 720, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 65535]], [6, 720, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 65535]]], "Sunnyside Gus Ryder Outdoor Pool": [[0, 600, 945, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 2147483392, 0]], [0, 1020, 1200, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 65520]], [1, 600, 945, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 2147483392, 0]], [1, 1020, 1200, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 65520]], [2, 600, 945, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 2147483392, 0]], [2, 1020, 1200, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 65520]], [3, 600, 945, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 2147483392, 0]], [3, 1020, 1200, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 65520]], [4, 600, 945, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 2147483392, 0]], [4, 1020, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 65520]], [5, 600, 945, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 2147483392, 0]], [5, 1020, 1200, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 65520]], [6, 600, 945, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 2147483392, 0]], [6, 1020, 1200, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 65520]]], "Swansea Community Recreation Centre": [[0, 855, 910, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 503316480, 0]], [1, 855, 910, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 503316480, 0]], [2, 855, 910, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 503316480, 0]], [3, 855, 910, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 503316480, 0]], [4, 855, 910, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 503316480, 0]], [4, 1140, 1215, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 126976]], [5, 825, 940, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 2139095040, 0]], [6, 825, 940, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 2139095040, 0]]], "The Elms Pool and Community School": [[0, 780, 835, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 15728640, 0]], [1, 1200, 1255, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 983040]], [2, 765, 820, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 7864320, 0]], [3, 1200, 1255, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 983040]], [4, 810, 925, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 1069547520, 0]], [5, 810, 925, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 1069547520, 0]], [6, 810, 925, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 1069547520, 0]]], "The New Generation Youth Recreation Centre": [[0, 840, 895, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 251658240, 0]], [2, 840, 895, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 251658240, 0]]], "Toronto Pan Am Sports Centre": [[0, 885, 990, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4160749568, 3]], [1, 885, 960, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4160749568, 0]], [1, 1155, 1230, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 253952]], [2, 885, 990, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4160749568, 3]], [3, 885, 960, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4160749568, 0]], [3, 1155, 1230, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 253952]], [4, 885, 990, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4160749568, 3]], [5, 855, 960, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4261412864, 0]], [6, 855, 960, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4261412864, 0]]], "Trinity Community Recreation Centre": [[0, 855, 1065, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4261412864, 127]], [1, 960, 1065, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 127]], [2, 960, 1065, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 127]], [3, 855, 1065, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4261412864, 127]], [4, 960, 1065, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 127]], [5, 840, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 0]], [6, 840, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 0]]], "Wallace Emerson Community Centre": [[1, 540, 600, "Leisure Swim", "2019-07-09", "2019-07-23", [0, 240, 0]], [1, 1080, 1140, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 3840]], [3, 540, 600, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 240, 0]], [3, 810, 930, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 1069547520, 0]], [3, 1080, 1140, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 3840]], [4, 600, 660, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 3840, 0]], [4, 1080, 1200, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 65280]], [6, 810, 990, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4290772992, 3]]], "Wedgewood Park  Outdoor Pool": [[0, 840, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4278190080, 0]], [0, 1140, 1195, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 61440]], [1, 840, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 0]], [1, 1140, 1195, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 61440]], [2, 840, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 0]], [2, 1140, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 61440]], [3, 840, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 0]], [3, 1140, 1195, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 61440]], [5, 840, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 0]], [5, 1140, 1195, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 61440]]], "West Deane Park Outdoor Pool": [[0, 840, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4278190080, 0]], [0, 1140, 1195, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 61440]], [1, 840, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 0]], [1, 1140, 1195, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 61440]], [2, 840, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 0]], [2, 1140, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 61440]], [3, 840, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 0]], [3, 1140, 1195, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 61440]], [5, 840, 985, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 3]], [5, 1140, 1195, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 61440]]], "West Hill Collegiate Institute": [[0, 840, 960, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 4278190080, 0]], [2, 840, 960, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 0]], [6, 840, 960, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 0]]], "West Mall Outdoor Pool": [[0, 840, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4278190080, 0]], [0, 1140, 1195, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 61440]], [1, 840, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4278190080, 0]], [1, 1140, 1195, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 61440]], [2, 840, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4278190080, 0]], [2, 1140, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 61440]], [3, 840, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4278190080, 0]], [3, 1140, 1195, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 61440]], [4, 840, 985, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4278190080, 3]], [4, 1140, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 61440]], [5, 840, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4278190080, 0]], [5, 1140, 1195, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 61440]], [6, 840, 985, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4278190080, 3]], [6, 1140, 1195, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 61440]]], "Westgrove Park Outdoor Pool": [[0, 825, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4286578688, 0]], [0, 1095, 1165, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 15872]], [1, 825, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4286578688, 0]], [1, 1095, 1165, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 15872]], [2, 825, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4286578688, 0]], [2, 1095, 1165, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 15872]], [3, 825, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4286578688, 0]], [3, 1095, 1165, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 15872]], [4, 825, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4286578688, 0]], [4, 1095, 1165, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 15872]], [5, 825, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4286578688, 0]], [5, 1095, 1165, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 15872]], [6, 825, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4286578688, 0]], [6, 1095, 1165, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 15872]]], "Westmount Park Outdoor Pool": [[0, 855, 975, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4261412864, 1]], [0, 1155, 1195, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 57344]], [1, 855, 975, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4261412864, 1]], [1, 1155, 1195, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 57344]], [2, 855, 975, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4261412864, 1]], [2, 1155, 1195, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 57344]], [3, 855, 975, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4261412864, 1]], [3, 1155, 1195, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 57344]], [4, 855, 975, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4261412864, 1]], [4, 1155, 1195, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 57344]], [5, 855, 975, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4261412864, 1]], [5, 1155, 1195, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 57344]], [6, 855, 975, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4261412864, 1]], [6, 1155, 1195, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 57344]]], "Weston Lions Park": [[0, 720, 955, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 4294901760, 0]], [0, 1020, 1170, "Leisure Swim", "2019-07-01", "2019-07-22", [0, 0, 16368]], [1, 720, 955, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 4294901760, 0]], [1, 1020, 1170, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 0, 16368]], [2, 720, 955, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 4294901760, 0]], [2, 1020, 1170, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 0, 16368]], [3, 720, 955, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 4294901760, 0]], [3, 1020, 1170, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 0, 16368]], [4, 720, 955, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4294901760, 0]], [4, 1020, 1170, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 16368]], [5, 720, 955, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 4294901760, 0]], [5, 1020, 1170, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 0, 16368]], [6, 720, 955, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 4294901760, 0]], [6, 1020, 1170, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 0, 16368]]], "Wexford Collegiate Institute": [[0, 930, 1020, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 3221225472, 15]], [1, 930, 1020, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 3221225472, 15]], [2, 930, 1020, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 3221225472, 15]], [3, 930, 1020, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 3221225472, 15]], [4, 930, 1020, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 3221225472, 15]]], "York Recreation Centre": [[0, 810, 930, "Leisure Swim", "2019-07-08", "2019-07-22", [0, 1069547520, 0]], [1, 870, 930, "Leisure Swim", "2019-07-02", "2019-07-23", [0, 1006632960, 0]], [2, 810, 930, "Leisure Swim", "2019-07-03", "2019-07-24", [0, 1069547520, 0]], [3, 810, 930, "Leisure Swim", "2019-07-04", "2019-07-25", [0, 1069547520, 0]], [4, 900, 1020, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 4026531840, 15]], [4, 1170, 1290, "Leisure Swim", "2019-07-05", "2019-07-26", [0, 0, 4177920]], [5, 810, 945, "Leisure Swim", "2019-07-06", "2019-07-27", [0, 2143289344, 0]], [6, 810, 945, "Leisure Swim", "2019-07-07", "2019-07-21", [0, 2143289344, 0]]]}, "slots": {"Birchmount Community Centre": {"2019-07-01": [0, 0, 0]}, "Broadlands Community Centre": {"2019-07-01": [0, 0, 0]}, "East York Community Centre": {"2019-07-01": [0, 0, 0]}, "Grandravine Community Recreation Centre": {"2019-07-01": [0, 0, 0]}, "Harrison Pool": {"2019-07-07": [0, 0, 0]}, "Irving W. Chapley Community Centre": {"2019-07-01": [0, 0, 0]}, "Lawrence Heights Community Centre": {"2019-07-01": [0, 0, 0]}, "Roding Community Centre": {"2019-07-01": [0, 0, 0]}, "Scadding Court Community Centre": {"2019-07-06": [0, 0, 0]}}});
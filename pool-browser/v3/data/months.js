@@ -0,0 +1 @@
+const pool_months = {"2019-06": {"first": "2019-06-02", "last": "2019-06-30", "src": "data/2019-06.js?v=daba0366cbb3"}, "2019-07": {"first": "2019-07-01", "last": "2019-07-27", "src": "data/2019-07.js?v=be1b5f1b7e7e"}};
@@ -0,0 +1,212 @@
+/*
+Distances and driving times from an address to every pool, for pools-v3.js's Distance/Driving time sorts. Runs as a
+Web Worker, so downloading, checking and ranking them never holds up the page.
+
+Every distance is kept in IndexedDB, by (normalized address, pool), so asking again for the same address (after a
+reload, on another date, ...) is answered from there without using any of the API key's quota. Only pools that aren't
+cached yet (or whose address changed) are downloaded, and a download that's already going is shared instead of being
+sent again.
+
+Messages in:  {id, address, apiKey, pools: [[name, address], ...], cacheOnly}
+Messages out: {id, status, error}          progress, as it goes
+              {id, done: true, distances: {name: [km, seconds]}, ranks: {distance: {name: rank}, time: {name: rank}},
+               cached, downloaded}       once it's done (with whatever it got, even if a download failed)
+*/
+
+const dataMatrixAPIURL = 'https://www.mapquestapi.com/directions/v2/routematrix'; // ?key=...
+const maxMatrixAPISize = 100;
+const dbName = 'pools-v3-distances';
+const storeName = 'distances';
+
+// map request (API key, address and pool addresses) -> promise of its response, while it's downloading
+const inFlight = new Map();
+
+let dbOpen;
+
+function openDB() {
+    if (dbOpen === undefined) {
+        dbOpen = new Promise((resolve, reject) => {
+            let request = indexedDB.open(dbName, 1);
+            request.onupgradeneeded = () => request.result.createObjectStore(storeName, {keyPath: ['origin', 'pool']});
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => reject(request.error);
+        }).catch(err => {
+            // e.g. private browsing: still works, just without the cache
+            console.log(`WARN: Couldn't open IndexedDB, distances won't be cached: ${err}`);
+            return undefined;
+        });
+    }
+    return dbOpen;
+}
+
+function normalizeAddress(address) {
+    // "  123 Main St.,  Toronto ON " and "123 main st, toronto, on" are the same place
+    let normalized = address.toLowerCase().replace(/[.,]/g, ' ').replace(/\s+/g, ' ').trim();
+    return normalized.replace(/ toronto( on(tario)?)?$/, '');
+}
+
+function readCached(db, origin, pools) {
+    // map pool name -> cached entry, for the pools whose address hasn't changed since
+    if (db === undefined) {
+        return Promise.resolve(new Map());
+    }
+
+    return new Promise((resolve, reject) => {
+        let cached = new Map();
+        let transaction = db.transaction(storeName, 'readonly');
+        let store = transaction.objectStore(storeName);
+        for (let [name, address] of pools) {
+            let request = store.get([origin, name]);
+            request.onsuccess = () => {
+                if (request.result !== undefined && request.result.address === address) {
+                    cached.set(name, request.result);
+                }
+            };
+        }
+        transaction.oncomplete = () => resolve(cached);
+        transaction.onerror = () => reject(transaction.error);
+    });
+}
+
+function writeCached(db, entries) {
+    if (db === undefined || entries.length === 0) {
+        return Promise.resolve();
+    }
+
+    return new Promise((resolve, reject) => {
+        let transaction = db.transaction(storeName, 'readwrite');
+        let store = transaction.objectStore(storeName);
+        for (let entry of entries) {
+            store.put(entry);
+        }
+        transaction.oncomplete = () => resolve();
+        transaction.onerror = () => reject(transaction.error);
+    });
+}
+
+function downloadBatch(apiKey, address, pools) {
+    // pools is [[name, address], ...], at most maxMatrixAPISize - 1 of them (the first location is our own address)
+    let body = JSON.stringify({locations: [address, ...pools.map(([, poolAddress]) => poolAddress)]});
+    let key = `${apiKey}\n${body}`;
+
+    if (!inFlight.has(key)) {
+        let download = fetch(`${dataMatrixAPIURL}?key=${encodeURIComponent(apiKey)}`, {method: 'POST', body: body})
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`unexpected (non-200) response from MapQuest: ${response.status}`);
+                }
+                return response.json();
+            })
+            .then(response => parseResponse(response, pools.length))
+            .finally(() => inFlight.delete(key));
+        inFlight.set(key, download);
+    }
+    return inFlight.get(key);
+}
+
+function parseResponse(response, poolCount) {
+    // Returns [distances, times], one for each pool, in the same order as they were asked for
+    if (response.route) {
+        let message = response.info.messages[0];
+        throw new Error(`The location finder doesn't seem to like your location. It says "${message}".`);
+    }
+
+    let distances = response.distance;
+    let times = response.time;
+
+    // one each per location, or per location but the first (our own)
+    let ll = response.locations.length;
+    if (ll !== poolCount + 1 || (distances.length !== ll && distances.length !== ll - 1) ||
+        (times.length !== ll && times.length !== ll - 1)) {
+        console.log(`ERROR: dl: ${distances.length}, tl: ${times.length}, ll: ${ll}`);
+        throw new Error("unexpected response (number of distances/times doesn't match number of pools...)");
+    }
+
+    // sometimes a little weird...
+    if (distances.length === ll) {
+        if (distances[0] !== 0) {
+            throw new Error('unexpected distances returned (distance to self is non-zero)');
+        }
+        distances = distances.slice(1);
+    }
+    if (times.length === ll) {
+        if (times[0] !== 0) {
+            throw new Error('unexpected times returned (time to self is non-zero)');
+        }
+        times = times.slice(1);
+    }
+
+    return [distances, times];
+}
+
+function ranksBy(distances, index) {
+    // map pool name -> its place when sorted by distances[name][index] (ties by name)
+    let names = Object.keys(distances);
+    names.sort((name1, name2) => distances[name1][index] - distances[name2][index] ||
+        (name1 > name2 ? 1 : name1 < name2 ? -1 : 0));
+    return Object.fromEntries(names.map((name, i) => [name, i]));
+}
+
+async function getDistances({id, address, apiKey, pools, cacheOnly}) {
+    let origin = normalizeAddress(address);
+    let db = await openDB();
+
+    let cached = await readCached(db, origin, pools);
+    let distances = {};
+    for (let [name, entry] of cached) {
+        distances[name] = [entry.distance, entry.time];
+    }
+
+    let missing = cacheOnly ? [] : pools.filter(([name]) => !cached.has(name));
+    let downloaded = 0;
+
+    // one batch at a time, so a bad key or address stops after the first one instead of using up quota on the rest
+    for (let i = 0; i < missing.length; i += maxMatrixAPISize - 1) {
+        let batch = missing.slice(i, i + maxMatrixAPISize - 1);
+        postMessage({id, status: `downloading distances/times of ${batch.length} pools...`});
+
+        let batchDistances, batchTimes;
+        try {
+            [batchDistances, batchTimes] = await downloadBatch(apiKey, address, batch);
+        } catch (err) {
+            postMessage({id, status: `${err.message || err}`, error: true});
+            break;
+        }
+        let entries = batch.map(([name, poolAddress], j) => ({
+            origin: origin, pool: name, address: poolAddress, distance: batchDistances[j], time: batchTimes[j],
+            downloaded: Date.now(),
+        }));
+
+        // a distance that looks off isn't cached, so that downloading again can fix it
+        let suspicious = entries.filter(entry => entry.distance > 50 || entry.distance === 0);
+        if (entries.some(entry => entry.distance > 50)) {
+            postMessage({id, status: 'one of the distances is >50km... maybe just a MapQuest bug, try re-downloading',
+                         error: true});
+        }
+        if (entries.some(entry => entry.distance === 0)) {
+            postMessage({id, status: 'one of the distances is 0km... maybe just a MapQuest bug, try re-downloading',
+                         error: true});
+        }
+        await writeCached(db, entries.filter(entry => !suspicious.includes(entry)));
+
+        for (let entry of entries) {
+            distances[entry.pool] = [entry.distance, entry.time];
+        }
+        downloaded += batch.length;
+    }
+
+    return {
+        id, done: true, distances, cached: cached.size, downloaded,
+        ranks: {distance: ranksBy(distances, 0), time: ranksBy(distances, 1)},
+    };
+}
+
+self.addEventListener('message', (event) => {
+    getDistances(event.data)
+        .then(result => postMessage(result))
+        .catch(err => {
+            postMessage({id: event.data.id, status: `${err.message || err}`, error: true});
+            postMessage({id: event.data.id, done: true, distances: {}, ranks: {distance: {}, time: {}}, cached: 0,
+                         downloaded: 0});
+        });
+});
@@ -0,0 +1 @@
+const pool_info = {"Albert Crosland Park": {"name": "Albert Crosland Park", "classified_name": "albert-crosland-park", "availabilities": {}, "slots": {}, "address": "14 FULLER AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Albion Pool and Health Club": {"name": "Albion Pool and Health Club", "classified_name": "albion-pool-and-health-club", "availabilities": {}, "slots": {}, "address": "1485 ALBION RD", "type": "indoor pool", "phone": "416 394-8676", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Alderwood Centre": {"name": "Alderwood Centre", "classified_name": "alderwood-centre", "availabilities": {}, "slots": {}, "address": "2 ORIANNA DR", "type": "indoor pool", "phone": "416 394-8738", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Alex Duff Memorial Pool": {"name": "Alex Duff Memorial Pool", "classified_name": "alex-duff-memorial-pool", "availabilities": {}, "slots": {}, "address": "779 CRAWFORD ST", "type": "outdoor pool", "phone": "416 392-0910", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Alexandra Park": {"name": "Alexandra Park", "classified_name": "alexandra-park", "availabilities": {}, "slots": {}, "address": "275 BATHURST ST", "type": "splash pad", "phone": null, "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Amesbury Sports Complex": {"name": "Amesbury Sports Complex", "classified_name": "amesbury-sports-complex", "availabilities": {}, "slots": {}, "address": "155 CULFORD RD", "type": "outdoor pool", "phone": "416 395-0145", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Amos Waites Park Outdoor Pool": {"name": "Amos Waites Park Outdoor Pool", "classified_name": "amos-waites-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "2441 LAKE SHORE BLVD W", "type": "outdoor pool", "phone": "416 394-8484", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Annette Community Recreation Centre": {"name": "Annette Community Recreation Centre", "classified_name": "annette-community-recreation-centre", "availabilities": {}, "slots": {}, "address": "333 ANNETTE ST", "type": "indoor pool", "phone": "416 392-0736", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Antibes Community Centre": {"name": "Antibes Community Centre", "classified_name": "antibes-community-centre", "availabilities": {}, "slots": {}, "address": "140 ANTIBES DR", "type": "indoor pool", "phone": "416 395-0096", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Art Eggleton Park": {"name": "Art Eggleton Park", "classified_name": "art-eggleton-park", "availabilities": {}, "slots": {}, "address": "323 HARBORD ST", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Beaches Recreation Centre": {"name": "Beaches Recreation Centre", "classified_name": "beaches-recreation-centre", "availabilities": {}, "slots": {}, "address": "6 WILLIAMSON RD", "type": "indoor pool", "phone": "416 392-0740", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Bedford Park Community Centre": {"name": "Bedford Park Community Centre", "classified_name": "bedford-park-community-centre", "availabilities": {}, "slots": {}, "address": "81 RANLEIGH AVE", "type": "indoor pool", "phone": "416 392-0618", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Beresford Park": {"name": "Beresford Park", "classified_name": "beresford-park", "availabilities": {}, "slots": {}, "address": "400 BERESFORD AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Birch Park": {"name": "Birch Park", "classified_name": "birch-park", "availabilities": {}, "slots": {}, "address": "75 ARCADIAN CIR", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Birchmount Community Centre": {"name": "Birchmount Community Centre", "classified_name": "birchmount-community-centre", "availabilities": {}, "slots": {}, "address": "93 BIRCHMOUNT RD", "type": "indoor pool", "phone": "416 396-4311", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Blantyre Park": {"name": "Blantyre Park", "classified_name": "blantyre-park", "availabilities": {}, "slots": {}, "address": "180 FALLINGBROOK RD", "type": "outdoor pool", "phone": "416-396-4126", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Broadlands Community Centre": {"name": "Broadlands Community Centre", "classified_name": "broadlands-community-centre", "availabilities": {}, "slots": {}, "address": "19 CASTLEGROVE BLVD", "type": "outdoor pool", "phone": "416 395-7966", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Budapest Park": {"name": "Budapest Park", "classified_name": "budapest-park", "availabilities": {}, "slots": {}, "address": "1575 LAKE SHORE BLVD W", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "CW Jefferys Collegiate Institute": {"name": "CW Jefferys Collegiate Institute", "classified_name": "cw-jefferys-collegiate-institute", "availabilities": {}, "slots": {}, "address": "340 SENTINEL RD", "type": "indoor pool", "phone": "416 395-7879", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Campbell Avenue Playground": {"name": "Campbell Avenue Playground", "classified_name": "campbell-avenue-playground", "availabilities": {}, "slots": {}, "address": "225 CAMPBELL AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Cedarbrae Collegiate Institute": {"name": "Cedarbrae Collegiate Institute", "classified_name": "cedarbrae-collegiate-institute", "availabilities": {}, "slots": {}, "address": "550 MARKHAM RD", "type": "indoor pool", "phone": "416 396-4006", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Centennial Park - Etobicoke": {"name": "Centennial Park - Etobicoke", "classified_name": "centennial-park---etobicoke", "availabilities": {}, "slots": {}, "address": "256 CENTENNIAL PARK RD", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Centennial Recreation Centre - Scarborough": {"name": "Centennial Recreation Centre - Scarborough", "classified_name": "centennial-recreation-centre---scarborough", "availabilities": {}, "slots": {}, "address": "1967 ELLESMERE RD", "type": "indoor pool", "phone": "416 396-4057", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Charles G. Williams Park": {"name": "Charles G. Williams Park", "classified_name": "charles-g-williams-park", "availabilities": {}, "slots": {}, "address": "75 WABASH AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Christie Pits Park": {"name": "Christie Pits Park", "classified_name": "christie-pits-park", "availabilities": {}, "slots": {}, "address": "750 BLOOR ST W", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Close Avenue Parkette": {"name": "Close Avenue Parkette", "classified_name": "close-avenue-parkette", "availabilities": {}, "slots": {}, "address": "116 CLOSE AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Columbus Parkette": {"name": "Columbus Parkette", "classified_name": "columbus-parkette", "availabilities": {}, "slots": {}, "address": "1985 DUNDAS ST W", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Cummer Park Community Centre": {"name": "Cummer Park Community Centre", "classified_name": "cummer-park-community-centre", "availabilities": {}, "slots": {}, "address": "6000 LESLIE ST", "type": "indoor pool", "phone": "416 395-7803", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "David Crombie Park": {"name": "David Crombie Park", "classified_name": "david-crombie-park", "availabilities": {}, "slots": {}, "address": "131 THE ESPLANADE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Dennis R. Timbrell Resource Centre": {"name": "Dennis R. Timbrell Resource Centre", "classified_name": "dennis-r-timbrell-resource-centre", "availabilities": {}, "slots": {}, "address": "29 ST DENNIS DR", "type": "indoor pool", "phone": "416 395-7972", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Domenico Di Luca Community Recreation Centre": {"name": "Domenico Di Luca Community Recreation Centre", "classified_name": "domenico-di-luca-community-recreation-centre", "availabilities": {}, "slots": {}, "address": "25 STANLEY RD", "type": "outdoor pool", "phone": "416 395-6673", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Don Russell Memorial Park": {"name": "Don Russell Memorial Park", "classified_name": "don-russell-memorial-park", "availabilities": {}, "slots": {}, "address": "290 BIRMINGHAM ST", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Donald D. Summerville Olympic Pools": {"name": "Donald D. Summerville Olympic Pools", "classified_name": "donald-d-summerville-olympic-pools", "availabilities": {}, "slots": {}, "address": "1867 LAKE SHORE BLVD E", "type": "outdoor pool", "phone": "416 392-7688", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Douglas Snow Aquatic Centre": {"name": "Douglas Snow Aquatic Centre", "classified_name": "douglas-snow-aquatic-centre", "availabilities": {}, "slots": {}, "address": "5100 YONGE ST", "type": "indoor pool", "phone": "416 395-7585", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Dovercourt Park": {"name": "Dovercourt Park", "classified_name": "dovercourt-park", "availabilities": {}, "slots": {}, "address": "155 BARTLETT AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Driftwood Community Recreation Centre": {"name": "Driftwood Community Recreation Centre", "classified_name": "driftwood-community-recreation-centre", "availabilities": {}, "slots": {}, "address": "4401 JANE ST", "type": "outdoor pool", "phone": "416 395-7944", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Dufferin Grove Park": {"name": "Dufferin Grove Park", "classified_name": "dufferin-grove-park", "availabilities": {}, "slots": {}, "address": "875 DUFFERIN ST", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Earl Beatty Community Centre": {"name": "Earl Beatty Community Centre", "classified_name": "earl-beatty-community-centre", "availabilities": {}, "slots": {}, "address": "455 GLEBEHOLME BLVD", "type": "indoor pool", "phone": "416 392-0752", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Earlscourt Park": {"name": "Earlscourt Park", "classified_name": "earlscourt-park", "availabilities": {}, "slots": {}, "address": "1200 LANSDOWNE AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "East York Community Centre": {"name": "East York Community Centre", "classified_name": "east-york-community-centre", "availabilities": {}, "slots": {}, "address": "1081 1/2 PAPE AVE", "type": "indoor pool", "phone": "416 396-2880", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Eglinton Park": {"name": "Eglinton Park", "classified_name": "eglinton-park", "availabilities": {}, "slots": {}, "address": "200 EGLINTON AVE W", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Eringate Park Outdoor Pool": {"name": "Eringate Park Outdoor Pool", "classified_name": "eringate-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "121 WELLESWORTH DR", "type": "outdoor pool", "phone": "416 394-8485", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Etobicoke Olympium": {"name": "Etobicoke Olympium", "classified_name": "etobicoke-olympium", "availabilities": {}, "slots": {}, "address": "590 RATHBURN RD", "type": "indoor pool", "phone": "416 394-8111", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Fairbank Memorial Park": {"name": "Fairbank Memorial Park", "classified_name": "fairbank-memorial-park", "availabilities": {}, "slots": {}, "address": "2213 DUFFERIN ST", "type": "outdoor pool", "phone": "416-394-2742", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Fairhaven Park": {"name": "Fairhaven Park", "classified_name": "fairhaven-park", "availabilities": {}, "slots": {}, "address": "100 GOLFWOOD HTS", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Fairhaven Park Outdoor Pool": {"name": "Fairhaven Park Outdoor Pool", "classified_name": "fairhaven-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "100 GOLFWOOD HTS", "type": "outdoor pool", "phone": "416 394-8486", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Fairmount Park Community Centre": {"name": "Fairmount Park Community Centre", "classified_name": "fairmount-park-community-centre", "availabilities": {}, "slots": {}, "address": "1757 GERRARD ST E", "type": "indoor pool", "phone": "416 392-7060", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Frankland Community Centre": {"name": "Frankland Community Centre", "classified_name": "frankland-community-centre", "availabilities": {}, "slots": {}, "address": "816 LOGAN AVE", "type": "indoor pool", "phone": "416 392-0749", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Fred Hamilton Playground": {"name": "Fred Hamilton Playground", "classified_name": "fred-hamilton-playground", "availabilities": {}, "slots": {}, "address": "155 ROXTON RD", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Geary Avenue Parkette": {"name": "Geary Avenue Parkette", "classified_name": "geary-avenue-parkette", "availabilities": {}, "slots": {}, "address": "15 GEARY AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "General Mercer School - Wading Pool": {"name": "General Mercer School - Wading Pool", "classified_name": "general-mercer-school---wading-pool", "availabilities": {}, "slots": {}, "address": "30 TURNBERRY AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Gihon Spring Park Outdoor Pool": {"name": "Gihon Spring Park Outdoor Pool", "classified_name": "gihon-spring-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "75 GIHON SPRING DR", "type": "outdoor pool", "phone": "416 394-8488", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Giovanni Caboto Rink, Pool and Tennis Courts": {"name": "Giovanni Caboto Rink, Pool and Tennis Courts", "classified_name": "giovanni-caboto-rink-pool-and-tennis-courts", "availabilities": {}, "slots": {}, "address": "1367 ST CLAIR AVE W", "type": "outdoor pool", "phone": "416 392-7762", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Glen Long Community Centre": {"name": "Glen Long Community Centre", "classified_name": "glen-long-community-centre", "availabilities": {}, "slots": {}, "address": "35 GLEN LONG AVE", "type": "outdoor pool", "phone": "416 395-7961", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Glen Park": {"name": "Glen Park", "classified_name": "glen-park", "availabilities": {}, "slots": {}, "address": "44 A EASTGLEN CRES", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Gord and Irene Risk Community Centre": {"name": "Gord and Irene Risk Community Centre", "classified_name": "gord-and-irene-risk-community-centre", "availabilities": {}, "slots": {}, "address": "2650 FINCH AVE W", "type": "outdoor pool", "phone": "416 395-0355", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Grandravine Community Recreation Centre": {"name": "Grandravine Community Recreation Centre", "classified_name": "grandravine-community-recreation-centre", "availabilities": {}, "slots": {}, "address": "23 GRANDRAVINE DR", "type": "outdoor pool", "phone": "416 395-6171", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Greenwood Park": {"name": "Greenwood Park", "classified_name": "greenwood-park", "availabilities": {}, "slots": {}, "address": "150 GREENWOOD AVE", "type": "splash pad", "phone": null, "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Gus Ryder Pool and Health Club": {"name": "Gus Ryder Pool and Health Club", "classified_name": "gus-ryder-pool-and-health-club", "availabilities": {}, "slots": {}, "address": "1 FAUSTINA DR", "type": "indoor pool", "phone": "416 394-8726", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Halbert Park": {"name": "Halbert Park", "classified_name": "halbert-park", "availabilities": {}, "slots": {}, "address": "24 ROCKWOOD DR", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Harrison Pool": {"name": "Harrison Pool", "classified_name": "harrison-pool", "availabilities": {}, "slots": {}, "address": "15 STEPHANIE ST", "type": "indoor pool", "phone": "416 392-7984", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Healey Willan Park": {"name": "Healey Willan Park", "classified_name": "healey-willan-park", "availabilities": {}, "slots": {}, "address": "504 EUCLID AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Heron Park Community Centre": {"name": "Heron Park Community Centre", "classified_name": "heron-park-community-centre", "availabilities": {}, "slots": {}, "address": "292 MANSE RD", "type": "outdoor pool", "phone": "416 396-4035", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "High Park": {"name": "High Park", "classified_name": "high-park", "availabilities": {}, "slots": {}, "address": "1873 BLOOR ST W", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Highview Park": {"name": "Highview Park", "classified_name": "highview-park", "availabilities": {}, "slots": {}, "address": "150 HIGHVIEW AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Hillcrest Community Centre": {"name": "Hillcrest Community Centre", "classified_name": "hillcrest-community-centre", "availabilities": {}, "slots": {}, "address": "1339 BATHURST ST", "type": "indoor pool", "phone": "416 392-0746", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Hillcrest Park": {"name": "Hillcrest Park", "classified_name": "hillcrest-park", "availabilities": {}, "slots": {}, "address": "950 DAVENPORT RD", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Humber Community Pool": {"name": "Humber Community Pool", "classified_name": "humber-community-pool", "availabilities": {}, "slots": {}, "address": "205 HUMBER COLLEGE BLVD", "type": "indoor pool", "phone": "416 394-6050", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Irving W. Chapley Community Centre": {"name": "Irving W. Chapley Community Centre", "classified_name": "irving-w-chapley-community-centre", "availabilities": {}, "slots": {}, "address": "205 WILMINGTON AVE", "type": "outdoor pool", "phone": "416 395-0453", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Jimmie Simpson Recreation Centre": {"name": "Jimmie Simpson Recreation Centre", "classified_name": "jimmie-simpson-recreation-centre", "availabilities": {}, "slots": {}, "address": "870 QUEEN ST E", "type": "indoor pool", "phone": "416 392-0751", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "John Innes Community Recreation Centre": {"name": "John Innes Community Recreation Centre", "classified_name": "john-innes-community-recreation-centre", "availabilities": {}, "slots": {}, "address": "150 SHERBOURNE ST", "type": "indoor pool", "phone": "416 392-6779", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Joseph J. Piccininni Community Centre": {"name": "Joseph J. Piccininni Community Centre", "classified_name": "joseph-j-piccininni-community-centre", "availabilities": {}, "slots": {}, "address": "1369 ST CLAIR AVE W", "type": "indoor pool", "phone": "416 392-0036", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Kidstown - Water Park": {"name": "Kidstown - Water Park", "classified_name": "kidstown---water-park", "availabilities": {}, "slots": {}, "address": "3159 BIRCHMOUNT RD", "type": "outdoor pool", "phone": "416-396-8325", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Kiwanis Outdoor Pool": {"name": "Kiwanis Outdoor Pool", "classified_name": "kiwanis-outdoor-pool", "availabilities": {}, "slots": {}, "address": "375 CEDARVALE AVE", "type": "outdoor pool", "phone": "416 396-2847", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Knob Hill Park": {"name": "Knob Hill Park", "classified_name": "knob-hill-park", "availabilities": {}, "slots": {}, "address": "625 BRIMLEY RD", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "L'Amoreaux Collegiate Institute": {"name": "L'Amoreaux Collegiate Institute", "classified_name": "lamoreaux-collegiate-institute", "availabilities": {}, "slots": {}, "address": "2501 BRIDLETOWNE CIR", "type": "indoor pool", "phone": "416 396-4005", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Lambton - Kingsway Park Outdoor Pool": {"name": "Lambton - Kingsway Park Outdoor Pool", "classified_name": "lambton---kingsway-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "37 MARQUIS AVE", "type": "outdoor pool", "phone": "416 394-8489", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Lawrence Heights Community Centre": {"name": "Lawrence Heights Community Centre", "classified_name": "lawrence-heights-community-centre", "availabilities": {}, "slots": {}, "address": "5 REPLIN RD", "type": "outdoor pool", "phone": "416 395-6118", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Leaside Memorial Gardens Swimming Pool - Indoor Pool": {"name": "Leaside Memorial Gardens Swimming Pool - Indoor Pool", "classified_name": "leaside-memorial-gardens-swimming-pool---indoor-pool", "availabilities": {}, "slots": {}, "address": "1073 MILLWOOD RD", "type": "indoor pool", "phone": "416 396-2822", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Leaside Outdoor Pool": {"name": "Leaside Outdoor Pool", "classified_name": "leaside-outdoor-pool", "availabilities": {}, "slots": {}, "address": "5 LEASIDE PARK DR", "type": "outdoor pool", "phone": "416 396-2846", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Lester B. Pearson Collegiate Institute": {"name": "Lester B. Pearson Collegiate Institute", "classified_name": "lester-b-pearson-collegiate-institute", "availabilities": {}, "slots": {}, "address": "150 TAPSCOTT RD", "type": "indoor pool", "phone": "416 396-4010", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Lionel Conacher Park": {"name": "Lionel Conacher Park", "classified_name": "lionel-conacher-park", "availabilities": {}, "slots": {}, "address": "80 COTTINGHAM ST", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Little Norway Park": {"name": "Little Norway Park", "classified_name": "little-norway-park", "availabilities": {}, "slots": {}, "address": "659 QUEENS QUAY  W", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Livingstone Park": {"name": "Livingstone Park", "classified_name": "livingstone-park", "availabilities": {}, "slots": {}, "address": "21 WOODVILLE AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Loretto College - Wading Pool": {"name": "Loretto College - Wading Pool", "classified_name": "loretto-college---wading-pool", "availabilities": {}, "slots": {}, "address": "151 ROSEMOUNT AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Main Square Community Centre": {"name": "Main Square Community Centre", "classified_name": "main-square-community-centre", "availabilities": {}, "slots": {}, "address": "245 MAIN ST", "type": "indoor pool", "phone": "416 392-1070", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Margaret Fairley Park": {"name": "Margaret Fairley Park", "classified_name": "margaret-fairley-park", "availabilities": {}, "slots": {}, "address": "100 BRUNSWICK AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Marian Engel Park": {"name": "Marian Engel Park", "classified_name": "marian-engel-park", "availabilities": {}, "slots": {}, "address": "285 MELITA AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Marie Curtis Park": {"name": "Marie Curtis Park", "classified_name": "marie-curtis-park", "availabilities": {}, "slots": {}, "address": "2 FORTY SECOND ST", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Mary McCormick Recreation Centre": {"name": "Mary McCormick Recreation Centre", "classified_name": "mary-mccormick-recreation-centre", "availabilities": {}, "slots": {}, "address": "66 SHERIDAN AVE", "type": "indoor pool", "phone": "416 392-0742", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Maryvale Park": {"name": "Maryvale Park", "classified_name": "maryvale-park", "availabilities": {}, "slots": {}, "address": "5 TRESTLESIDE GRV", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Maryvale Park Outdoor Pool": {"name": "Maryvale Park Outdoor Pool", "classified_name": "maryvale-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "5 TRESTLESIDE GRV", "type": "outdoor pool", "phone": "416 396-4127", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Masaryk Park": {"name": "Masaryk Park", "classified_name": "masaryk-park", "availabilities": {}, "slots": {}, "address": "212 COWAN AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Matty Eckler Recreation Centre": {"name": "Matty Eckler Recreation Centre", "classified_name": "matty-eckler-recreation-centre", "availabilities": {}, "slots": {}, "address": "953 GERRARD ST E", "type": "indoor pool", "phone": "416 392-0750", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "McGregor Park Community Centre": {"name": "McGregor Park Community Centre", "classified_name": "mcgregor-park-community-centre", "availabilities": {}, "slots": {}, "address": "2231 LAWRENCE AVE E", "type": "outdoor pool", "phone": "416 396-4023", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Memorial Pool and Health Club": {"name": "Memorial Pool and Health Club", "classified_name": "memorial-pool-and-health-club", "availabilities": {}, "slots": {}, "address": "44 MONTGOMERY RD", "type": "indoor pool", "phone": "416 394-8731", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Mimico Memorial Park": {"name": "Mimico Memorial Park", "classified_name": "mimico-memorial-park", "availabilities": {}, "slots": {}, "address": "75 HILLSIDE AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Monarch Park": {"name": "Monarch Park", "classified_name": "monarch-park", "availabilities": {}, "slots": {}, "address": "115 FELSTEAD AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Moorevale Park": {"name": "Moorevale Park", "classified_name": "moorevale-park", "availabilities": {}, "slots": {}, "address": "175 MOORE AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Norseman Community School And Pool": {"name": "Norseman Community School And Pool", "classified_name": "norseman-community-school-and-pool", "availabilities": {}, "slots": {}, "address": "105 NORSEMAN ST", "type": "indoor pool", "phone": "416 394-8719", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "North Toronto Memorial Community Centre": {"name": "North Toronto Memorial Community Centre", "classified_name": "north-toronto-memorial-community-centre", "availabilities": {}, "slots": {}, "address": "200 EGLINTON AVE W", "type": "outdoor pool", "phone": "416 392-6591", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Northumberland Playground": {"name": "Northumberland Playground", "classified_name": "northumberland-playground", "availabilities": {}, "slots": {}, "address": "770 OSSINGTON AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "O'Connor Community Centre": {"name": "O'Connor Community Centre", "classified_name": "oconnor-community-centre", "availabilities": {}, "slots": {}, "address": "1386 VICTORIA PARK AVE", "type": "outdoor pool", "phone": "416 395-7957", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Oakdale Community Centre": {"name": "Oakdale Community Centre", "classified_name": "oakdale-community-centre", "availabilities": {}, "slots": {}, "address": "350 GRANDRAVINE DR", "type": "outdoor pool", "phone": "416 395-0484", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Oriole Park - Toronto": {"name": "Oriole Park - Toronto", "classified_name": "oriole-park---toronto", "availabilities": {}, "slots": {}, "address": "201 ORIOLE PKWY", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Osler Playground": {"name": "Osler Playground", "classified_name": "osler-playground", "availabilities": {}, "slots": {}, "address": "123 ARGYLE ST", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Ourland Park Outdoor Pool": {"name": "Ourland Park Outdoor Pool", "classified_name": "ourland-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "36 OURLAND AVE", "type": "outdoor pool", "phone": "416 394-8490", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Pam McConnell Aquatic Centre": {"name": "Pam McConnell Aquatic Centre", "classified_name": "pam-mcconnell-aquatic-centre", "availabilities": {}, "slots": {}, "address": "640 DUNDAS ST E", "type": "indoor pool", "phone": "416 338-2237", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Park Lawn Park": {"name": "Park Lawn Park", "classified_name": "park-lawn-park", "availabilities": {}, "slots": {}, "address": "330 PARK LAWN RD", "type": "outdoor pool", "phone": "416-394-8491", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Parkdale Community Recreation Centre": {"name": "Parkdale Community Recreation Centre", "classified_name": "parkdale-community-recreation-centre", "availabilities": {}, "slots": {}, "address": "75 LANSDOWNE AVE", "type": "indoor pool", "phone": "416 392-6696", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Parkway Forest Outdoor Pool": {"name": "Parkway Forest Outdoor Pool", "classified_name": "parkway-forest-outdoor-pool", "availabilities": {}, "slots": {}, "address": "59 Forest Manor RD", "type": "outdoor pool", "phone": "416-392-0945", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Pelham Avenue Playground": {"name": "Pelham Avenue Playground", "classified_name": "pelham-avenue-playground", "availabilities": {}, "slots": {}, "address": "20 PELHAM AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Pine Point Park Outdoor Pool": {"name": "Pine Point Park Outdoor Pool", "classified_name": "pine-point-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "15 GRIERSON RD", "type": "outdoor pool", "phone": "416 394-8492", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Pleasantview Community Centre": {"name": "Pleasantview Community Centre", "classified_name": "pleasantview-community-centre", "availabilities": {}, "slots": {}, "address": "545 VAN HORNE AVE", "type": "outdoor pool", "phone": "416 395-6006", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Prairie Drive Park": {"name": "Prairie Drive Park", "classified_name": "prairie-drive-park", "availabilities": {}, "slots": {}, "address": "101 Pharmacy Ave DR", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Primrose Avenue Parkette": {"name": "Primrose Avenue Parkette", "classified_name": "primrose-avenue-parkette", "availabilities": {}, "slots": {}, "address": "120 PRIMROSE AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Prince of Wales Park": {"name": "Prince of Wales Park", "classified_name": "prince-of-wales-park", "availabilities": {}, "slots": {}, "address": "1 THIRD ST", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Ramsden Park": {"name": "Ramsden Park", "classified_name": "ramsden-park", "availabilities": {}, "slots": {}, "address": "1020 YONGE ST", "type": "splash pad", "phone": null, "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Randy Padmore Park": {"name": "Randy Padmore Park", "classified_name": "randy-padmore-park", "availabilities": {}, "slots": {}, "address": "47 DENISON AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Ravina Gardens": {"name": "Ravina Gardens", "classified_name": "ravina-gardens", "availabilities": {}, "slots": {}, "address": "290 CLENDENAN AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Rennie Park": {"name": "Rennie Park", "classified_name": "rennie-park", "availabilities": {}, "slots": {}, "address": "1 RENNIE TER", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Rexlington Park": {"name": "Rexlington Park", "classified_name": "rexlington-park", "availabilities": {}, "slots": {}, "address": "30 BERGAMOT AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Richmond Gardens Pool": {"name": "Richmond Gardens Pool", "classified_name": "richmond-gardens-pool", "availabilities": {}, "slots": {}, "address": "44 STRATHDEE DR", "type": "outdoor pool", "phone": "416 394-8493", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Riverdale Park East": {"name": "Riverdale Park East", "classified_name": "riverdale-park-east", "availabilities": {}, "slots": {}, "address": "550 BROADVIEW AVE", "type": "outdoor pool", "phone": "416-392-7801", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Riverdale Park West": {"name": "Riverdale Park West", "classified_name": "riverdale-park-west", "availabilities": {}, "slots": {}, "address": "375 SUMACH ST", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Roding Community Centre": {"name": "Roding Community Centre", "classified_name": "roding-community-centre", "availabilities": {}, "slots": {}, "address": "600 RODING ST", "type": "outdoor pool", "phone": "416 395-7964", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Rosedale Park": {"name": "Rosedale Park", "classified_name": "rosedale-park", "availabilities": {}, "slots": {}, "address": "20 SCHOLFIELD AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Rotary Peace Park Outdoor Pool": {"name": "Rotary Peace Park Outdoor Pool", "classified_name": "rotary-peace-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "25 ELEVENTH ST", "type": "outdoor pool", "phone": "416 394-8494", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Runnymede Collegiate Institute": {"name": "Runnymede Collegiate Institute", "classified_name": "runnymede-collegiate-institute", "availabilities": {}, "slots": {}, "address": "569 JANE ST", "type": "indoor pool", "phone": "416 392-0036", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Runnymede Park": {"name": "Runnymede Park", "classified_name": "runnymede-park", "availabilities": {}, "slots": {}, "address": "221 RYDING AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "S.H. Armstrong Community Centre": {"name": "S.H. Armstrong Community Centre", "classified_name": "sh-armstrong-community-centre", "availabilities": {}, "slots": {}, "address": "56 WOODFIELD RD", "type": "indoor pool", "phone": "416 392-0734", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Scadding Court Community Centre": {"name": "Scadding Court Community Centre", "classified_name": "scadding-court-community-centre", "availabilities": {}, "slots": {}, "address": "707 DUNDAS ST W", "type": "indoor pool", "phone": "416 392-0335", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Sherwood Park": {"name": "Sherwood Park", "classified_name": "sherwood-park", "availabilities": {}, "slots": {}, "address": "190 SHERWOOD AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Sir Casimir Gzowski Park": {"name": "Sir Casimir Gzowski Park", "classified_name": "sir-casimir-gzowski-park", "availabilities": {}, "slots": {}, "address": "2001 LAKE SHORE BLVD W", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Sir Oliver Mowat Collegiate Institute": {"name": "Sir Oliver Mowat Collegiate Institute", "classified_name": "sir-oliver-mowat-collegiate-institute", "availabilities": {}, "slots": {}, "address": "5400 LAWRENCE AVE E", "type": "indoor pool", "phone": "416 396-4007", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Smithfield Park Outdoor Pool": {"name": "Smithfield Park Outdoor Pool", "classified_name": "smithfield-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "175 MOUNT OLIVE DR", "type": "outdoor pool", "phone": "416 394-8495", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Smythe Park": {"name": "Smythe Park", "classified_name": "smythe-park", "availabilities": {}, "slots": {}, "address": "61 BLACK CREEK BLVD", "type": "splash pad", "phone": null, "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Spencer - Cowan Parkette": {"name": "Spencer - Cowan Parkette", "classified_name": "spencer---cowan-parkette", "availabilities": {}, "slots": {}, "address": "80 SPENCER AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "St. Lawrence Community Recreation Centre": {"name": "St. Lawrence Community Recreation Centre", "classified_name": "st-lawrence-community-recreation-centre", "availabilities": {}, "slots": {}, "address": "230 THE ESPLANADE", "type": "indoor pool", "phone": "416 392-1347", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Stanley Park North - Toronto": {"name": "Stanley Park North - Toronto", "classified_name": "stanley-park-north---toronto", "availabilities": {}, "slots": {}, "address": "890 KING ST W", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Stanley Park South - Toronto": {"name": "Stanley Park South - Toronto", "classified_name": "stanley-park-south---toronto", "availabilities": {}, "slots": {}, "address": "700 WELLINGTON ST W", "type": "outdoor pool", "phone": "416-392-0703", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Sumach - Shuter Parkette": {"name": "Sumach - Shuter Parkette", "classified_name": "sumach---shuter-parkette", "availabilities": {}, "slots": {}, "address": "485 SHUTER ST", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Summerlea Park": {"name": "Summerlea Park", "classified_name": "summerlea-park", "availabilities": {}, "slots": {}, "address": "2 ARCOT BLVD", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Sunnydale Acres Park": {"name": "Sunnydale Acres Park", "classified_name": "sunnydale-acres-park", "availabilities": {}, "slots": {}, "address": "50 AMORO DR", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Sunnylea Park": {"name": "Sunnylea Park", "classified_name": "sunnylea-park", "availabilities": {}, "slots": {}, "address": "195 PRINCE EDWARD DR S", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Sunnyside Gus Ryder Outdoor Pool": {"name": "Sunnyside Gus Ryder Outdoor Pool", "classified_name": "sunnyside-gus-ryder-outdoor-pool", "availabilities": {}, "slots": {}, "address": "1755 LAKE SHORE BLVD W", "type": "outdoor pool", "phone": "416 392-7915", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Swansea Community Recreation Centre": {"name": "Swansea Community Recreation Centre", "classified_name": "swansea-community-recreation-centre", "availabilities": {}, "slots": {}, "address": "15 WALLER AVE", "type": "indoor pool", "phone": "416 392-6796", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "The Elms Pool and Community School": {"name": "The Elms Pool and Community School", "classified_name": "the-elms-pool-and-community-school", "availabilities": {}, "slots": {}, "address": "45 GOLFDOWN DR", "type": "indoor pool", "phone": "416-394-8983", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "The New Generation Youth Recreation Centre": {"name": "The New Generation Youth Recreation Centre", "classified_name": "the-new-generation-youth-recreation-centre", "availabilities": {}, "slots": {}, "address": "2694 EGLINTON AVE W", "type": "indoor pool", "phone": "416 394-2717", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Toronto Pan Am Sports Centre": {"name": "Toronto Pan Am Sports Centre", "classified_name": "toronto-pan-am-sports-centre", "availabilities": {}, "slots": {}, "address": "875 MORNINGSIDE AVE", "type": "indoor pool", "phone": "416 283-5222", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Trace Manes Park": {"name": "Trace Manes Park", "classified_name": "trace-manes-park", "availabilities": {}, "slots": {}, "address": "110 RUMSEY RD", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Trinity Bellwoods Park": {"name": "Trinity Bellwoods Park", "classified_name": "trinity-bellwoods-park", "availabilities": {}, "slots": {}, "address": "790 QUEEN ST W", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Trinity Community Recreation Centre": {"name": "Trinity Community Recreation Centre", "classified_name": "trinity-community-recreation-centre", "availabilities": {}, "slots": {}, "address": "155 CRAWFORD ST", "type": "indoor pool", "phone": "416 392-0743", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Vaughan Road Academy": {"name": "Vaughan Road Academy", "classified_name": "vaughan-road-academy", "availabilities": {}, "slots": {}, "address": "529 VAUGHAN RD", "type": "indoor pool", "phone": "416 392-6585", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Vermont Square Park": {"name": "Vermont Square Park", "classified_name": "vermont-square-park", "availabilities": {}, "slots": {}, "address": "819 PALMERSTON AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Vine Avenue Playground": {"name": "Vine Avenue Playground", "classified_name": "vine-avenue-playground", "availabilities": {}, "slots": {}, "address": "200 VINE AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Wadsworth Park": {"name": "Wadsworth Park", "classified_name": "wadsworth-park", "availabilities": {}, "slots": {}, "address": "120 CONNOLLY ST", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Wallace Emerson Community Centre": {"name": "Wallace Emerson Community Centre", "classified_name": "wallace-emerson-community-centre", "availabilities": {}, "slots": {}, "address": "1260 DUFFERIN ST", "type": "indoor pool", "phone": "416 392-0039", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Wanless Park": {"name": "Wanless Park", "classified_name": "wanless-park", "availabilities": {}, "slots": {}, "address": "250 WANLESS AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Wedgewood Park  Outdoor Pool": {"name": "Wedgewood Park  Outdoor Pool", "classified_name": "wedgewood-park--outdoor-pool", "availabilities": {}, "slots": {}, "address": "15 SWAN AVE", "type": "outdoor pool", "phone": "416 394-8496", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Wells Hill Park": {"name": "Wells Hill Park", "classified_name": "wells-hill-park", "availabilities": {}, "slots": {}, "address": "145 HILTON AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "West Deane Park Outdoor Pool": {"name": "West Deane Park Outdoor Pool", "classified_name": "west-deane-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "19 SEDGEBROOK CRES", "type": "outdoor pool", "phone": "416 394-8497", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "West Hill Collegiate Institute": {"name": "West Hill Collegiate Institute", "classified_name": "west-hill-collegiate-institute", "availabilities": {}, "slots": {}, "address": "350 MORNINGSIDE AVE", "type": "indoor pool", "phone": "416 396-4008", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "West Lodge Park": {"name": "West Lodge Park", "classified_name": "west-lodge-park", "availabilities": {}, "slots": {}, "address": "165 LANSDOWNE AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "West Mall Outdoor Pool": {"name": "West Mall Outdoor Pool", "classified_name": "west-mall-outdoor-pool", "availabilities": {}, "slots": {}, "address": "380 THE WEST MALL", "type": "outdoor pool", "phone": "416 394-8498", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Westgrove Park Outdoor Pool": {"name": "Westgrove Park Outdoor Pool", "classified_name": "westgrove-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "15 REDGRAVE DR", "type": "outdoor pool", "phone": "416 394-8500", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Westmount Park Outdoor Pool": {"name": "Westmount Park Outdoor Pool", "classified_name": "westmount-park-outdoor-pool", "availabilities": {}, "slots": {}, "address": "22 ARCADE DR", "type": "outdoor pool", "phone": "416 394-8499", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Weston Lions Park": {"name": "Weston Lions Park", "classified_name": "weston-lions-park", "availabilities": {}, "slots": {}, "address": "2125 LAWRENCE AVE W", "type": "splash pad", "phone": null, "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Wexford Collegiate Institute": {"name": "Wexford Collegiate Institute", "classified_name": "wexford-collegiate-institute", "availabilities": {}, "slots": {}, "address": "1176 PHARMACY AVE", "type": "indoor pool", "phone": "416 396-4016", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Winchester Park": {"name": "Winchester Park", "classified_name": "winchester-park", "availabilities": {}, "slots": {}, "address": "530 ONTARIO ST", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "Woburn Avenue Playground": {"name": "Woburn Avenue Playground", "classified_name": "woburn-avenue-playground", "availabilities": {}, "slots": {}, "address": "75 WOBURN AVE", "type": "wading pool", "phone": "", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}, "York Recreation Centre": {"name": "York Recreation Centre", "classified_name": "york-recreation-centre", "availabilities": {}, "slots": {}, "address": "115 BLACK CREEK DR", "type": "indoor pool", "phone": "416 392-9675", "coordinates": null, "url": null, "amenities": [], "accessibility": [], "closures": [], "rules": [], "exceptions": {}, "alternatives": {}}};
@@ -1,486 +1,863 @@
-const oneDayMinutes = 60 * 24;
-const dataMatrixAPIURL = 'https://www.mapquestapi.com/directions/v2/routematrix'; // ?key=...
-const maxMatrixAPISize = 100;
-const requests = [];
-const responses = [];
-const apiKeyLocalStorageKey = "ApiKeyMapQuest";
-
-const sortOptions = {
-    name: (cardEl, cardEl2) => {
-        if (cardEl.pool_info.name > cardEl2.pool_info.name) {
-            return 1;
-        } else if (cardEl.pool_info.name < cardEl2.pool_info.name) {
-            return -1;
-        } else {
-            return 0;
-        }
-    },
-    distance: (cardEl, cardEl2) => {
-        let d1 = cardEl.pool_info.distance;
-        let d2 = cardEl2.pool_info.distance;
-
-        if (d1 === d2) {
-            return 0;
-        }
-
-        // if d1 loses, d2 wins (is closer)
-        if (d1 === undefined) {
-            console.log(`WARN: Pool ${cardEl.pool_info.name} has no distance.`);
-            return 1;
-        }
-
-        // and vice versa
-        if (d2 === undefined) {
-            console.log(`WARN: Pool ${cardEl2.pool_info.name} has no distance.`);
-            return -1;
-        }
-
-        if (d1 < d2) {
-            return -1;
-        } else if (d1 > d2) {
-            return 1;
-        } else {
-            // should never reach here
-            return 0;
-        }
-    },
-    time: (cardEl, cardEl2) => {
-        let t1 = cardEl.pool_info.time;
-        let t2 = cardEl2.pool_info.time;
-
-        if (t1 === t2) {
-            return 0;
-        }
-
-        // if d1 loses, d2 wins (is closer)
-        if (t1 === undefined) {
-            console.log(`WARN: Pool ${cardEl.pool_info.name} has no time.`);
-            return 1;
-        }
-
-        // and vice versa
-        if (t2 === undefined) {
-            console.log(`WARN: Pool ${cardEl2.pool_info.name} has no time.`);
-            return -1;
-        }
-
-        if (t1 < t2) {
-            return -1;
-        } else if (t1 > t2) {
-            return 1;
-        } else {
-            // should never reach here
-            return 0;
-        }
-    },
-    length: (cardEl, cardEl2) => {
-        let date = elSelectDate.value;
-
-        let length1 = Math.max(...cardEl.pool_info.availabilities[date].map(avail => avail.end - avail.start));
-        let length2 = Math.max(...cardEl2.pool_info.availabilities[date].map(avail => avail.end - avail.start));
-
-        // reverse sort
-        if (length1 > length2) {
-            return -1;
-        } else if (length1 < length2) {
-            return 1;
-        } else {
-            return sortOptions.name(cardEl, cardEl2);
-        }
-    },
-    soonest: (cardEl, cardEl2) => {
-        // TODO: Get EST time? https://stackoverflow.com/a/36206597/5090928
-        let date = elSelectDate.value;
-
-        let d = new Date();
-        let timeInMinutes = d.getHours() * 60 + d.getMinutes();
-
-        let soonest1 = Math.min(...cardEl.pool_info.availabilities[date].map(avail =>
-            (avail.start - timeInMinutes >= 0) ? avail.start - timeInMinutes : oneDayMinutes));
-        let soonest2 = Math.min(...cardEl2.pool_info.availabilities[date].map(avail =>
-            (avail.start - timeInMinutes >= 0) ? avail.start - timeInMinutes : oneDayMinutes));
-
-        if (soonest1 > soonest2) {
-            return 1;
-        } else if (soonest1 < soonest2) {
-            return -1;
-        } else {
-            return sortOptions.length(cardEl, cardEl2);
-        }
-    },
-    start: (cardEl, cardEl2) => {
-        let date = elSelectDate.value;
-
-        let earliest1 = Math.min(...cardEl.pool_info.availabilities[date].map(avail => avail.start));
-        let earliest2 = Math.min(...cardEl2.pool_info.availabilities[date].map(avail => avail.start));
-
-        if (earliest1 > earliest2) {
-            return 1;
-        } else if (earliest1 < earliest2) {
-            return -1;
-        } else {
-            return sortOptions.name(cardEl, cardEl2);
-        }
-    },
-    end: (cardEl, cardEl2) => {
-        let date = elSelectDate.value;
-
-        let earliest1 = Math.min(...cardEl.pool_info.availabilities[date].map(avail => avail.end));
-        let earliest2 = Math.min(...cardEl2.pool_info.availabilities[date].map(avail => avail.end));
-
-        if (earliest1 > earliest2) {
-            return 1;
-        } else if (earliest1 < earliest2) {
-            return -1;
-        } else {
-            return sortOptions.name(cardEl, cardEl2);
-        }
-    }
-};
-
-// globals that are filled in on page load
-let elSelectDate, elSelectSort, elCardHolder, elInputAddress, elDownloadResult;
-
-function removeChildren(el) {
-    while (el.firstChild) {
-        el.removeChild(el.firstChild);
-    }
-}
-
-function sortCards(sortOption) {
-    console.log(`sortCards(${sortOption})`);
-
-    // get sorter
-    let compareFn = sortOptions[sortOption];
-    if (compareFn === undefined) {
-        console.log(`ERR: No sort function called ${compareFn}`);
-        return;
-    }
-
-    // get pool card elements
-    let poolCardEls = document.querySelectorAll('.pool-card');
-    let poolCardArr = Array.from(poolCardEls);
-
-    // sort elements
-    poolCardArr.sort(compareFn);
-
-    // stick 'em back in!
-
-    // for (let [i, el] of poolCardArr.entries()) {
-    //     elCardHolder.replaceChild(el, poolCardEls[i]);
-    // }
-
-    removeChildren(elCardHolder);
-    for (let card of poolCardArr) {
-        elCardHolder.appendChild(card);
-    }
-}
-
-function getDate() {
-    let today = new Date();
-    let dd = today.getDate();
-
-    let mm = today.getMonth() + 1;
-    let yyyy = today.getFullYear();
-
-    if (dd < 10) {
-        dd = '0' + dd;
-    }
-
-    if (mm < 10) {
-        mm = '0' + mm;
-    }
-
-    return `${yyyy}-${mm}-${dd}`;
-}
-
-function selectDate(date) {
-    // create pool cards
-    let cards = [];
-    for (let pool of Object.values(pool_info)) {
-        let times = pool.availabilities[date];
-        if (times === undefined) {
-            continue;
-        }
-
-        cards.push(createPoolCard(pool, date));
-    }
-
-    // delete old cards
-    removeChildren(elCardHolder);
-
-    // insert new ones
-    for (let card of cards) {
-        elCardHolder.appendChild(card);
-    }
-}
-
-function timestampToText(timestamp) {
-    // convert single start/end timestamp from pool_info into text
-    // ex: 330 -> 5:30
-    // ex: 300 -> 5
-
-    if (timestamp < 0 || timestamp >= 1440) {
-        console.log(`What is this timestamp you're giving me? ${timestamp}??`);
-    }
-
-    let hrs = parseInt(timestamp / 60);
-    let mins = timestamp - hrs * 60;
-
-    return `${hrs}:${mins.toString().padStart(2, '0')}`;
-}
-
-function timeToText(time) {
-    // format time from pool_info as text
-    // ex: 300, 330 -> 5 - 5:30am
-    // basically: always add am/pm onto second timestamp, and only add it to first if first is AM and 2nd is PM.
-    let start_str = timestampToText(time.start);
-    let end_str = timestampToText(time.end);
-
-    if ((time.end / 60) >= 12) {
-        end_str += 'pm';
-        if ((time.start / 60) < 12) {
-            start_str += 'am';
-        }
-    } else {
-        end_str += 'am';
-    }
-
-    return `${start_str} - ${end_str}`
-}
-
-
-function createPoolCard(pool, date) {
-    /*
-    Sample pool:
-        {"name": "York Recreation Centre", "classified_name": "york-recreation-centre", "availabilities": {"2019-07-09": [{"start": 870, "end": 930}], "2019-06-21": [{"start": 1170, "end": 1290}], "2019-06-08": [{"start": 810, "end": 945}], "2019-07-04": [{"start": 810, "end": 930}], "2019-07-06": [{"start": 810, "end": 945}], "2019-06-09": [{"start": 810, "end": 945}], "2019-07-07": [{"start": 810, "end": 945}], "2019-07-14": [{"start": 810, "end": 945}], "2019-07-17": [{"start": 810, "end": 930}], "2019-07-21": [{"start": 810, "end": 945}], "2019-06-16": [{"start": 810, "end": 945}], "2019-06-28": [{"start": 1170, "end": 1290}], "2019-06-13": [{"start": 1170, "end": 1245}], "2019-07-02": [{"start": 870, "end": 930}], "2019-06-20": [{"start": 1170, "end": 1245}], "2019-07-03": [{"start": 810, "end": 930}], "2019-06-06": [{"start": 1170, "end": 1245}], "2019-06-15": [{"start": 810, "end": 945}], "2019-07-27": [{"start": 810, "end": 945}], "2019-07-22": [{"start": 810, "end": 930}], "2019-06-30": [{"start": 810, "end": 945}], "2019-07-11": [{"start": 810, "end": 930}], "2019-06-29": [{"start": 810, "end": 945}], "2019-06-04": [{"start": 1170, "end": 1245}], "2019-06-11": [{"start": 1170, "end": 1245}], "2019-06-18": [{"start": 1170, "end": 1245}], "2019-07-13": [{"start": 810, "end": 945}], "2019-07-15": [{"start": 810, "end": 930}], "2019-06-14": [{"start": 1170, "end": 1290}], "2019-07-19": [{"start": 900, "end": 1020}, {"start": 1170, "end": 1290}], "2019-06-07": [{"start": 1170, "end": 1290}], "2019-06-25": [{"start": 1170, "end": 1245}], "2019-07-16": [{"start": 870, "end": 930}], "2019-07-05": [{"start": 900, "end": 1020}, {"start": 1170, "end": 1290}], "2019-06-02": [{"start": 810, "end": 945}], "2019-07-20": [{"start": 810, "end": 945}], "2019-07-18": [{"start": 810, "end": 930}], "2019-07-10": [{"start": 810, "end": 930}], "2019-07-25": [{"start": 810, "end": 930}], "2019-06-22": [{"start": 810, "end": 945}], "2019-06-27": [{"start": 1170, "end": 1245}], "2019-07-23": [{"start": 870, "end": 930}], "2019-07-08": [{"start": 810, "end": 930}], "2019-07-24": [{"start": 810, "end": 930}], "2019-07-26": [{"start": 900, "end": 1020}, {"start": 1170, "end": 1290}], "2019-07-12": [{"start": 900, "end": 1020}, {"start": 1170, "end": 1290}], "2019-06-23": [{"start": 810, "end": 945}]}, "address": "115 BLACK CREEK DR", "type": "indoor pool", "phone": "416 392-9675"}
-
-    Sample output:
-        <div class="pool-card Albert-Campbell-Collegiate-Institute">
-            <div class="pool-name">Albert Campbell Collegiate Institute</div>
-            <div class="pool-time date-2019-05-26">1 - 2pm</div>
-            <div class="pool-time date-2019-05-27">5 - 6pm</div>
-            <div class="pool-time date-2019-06-01">2 - 5pm</div>
-        </div>
-    """
-    */
-
-    let times = pool.availabilities[date];
-
-    let card_el = document.createElement('div');
-    card_el.classList.add('pool-card');
-
-    let name_el = document.createElement('name');
-    name_el.classList.add('pool-name');
-    name_el.textContent = pool.name;
-    if (pool.distance) {
-        name_el.textContent += ` (~${pool.distance.toFixed(1)}km)`;
-    }
-    if (pool.time) {
-        name_el.textContent += ` (~${Math.ceil(pool.time / 60)}min)`;
-    }
-    card_el.appendChild(name_el);
-
-    for (let time of times) {
-        let time_el = document.createElement('div');
-        time_el.classList.add('pool-time');
-        time_el.textContent = timeToText(time);
-        card_el.appendChild(time_el);
-    }
-
-    // expando this mf
-    card_el.pool_info = pool;
-
-    return card_el;
-}
-
-function appendDownloadStatus(status, err = false) {
-    let el = document.createElement('li');
-    el.textContent = status;
-    if (err) {
-        el.classList.add('err-msg');
-    }
-    elDownloadResult.appendChild(el);
-    return el;
-}
-
-function updateDistances(address, pools) {
-    // give them an update
-    let elStatus = appendDownloadStatus('downloading batch of distances/times...');
-
-    let apikey = document.querySelector('#input-apikey').value;
-    // save API key so they don't have to re-enter it every visit
-    localStorage.setItem(apiKeyLocalStorageKey, apikey);
-
-    let req;
-    if (window.XMLHttpRequest) { // Mozilla, Safari, IE7+ ...
-        req = new XMLHttpRequest();
-    } else if (window.ActiveXObject) { // IE 6 and older
-        console.log('WARN: XMLHttpRequest not supported, hopefully should still work.');
-        req = new ActiveXObject("Microsoft.XMLHTTP");
-    } else {
-        console.log('ERR: Ajax requests not supported on this browser.');
-        elDownloadResult.removeChild(elStatus);
-        appendDownloadStatus('ERR: NO AJAX', true);
-        return;
-    }
-
-    let URL = `${dataMatrixAPIURL}?key=${apikey}`;
-
-    // extract addresses in reliable order: Get pools, sort by name, then extract addresses.
-    pools.sort((pool1, pool2) => pool1.name > pool2.name ? 1 : pool1.name < pool2.name ? -1 : 0);
-    let addresses = pools.map(pool => `${pool.address}, Toronto ON`);
-
-    // add own address as first entry; the one to get distances too
-    addresses.unshift(address);
-
-    let body = {"locations": addresses};
-    requests.push(body);
-
-    req.onreadystatechange = function () {
-        if (req.readyState !== XMLHttpRequest.DONE) {
-            // If not ready yet, ignore.
-            return;
-        }
-
-        if (req.status !== 200) {
-            console.log(`ERR: MapQuest responded with non-200 status: ${req.status}`);
-            elDownloadResult.removeChild(elStatus);
-            appendDownloadStatus('ERR: unexpected (non-200) response from MapQuest', true);
-            return;
-        }
-
-        // console.log(`Success! Response: ${JSON.stringify(this.response)}`);
-        elDownloadResult.removeChild(elStatus);
-        onDistanceResponse(this.response, pools);
-    };
-
-    req.open('POST', URL);
-    req.send(JSON.stringify(body));
-    // response = JSON.parse(response);
-}
-
-function onDistanceResponse(response, requestedPools) {
-    response = JSON.parse(response);
-    responses.push(response);
-
-    // check for errors
-    if (response.route) {
-        appendDownloadStatus(`ERR: The location finder doesn\'t seem to like your location. It says "${response.info.messages[0]}".`, true);
-        return;
-    }
-
-    // extract distances (and times) from response
-    let distances = response.distance;
-    let times = response.time;
-
-    // assert as expected
-    let dl = distances.length;
-    let ll = response.locations.length;
-    let tl = times.length;
-    if (((dl !== ll) && (dl !== ll - 1)) || ((tl !== ll) && (tl !== ll - 1))) {
-        console.log(`ERROR: dl: ${dl}, tl: ${tl}, ll: ${ll}`);
-        appendDownloadStatus('ERR: unexpected response (number of distances/times doesn\'t match number of pools...)', true);
-        return;
-    }
-
-    // sometimes a little weird...
-    if (distances.length === response.locations.length) {
-        if (distances[0] !== 0) {
-            console.log(`ERR: distances[0] != ${distances[0]}`);
-            appendDownloadStatus('ERR: unexpected distances returned (distance to self is non-zero)', true);
-            return;
-        }
-        distances.shift();
-    }
-    if (times.length === response.locations.length) {
-        if (times[0] !== 0) {
-            console.log(`ERR: times[0] != ${times[0]}`);
-            appendDownloadStatus('ERR: unexpected times returned (time to self is non-zero)', true);
-            return;
-        }
-        times.shift();
-    }
-
-    // append to pool info
-    for (let i = 0; i < distances.length; i++) {
-        requestedPools[i].distance = distances[i];
-        requestedPools[i].time = times[i];
-    }
-
-    if (Math.max(...distances) > 50) {
-        appendDownloadStatus('ERR: one of the distances is >50km... maybe just a MapQuest bug, try re-downloading', true);
-    }
-    if (Math.min(...distances) === 0) {
-        appendDownloadStatus('ERR: one of the distances is 0km... maybe just a MapQuest bug, try re-downloading', true);
-    }
-
-    // refresh cards (hacky)
-    selectDate(elSelectDate.value);
-}
-
-function onSelectDate(event) {
-    // get the date they chose
-    let date = event.target.value;
-
-    // change to it
-    selectDate(date);
-    sortCards(elSelectSort.value);
-}
-
-function onSelectSort(event) {
-    // get the sort option they chose
-    let sortOption = event.target.value;
-
-    // change to it
-    sortCards(sortOption);
-}
-
-function onPressDownloadAddresses(event) {
-    // reset download status
-    removeChildren(elDownloadResult);
-
-    let address = elInputAddress.value;
-    if (address.trim().length === 0) {
-        console.log('Really?');
-        return;
-    }
-
-    // can only do max 100 here, so let's split it up
-    let all_pools = Object.values(pool_info);
-    // subtract 1 from api size, 'cause always need to append our own address first
-    for (let i = 0; i < (all_pools.length / (maxMatrixAPISize - 1)); i++) {
-        console.log(`Update addresses for pools ${i * (maxMatrixAPISize - 1)}...${(i + 1) * (maxMatrixAPISize - 1) - 1}`);
-        let pools = all_pools.slice(i * (maxMatrixAPISize - 1), (i + 1) * (maxMatrixAPISize - 1));
-        updateDistances(address, pools);
-    }
-}
-
-function addDownloadStatus(status) {
-    // create element
-    // return it, so we can delete it later
-}
-
-window.addEventListener('load', (event) => {
-    // get elements
-    elSelectDate = document.querySelector('#date-select');
-    elSelectSort = document.querySelector('#sort-select');
-    elCardHolder = document.querySelector('.pool-card-holder');
-    elInputAddress = document.querySelector('#input-address');
-    elDownloadResult = document.querySelector('#download-result');
-
-    // hook up date select
-    elSelectDate.addEventListener('change', onSelectDate);
-    let today = getDate();
-    elSelectDate.value = today;
-    selectDate(today);
-
-    // hook up sort select
-    elSelectSort.addEventListener('change', onSelectSort);
-
-    // hook up distance checker
-    document.querySelector('#btn-distance-update').addEventListener('click', onPressDownloadAddresses);
-
-    // stick in previous API key, if exists
-    document.querySelector('#input-apikey').value = localStorage.getItem(apiKeyLocalStorageKey) || '';
-});
+const oneDayMinutes = 60 * 24;
+// 15-minute slots, same as pool_slots.py
+const slotMinutes = 15;
+const slotsPerDay = oneDayMinutes / slotMinutes;
+const slotWords = 3;
+// distances/driving times are downloaded, cached and ranked off the main thread (see distance-worker.js)
+const distanceWorkerURL = 'distance-worker.js';
+const apiKeyLocalStorageKey = "ApiKeyMapQuest";
+const addressLocalStorageKey = "Address";
+// size of a card, including padding and margin (same as .pool-card in pools-v3.css)
+const cardWidth = 340;
+const cardHeight = 200;
+// rows of cards to render past the top and bottom of the screen, so scrolling doesn't show blank space
+const overscanRows = 2;
+// search index (see pool_search.py), and how much of a search's trigrams a pool needs for a fuzzy match
+const searchIndexURL = 'search-index.json';
+const fuzzyThreshold = 0.6;
+
+const sortOptions = {
+    name: (pool1, pool2) => {
+        if (pool1.name > pool2.name) {
+            return 1;
+        } else if (pool1.name < pool2.name) {
+            return -1;
+        } else {
+            return 0;
+        }
+    },
+    // ranked by distance-worker.js, pools without one go last
+    distance: (pool1, pool2) => compareRanks(distanceRanks.distance, pool1, pool2),
+    time: (pool1, pool2) => compareRanks(distanceRanks.time, pool1, pool2),
+    length: (pool1, pool2) => {
+        let date = elSelectDate.value;
+
+        let length1 = Math.max(...poolTimes(pool1, date).map(avail => avail.end - avail.start));
+        let length2 = Math.max(...poolTimes(pool2, date).map(avail => avail.end - avail.start));
+
+        // reverse sort
+        if (length1 > length2) {
+            return -1;
+        } else if (length1 < length2) {
+            return 1;
+        } else {
+            return sortOptions.name(pool1, pool2);
+        }
+    },
+    soonest: (pool1, pool2) => {
+        // what opens next from now (in Toronto), looked up in the date's next-opening table
+        let ranks = soonestRanks(elSelectDate.value, torontoMinutes(), elSelectProgram.value);
+
+        let soonest1 = ranks.get(pool1.name);
+        let soonest2 = ranks.get(pool2.name);
+        soonest1 = soonest1 === undefined ? Infinity : soonest1;
+        soonest2 = soonest2 === undefined ? Infinity : soonest2;
+
+        if (soonest1 > soonest2) {
+            return 1;
+        } else if (soonest1 < soonest2) {
+            return -1;
+        } else {
+            return sortOptions.length(pool1, pool2);
+        }
+    },
+    start: (pool1, pool2) => {
+        let date = elSelectDate.value;
+
+        let earliest1 = Math.min(...poolTimes(pool1, date).map(avail => avail.start));
+        let earliest2 = Math.min(...poolTimes(pool2, date).map(avail => avail.start));
+
+        if (earliest1 > earliest2) {
+            return 1;
+        } else if (earliest1 < earliest2) {
+            return -1;
+        } else {
+            return sortOptions.name(pool1, pool2);
+        }
+    },
+    end: (pool1, pool2) => {
+        let date = elSelectDate.value;
+
+        let earliest1 = Math.min(...poolTimes(pool1, date).map(avail => avail.end));
+        let earliest2 = Math.min(...poolTimes(pool2, date).map(avail => avail.end));
+
+        if (earliest1 > earliest2) {
+            return 1;
+        } else if (earliest1 < earliest2) {
+            return -1;
+        } else {
+            return sortOptions.name(pool1, pool2);
+        }
+    }
+};
+
+// globals that are filled in on page load
+let elSelectMonth, elSelectDate, elSelectProgram, elInputName, elInputFrom, elInputTo, elSelectSort, elCardHolder, elInputAddress, elDownloadResult;
+
+// map month -> promise that resolves once that month's weekly rules and exceptions are in pool_info
+const monthLoads = {};
+
+// months whose data has been loaded
+const loadedMonths = new Set();
+
+// search index over pool names/addresses/types (see pool_search.py), downloaded the first time someone searches
+let searchIndex = undefined;
+let searchIndexLoad = undefined;
+
+// map date -> {order: [[pool name, start, program], ...] sorted by start, buckets: where each 15 minutes start in order}
+// filled in as each month is loaded (dates with the same sessions share a table)
+const nextOpenings = {};
+
+// map pool name -> its place when sorted by distance/driving time from the address, from distance-worker.js
+let distanceRanks = {distance: new Map(), time: new Map()};
+
+// the worker, started the first time distances are asked for, and the id of the latest request to it (replies to
+//   older ones are ignored)
+let distanceWorker = undefined;
+let distanceRequestId = 0;
+let elDistanceStatus = undefined;
+
+// the last ranks worked out by soonestRanks(), since a sort asks for them once per comparison
+let soonestRanksCache = {key: undefined, ranks: undefined};
+
+// pools shown for the chosen date, in the chosen sort order. Only the ones on screen have their card in the page.
+let shownPools = [];
+
+// map pool name -> its card, kept (and reused) while it's off screen
+const cardEls = new Map();
+
+// names of the pools whose cards are in the page right now
+let renderedNames = new Set();
+
+// whether renderCards() already asked for the next frame
+let renderQueued = false;
+
+const torontoTimeFormat = new Intl.DateTimeFormat('en-CA', {
+    timeZone: 'America/Toronto', hourCycle: 'h23', year: 'numeric', month: '2-digit', day: '2-digit',
+    hour: '2-digit', minute: '2-digit'
+});
+
+function removeChildren(el) {
+    while (el.firstChild) {
+        el.removeChild(el.firstChild);
+    }
+}
+
+function sortCards(sortOption) {
+    console.log(`sortCards(${sortOption})`);
+
+    // get sorter
+    let compareFn = sortOptions[sortOption];
+    if (compareFn === undefined) {
+        console.log(`ERR: No sort function called ${compareFn}`);
+        return;
+    }
+
+    // sort the order of the shown pools, then move just the cards on screen to their new spots
+    let permutation = shownPools.map((pool, i) => i);
+    permutation.sort((i, j) => compareFn(shownPools[i], shownPools[j]));
+    shownPools = permutation.map(i => shownPools[i]);
+
+    renderCards();
+}
+
+function renderCards() {
+    // re-render the cards on screen, once per frame at most
+    if (!renderQueued) {
+        renderQueued = true;
+        window.requestAnimationFrame(renderVisibleCards);
+    }
+}
+
+function renderVisibleCards() {
+    // only the cards on screen (and a couple rows either side) are in the page, each at its spot in the grid
+    renderQueued = false;
+
+    // a date's static page comes with its cards already in it (see pool_static.py), swap them out in the same frame
+    if (elCardHolder.dataset.static !== undefined) {
+        removeChildren(elCardHolder);
+        delete elCardHolder.dataset.static;
+    }
+
+    let date = elSelectDate.value;
+    let columns = Math.max(1, Math.floor(elCardHolder.clientWidth / cardWidth));
+    let rows = Math.ceil(shownPools.length / columns);
+    elCardHolder.style.height = `${rows * cardHeight}px`;
+
+    // which rows are on screen
+    let holderTop = elCardHolder.getBoundingClientRect().top;
+    let firstRow = Math.max(0, Math.floor(-holderTop / cardHeight) - overscanRows);
+    let lastRow = Math.min(rows, Math.ceil((window.innerHeight - holderTop) / cardHeight) + overscanRows);
+
+    let visibleNames = new Set();
+    for (let i = firstRow * columns; i < Math.min(lastRow * columns, shownPools.length); i++) {
+        let pool = shownPools[i];
+
+        let card_el = cardEls.get(pool.name);
+        if (card_el === undefined) {
+            card_el = createPoolCard(pool, date);
+            cardEls.set(pool.name, card_el);
+        } else {
+            updatePoolCard(card_el, date);
+        }
+        card_el.style.transform = `translate(${(i % columns) * cardWidth}px, ${Math.floor(i / columns) * cardHeight}px)`;
+
+        if (!renderedNames.has(pool.name)) {
+            elCardHolder.appendChild(card_el);
+        }
+        visibleNames.add(pool.name);
+    }
+
+    // take out the ones that went off screen
+    for (let name of renderedNames) {
+        if (!visibleNames.has(name)) {
+            elCardHolder.removeChild(cardEls.get(name));
+        }
+    }
+    renderedNames = visibleNames;
+}
+
+function torontoTime() {
+    // the date and time right now in Toronto (where the pools are), whatever timezone the viewer is in
+    let parts = {};
+    for (let part of torontoTimeFormat.formatToParts(new Date())) {
+        parts[part.type] = part.value;
+    }
+    return parts;
+}
+
+function getDate() {
+    // ex: 2019-06-05
+    let now = torontoTime();
+    return `${now.year}-${now.month}-${now.day}`;
+}
+
+function torontoMinutes() {
+    // ex: 6:30pm -> 1110
+    let now = torontoTime();
+    return parseInt(now.hour) * 60 + parseInt(now.minute);
+}
+
+function soonestRanks(date, minutes, program) {
+    // map pool name -> how soon (1st, 2nd, ...) its next session starts, from `minutes` onwards
+    // same as NextOpenings.after() in pool_next.py
+    let key = `${date} ${minutes} ${program}`;
+    if (soonestRanksCache.key === key) {
+        return soonestRanksCache.ranks;
+    }
+
+    let ranks = new Map();
+    let table = nextOpenings[date];
+    if (table !== undefined && minutes < oneDayMinutes) {
+        for (let i = table.buckets[Math.floor(minutes / slotMinutes)]; i < table.order.length; i++) {
+            let [name, start, sessionProgram] = table.order[i];
+            // the bucket can start a few minutes before now
+            if (start < minutes || ranks.has(name) || (program !== '' && sessionProgram !== program)) {
+                continue;
+            }
+            ranks.set(name, ranks.size);
+        }
+    }
+
+    soonestRanksCache = {key: key, ranks: ranks};
+    return ranks;
+}
+
+function datesBetween(first, last) {
+    // ex: 2019-06-29, 2019-07-01 -> [2019-06-29, 2019-06-30, 2019-07-01]
+    let dates = [];
+    let date = new Date(`${first}T00:00:00Z`);
+    let lastDate = new Date(`${last}T00:00:00Z`);
+    while (date <= lastDate) {
+        dates.push(date.toISOString().slice(0, 10));
+        date.setUTCDate(date.getUTCDate() + 1);
+    }
+    return dates;
+}
+
+function loadMonth(month) {
+    // load a month's data file (once), which calls onMonthData
+    if (monthLoads[month] === undefined) {
+        monthLoads[month] = new Promise((resolve, reject) => {
+            if (pool_months[month] === undefined) {
+                reject(new Error(`No data for month ${month}`));
+                return;
+            }
+
+            let el = document.createElement('script');
+            el.src = pool_months[month].src;
+            el.onload = resolve;
+            el.onerror = () => reject(new Error(`Couldn't load data for month ${month}`));
+            document.head.appendChild(el);
+        });
+    }
+    return monthLoads[month];
+}
+
+function onMonthData(month, data) {
+    // called by data/YYYY-MM.js: add that month's weekly rules and exceptions (and their slots) to pool_info (see
+    //   pool_recurrence.py), and keep its next-opening tables
+    for (let [name, rules] of Object.entries(data.rules)) {
+        pool_info[name].rules.push(...rules);
+    }
+    for (let [name, dates] of Object.entries(data.exceptions)) {
+        Object.assign(pool_info[name].exceptions, dates);
+    }
+    for (let [name, dates] of Object.entries(data.slots)) {
+        Object.assign(pool_info[name].slots, dates);
+    }
+    // swap each pool's/program's index in the month's lists for its name, once per table
+    let {pools, programs, tables} = data.next_openings;
+    tables = tables.map(({order, buckets}) => ({
+        order: order.map(([pool, start, program]) => [pools[pool], start, programs[program]]), buckets: buckets,
+    }));
+    for (let [date, index] of Object.entries(data.next_openings.dates)) {
+        nextOpenings[date] = tables[index];
+    }
+    for (let [name, dates] of Object.entries(data.alternatives.sessions)) {
+        for (let [date, sessions] of Object.entries(dates)) {
+            // swap each pool's index in the month's list of pools for its name
+            pool_info[name].alternatives[date] = sessions.map(([start, end, program, others]) => [start, end, program,
+                others.map(([index, ...rest]) => [data.alternatives.pools[index], ...rest])]);
+        }
+    }
+    loadedMonths.add(month);
+}
+
+function weekday(date) {
+    // ex: 2019-06-03 -> 0 (Monday), same as datetime.weekday()
+    return (new Date(`${date}T00:00:00Z`).getUTCDay() + 6) % 7;
+}
+
+function poolRules(pool, date) {
+    // the weekly rules a pool has on a date, in order of start (then end, then program), like the generator sorts them
+    let day = weekday(date);
+    return pool.rules.filter(([ruleDay, , , , first, last]) => ruleDay === day && first <= date && date <= last);
+}
+
+function poolSessions(pool, date) {
+    // every session a pool has on a date: its exceptions if the date has any, otherwise whatever its weekly rules say
+    // same as RecurringSchedule in pool_recurrence.py. Worked out once per date, once its month is loaded.
+    let times = pool.availabilities[date];
+    if (times !== undefined) {
+        return times;
+    }
+
+    times = pool.exceptions[date];
+    if (times === undefined) {
+        times = poolRules(pool, date).map(([, start, end, program]) => ({start: start, end: end, program: program}));
+    }
+
+    if (loadedMonths.has(date.slice(0, 7))) {
+        pool.availabilities[date] = times;
+    }
+    return times;
+}
+
+function poolTimes(pool, date) {
+    // a pool's sessions on a date, of the chosen program (or all of them)
+    let times = poolSessions(pool, date);
+    let program = elSelectProgram.value;
+    if (program === '') {
+        return times;
+    }
+    return times.filter(time => time.program === program);
+}
+
+function windowSlots(start, end) {
+    // slot mask (as 32-bit words) of every slot that start..end (minutes since midnight) overlaps
+    // ex: 1080, 1200 (6pm - 8pm) -> slots 72 to 79
+    let words = new Array(slotWords).fill(0);
+    let first = Math.max(Math.floor(start / slotMinutes), 0);
+    let last = Math.min(Math.ceil(end / slotMinutes), slotsPerDay);
+    for (let slot = first; slot < last; slot++) {
+        words[slot >> 5] |= 1 << (slot & 31);
+    }
+    return words;
+}
+
+function poolSlots(pool, date) {
+    // slot mask of every slot the pool has a session of the chosen program in, same as pool_slots.py
+    // the generated slots include every program (the exceptions' are in the month data, and the rest are the rules'
+    //   words ORed together), so only work them out from the sessions when a program is chosen
+    let program = elSelectProgram.value;
+    if (program === '' && pool.slots[date] !== undefined) {
+        return pool.slots[date];
+    }
+
+    let words = new Array(slotWords).fill(0);
+    if (program === '') {
+        for (let rule of poolRules(pool, date)) {
+            rule[6].forEach((word, i) => words[i] |= word);
+        }
+        if (loadedMonths.has(date.slice(0, 7))) {
+            pool.slots[date] = words;
+        }
+        return words;
+    }
+
+    for (let time of poolTimes(pool, date)) {
+        windowSlots(time.start, time.end).forEach((word, i) => words[i] |= word);
+    }
+    return words;
+}
+
+function poolOpenDuring(pool, date, start, end) {
+    // whether a pool is open at any point between start and end (minutes since midnight), to the nearest 15 minutes
+    let window = windowSlots(start, end);
+    let slots = poolSlots(pool, date);
+    return window.some((word, i) => (slots[i] & word) !== 0);
+}
+
+function inputMinutes(el, otherwise) {
+    // read an <input type="time"> as minutes since midnight
+    if (el.value === '') {
+        return otherwise;
+    }
+    let [hours, minutes] = el.value.split(':').map(Number);
+    return hours * 60 + minutes;
+}
+
+function fillDateSelect(month) {
+    // only list the dates in the chosen month
+    removeChildren(elSelectDate);
+    for (let date of datesBetween(pool_months[month].first, pool_months[month].last)) {
+        let el = document.createElement('option');
+        el.value = date;
+        el.textContent = date;
+        elSelectDate.appendChild(el);
+    }
+}
+
+function loadSearchIndex() {
+    if (searchIndexLoad === undefined) {
+        searchIndexLoad = fetch(searchIndexURL)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`Couldn't load search index: ${response.status}`);
+                }
+                return response.json();
+            })
+            .then(index => {
+                searchIndex = index;
+            })
+            .catch(err => {
+                // try again next time
+                searchIndexLoad = undefined;
+                throw err;
+            });
+    }
+    return searchIndexLoad;
+}
+
+function searchText(text) {
+    // same as search_text() in pool_search.py
+    // ex: "Albert Campbell C.I." -> "albert campbell c i"
+    return text.toLowerCase().split(/[^a-z0-9]+/).join(' ').trim();
+}
+
+function textTrigrams(text) {
+    let trigrams = new Set();
+    for (let i = 0; i + 3 <= text.length; i++) {
+        trigrams.add(text.slice(i, i + 3));
+    }
+    return trigrams;
+}
+
+function searchPools(query) {
+    // names of the pools that have the query in their name, classified name, address or type, or if none do, the ones
+    //   with most of its trigrams (e.g. typos). Same as SearchIndex.search() in pool_search.py, with fuzzy=True only
+    //   when nothing matches exactly.
+    query = searchText(query);
+    if (query === '') {
+        return new Set(searchIndex.names);
+    }
+
+    let trigrams = textTrigrams(query);
+    let candidates;
+    if (trigrams.size > 0) {
+        // only the pools that have every trigram of the query can have it
+        for (let trigram of trigrams) {
+            let postings = searchIndex.postings[trigram] || [];
+            candidates = candidates === undefined ? new Set(postings) : new Set(postings.filter(i => candidates.has(i)));
+            if (candidates.size === 0) {
+                break;
+            }
+        }
+    } else {
+        candidates = searchIndex.names.keys();
+    }
+
+    let hits = new Set();
+    for (let i of candidates) {
+        if (searchIndex.fields[i].some(field => field.includes(query))) {
+            hits.add(searchIndex.names[i]);
+        }
+    }
+
+    if (hits.size === 0 && trigrams.size > 0) {
+        let shared = new Map();
+        for (let trigram of trigrams) {
+            for (let i of searchIndex.postings[trigram] || []) {
+                shared.set(i, (shared.get(i) || 0) + 1);
+            }
+        }
+        for (let [i, count] of shared) {
+            if (count / trigrams.size >= fuzzyThreshold) {
+                hits.add(searchIndex.names[i]);
+            }
+        }
+    }
+
+    return hits;
+}
+
+function selectDate(date) {
+    // make sure the month (and the search index, if searching) is loaded before showing its cards
+    let query = elInputName.value.trim();
+    let loads = [loadMonth(date.slice(0, 7))];
+    if (query !== '') {
+        loads.push(loadSearchIndex());
+    }
+
+    return Promise.all(loads).then(() => {
+        // only show pools open during the chosen times (if any)
+        let from = inputMinutes(elInputFrom, 0);
+        let to = inputMinutes(elInputTo, oneDayMinutes);
+
+        // and the ones that match the search (if any)
+        let names = query !== '' ? searchPools(query) : undefined;
+
+        // pick the pools to show (their cards are made/updated as they come on screen)
+        shownPools = [];
+        for (let pool of Object.values(pool_info)) {
+            if (names !== undefined && !names.has(pool.name)) {
+                continue;
+            }
+            if (poolTimes(pool, date).length === 0) {
+                continue;
+            }
+            if ((from > 0 || to < oneDayMinutes) && !poolOpenDuring(pool, date, from, to)) {
+                continue;
+            }
+
+            shownPools.push(pool);
+        }
+
+        renderCards();
+    }).catch(err => console.log(`ERR: ${err.message}`));
+}
+
+function timestampToText(timestamp) {
+    // convert single start/end timestamp from pool_info into text
+    // ex: 330 -> 5:30
+    // ex: 300 -> 5
+
+    if (timestamp < 0 || timestamp >= 1440) {
+        console.log(`What is this timestamp you're giving me? ${timestamp}??`);
+    }
+
+    let hrs = parseInt(timestamp / 60);
+    let mins = timestamp - hrs * 60;
+
+    return `${hrs}:${mins.toString().padStart(2, '0')}`;
+}
+
+function timeToText(time) {
+    // format time from pool_info as text
+    // ex: 300, 330 -> 5 - 5:30am
+    // basically: always add am/pm onto second timestamp, and only add it to first if first is AM and 2nd is PM.
+    let start_str = timestampToText(time.start);
+    let end_str = timestampToText(time.end);
+
+    if ((time.end / 60) >= 12) {
+        end_str += 'pm';
+        if ((time.start / 60) < 12) {
+            start_str += 'am';
+        }
+    } else {
+        end_str += 'am';
+    }
+
+    return `${start_str} - ${end_str}`
+}
+
+
+function createPoolCard(pool, date) {
+    /*
+    Sample pool:
+        {"name": "York Recreation Centre", "classified_name": "york-recreation-centre", "availabilities": {"2019-07-09": [{"start": 870, "end": 930}], "2019-06-21": [{"start": 1170, "end": 1290}], "2019-06-08": [{"start": 810, "end": 945}], "2019-07-04": [{"start": 810, "end": 930}], "2019-07-06": [{"start": 810, "end": 945}], "2019-06-09": [{"start": 810, "end": 945}], "2019-07-07": [{"start": 810, "end": 945}], "2019-07-14": [{"start": 810, "end": 945}], "2019-07-17": [{"start": 810, "end": 930}], "2019-07-21": [{"start": 810, "end": 945}], "2019-06-16": [{"start": 810, "end": 945}], "2019-06-28": [{"start": 1170, "end": 1290}], "2019-06-13": [{"start": 1170, "end": 1245}], "2019-07-02": [{"start": 870, "end": 930}], "2019-06-20": [{"start": 1170, "end": 1245}], "2019-07-03": [{"start": 810, "end": 930}], "2019-06-06": [{"start": 1170, "end": 1245}], "2019-06-15": [{"start": 810, "end": 945}], "2019-07-27": [{"start": 810, "end": 945}], "2019-07-22": [{"start": 810, "end": 930}], "2019-06-30": [{"start": 810, "end": 945}], "2019-07-11": [{"start": 810, "end": 930}], "2019-06-29": [{"start": 810, "end": 945}], "2019-06-04": [{"start": 1170, "end": 1245}], "2019-06-11": [{"start": 1170, "end": 1245}], "2019-06-18": [{"start": 1170, "end": 1245}], "2019-07-13": [{"start": 810, "end": 945}], "2019-07-15": [{"start": 810, "end": 930}], "2019-06-14": [{"start": 1170, "end": 1290}], "2019-07-19": [{"start": 900, "end": 1020}, {"start": 1170, "end": 1290}], "2019-06-07": [{"start": 1170, "end": 1290}], "2019-06-25": [{"start": 1170, "end": 1245}], "2019-07-16": [{"start": 870, "end": 930}], "2019-07-05": [{"start": 900, "end": 1020}, {"start": 1170, "end": 1290}], "2019-06-02": [{"start": 810, "end": 945}], "2019-07-20": [{"start": 810, "end": 945}], "2019-07-18": [{"start": 810, "end": 930}], "2019-07-10": [{"start": 810, "end": 930}], "2019-07-25": [{"start": 810, "end": 930}], "2019-06-22": [{"start": 810, "end": 945}], "2019-06-27": [{"start": 1170, "end": 1245}], "2019-07-23": [{"start": 870, "end": 930}], "2019-07-08": [{"start": 810, "end": 930}], "2019-07-24": [{"start": 810, "end": 930}], "2019-07-26": [{"start": 900, "end": 1020}, {"start": 1170, "end": 1290}], "2019-07-12": [{"start": 900, "end": 1020}, {"start": 1170, "end": 1290}], "2019-06-23": [{"start": 810, "end": 945}]}, "address": "115 BLACK CREEK DR", "type": "indoor pool", "phone": "416 392-9675"}
+
+    Sample output:
+        <div class="pool-card Albert-Campbell-Collegiate-Institute">
+            <div class="pool-name">Albert Campbell Collegiate Institute</div>
+            <div class="pool-time date-2019-05-26">1 - 2pm</div>
+            <div class="pool-time date-2019-05-27">5 - 6pm</div>
+            <div class="pool-time date-2019-06-01">2 - 5pm</div>
+        </div>
+    """
+    */
+
+    let card_el = document.createElement('div');
+    card_el.classList.add('pool-card');
+
+    // expando this mf
+    card_el.pool_info = pool;
+
+    updatePoolCard(card_el, date);
+    return card_el;
+}
+
+function updatePoolCard(card_el, date) {
+    // fill in a card for a date, unless it already shows exactly that
+    let pool = card_el.pool_info;
+    let key = `${date} ${elSelectProgram.value} ${pool.distance} ${pool.time}`;
+    if (card_el.renderedKey === key) {
+        return;
+    }
+    card_el.renderedKey = key;
+    removeChildren(card_el);
+
+    let times = poolTimes(pool, date);
+
+    let name_el = document.createElement('name');
+    name_el.classList.add('pool-name');
+    name_el.textContent = pool.name;
+    if (pool.distance) {
+        name_el.textContent += ` (~${pool.distance.toFixed(1)}km)`;
+    }
+    if (pool.time) {
+        name_el.textContent += ` (~${Math.ceil(pool.time / 60)}min)`;
+    }
+    card_el.appendChild(name_el);
+
+    // subscribe to this pool's schedule in a calendar app (see pool_ics.py)
+    let ics_el = document.createElement('a');
+    ics_el.classList.add('pool-ics');
+    ics_el.href = `ics/pools/${pool.classified_name}.ics`;
+    ics_el.textContent = 'calendar';
+    card_el.appendChild(ics_el);
+
+    for (let time of times) {
+        let time_el = document.createElement('div');
+        time_el.classList.add('pool-time');
+        time_el.textContent = timeToText(time);
+        if (elSelectProgram.value === '') {
+            time_el.textContent += ` (${time.program})`;
+        }
+        let nearby = nearbyText(pool, date, time);
+        if (nearby !== undefined) {
+            time_el.title = nearby;
+        }
+        card_el.appendChild(time_el);
+    }
+}
+
+function nearbyText(pool, date, time) {
+    // the nearest other pools open at the same time as a session, precomputed by the generator (see pool_nearby.py)
+    // ex: "Also open nearby: Alderwood Centre (1.2km, 7:15 - 8:10pm), ..."
+    let alternatives = (pool.alternatives[date] || []).find(([start, end, program]) =>
+        start === time.start && end === time.end && program === time.program);
+    if (alternatives === undefined) {
+        return undefined;
+    }
+
+    let others = alternatives[3].map(([name, start, end, km]) => `${name} (${km}km, ${timeToText({start: start, end: end})})`);
+    return `Also open nearby: ${others.join(', ')}`;
+}
+
+function appendDownloadStatus(status, err = false) {
+    let el = document.createElement('li');
+    el.textContent = status;
+    if (err) {
+        el.classList.add('err-msg');
+    }
+    elDownloadResult.appendChild(el);
+    return el;
+}
+
+function compareRanks(ranks, pool1, pool2) {
+    let rank1 = ranks.get(pool1.name);
+    let rank2 = ranks.get(pool2.name);
+    rank1 = rank1 === undefined ? Infinity : rank1;
+    rank2 = rank2 === undefined ? Infinity : rank2;
+
+    if (rank1 > rank2) {
+        return 1;
+    } else if (rank1 < rank2) {
+        return -1;
+    } else {
+        return sortOptions.name(pool1, pool2);
+    }
+}
+
+function requestDistances(address, cacheOnly) {
+    // ask the worker for every pool's distance/driving time from address. With cacheOnly, only the ones it already has
+    //   (e.g. on page load), which doesn't use any of the API key's quota.
+    if (distanceWorker === undefined) {
+        distanceWorker = new Worker(distanceWorkerURL);
+        distanceWorker.addEventListener('message', onDistanceMessage);
+    }
+
+    let pools = Object.values(pool_info).filter(pool => pool.address)
+        .map(pool => [pool.name, `${pool.address}, Toronto ON`]);
+
+    distanceRequestId += 1;
+    distanceWorker.postMessage({
+        id: distanceRequestId, address: address, apiKey: document.querySelector('#input-apikey').value, pools: pools,
+        cacheOnly: cacheOnly,
+    });
+}
+
+function onDistanceMessage(event) {
+    let message = event.data;
+    if (message.id !== distanceRequestId) {
+        // the address changed since
+        return;
+    }
+
+    if (elDistanceStatus !== undefined) {
+        elDownloadResult.removeChild(elDistanceStatus);
+        elDistanceStatus = undefined;
+    }
+
+    if (!message.done) {
+        let el = appendDownloadStatus(message.error ? `ERR: ${message.status}` : message.status, message.error);
+        if (!message.error) {
+            // replaced by whatever comes next
+            elDistanceStatus = el;
+        }
+        return;
+    }
+
+    // append to pool info
+    for (let [name, [distance, time]] of Object.entries(message.distances)) {
+        pool_info[name].distance = distance;
+        pool_info[name].time = time;
+    }
+    distanceRanks = {distance: new Map(Object.entries(message.ranks.distance)),
+                     time: new Map(Object.entries(message.ranks.time))};
+
+    if (message.cached > 0 || message.downloaded > 0) {
+        appendDownloadStatus(`${message.cached} pools from the cache, ${message.downloaded} downloaded.`);
+    }
+
+    // the distances/times (and maybe the order) of the cards on screen changed
+    sortCards(elSelectSort.value);
+}
+
+function onSelectDate(event) {
+    // get the date they chose
+    let date = event.target.value;
+
+    // change to it
+    selectDate(date).then(() => sortCards(elSelectSort.value));
+}
+
+function onSelectMonth(event) {
+    // get the month they chose
+    let month = event.target.value;
+
+    // show its dates, and change to the first one
+    fillDateSelect(month);
+    elSelectDate.value = pool_months[month].first;
+    selectDate(elSelectDate.value).then(() => sortCards(elSelectSort.value));
+}
+
+function onChangeFilters(event) {
+    // re-show the chosen date with just that program's sessions (and the pools open during the chosen times)
+    selectDate(elSelectDate.value).then(() => sortCards(elSelectSort.value));
+}
+
+function onSelectSort(event) {
+    // get the sort option they chose
+    let sortOption = event.target.value;
+
+    // change to it
+    sortCards(sortOption);
+}
+
+function onPressDownloadAddresses(event) {
+    // reset download status
+    removeChildren(elDownloadResult);
+    elDistanceStatus = undefined;
+
+    let address = elInputAddress.value;
+    if (address.trim().length === 0) {
+        console.log('Really?');
+        return;
+    }
+
+    // save API key and address so they don't have to re-enter them every visit (and so the distances come back from
+    //   the cache next time)
+    localStorage.setItem(apiKeyLocalStorageKey, document.querySelector('#input-apikey').value);
+    localStorage.setItem(addressLocalStorageKey, address);
+
+    // only the pools that aren't cached yet are downloaded (see distance-worker.js)
+    requestDistances(address, false);
+}
+
+function addDownloadStatus(status) {
+    // create element
+    // return it, so we can delete it later
+}
+
+window.addEventListener('load', (event) => {
+    // get elements
+    elSelectMonth = document.querySelector('#month-select');
+    elSelectDate = document.querySelector('#date-select');
+    elSelectProgram = document.querySelector('#program-select');
+    elInputName = document.querySelector('#input-name');
+    elInputFrom = document.querySelector('#input-from');
+    elInputTo = document.querySelector('#input-to');
+    elSelectSort = document.querySelector('#sort-select');
+    elCardHolder = document.querySelector('.pool-card-holder');
+    elInputAddress = document.querySelector('#input-address');
+    elDownloadResult = document.querySelector('#download-result');
+
+    // hook up month/date select, and start on today (or the first date, if today isn't in the schedule). A date's static
+    //   page starts on its date.
+    elSelectMonth.addEventListener('change', onSelectMonth);
+    elSelectDate.addEventListener('change', onSelectDate);
+    let today = elCardHolder.dataset.date || getDate();
+    let month = today.slice(0, 7);
+    if (pool_months[month] === undefined || today < pool_months[month].first || today > pool_months[month].last) {
+        month = Object.keys(pool_months).sort()[0];
+        today = pool_months[month].first;
+    }
+    elSelectMonth.value = month;
+    fillDateSelect(month);
+    elSelectDate.value = today;
+    selectDate(today);
+
+    // hook up program select
+    elSelectProgram.addEventListener('change', onChangeFilters);
+    elInputName.addEventListener('input', onChangeFilters);
+    elInputFrom.addEventListener('change', onChangeFilters);
+    elInputTo.addEventListener('change', onChangeFilters);
+
+    // hook up sort select
+    elSelectSort.addEventListener('change', onSelectSort);
+
+    // render the cards that come on screen
+    window.addEventListener('scroll', renderCards, {passive: true});
+    window.addEventListener('resize', renderCards);
+
+    // hook up distance checker
+    document.querySelector('#btn-distance-update').addEventListener('click', onPressDownloadAddresses);
+
+    // stick in previous API key, if exists
+    document.querySelector('#input-apikey').value = localStorage.getItem(apiKeyLocalStorageKey) || '';
+
+    // and the previous address, with whatever distances from it are cached
+    let address = localStorage.getItem(addressLocalStorageKey);
+    if (address) {
+        elInputAddress.value = address;
+        requestDistances(address, true);
+    }
+
+    // cache the page and its data, so that the next visit is instant (and works offline). See sw_template.js.
+    if ('serviceWorker' in navigator) {
+        navigator.serviceWorker.register('sw.js').catch(err => console.log(`Couldn't register service worker: ${err}`));
+    }
+});
@@ -0,0 +1,129 @@
+/*
+Service worker for pools-v3.html, so that repeat visits load straight from the cache (even offline, at the pool).
+
+The precache list is filled in by gen_v3() (see write_service_worker() in generate_pages_v3.py): every asset the page
+needs, with a hash of its contents. Each asset is cached under its URL + hash, so when the data changes this file
+changes too, the browser installs it again, and only the assets whose hash changed get downloaded.
+*/
+
+const PRECACHE = [
+    {
+        "url": "pools-v3.html",
+        "revision": "444a29442149"
+    },
+    {
+        "url": "pools-v3.css",
+        "revision": "b6bbc36c6b64"
+    },
+    {
+        "url": "pools-v3.js",
+        "revision": "8457c77eb7ac"
+    },
+    {
+        "url": "distance-worker.js",
+        "revision": "967b7b96390b"
+    },
+    {
+        "url": "search-index.json",
+        "revision": "93e96687e55b"
+    },
+    {
+        "url": "data/months.js",
+        "revision": "4ac6313d6243"
+    },
+    {
+        "url": "coverage.html",
+        "revision": "51f67ab6ed8f"
+    },
+    {
+        "url": "coverage.js",
+        "revision": "e4d37a3f7ebb"
+    },
+    {
+        "url": "coverage.json",
+        "revision": "60213c5a3380"
+    },
+    {
+        "url": "data/2019-06.js?v=daba0366cbb3",
+        "revision": "daba0366cbb3"
+    },
+    {
+        "url": "data/2019-07.js?v=be1b5f1b7e7e",
+        "revision": "be1b5f1b7e7e"
+    },
+    {
+        "url": "coverage.bin?v=22233a2c41f6",
+        "revision": "22233a2c41f6"
+    }
+];
+
+const CACHE_NAME = 'pools-v3';
+const REVISION_PARAM = '__revision';
+
+// map url (as the page requests it, relative to this file) -> cache key
+const precacheKeys = new Map(PRECACHE.map(({url, revision}) => [
+    new URL(url, self.location).href,
+    cacheKey(url, revision),
+]));
+
+function cacheKey(url, revision) {
+    let key = new URL(url, self.location);
+    key.searchParams.set(REVISION_PARAM, revision);
+    return key.href;
+}
+
+self.addEventListener('install', (event) => {
+    // download whatever isn't cached under its current hash yet
+    event.waitUntil(caches.open(CACHE_NAME).then(async (cache) => {
+        let cached = new Set((await cache.keys()).map(request => request.url));
+        let missing = [...precacheKeys].filter(([, key]) => !cached.has(key));
+
+        await Promise.all(missing.map(async ([url, key]) => {
+            let response = await fetch(url, {cache: 'no-cache'});
+            if (!response.ok) {
+                throw new Error(`Couldn't precache ${url}: ${response.status}`);
+            }
+            await cache.put(key, response);
+        }));
+    }).then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', (event) => {
+    // drop assets that were replaced by a new hash (or aren't used anymore)
+    event.waitUntil(caches.open(CACHE_NAME).then(async (cache) => {
+        let keep = new Set(precacheKeys.values());
+        for (let request of await cache.keys()) {
+            if (!keep.has(request.url)) {
+                await cache.delete(request);
+            }
+        }
+    }).then(() => self.clients.claim()));
+});
+
+self.addEventListener('fetch', (event) => {
+    if (event.request.method !== 'GET') {
+        return;
+    }
+
+    let url = new URL(event.request.url);
+    url.hash = '';
+    let key = precacheKeys.get(url.href);
+
+    // opening the folder itself (or the page with some query string) means the page
+    if (key === undefined && event.request.mode === 'navigate') {
+        url.search = '';
+        if (url.pathname.endsWith('/')) {
+            url.pathname += 'pools-v3.html';
+        }
+        key = precacheKeys.get(url.href);
+    }
+
+    // anything else (e.g. the distance API) goes straight to the network
+    if (key === undefined) {
+        return;
+    }
+
+    event.respondWith(caches.open(CACHE_NAME)
+        .then(cache => cache.match(key))
+        .then(response => response || fetch(event.request)));
+});
@@ -0,0 +1,80 @@
+/*
+Service worker for pools-v3.html, so that repeat visits load straight from the cache (even offline, at the pool).
+
+The precache list is filled in by gen_v3() (see write_service_worker() in generate_pages_v3.py): every asset the page
+needs, with a hash of its contents. Each asset is cached under its URL + hash, so when the data changes this file
+changes too, the browser installs it again, and only the assets whose hash changed get downloaded.
+*/
+
+const PRECACHE = {{ precache }};
+
+const CACHE_NAME = 'pools-v3';
+const REVISION_PARAM = '__revision';
+
+// map url (as the page requests it, relative to this file) -> cache key
+const precacheKeys = new Map(PRECACHE.map(({url, revision}) => [
+    new URL(url, self.location).href,
+    cacheKey(url, revision),
+]));
+
+function cacheKey(url, revision) {
+    let key = new URL(url, self.location);
+    key.searchParams.set(REVISION_PARAM, revision);
+    return key.href;
+}
+
+self.addEventListener('install', (event) => {
+    // download whatever isn't cached under its current hash yet
+    event.waitUntil(caches.open(CACHE_NAME).then(async (cache) => {
+        let cached = new Set((await cache.keys()).map(request => request.url));
+        let missing = [...precacheKeys].filter(([, key]) => !cached.has(key));
+
+        await Promise.all(missing.map(async ([url, key]) => {
+            let response = await fetch(url, {cache: 'no-cache'});
+            if (!response.ok) {
+                throw new Error(`Couldn't precache ${url}: ${response.status}`);
+            }
+            await cache.put(key, response);
+        }));
+    }).then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', (event) => {
+    // drop assets that were replaced by a new hash (or aren't used anymore)
+    event.waitUntil(caches.open(CACHE_NAME).then(async (cache) => {
+        let keep = new Set(precacheKeys.values());
+        for (let request of await cache.keys()) {
+            if (!keep.has(request.url)) {
+                await cache.delete(request);
+            }
+        }
+    }).then(() => self.clients.claim()));
+});
+
+self.addEventListener('fetch', (event) => {
+    if (event.request.method !== 'GET') {
+        return;
+    }
+
+    let url = new URL(event.request.url);
+    url.hash = '';
+    let key = precacheKeys.get(url.href);
+
+    // opening the folder itself (or the page with some query string) means the page
+    if (key === undefined && event.request.mode === 'navigate') {
+        url.search = '';
+        if (url.pathname.endsWith('/')) {
+            url.pathname += 'pools-v3.html';
+        }
+        key = precacheKeys.get(url.href);
+    }
+
+    // anything else (e.g. the distance API) goes straight to the network
+    if (key === undefined) {
+        return;
+    }
+
+    event.respondWith(caches.open(CACHE_NAME)
+        .then(cache => cache.match(key))
+        .then(response => response || fetch(event.request)));
+});
@@ -0,0 +1,237 @@
+"""
+Append-only archive of every scrape, so we can look back at how the schedules changed over a season.
+
+Everything is stored as compressed chunks, named by the hash of what's in them, so anything that didn't change between
+scrapes (which is most of it) is only ever stored once:
+    - a week chunk is one pool's sessions for one Sun-Sat week
+    - a pool chunk is a pool's name/address/type/phone, plus the hashes of its week chunks
+    - a snapshot chunk is the hashes of every pool chunk in a scrape
+
+Files (in the archive folder):
+    chunks.pack      the compressed chunks, one after another (only ever appended to)
+    chunks.idx       hash, offset and length of each chunk in chunks.pack (one line per chunk)
+    snapshots.jsonl  index by scrape timestamp: {"timestamp": ..., "chunk": snapshot chunk hash}
+    pools.jsonl      index by pool: {"pool": ..., "timestamp": ..., "chunk": pool chunk hash}, only when the pool changed
+
+A snapshot's line is written last, so a scrape that was interrupted half-way through archiving is just never listed.
+
+Usage:
+    from pool_archive import Archive
+
+    archive = Archive('archive')
+    archive.add(pool_info)                    # after scraping
+    archive.timestamps()                      # every scrape archived
+    archive.snapshot('2019-06-01T12:00:00')   # pool info as of that scrape (or the latest one before it)
+    archive.history('York Recreation Centre')  # [(timestamp, Pool)], every time it changed
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime, timedelta
+from typing import List
+
+from generate_pages_v3 import ARCHIVE_FOLDER, Pool, PoolType, Session
+
+PACK_FNAME = 'chunks.pack'
+INDEX_FNAME = 'chunks.idx'
+SNAPSHOTS_FNAME = 'snapshots.jsonl'
+POOLS_FNAME = 'pools.jsonl'
+
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+
+def to_json(value):
+    # same value -> same bytes -> same hash
+    return json.dumps(value, sort_keys=True, separators=(',', ':')).encode()
+
+
+def week_start(date: datetime):
+    # toronto.ca weeks start on Sunday
+    return date - timedelta(days=(date.weekday() + 1) % 7)
+
+
+class Archive:
+    def __init__(self, folder=ARCHIVE_FOLDER):
+        self.folder = folder
+
+        # chunk hash -> (offset, length) in the pack
+        self.chunks = dict()
+        # decompressed chunks, since the same weeks come up over and over when reading history
+        self.cache = dict()
+        # kept open while reading, since a snapshot is a couple thousand chunks
+        self._pack = None
+
+        self._load_index()
+
+    def path(self, fname):
+        return os.path.join(self.folder, fname)
+
+    def _load_index(self):
+        try:
+            pack_size = os.path.getsize(self.path(PACK_FNAME))
+            with open(self.path(INDEX_FNAME), 'r') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+
+        for line in lines:
+            parts = line.split()
+            # skip anything a crash left half-written
+            if len(parts) != 3:
+                continue
+            chunk_hash, offset, length = parts[0], int(parts[1]), int(parts[2])
+            if offset + length <= pack_size:
+                self.chunks[chunk_hash] = (offset, length)
+
+    def _read_lines(self, fname):
+        try:
+            with open(self.path(fname), 'r') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return []
+
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                pass
+        return records
+
+    ##### WRITING #####
+
+    def add(self, pool_info: List[Pool], timestamp: datetime = None):
+        """
+        Archive a scrape. Returns the timestamp it was archived under.
+        """
+
+        timestamp = (timestamp or datetime.now()).strftime(TIMESTAMP_FORMAT)
+        os.makedirs(self.folder, exist_ok=True)
+
+        latest_pool_chunks = self._latest_pool_chunks()
+        new_pool_lines = []
+
+        with open(self.path(PACK_FNAME), 'ab') as pack, open(self.path(INDEX_FNAME), 'a') as index:
+            def put(value):
+                return self._put(pack, index, to_json(value))
+
+            pool_chunks = dict()
+            for pool in pool_info:
+                weeks = dict()
+                for date, times in pool.availabilities.items():
+                    weeks.setdefault(week_start(date), dict())[date.strftime('%Y-%m-%d')] = sorted(
+                        [int(start.total_seconds()) // 60, int(end.total_seconds()) // 60, program]
+                        for start, end, program in times)
+
+                pool_chunk = put({
+                    'name': pool.name,
+                    'address': pool.address,
+                    'type': getattr(pool.type, 'value', pool.type),
+                    'phone': pool.phone,
+                    'weeks': [put(weeks[week]) for week in sorted(weeks)],
+                })
+                pool_chunks[pool.name] = pool_chunk
+
+                if latest_pool_chunks.get(pool.name) != pool_chunk:
+                    new_pool_lines.append({'pool': pool.name, 'timestamp': timestamp, 'chunk': pool_chunk})
+
+            snapshot_chunk = put({'pools': [pool_chunks[pool.name] for pool in pool_info]})
+
+        # reopen the pack next time it's read, to see what was just added
+        self.close()
+
+        # indexes last, so they never point at chunks that aren't there
+        with open(self.path(POOLS_FNAME), 'a') as f:
+            for line in new_pool_lines:
+                f.write(json.dumps(line) + '\n')
+        with open(self.path(SNAPSHOTS_FNAME), 'a') as f:
+            f.write(json.dumps({'timestamp': timestamp, 'chunk': snapshot_chunk}) + '\n')
+
+        return timestamp
+
+    def _put(self, pack, index, data: bytes):
+        chunk_hash = hashlib.sha1(data).hexdigest()
+        if chunk_hash not in self.chunks:
+            compressed = zlib.compress(data, 9)
+            offset = pack.tell()
+            pack.write(compressed)
+            pack.flush()
+            index.write(f'{chunk_hash} {offset} {len(compressed)}\n')
+            self.chunks[chunk_hash] = (offset, len(compressed))
+        return chunk_hash
+
+    def _latest_pool_chunks(self):
+        latest = dict()
+        for line in self._read_lines(POOLS_FNAME):
+            latest[line['pool']] = line['chunk']
+        return latest
+
+    ##### READING #####
+
+    def get(self, chunk_hash):
+        if chunk_hash not in self.cache:
+            offset, length = self.chunks[chunk_hash]
+            if self._pack is None:
+                self._pack = open(self.path(PACK_FNAME), 'rb')
+            self._pack.seek(offset)
+            self.cache[chunk_hash] = json.loads(zlib.decompress(self._pack.read(length)))
+        return self.cache[chunk_hash]
+
+    def timestamps(self):
+        return [line['timestamp'] for line in self._read_lines(SNAPSHOTS_FNAME)]
+
+    def snapshot(self, timestamp: str = None) -> List[Pool]:
+        """
+        Pool info as of a scrape: the latest one at or before `timestamp` (or the latest one overall).
+        Timestamps can be partial, e.g. "2019-06-01" means the last scrape on June 1.
+        """
+
+        snapshots = [line for line in self._read_lines(SNAPSHOTS_FNAME)
+                     if timestamp is None or line['timestamp'][:len(timestamp)] <= timestamp]
+        if len(snapshots) == 0:
+            raise KeyError(f'no scrapes archived in {self.folder}' + (f' as of {timestamp}' if timestamp else ''))
+
+        return [self._pool(pool_chunk) for pool_chunk in self.get(snapshots[-1]['chunk'])['pools']]
+
+    def history(self, name) -> List[tuple]:
+        """
+        Every version of a pool that was archived, as a list of (timestamp, Pool), oldest first.
+        """
+
+        return [(line['timestamp'], self._pool(line['chunk'])) for line in self._read_lines(POOLS_FNAME)
+                if line['pool'] == name]
+
+    def pool_names(self):
+        return sorted({line['pool'] for line in self._read_lines(POOLS_FNAME)})
+
+    def _pool(self, pool_chunk) -> Pool:
+        info = self.get(pool_chunk)
+
+        pool = Pool(info['name'])
+        pool.address = info['address']
+        pool.type = PoolType(info['type']) if info['type'] is not None else None
+        pool.phone = info['phone']
+
+        for week_chunk in info['weeks']:
+            for date, times in self.get(week_chunk).items():
+                pool.availabilities[datetime.strptime(date, '%Y-%m-%d')] = [
+                    Session(timedelta(minutes=start), timedelta(minutes=end), program) for start, end, program in times]
+        pool.compress_schedule()
+        pool.update_slots()
+
+        return pool
+
+    def close(self):
+        if self._pack is not None:
+            self._pack.close()
+            self._pack = None
+
+    def size(self):
+        """
+        Bytes on disk.
+        """
+
+        return sum(os.path.getsize(self.path(fname)) for fname in (PACK_FNAME, INDEX_FNAME, SNAPSHOTS_FNAME, POOLS_FNAME)
+                   if os.path.exists(self.path(fname)))
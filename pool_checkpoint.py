@@ -0,0 +1,184 @@
+"""
+Checkpoints for each scrape, so that one odd row (or a crash half-way through) doesn't cost a whole rescrape.
+
+Every scrape is a run, with its own folder (runs/<run id>/):
+    pages/       every page downloaded (same format as --record)
+    listings/    each pool listing's parse results, named by a hash of its HTML (and of when the page was served)
+    quarantine/  rows that couldn't be parsed, per listing: which pool they're from, their HTML, and the error
+    joined.pkl   the finished pool info (parsed, joined to the facility pages and compressed)
+
+Resuming a run picks it up from the last good stage: pages are read back instead of downloaded, listings that parsed
+cleanly are loaded instead of parsed, and only listings with quarantined rows are parsed again. So after fixing the
+parser, a rerun takes seconds.
+
+Usage:
+    from pool_checkpoint import ScrapeRun
+
+    run = ScrapeRun.resume('runs')  # or ScrapeRun('runs') for a new one
+    pool_info = get_pool_info(refresh=True, run=run)
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+from datetime import datetime
+
+from generate_pages_v3 import RUNS_FOLDER, PoolUnpickler
+from pool_fetch import FetchError, fetcher, read_recorded_page, record_page
+from pool_metrics import metrics
+
+# How many runs to keep around (the oldest ones are deleted once a run finishes)
+RUNS_KEPT = 5
+
+RUN_ID_FORMAT = '%Y%m%dT%H%M%S'
+
+PAGES_FOLDER = 'pages'
+LISTINGS_FOLDER = 'listings'
+QUARANTINE_FOLDER = 'quarantine'
+JOINED_FNAME = 'joined.pkl'
+
+
+def run_ids(folder=RUNS_FOLDER):
+    """
+    Every run in the folder, oldest first.
+    """
+
+    try:
+        return sorted(name for name in os.listdir(folder) if os.path.isdir(os.path.join(folder, name)))
+    except FileNotFoundError:
+        return []
+
+
+def prune_runs(folder=RUNS_FOLDER, keep=RUNS_KEPT):
+    for run_id in run_ids(folder)[:-keep]:
+        shutil.rmtree(os.path.join(folder, run_id), ignore_errors=True)
+
+
+def _write_atomically(fname, data: bytes):
+    # so a crash while writing a checkpoint never leaves half of one behind
+    tmp_fname = f'{fname}.tmp'
+    with open(tmp_fname, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_fname, fname)
+
+
+class ScrapeRun:
+    def __init__(self, folder=RUNS_FOLDER, run_id=None):
+        self.folder = folder
+        self.run_id = run_id or datetime.now().strftime(RUN_ID_FORMAT)
+
+        for subfolder in (PAGES_FOLDER, LISTINGS_FOLDER, QUARANTINE_FOLDER):
+            os.makedirs(self.path(subfolder), exist_ok=True)
+
+    @classmethod
+    def resume(cls, folder=RUNS_FOLDER, run_id=None):
+        """
+        Pick a run back up (the latest one, unless run_id is given).
+        """
+
+        if run_id is None:
+            ids = run_ids(folder)
+            if len(ids) == 0:
+                raise FileNotFoundError(f'no runs to resume in {folder}')
+            run_id = ids[-1]
+        elif not os.path.isdir(os.path.join(folder, run_id)):
+            raise FileNotFoundError(f'no run {run_id} in {folder}')
+
+        print(f'INFO: Resuming run {run_id}.')
+        return cls(folder, run_id)
+
+    def path(self, *names):
+        return os.path.join(self.folder, self.run_id, *names)
+
+    ##### PAGES #####
+
+    def get_page(self, url):
+        """
+        Same as fetcher.get(), but each page is only downloaded once per run.
+        """
+
+        try:
+            page = read_recorded_page(self.path(PAGES_FOLDER), url)
+        except FetchError:
+            pass
+        else:
+            metrics.inc('pools_checkpoint_pages_reused')
+            return page
+
+        page = fetcher.get(url)
+        # anything else gets downloaded again next time
+        if page.status_code == 200:
+            record_page(self.path(PAGES_FOLDER), page)
+        return page
+
+    ##### LISTINGS #####
+
+    @staticmethod
+    def listing_key(listing, reference_date: datetime = None):
+        if isinstance(listing, str):
+            listing = listing.encode()
+        reference = reference_date.isoformat() if reference_date is not None else ''
+        return hashlib.sha1(listing + reference.encode()).hexdigest()
+
+    def load_listing(self, key):
+        """
+        A listing's parse results (list of Pool, counts, quarantined rows), or None if it hasn't been parsed cleanly yet.
+        """
+
+        try:
+            with open(self.path(LISTINGS_FOLDER, f'{key}.pkl'), 'rb') as f:
+                result = PoolUnpickler(f).load()
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+        metrics.inc('pools_checkpoint_listings_reused')
+        return result
+
+    def save_listing(self, key, pools, counts, quarantined):
+        """
+        Keep a listing's parse results, unless some of its rows were quarantined (then it's parsed again on resume, and
+        the rows go into the quarantine folder instead).
+        """
+
+        quarantine_fname = self.path(QUARANTINE_FOLDER, f'{key}.json')
+
+        if len(quarantined) > 0:
+            with open(quarantine_fname, 'w') as f:
+                json.dump(quarantined, f, indent=2)
+            return
+
+        _write_atomically(self.path(LISTINGS_FOLDER, f'{key}.pkl'), pickle.dumps((pools, counts, quarantined)))
+        if os.path.exists(quarantine_fname):
+            os.remove(quarantine_fname)
+
+    def quarantined_rows(self):
+        """
+        Every row quarantined so far, as dicts of pool name, row HTML and error.
+        """
+
+        rows = []
+        for fname in sorted(os.listdir(self.path(QUARANTINE_FOLDER))):
+            with open(self.path(QUARANTINE_FOLDER, fname), 'r') as f:
+                rows.extend(json.load(f))
+        return rows
+
+    ##### JOINED #####
+
+    def load_joined(self):
+        """
+        The finished pool info, or None if this run didn't get that far (or has quarantined rows to try again).
+        """
+
+        if len(os.listdir(self.path(QUARANTINE_FOLDER))) > 0:
+            return None
+
+        try:
+            with open(self.path(JOINED_FNAME), 'rb') as f:
+                return PoolUnpickler(f).load()
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def save_joined(self, pool_info):
+        _write_atomically(self.path(JOINED_FNAME), pickle.dumps(pool_info))
@@ -0,0 +1,218 @@
+"""
+How many pools are open in each 15-minute slot of each date, by type of pool, citywide and per area, for the page's
+coverage heatmap (coverage.html).
+
+Every session goes into one (pool-date x slot) difference array: +1 at the slot it starts in, -1 at the slot after it
+ends. A cumulative sum along the slots gives how many of a pool's sessions are going on in each slot, so a pool with
+overlapping sessions (e.g. lane and leisure swim at once) still only counts once. Those rows are then summed into an
+(area x date x slot x type) tensor in one go. The first area is the whole city.
+
+Areas are roughly the city's four districts, going by each pool's coordinates (see pool_nearby.py). Pools without
+coordinates are counted under "Unknown" (and citywide).
+
+The tensor is written as raw bytes (coverage.bin) with a small JSON description of its axes (coverage.json), so the
+page can view it as a typed array without parsing or recomputing anything. When only some dates changed since, the
+rest are copied from the last tensor written instead of counted again.
+
+Usage:
+    from pool_coverage import Coverage
+
+    coverage = Coverage.from_pools(pool_info)
+    coverage = Coverage.from_pools(pool_info, Coverage.load('pool-browser/v3'), changed_dates)  # same, but faster
+    coverage.counts[0, coverage.date_index(date), :, coverage.types.index('indoor pool')]  # citywide, per slot
+    coverage.save('pool-browser/v3')
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+
+from pool_slots import SLOT_MINUTES, SLOTS_PER_DAY, to_minutes
+
+COVERAGE_FNAME = 'coverage.json'
+COVERAGE_DATA_FNAME = 'coverage.bin'
+COVERAGE_VERSION = 1
+
+CITYWIDE = 'All of Toronto'
+UNKNOWN = 'Unknown'
+
+# Area -> (min latitude, max latitude, min longitude, max longitude), the first one a pool is in wins. Roughly the
+#   city's districts: Scarborough east of Victoria Park, Etobicoke York west of the Humber, North York north of
+#   Lawrence, and Toronto and East York the rest.
+AREA_BOUNDS = [
+    ('Scarborough', (-90, 90, -79.31, 180)),
+    ('Etobicoke York', (-90, 90, -180, -79.47)),
+    ('North York', (43.715, 90, -180, 180)),
+    ('Toronto and East York', (-90, 90, -180, 180)),
+]
+
+
+def pool_area(pool):
+    """
+    Which area (see AREA_BOUNDS) a pool is in, or UNKNOWN if it has no coordinates.
+    """
+
+    coordinates = getattr(pool, 'coordinates', None)
+    if coordinates is None:
+        return UNKNOWN
+
+    lat, lon = coordinates
+    for area, (min_lat, max_lat, min_lon, max_lon) in AREA_BOUNDS:
+        if min_lat <= lat < max_lat and min_lon <= lon < max_lon:
+            return area
+    return UNKNOWN
+
+
+def pool_type_name(pool):
+    return getattr(pool.type, 'value', pool.type) or UNKNOWN.lower()
+
+
+class Coverage:
+    """
+    counts[area, date, slot, type]: how many pools of that type in that area are open at some point during that slot.
+    Dates run from first_date, one per day. Area 0 is the whole city.
+    """
+
+    def __init__(self, first_date, areas, types, counts):
+        self.first_date = first_date
+        self.areas = areas
+        self.types = types
+        self.counts = counts
+
+    def date_index(self, date):
+        return (date - self.first_date).days
+
+    @classmethod
+    def from_pools(cls, pool_info, previous=None, changed_dates=None):
+        """
+        previous and changed_dates: the last coverage written (see load()), and the dates whose sessions changed since.
+        The other dates are copied from previous instead of counted again, as long as it has the same areas and types.
+        """
+
+        import numpy as np
+
+        from generate_pages_v3 import PoolType
+
+        pool_areas = [pool_area(pool) for pool in pool_info]
+        pool_types = [pool_type_name(pool) for pool in pool_info]
+        areas = [CITYWIDE] + [area for area, _ in AREA_BOUNDS if area in pool_areas] + \
+                ([UNKNOWN] if UNKNOWN in pool_areas else [])
+        types = [pool_type.value for pool_type in PoolType if pool_type.value in pool_types]
+        types += sorted(set(pool_types) - set(types))
+
+        reuse = previous is not None and changed_dates is not None and previous.first_date is not None and \
+            previous.areas == areas and previous.types == types
+
+        # one row per (pool, date) that has sessions, and the start/end slot of each session on it
+        all_dates = set()
+        row_pools, row_dates, session_rows, first_slots, last_slots = [], [], [], [], []
+        for p, pool in enumerate(pool_info):
+            for date in pool.availabilities:
+                all_dates.add(date)
+                if reuse and date not in changed_dates:
+                    continue
+                times = pool.availabilities[date]
+                if len(times) == 0:
+                    continue
+                for start, end, _ in times:
+                    session_rows.append(len(row_pools))
+                    first_slots.append(to_minutes(start) // SLOT_MINUTES)
+                    # same as window_mask(): the slot a session ends right at the start of isn't counted
+                    last_slots.append(-(-to_minutes(end) // SLOT_MINUTES))
+                row_pools.append(p)
+                row_dates.append(date)
+
+        if len(all_dates) == 0:
+            return cls(None, [CITYWIDE], types, np.zeros((1, 0, SLOTS_PER_DAY, len(types)), dtype=np.uint8))
+
+        first_date = min(all_dates)
+        n_dates = (max(all_dates) - first_date).days + 1
+        counts = np.zeros((len(areas), n_dates, len(types), SLOTS_PER_DAY), dtype=np.int32)
+
+        if len(row_pools) > 0:
+            session_rows = np.array(session_rows)
+            first_slots = np.clip(first_slots, 0, SLOTS_PER_DAY)
+            last_slots = np.clip(last_slots, 0, SLOTS_PER_DAY)
+
+            # which slots each pool is open in on each date
+            diff = np.zeros((len(row_pools), SLOTS_PER_DAY + 1), dtype=np.int16)
+            np.add.at(diff, (session_rows, first_slots), 1)
+            np.add.at(diff, (session_rows, last_slots), -1)
+            is_open = np.cumsum(diff[:, :-1], axis=1) > 0
+
+            # sum the rows into their (area, date, type)
+            row_pools = np.array(row_pools)
+            area_codes = np.array([areas.index(area) for area in pool_areas])[row_pools]
+            type_codes = np.array([types.index(pool_type) for pool_type in pool_types])[row_pools]
+            date_codes = np.array([(date - first_date).days for date in row_dates])
+
+            np.add.at(counts, (area_codes, date_codes, type_codes), is_open)
+
+        if reuse:
+            # the dates that didn't change, as they were
+            for day in range(n_dates):
+                date = first_date + timedelta(days=day)
+                previous_day = previous.date_index(date)
+                if date not in changed_dates and 0 <= previous_day < previous.counts.shape[1]:
+                    counts[:, day] = previous.counts[:, previous_day].swapaxes(1, 2)
+
+        counts[0] = counts[1:].sum(axis=0)
+
+        dtype = np.uint8 if counts.max() <= np.iinfo(np.uint8).max else np.uint16
+        return cls(first_date, areas, types, np.ascontiguousarray(counts.transpose(0, 1, 3, 2), dtype=dtype))
+
+    def to_json(self, src):
+        return {
+            'version': COVERAGE_VERSION,
+            'first_date': self.first_date.strftime('%Y-%m-%d') if self.first_date is not None else None,
+            'slot_minutes': SLOT_MINUTES,
+            'areas': self.areas,
+            'types': self.types,
+            'shape': list(self.counts.shape),
+            'dtype': self.counts.dtype.name,
+            'max': int(self.counts.max(initial=0)),
+            'src': src,
+        }
+
+    def save(self, folder):
+        """
+        Write coverage.bin (the counts, little-endian, area-major) and coverage.json (what the axes are, and the URL of
+        coverage.bin with a hash of its contents). Returns the size of coverage.bin.
+        """
+
+        data = self.counts.astype(self.counts.dtype.newbyteorder('<'), copy=False).tobytes()
+        src = f'{COVERAGE_DATA_FNAME}?v={hashlib.sha1(data).hexdigest()[:12]}'
+
+        with open(os.path.join(folder, COVERAGE_DATA_FNAME), 'wb') as f:
+            f.write(data)
+        with open(os.path.join(folder, COVERAGE_FNAME), 'w') as f:
+            json.dump(self.to_json(src), f, indent=2)
+
+        return len(data)
+
+    @classmethod
+    def load(cls, folder):
+        """
+        The coverage that save() wrote into folder, or None if there isn't one (or it's from another version).
+        """
+
+        import numpy as np
+
+        try:
+            with open(os.path.join(folder, COVERAGE_FNAME), 'r') as f:
+                description = json.load(f)
+            dtype = np.dtype(description['dtype']).newbyteorder('<')
+            data = np.fromfile(os.path.join(folder, COVERAGE_DATA_FNAME), dtype=dtype)
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return None
+
+        if description.get('version') != COVERAGE_VERSION or description['first_date'] is None or \
+                data.size != np.prod(description['shape']):
+            return None
+
+        return cls(datetime.strptime(description['first_date'], '%Y-%m-%d'), description['areas'], description['types'],
+                   data.reshape(description['shape']))
+
+    def dates(self):
+        return [self.first_date + timedelta(days=i) for i in range(self.counts.shape[1])]
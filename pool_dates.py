@@ -0,0 +1,154 @@
+"""
+Date helpers.
+
+Mostly for parsing the week ranges that toronto.ca puts on every schedule row (e.g. "May 26 to June 1", "Dec 29 to
+Jan 4").
+
+The page never says which year a range is in, so we work it out from the page itself: each pool's rows go forwards,
+week by week, starting around the date the page was downloaded. The first row gets the year that puts it closest to
+that date, and every row after it gets the year that puts it closest to the row before: the same year, plus one if the
+month drops by more than half a year (i.e. we've crossed New Year's), or minus one if it jumps ahead by that much. That
+way "Dec 29 to Jan 4" scraped in December becomes Dec 29 this year to Jan 4 next year, "Jan 5 to Jan 11" after it
+becomes next January, and a schedule that runs a year ahead keeps counting up, instead of dateutil's guess of "the
+current year". Rows go program by program, so a program starting over in June after another's August rows is still
+this June.
+"""
+
+import re
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+
+# First 3 letters of every month, as lowercase (covers "June", "Jun", "Sept", "Sep.", etc.)
+MONTHS = {month: i + 1 for i, month in
+          enumerate(['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'])}
+
+# Month D to Month D (the second month can be left out, e.g. "May 5 to 11")
+DATERANGE_REGEX = re.compile(r'\s*([A-Za-z]+)\.?\s+(\d{1,2})\s+to\s+(?:([A-Za-z]+)\.?\s+)?(\d{1,2})\s*')
+
+
+class DaterangeParser:
+    """
+    Convert "Month D to Month D" into (start, end) datetimes, one pool's rows at a time (call start_listing() before
+    each pool). The year is carried forward from the row before, and the first row's is inferred from the date the page
+    was downloaded.
+    The months/days are cached per distinct string, since every pool repeats the same handful of weeks.
+    """
+
+    def __init__(self, reference_date: datetime = None):
+        self.reference_date = reference_date or datetime.today()
+        self.cache = dict()
+        self.previous = None
+
+    def start_listing(self):
+        """
+        The next row is the first one of a pool, so its year comes from the reference date again.
+        """
+
+        self.previous = None
+
+    def parse(self, daterange: str):
+        if daterange not in self.cache:
+            self.cache[daterange] = self._read(daterange)
+        start_month, start_day, end_month, end_day = self.cache[daterange]
+
+        try:
+            if self.previous is None:
+                start = closest_date(start_month, start_day, self.reference_date)
+            else:
+                # rows go forwards within a program, but each program starts over, so only a big jump crosses New Year's
+                start_year = self.previous.year
+                if start_month - self.previous.month < -6:
+                    start_year += 1
+                elif start_month - self.previous.month > 6:
+                    start_year -= 1
+                start = datetime(start_year, start_month, start_day)
+
+            # same for the end of the range
+            end_year = start.year + 1 if end_month < start_month else start.year
+            end = datetime(end_year, end_month, end_day)
+        except ValueError:
+            raise ValueError(f'cannot read daterange {daterange!r}, it has a day that doesn\'t exist')
+
+        self.previous = start
+        return start, end
+
+    def _read(self, daterange: str):
+        """
+        Returns (start month, start day, end month, end day).
+        """
+
+        match = DATERANGE_REGEX.fullmatch(daterange)
+        if match is None:
+            raise ValueError(f'cannot read daterange {daterange!r}, expected something like "May 26 to June 1"')
+
+        start_month, start_day, end_month, end_day = match.groups()
+        start_month = read_month(start_month)
+        end_month = read_month(end_month) if end_month is not None else start_month
+
+        return start_month, int(start_day), end_month, int(end_day)
+
+
+def read_month(month: str):
+    try:
+        return MONTHS[month[:3].lower()]
+    except KeyError:
+        raise ValueError(f'cannot read month {month!r}')
+
+
+def closest_date(month: int, day: int, reference_date: datetime):
+    """
+    Of last year, this year and next year, get the month/day closest to the reference date.
+
+    Example (reference date is Dec 20, 2019):
+        Dec 29  --> Dec 29, 2019
+        Jan 4   --> Jan 4, 2020
+    """
+
+    candidates = []
+    for year in (reference_date.year - 1, reference_date.year, reference_date.year + 1):
+        try:
+            candidates.append(datetime(year, month, day))
+        except ValueError:
+            # Feb 29 on a non-leap year
+            pass
+
+    if len(candidates) == 0:
+        raise ValueError(f'invalid date: month {month}, day {day}')
+
+    return min(candidates, key=lambda candidate: abs(candidate - reference_date))
+
+
+def response_date(response):
+    """
+    Get the date a page was served (from its Date header), or today if it doesn't have one.
+    """
+
+    date_header = response.headers.get('Date') or response.headers.get('date')
+    if date_header is not None:
+        try:
+            return parsedate_to_datetime(date_header).replace(tzinfo=None)
+        except (TypeError, ValueError):
+            pass
+
+    return datetime.today()
+
+
+def month_ranges(start: datetime, end: datetime):
+    """
+    Split start..end (inclusive) into calendar months.
+    Returns a list of (month key, first date, last date), with the first/last dates clipped to start and end.
+
+    Example:
+        June 20, 2019 .. Aug 5, 2019 --> [('2019-06', June 20, June 30), ('2019-07', July 1, July 31),
+                                          ('2019-08', Aug 1, Aug 5)]
+    """
+
+    months = []
+    month_start = start
+    while month_start <= end:
+        # first day of next month
+        next_month = datetime(month_start.year + month_start.month // 12, month_start.month % 12 + 1, 1)
+        month_end = min(next_month - timedelta(days=1), end)
+        months.append((month_start.strftime('%Y-%m'), month_start, month_end))
+        month_start = next_month
+    return months
@@ -0,0 +1,185 @@
+"""
+Optional enrichment from each facility's own page (linked from its name on the schedule page): amenities,
+accessibility and closures, which the schedule and facility list pages don't have.
+
+Facility pages are downloaded by a bounded pool of async workers (ENRICH_CONCURRENCY at a time), and kept in a cache
+folder along with their HTTP validators (ETag/Last-Modified). A cached page is used as is while it's fresh (its
+Cache-Control max-age, or ENRICH_MAX_AGE_SECONDS), and after that it's revalidated with a conditional request, so a
+warm rerun downloads almost nothing.
+
+Usage:
+    from pool_enrich import enrich_pools
+
+    enrich_pools(pool_info)  # sets pool.amenities, pool.accessibility and pool.closures
+"""
+
+import asyncio
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pool_fetch import FetchError, Page, fetcher, read_recorded_page, record_page, recorded_fname
+from pool_metrics import metrics
+
+ENRICH_CACHE_FOLDER = 'facility-pages'
+
+# How many facility pages to download at once
+ENRICH_CONCURRENCY = 8
+
+# How long a cached page is used without asking whether it changed, unless it says otherwise (Cache-Control max-age)
+ENRICH_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Headings on a facility page -> which attribute the list under them goes into
+SECTION_KEYWORDS = {
+    'amenities': ('amenities', 'features', 'facilities'),
+    'accessibility': ('accessibility', 'accessible'),
+    'closures': ('closure', 'service alert', 'notice'),
+}
+
+HEADING_TAGS = ['h2', 'h3', 'h4', 'h5']
+
+
+def header(headers, name):
+    # header names are case-insensitive, and servers spell them all sorts of ways
+    return next((value for key, value in headers.items() if key.lower() == name.lower()), None)
+
+
+def max_age(headers):
+    match = re.search(r'max-age\s*=\s*(\d+)', header(headers, 'Cache-Control') or '')
+    return int(match.group(1)) if match is not None else ENRICH_MAX_AGE_SECONDS
+
+
+def get_facility_page(url, cache_folder=ENRICH_CACHE_FOLDER):
+    """
+    A facility page: from the cache if it's fresh, revalidated if it's stale, downloaded if it's not cached.
+    Returns (Page, 'fresh', 'not modified' or 'downloaded'). Raises FetchError if it can't be had.
+    """
+
+    try:
+        cached = read_recorded_page(cache_folder, url)
+        age = time.time() - os.path.getmtime(f'{recorded_fname(cache_folder, url)}.json')
+    except FetchError:
+        cached, age = None, None
+
+    if cached is not None and age < max_age(cached.headers):
+        return cached, 'fresh'
+
+    # only download it again if it changed
+    headers = dict()
+    if cached is not None:
+        if header(cached.headers, 'ETag') is not None:
+            headers['If-None-Match'] = header(cached.headers, 'ETag')
+        if header(cached.headers, 'Last-Modified') is not None:
+            headers['If-Modified-Since'] = header(cached.headers, 'Last-Modified')
+
+    page = fetcher.get(url, headers=headers)
+
+    if page.status_code == 304 and cached is not None:
+        # fresh again, with whatever validators came with the 304
+        outcome = 'not modified'
+        page = Page(url, 200, cached.content, {**cached.headers, **page.headers})
+    elif page.status_code == 200:
+        outcome = 'downloaded'
+    else:
+        raise FetchError(f'{url} returned {page.status_code}')
+
+    record_page(cache_folder, page)
+    return page, outcome
+
+
+async def _get_facility_pages(urls, cache_folder, concurrency):
+    # requests isn't async, so each download runs on one of `concurrency` threads, and the event loop keeps that many
+    #   going at once
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        async def get(url):
+            async with semaphore:
+                try:
+                    page, outcome = await loop.run_in_executor(executor, get_facility_page, url, cache_folder)
+                except FetchError as e:
+                    print(f'WARN: {e}. Skipping its details...')
+                    metrics.inc('pools_enrich_failures')
+                    return url, None
+
+            # counted here, on the event loop's thread, rather than on the download threads
+            metrics.inc('pools_enrich_pages', outcome=outcome)
+            return url, page
+
+        return dict(await asyncio.gather(*(get(url) for url in urls)))
+
+
+def get_facility_pages(urls, cache_folder=ENRICH_CACHE_FOLDER, concurrency=ENRICH_CONCURRENCY):
+    """
+    Map url -> Page (None if it couldn't be downloaded), downloading up to `concurrency` at a time.
+    """
+
+    return asyncio.run(_get_facility_pages(sorted(set(urls)), cache_folder, concurrency))
+
+
+def parse_facility_page(html):
+    """
+    The lists under a facility page's amenities/accessibility/closures headings, as a map of attribute -> [text, ...].
+    Headings it doesn't have are left out.
+    """
+
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html)
+
+    details = dict()
+    for heading in soup.find_all(HEADING_TAGS):
+        title = heading.get_text(' ', strip=True).lower()
+        attribute = next((attribute for attribute, keywords in SECTION_KEYWORDS.items()
+                          if any(keyword in title for keyword in keywords)), None)
+        if attribute is None:
+            continue
+
+        # everything up to the next heading at the same level (or higher)
+        level = HEADING_TAGS.index(heading.name)
+        items = []
+        for sibling in heading.find_next_siblings():
+            if sibling.name in HEADING_TAGS and HEADING_TAGS.index(sibling.name) <= level:
+                break
+            elements = sibling.find_all('li') if sibling.name not in ('li', 'p') else [sibling]
+            if len(elements) == 0 and sibling.name in ('div', 'section'):
+                elements = sibling.find_all('p')
+            items.extend(element.get_text(' ', strip=True) for element in elements)
+
+        details.setdefault(attribute, []).extend(item for item in items if item != '')
+
+    return details
+
+
+def enrich_pools(pool_info, cache_folder=ENRICH_CACHE_FOLDER, concurrency=ENRICH_CONCURRENCY):
+    """
+    Set each pool's amenities, accessibility and closures from its facility page. Pools without a facility page link
+    (or whose page couldn't be downloaded) are left as they are.
+    Returns how many pools were enriched.
+    """
+
+    urls = [pool.url for pool in pool_info if getattr(pool, 'url', None)]
+    if len(urls) == 0:
+        print('INFO: No pools link to a facility page (re-scrape with --refresh to find the links). Skipping...')
+        return 0
+
+    with metrics.stage('fetch'):
+        pages = get_facility_pages(urls, cache_folder, concurrency)
+
+    enriched = 0
+    with metrics.stage('enrich'):
+        for pool in pool_info:
+            page = pages.get(getattr(pool, 'url', None))
+            if page is None:
+                continue
+
+            details = parse_facility_page(page.content)
+            pool.amenities = details.get('amenities', [])
+            pool.accessibility = details.get('accessibility', [])
+            pool.closures = details.get('closures', [])
+            enriched += 1
+
+    metrics.set('pools_enrich_pools', enriched)
+    return enriched
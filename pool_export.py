@@ -0,0 +1,227 @@
+"""
+Export every session as a flat table (one row per session), for analysis in pandas/Spark/a notebook without unpickling
+pools-v3.pkl. Columns: pool, type, program, date, start_min, end_min, address (start/end in minutes after midnight).
+
+Rows are written in chunks of EXPORT_CHUNK_ROWS as they're read off the schedules, so memory stays flat however many
+seasons are exported. Three formats, by file extension:
+    .csv      plain CSV with a header row
+    .parquet  Parquet (needs pyarrow), with dictionary-encoded string columns and a date32 date column
+    .npz      NumPy arrays (no dependencies): each string column is int32 codes into a `<column>_values` array of its
+              distinct values, dates are datetime64[D] and times are int16. Read it back with load_sessions_npz().
+
+Usage:
+    python pools.py export sessions.csv sessions.npz
+    python pools.py export sessions.parquet --program lane
+
+    from pool_export import export_sessions, load_sessions_npz
+
+    export_sessions(pool_info, 'sessions.npz')
+    columns = load_sessions_npz('sessions.npz')  # map column -> numpy array
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import zipfile
+
+# How many rows to buffer before writing them out
+EXPORT_CHUNK_ROWS = 64 * 1024
+
+COLUMNS = ['pool', 'type', 'program', 'date', 'start_min', 'end_min', 'address']
+
+# Columns with only a few distinct values, which are stored as codes into a list of them
+DICTIONARY_COLUMNS = ['pool', 'type', 'program', 'address']
+
+# Type of each column's numpy array (string columns are codes)
+COLUMN_DTYPES = {'pool': 'int32', 'type': 'int32', 'program': 'int32', 'date': 'datetime64[D]', 'start_min': 'int16',
+                 'end_min': 'int16', 'address': 'int32'}
+
+EXPORT_FORMATS = ['.csv', '.parquet', '.npz']
+
+
+def session_rows(pool_info, programs=None):
+    """
+    Every session as a (pool, type, program, date, start_min, end_min, address) tuple, pool by pool, date by date.
+    Optionally only sessions of some programs (see program_matches()).
+    """
+
+    from generate_pages_v3 import program_matches
+
+    for pool in pool_info:
+        pool_type = getattr(pool.type, 'value', pool.type) or ''
+        address = pool.address or ''
+        for date in pool.availabilities:
+            for session in pool.availabilities[date]:
+                if programs and not program_matches(session.program, programs):
+                    continue
+                yield (pool.name, pool_type, session.program, date.date(), int(session.start.total_seconds()) // 60,
+                       int(session.end.total_seconds()) // 60, address)
+
+
+def chunked(rows, size=None):
+    size = size or EXPORT_CHUNK_ROWS
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if len(chunk) > 0:
+        yield chunk
+
+
+class Dictionary:
+    """
+    Codes for a string column's values, in the order they're first seen. Codes stay the same from chunk to chunk.
+    """
+
+    def __init__(self):
+        self.codes = dict()
+        self.values = []
+
+    def encode(self, values):
+        import numpy as np
+
+        codes = np.empty(len(values), dtype=np.int32)
+        for i, value in enumerate(values):
+            code = self.codes.get(value)
+            if code is None:
+                code = self.codes[value] = len(self.values)
+                self.values.append(value)
+            codes[i] = code
+        return codes
+
+
+def typed_columns(chunk, dictionaries):
+    """
+    A chunk of rows as a map of column -> numpy array (string columns as codes into dictionaries).
+    """
+
+    import numpy as np
+
+    columns = dict(zip(COLUMNS, zip(*chunk)))
+    typed = {column: dictionaries[column].encode(columns[column]) for column in DICTIONARY_COLUMNS}
+    for column in ('date', 'start_min', 'end_min'):
+        typed[column] = np.array(columns[column], dtype=COLUMN_DTYPES[column])
+    return typed
+
+
+##### WRITERS #####
+
+def write_csv(rows, fname):
+    with open(fname, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        count = 0
+        for chunk in chunked(rows):
+            writer.writerows((pool, pool_type, program, date.isoformat(), start, end, address)
+                             for pool, pool_type, program, date, start, end, address in chunk)
+            count += len(chunk)
+    return count
+
+
+def write_parquet(rows, fname):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(column, pa.dictionary(pa.int32(), pa.string())) if column in DICTIONARY_COLUMNS else
+                        (column, pa.date32() if column == 'date' else pa.int16()) for column in COLUMNS])
+    dictionaries = {column: Dictionary() for column in DICTIONARY_COLUMNS}
+
+    count = 0
+    with pq.ParquetWriter(fname, schema) as writer:
+        for chunk in chunked(rows):
+            typed = typed_columns(chunk, dictionaries)
+            arrays = [pa.DictionaryArray.from_arrays(typed[column], pa.array(dictionaries[column].values, pa.string()))
+                      if column in DICTIONARY_COLUMNS else pa.array(typed[column], type=schema.field(column).type)
+                      for column in COLUMNS]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            count += len(chunk)
+    return count
+
+
+def write_npz(rows, fname):
+    """
+    np.savez() needs whole arrays, so each column's chunks are appended to a temporary file, and then copied into the
+    .npz behind a .npy header once the number of rows is known.
+    """
+
+    import numpy as np
+
+    dictionaries = {column: Dictionary() for column in DICTIONARY_COLUMNS}
+    count = 0
+
+    tmp_folder = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(fname)))
+    try:
+        parts = {column: open(os.path.join(tmp_folder, column), 'wb') for column in COLUMNS}
+        try:
+            for chunk in chunked(rows):
+                for column, array in typed_columns(chunk, dictionaries).items():
+                    array.tofile(parts[column])
+                count += len(chunk)
+        finally:
+            for part in parts.values():
+                part.close()
+
+        tmp_fname = f'{fname}.tmp'
+        with zipfile.ZipFile(tmp_fname, 'w', zipfile.ZIP_STORED, allowZip64=True) as npz:
+            for column in COLUMNS:
+                header = {'descr': np.lib.format.dtype_to_descr(np.dtype(COLUMN_DTYPES[column])),
+                          'fortran_order': False, 'shape': (count,)}
+                with npz.open(f'{column}.npy', 'w', force_zip64=True) as f:
+                    np.lib.format.write_array_header_1_0(f, header)
+                    with open(os.path.join(tmp_folder, column), 'rb') as part:
+                        shutil.copyfileobj(part, f)
+
+            for column, dictionary in dictionaries.items():
+                with npz.open(f'{column}_values.npy', 'w') as f:
+                    np.lib.format.write_array(f, np.array(dictionary.values, dtype=str))
+        os.replace(tmp_fname, fname)
+    finally:
+        shutil.rmtree(tmp_folder, ignore_errors=True)
+
+    return count
+
+
+def export_sessions(pool_info, fname, programs=None):
+    """
+    Write every session to fname, as CSV, Parquet or NumPy arrays depending on its extension (see EXPORT_FORMATS).
+    Returns how many rows were written.
+    """
+
+    extension = os.path.splitext(fname)[1].lower()
+    writers = {'.csv': write_csv, '.parquet': write_parquet, '.npz': write_npz}
+    if extension not in writers:
+        raise ValueError(f'cannot export to {fname}, expected one of {", ".join(EXPORT_FORMATS)}')
+
+    return writers[extension](session_rows(pool_info, programs), fname)
+
+
+def columnar_extension():
+    """
+    .parquet if pyarrow is installed, otherwise .npz.
+    """
+
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return '.npz'
+    return '.parquet'
+
+
+def load_sessions_npz(fname, decode=True):
+    """
+    Read an .npz export back as a map of column -> numpy array.
+    decode=False leaves string columns as codes, with their values under '<column>_values' (much faster to group by).
+    """
+
+    import numpy as np
+
+    with np.load(fname) as npz:
+        columns = {name: npz[name] for name in npz.files}
+
+    if decode:
+        for column in DICTIONARY_COLUMNS:
+            columns[column] = columns.pop(f'{column}_values')[columns[column]]
+    return columns
@@ -0,0 +1,148 @@
+"""
+Download pages from toronto.ca with timeouts and retries, and optionally record them to (or replay them from) a folder,
+so that a rebuild can run offline and always see exactly the same pages.
+
+Usage:
+    from pool_fetch import fetcher, FetchError
+
+    fetcher.configure(record_dir='recorded')   # save every page we download
+    fetcher.configure(replay_dir='recorded')   # don't touch the network, use saved pages instead
+
+    page = fetcher.get(url)  # raises FetchError if it still fails after retrying
+    page.status_code, page.content, page.headers
+"""
+
+import hashlib
+import json
+import os
+import random
+import time
+
+from pool_metrics import metrics
+
+# (connect, read) timeouts, in seconds
+DEFAULT_TIMEOUT = (5, 30)
+DEFAULT_RETRIES = 3
+# wait 1s, 2s, 4s, ... (plus some jitter) between retries
+DEFAULT_BACKOFF = 1
+
+# Statuses worth retrying, since they're usually temporary
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    pass
+
+
+class Page:
+    """
+    The parts of a response we care about. Same attribute names as requests.Response, so either can be used.
+    """
+
+    def __init__(self, url, status_code, content: bytes, headers: dict):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+
+class Fetcher:
+    def __init__(self):
+        self.timeout = DEFAULT_TIMEOUT
+        self.retries = DEFAULT_RETRIES
+        self.backoff = DEFAULT_BACKOFF
+        self.record_dir = None
+        self.replay_dir = None
+        self._session = None
+
+    def configure(self, timeout=None, retries=None, backoff=None, record_dir=None, replay_dir=None):
+        if timeout is not None:
+            self.timeout = timeout
+        if retries is not None:
+            self.retries = retries
+        if backoff is not None:
+            self.backoff = backoff
+        if record_dir is not None:
+            self.record_dir = record_dir
+        if replay_dir is not None:
+            self.replay_dir = replay_dir
+
+    def get(self, url, headers=None) -> Page:
+        """
+        headers: extra request headers, e.g. If-None-Match (a 304 is returned as is).
+        """
+
+        start = time.perf_counter()
+
+        if self.replay_dir is not None:
+            page = read_recorded_page(self.replay_dir, url)
+        else:
+            page = self._get_with_retries(url, headers)
+            if self.record_dir is not None:
+                record_page(self.record_dir, page)
+
+        metrics.record_fetch(url, page, time.perf_counter() - start)
+        return page
+
+    def _get_with_retries(self, url, headers=None) -> Page:
+        import requests
+
+        if self._session is None:
+            self._session = requests.Session()
+
+        attempt = 0
+        while True:
+            try:
+                response = self._session.get(url, headers=headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                error = f'{type(e).__name__}: {e}'
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    return Page(url, response.status_code, response.content, dict(response.headers))
+                error = f'status {response.status_code}'
+
+            metrics.inc('pools_fetch_retries', url=url)
+            if attempt >= self.retries:
+                raise FetchError(f'giving up on {url} after {attempt + 1} tries ({error})')
+
+            wait = self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+            print(f'WARN: fetching {url} failed ({error}), retrying in {wait:.1f}s...')
+            time.sleep(wait)
+            attempt += 1
+
+
+def recorded_fname(folder, url):
+    return os.path.join(folder, hashlib.sha1(url.encode()).hexdigest()[:16])
+
+
+def record_page(folder, page: Page):
+    """
+    Save a page as <hash of url>.body (the raw bytes) and <hash of url>.json (url, status and headers).
+    """
+
+    os.makedirs(folder, exist_ok=True)
+    fname = recorded_fname(folder, page.url)
+
+    with open(f'{fname}.body', 'wb') as f:
+        f.write(page.content)
+
+    with open(f'{fname}.json', 'w') as f:
+        json.dump({'url': page.url, 'status_code': page.status_code, 'headers': page.headers}, f, indent=2)
+
+
+def read_recorded_page(folder, url) -> Page:
+    fname = recorded_fname(folder, url)
+
+    try:
+        with open(f'{fname}.json', 'r') as f:
+            info = json.load(f)
+        with open(f'{fname}.body', 'rb') as f:
+            content = f.read()
+    except FileNotFoundError:
+        raise FetchError(f'{url} was never recorded into {folder}')
+
+    return Page(info['url'], info['status_code'], content, info['headers'])
+
+
+# What the scrapers download with
+fetcher = Fetcher()
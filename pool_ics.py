@@ -0,0 +1,246 @@
+"""
+iCalendar (.ics) feeds of the schedules, to subscribe to in a calendar app instead of checking the page:
+    ics/pools/<pool>.ics        one pool
+    ics/types/<pool type>.ics   every pool of a type (e.g. indoor-pool.ics)
+    ics/programs/<program>.ics  every session of a program (e.g. lane-swim.ics)
+
+Feeds are only rewritten when their schedules changed (tracked by hash in ics/manifest.json), and can be written by a
+process pool, since a full rebuild is a few hundred files. Each pool's schedule is expanded into sessions once, and
+each feed's events are merged from its pools' sessions as it's written, so no feed is ever all in memory.
+
+Usage:
+    from pool_ics import write_ics_feeds
+
+    write_ics_feeds(pool_info, 'pool-browser/v3/ics')
+"""
+
+import hashlib
+import heapq
+import json
+import os
+from datetime import datetime, timezone
+
+from generate_pages_v3 import PoolType, classify_pool_name
+from pool_metrics import metrics
+from pool_slots import to_minutes
+
+ICS_MANIFEST_FNAME = 'manifest.json'
+
+# How many processes to write changed feeds with (0 means one per CPU), and how many changed feeds it takes to be worth
+#   starting them
+ICS_WORKERS = 0
+MIN_FEEDS_PER_WORKER = 16
+
+PRODID = '-//toronto-pools//pool schedules//EN'
+
+# Times are local to Toronto. Calendar apps need the zone spelled out, so this is America/Toronto since 2007.
+VTIMEZONE = [
+    'BEGIN:VTIMEZONE',
+    'TZID:America/Toronto',
+    'BEGIN:DAYLIGHT',
+    'TZOFFSETFROM:-0500',
+    'TZOFFSETTO:-0400',
+    'TZNAME:EDT',
+    'DTSTART:19700308T020000',
+    'RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU',
+    'END:DAYLIGHT',
+    'BEGIN:STANDARD',
+    'TZOFFSETFROM:-0400',
+    'TZOFFSETTO:-0500',
+    'TZNAME:EST',
+    'DTSTART:19701101T020000',
+    'RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=1SU',
+    'END:STANDARD',
+    'END:VTIMEZONE',
+]
+
+
+def escape_text(text):
+    return str(text).replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\n', '\\n')
+
+
+def fold(line):
+    """
+    Lines can be at most 75 bytes, so longer ones continue on the next line (starting with a space).
+    """
+
+    data = line.encode()
+    if len(data) <= 75:
+        return line
+
+    parts = []
+    while len(data) > 0:
+        limit = 75 if len(parts) == 0 else 74
+        # don't cut a character in half
+        while limit < len(data) and (data[limit] & 0xC0) == 0x80:
+            limit -= 1
+        parts.append(data[:limit].decode())
+        data = data[limit:]
+    return '\r\n '.join(parts)
+
+
+def pool_events(pool):
+    """
+    A pool's sessions, as (date, start minutes, end minutes, program, pool name, address) tuples, sorted.
+    """
+
+    return sorted((date.strftime('%Y%m%d'), to_minutes(start), to_minutes(end), program, pool.name, pool.address or '')
+                  for date, times in pool.availabilities.items() for start, end, program in times)
+
+
+def events_hash(events):
+    return hashlib.sha1(json.dumps(events).encode()).hexdigest()
+
+
+def feed_events(events_of_pools, pools, program=None):
+    """
+    A feed's events in order, merged from each of its pools' (sorted) events one at a time.
+    events_of_pools: each pool's pool_events(), pools: indexes into it.
+    """
+
+    events = heapq.merge(*(events_of_pools[i] for i in pools))
+    if program is not None:
+        events = (event for event in events if event[3] == program)
+    return events
+
+
+def feed_lines(name, events, stamp):
+    """
+    Lines of a calendar, one event at a time.
+    """
+
+    yield 'BEGIN:VCALENDAR'
+    yield 'VERSION:2.0'
+    yield f'PRODID:{PRODID}'
+    yield 'CALSCALE:GREGORIAN'
+    yield fold(f'X-WR-CALNAME:{escape_text(name)}')
+    yield 'X-WR-TIMEZONE:America/Toronto'
+    yield from VTIMEZONE
+
+    for date, start, end, program, pool_name, address in events:
+        yield 'BEGIN:VEVENT'
+        yield fold(f'UID:{date}-{start}-{classify_pool_name(pool_name)}-{classify_pool_name(program)}@toronto-pools')
+        yield f'DTSTAMP:{stamp}'
+        yield f'DTSTART;TZID=America/Toronto:{date}T{start // 60:02}{start % 60:02}00'
+        yield f'DTEND;TZID=America/Toronto:{date}T{end // 60:02}{end % 60:02}00'
+        yield fold(f'SUMMARY:{escape_text(program)} at {escape_text(pool_name)}')
+        if address:
+            yield fold(f'LOCATION:{escape_text(address)}\\, Toronto ON')
+        yield 'END:VEVENT'
+
+    yield 'END:VCALENDAR'
+
+
+def write_feed(fname, name, events, stamp):
+    """
+    Write one .ics file (line by line, it's never all in memory). Returns how many bytes were written.
+    """
+
+    os.makedirs(os.path.dirname(fname), exist_ok=True)
+
+    written = 0
+    tmp_fname = f'{fname}.{os.getpid()}.tmp'
+    with open(tmp_fname, 'w', newline='') as f:
+        for line in feed_lines(name, events, stamp):
+            written += f.write(line + '\r\n')
+    os.replace(tmp_fname, fname)
+
+    return written
+
+
+# Each pool's events, in a worker process (see _init_worker), so that feeds only need to say which pools they're of
+_worker_events_of_pools = None
+
+
+def _init_worker(events_of_pools):
+    global _worker_events_of_pools
+    _worker_events_of_pools = events_of_pools
+
+
+def _write_feed(feed):
+    fname, name, pools, program, stamp = feed
+    return write_feed(fname, name, feed_events(_worker_events_of_pools, pools, program), stamp)
+
+
+def ics_feeds(pool_info):
+    """
+    Every feed there should be, as map of relative file name -> (calendar name, indexes of the pools in it, program or
+    None).
+    """
+
+    feeds = dict()
+
+    for i, pool in enumerate(pool_info):
+        feeds[f'pools/{classify_pool_name(pool.name)}.ics'] = (pool.name, [i], None)
+
+    for pool_type in PoolType:
+        pools = [i for i, pool in enumerate(pool_info) if pool.type in (pool_type, pool_type.value)]
+        if len(pools) > 0:
+            feeds[f'types/{classify_pool_name(pool_type.value)}.ics'] = (f'{pool_type.value.title()}s', pools, None)
+
+    programs = sorted({time.program for pool in pool_info for times in pool.availabilities.values() for time in times})
+    for program in programs:
+        feeds[f'programs/{classify_pool_name(program)}.ics'] = (program, list(range(len(pool_info))), program)
+
+    return feeds
+
+
+def write_ics_feeds(pool_info, folder, workers=ICS_WORKERS):
+    """
+    Write a feed per pool, per pool type and per program into folder, skipping the ones that didn't change since last
+    time and deleting the ones that aren't needed anymore.
+    """
+
+    manifest_fname = os.path.join(folder, ICS_MANIFEST_FNAME)
+    try:
+        with open(manifest_fname, 'r') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        manifest = dict()
+
+    # expand and hash each pool once, then each feed is a hash of its pools' hashes
+    events_of_pools = [pool_events(pool) for pool in pool_info]
+    pool_hashes = [events_hash(events) for events in events_of_pools]
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+    new_manifest = dict()
+    changed = []
+    for rel_fname, (name, pools, program) in ics_feeds(pool_info).items():
+        feed_hash = hashlib.sha1(json.dumps([name, program] + [pool_hashes[i] for i in pools]).encode()).hexdigest()
+        new_manifest[rel_fname] = feed_hash
+
+        fname = os.path.join(folder, rel_fname)
+        if manifest.get(rel_fname) == feed_hash and os.path.exists(fname):
+            continue
+
+        changed.append((fname, name, pools, program, stamp))
+
+    workers = workers or os.cpu_count()
+    workers = min(workers, len(changed) // MIN_FEEDS_PER_WORKER)
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # the pools' events are sent once per worker, and each feed is just its pools' indexes
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(events_of_pools,)) as executor:
+            written = list(executor.map(_write_feed, changed, chunksize=max(1, len(changed) // (workers * 4))))
+    else:
+        written = [write_feed(fname, name, feed_events(events_of_pools, pools, program), stamp)
+                   for fname, name, pools, program, stamp in changed]
+
+    # delete feeds for pools/types/programs that are gone
+    for rel_fname in set(manifest) - set(new_manifest):
+        try:
+            os.remove(os.path.join(folder, rel_fname))
+        except FileNotFoundError:
+            pass
+
+    os.makedirs(folder, exist_ok=True)
+    with open(manifest_fname, 'w') as f:
+        json.dump(new_manifest, f, indent=2, sort_keys=True)
+
+    metrics.set('pools_ics_feeds_written', len(changed))
+    metrics.set('pools_ics_feeds_unchanged', len(new_manifest) - len(changed))
+    metrics.set('pools_ics_bytes_written', sum(written))
+
+    return len(changed)
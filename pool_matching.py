@@ -0,0 +1,158 @@
+"""
+Match pool names from the schedule page to facility names from the four facility pages.
+
+The two don't always agree exactly (e.g. "Centre" vs "Center", "C.I." vs "Collegiate Institute", a missing "Park"), so
+names are normalized first, and anything still missing is matched by how many trigrams (3-letter chunks) it shares with
+each facility name. Only facilities sharing at least one trigram with the name are looked at, so matching doesn't slow
+down much as the facility pages grow.
+
+Usage:
+    from pool_matching import NameIndex
+
+    index = NameIndex(addresses.keys())
+    facility_name, score = index.match('Wallace Emerson Community Center')  # (None, score) if nothing's close enough
+"""
+
+import re
+from typing import Iterable
+
+# How similar (Dice coefficient of trigrams, 0 to 1) a facility name has to be for us to trust it
+MATCH_THRESHOLD = 0.75
+
+# Spellings/abbreviations toronto.ca mixes up between pages
+NAME_SYNONYMS = {
+    'center': 'centre',
+    'cc': 'community centre',
+    'cntr': 'centre',
+    'ctr': 'centre',
+    'ci': 'collegiate institute',
+    'rec': 'recreation',
+    'st': 'saint',
+    'ave': 'avenue',
+    'pk': 'park',
+    '&': 'and',
+}
+
+
+def classify_pool_name(name):
+    """
+    Sanitize pool name so that it can be a class.
+    """
+
+    name = name.lower()
+
+    replace = {
+        ' ': '-',
+        "'": "",
+        ',': "",
+        '-': "-",
+        '.': ""
+    }
+
+    for c in set(name):
+        if c in replace:
+            name = name.replace(c, replace[c])
+
+    return name
+
+
+def normalize_name(name):
+    """
+    Boil a pool name down to lowercase words, so that different spellings of the same place compare equal.
+
+    Examples:
+        Centennial Recreation Centre - Scarborough  --> centennial recreation centre scarborough
+        Wallace Emerson C.C.                        --> wallace emerson community centre
+    """
+
+    words = re.split(r'[-/()]+', classify_pool_name(name))
+    words = [NAME_SYNONYMS.get(word, word) for word in words if word != '']
+    return ' '.join(words)
+
+
+def trigrams(text, pad=True):
+    """
+    Every 3-letter chunk of text, e.g. "york" --> {" yo", "yor", "ork", "rk "}.
+    pad: put a space at each end, so that where the text starts/ends counts too (when comparing whole names). Searching
+        for part of a name (see pool_search.py) needs it off, since the part can be anywhere: "york" --> {"yor", "ork"}.
+    """
+
+    if pad:
+        text = f' {text} '
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class NameIndex:
+    """
+    Trigram index over facility names, for finding the closest one to a pool name.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names = list(names)
+
+        # normalized name -> position in self.names, for names that only differ in spelling
+        self.exact = dict()
+
+        # trigram -> positions of the names that have it
+        self.postings = dict()
+        self.trigram_counts = []
+
+        for i, name in enumerate(self.names):
+            normalized = normalize_name(name)
+            self.exact.setdefault(normalized, i)
+
+            name_trigrams = trigrams(normalized)
+            self.trigram_counts.append(len(name_trigrams))
+            for trigram in name_trigrams:
+                self.postings.setdefault(trigram, []).append(i)
+
+    def match(self, name, threshold=MATCH_THRESHOLD):
+        """
+        Find the facility name closest to this name.
+        Returns (facility name, score), or (None, best score) if nothing is at least `threshold` similar, or if two
+        facilities are equally close (better to report it than to guess).
+        """
+
+        normalized = normalize_name(name)
+        if normalized in self.exact:
+            return self.names[self.exact[normalized]], 1.0
+
+        # count shared trigrams, only for names that share any
+        name_trigrams = trigrams(normalized)
+        shared = dict()
+        for trigram in name_trigrams:
+            for i in self.postings.get(trigram, ()):
+                shared[i] = shared.get(i, 0) + 1
+
+        best, best_score, runner_up_score = None, 0.0, 0.0
+        for i, count in shared.items():
+            score = 2 * count / (len(name_trigrams) + self.trigram_counts[i])
+            if score > best_score:
+                best, best_score, runner_up_score = i, score, best_score
+            elif score > runner_up_score:
+                runner_up_score = score
+
+        if best is None or best_score < threshold or best_score == runner_up_score:
+            return None, best_score
+
+        return self.names[best], best_score
+
+
+def match_pool_names(names: Iterable[str], facility_names: Iterable[str], threshold=MATCH_THRESHOLD):
+    """
+    Match every pool name to a facility name.
+    Returns (map of pool name -> (facility name, score), list of (unresolved pool name, best score)).
+    """
+
+    index = NameIndex(facility_names)
+
+    matches = dict()
+    unresolved = []
+    for name in names:
+        facility_name, score = index.match(name, threshold)
+        if facility_name is None:
+            unresolved.append((name, score))
+        else:
+            matches[name] = (facility_name, score)
+
+    return matches, unresolved
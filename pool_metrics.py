@@ -0,0 +1,181 @@
+"""
+Metrics for the scrape -> parse -> join -> generate pipeline, so a slow or weird nightly build can be looked into after
+the fact (and charted over time).
+
+Usage:
+    from pool_metrics import metrics
+
+    with metrics.stage('fetch'):
+        ...
+    metrics.set('pools_fetch_bytes', len(content), url=url)
+    metrics.inc('pools_parse_rows')
+
+    metrics.write_json('metrics.json')
+    metrics.write_prometheus('metrics.prom')  # for node_exporter's textfile collector
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Help text for the Prometheus textfile (metrics without any are still written, just without a # HELP line)
+METRIC_HELP = {
+    'pools_run_timestamp_seconds': 'When this run started.',
+    'pools_stage_seconds': 'Time spent in each pipeline stage.',
+    'pools_stage_peak_memory_bytes': 'Peak traced memory in each pipeline stage (only with --trace-memory).',
+    'pools_fetch_bytes': 'Size of each downloaded page.',
+    'pools_fetch_seconds': 'Time taken to download each page.',
+    'pools_fetch_status': 'HTTP status of each downloaded page.',
+    'pools_fetch_retries': 'Failed attempts at downloading each page (timeouts, connection errors, 5xx, 429).',
+    'pools_fetch_failures': 'Pages that could not be downloaded, even after retrying.',
+    'pools_parse_pools': 'Pools found on the schedule page.',
+    'pools_parse_rows': 'Schedule rows read.',
+    'pools_parse_skipped_rows': 'Schedule rows left out because they are not Leisure Swim (v1/v2 pages only).',
+    'pools_parse_sessions': 'Sessions (start/end times) read.',
+    'pools_parse_program_sessions': 'Sessions of each program, after merging every program page.',
+    'pools_parse_duplicate_time_fixes': 'Pool/date pairs that had duplicate times removed.',
+    'pools_parse_facilities': 'Facilities found on each facility page.',
+    'pools_parse_quarantined_rows': 'Schedule rows that could not be parsed, and were left out.',
+    'pools_checkpoint_pages_reused': 'Pages read back from the run\'s checkpoint instead of downloaded.',
+    'pools_checkpoint_listings_reused': 'Pool listings read back from the run\'s checkpoint instead of parsed.',
+    'pools_join_mismatches': 'Pools on the schedule page that could not be found on any facility page.',
+    'pools_join_fuzzy_matches': 'Pools joined to a facility with a differently spelled name.',
+    'pools_generate_bytes': 'Size of each generated file.',
+    'pools_generate_months_rebuilt': 'Months whose data file, tables and date pages were rebuilt because their inputs '
+                                     'changed.',
+    'pools_generate_months_unchanged': 'Months left as they were because nothing that goes into them changed.',
+    'pools_schedule_rules': 'Weekly rules that the schedules were compressed into.',
+    'pools_schedule_exceptions': 'Dates that do not follow their pool\'s weekly rules.',
+    'pools_nearby_located': 'Pools with coordinates, which the nearby-pool tables are worked out for.',
+    'pools_nearby_sessions': 'Sessions that have a nearby pool open at the same time (in the months rebuilt).',
+    'pools_static_pages_written': 'Static date pages rewritten because their cards changed.',
+    'pools_static_pages_unchanged': 'Static date pages left alone because their cards did not change.',
+    'pools_static_bytes_written': 'Total size of the static date pages rewritten.',
+    'pools_coverage_max_open': 'Most pools open at once in any 15 minutes, citywide (see coverage.html).',
+    'pools_window_dates_evicted': 'Pool dates dropped from the cache because they are older than the window.',
+    'pools_window_dates_merged': 'Pool dates kept from the cache because the scrape no longer lists them.',
+    'pools_enrich_pages': 'Facility pages used for enrichment, by whether they were fresh, not modified or downloaded.',
+    'pools_enrich_failures': 'Facility pages that could not be downloaded.',
+    'pools_enrich_pools': 'Pools enriched with amenities, accessibility and closures from their facility page.',
+    'pools_archive_bytes': 'Size of the archive of every scrape.',
+    'pools_ics_feeds_written': '.ics feeds rewritten because their schedules changed.',
+    'pools_ics_feeds_unchanged': '.ics feeds left alone because their schedules did not change.',
+    'pools_ics_bytes_written': 'Total size of the .ics feeds rewritten.',
+}
+
+
+class Metrics:
+    def __init__(self):
+        self.started = time.time()
+        self.trace_memory = False
+
+        # peak memory of each stage that's running, from before the stages inside it reset the peak
+        self._outer_peaks = []
+
+        # map metric name -> map of labels (as a sorted tuple of (key, value)) -> value
+        self.values = dict()
+
+        # anything too long to be a metric (e.g. which pool names didn't match)
+        self.details = dict()
+
+        # fetches can run on several threads at once (see pool_enrich.py)
+        self._lock = threading.Lock()
+
+        self.set('pools_run_timestamp_seconds', self.started)
+
+    def start_tracing_memory(self):
+        """
+        Also record the peak memory of each stage. Makes everything slower, so it's opt-in.
+        """
+
+        self.trace_memory = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def set(self, name, value, **labels):
+        self.values.setdefault(name, dict())[tuple(sorted(labels.items()))] = value
+
+    def inc(self, name, value=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            values = self.values.setdefault(name, dict())
+            values[key] = values.get(key, 0) + value
+
+    def get(self, name, **labels):
+        return self.values.get(name, dict()).get(tuple(sorted(labels.items())))
+
+    def record_fetch(self, url, response, seconds):
+        self.set('pools_fetch_bytes', len(response.content), url=url)
+        self.set('pools_fetch_seconds', seconds, url=url)
+        self.set('pools_fetch_status', response.status_code, url=url)
+
+    def add_detail(self, name, value):
+        self.details.setdefault(name, []).append(value)
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time a stage of the pipeline. Running the same stage more than once adds up.
+        """
+
+        if self.trace_memory:
+            # resetting the peak wipes it for the stages this one is in too, so they keep what it was
+            _, peak = tracemalloc.get_traced_memory()
+            self._outer_peaks = [max(outer_peak, peak) for outer_peak in self._outer_peaks]
+            self._outer_peaks.append(0)
+            tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.inc('pools_stage_seconds', time.perf_counter() - start, stage=name)
+
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, self._outer_peaks.pop() if len(self._outer_peaks) > 0 else 0)
+                previous_peak = self.get('pools_stage_peak_memory_bytes', stage=name) or 0
+                self.set('pools_stage_peak_memory_bytes', max(peak, previous_peak), stage=name)
+
+    def to_dict(self):
+        return {
+            'metrics': {name: [{'labels': dict(labels), 'value': value} for labels, value in values.items()]
+                        for name, values in sorted(self.values.items())},
+            'details': self.details,
+        }
+
+    def write_json(self, fname):
+        with open(fname, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def to_prometheus(self):
+        lines = []
+        for name, values in sorted(self.values.items()):
+            if name in METRIC_HELP:
+                lines.append(f'# HELP {name} {METRIC_HELP[name]}')
+            lines.append(f'# TYPE {name} gauge')
+            for labels, value in values.items():
+                if len(labels) > 0:
+                    labels_text = ','.join(f'{key}="{prometheus_escape(str(label))}"' for key, label in labels)
+                    lines.append(f'{name}{{{labels_text}}} {value}')
+                else:
+                    lines.append(f'{name} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, fname):
+        # write then rename, so the textfile collector never reads half a file
+        tmp_fname = f'{fname}.{os.getpid()}.tmp'
+        with open(tmp_fname, 'w') as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_fname, fname)
+
+
+def prometheus_escape(text: str):
+    return text.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+# What the pipeline records into
+metrics = Metrics()
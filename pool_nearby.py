@@ -0,0 +1,246 @@
+"""
+"Where else can I swim?" tables: for each session at a pool, the nearest other pools with a session of the same program
+at the same time (ranked by straight-line distance, then by how long the two sessions overlap).
+
+Distances come from each pool's coordinates, which are kept in pool-coordinates.json (pool name -> [latitude, longitude])
+since the facility pages don't have them. Pools that aren't in it are left out of every table. Fill it in with:
+    python pool_nearby.py --geocode --key <MapQuest API key>
+
+Each date is worked out with numpy, all of its sessions against each other at once: a (sessions x sessions) overlap
+matrix, reduced to each session's best-overlapping session at every other pool, then sorted by distance.
+
+Usage:
+    from pool_nearby import NearbyAlternatives, add_coordinates, load_coordinates
+
+    add_coordinates(pool_info, load_coordinates())
+    for pool, session, km, overlap in NearbyAlternatives(pool_info).for_session(pool, date, session):
+        ...
+"""
+
+import argparse
+import json
+import os
+
+from pool_slots import to_minutes
+
+COORDINATES_FNAME = 'pool-coordinates.json'
+
+# How many alternatives to keep for each session
+ALTERNATIVES_K = 3
+
+# How many sessions to compare against the rest of the date at a time, so a huge date doesn't need a huge matrix
+ROWS_PER_BLOCK = 1024
+
+EARTH_RADIUS_KM = 6371.0
+
+GEOCODE_URL = 'https://www.mapquestapi.com/geocoding/v1/batch'
+GEOCODE_BATCH_SIZE = 100
+
+
+def load_coordinates(fname=COORDINATES_FNAME):
+    """
+    Map pool name -> (latitude, longitude). Empty if there's no coordinates file.
+    """
+
+    try:
+        with open(fname, 'r') as f:
+            return {name: tuple(lat_lon) for name, lat_lon in json.load(f).items()}
+    except FileNotFoundError:
+        return dict()
+
+
+def add_coordinates(pool_info, coordinates):
+    """
+    Set each pool's coordinates (None if they aren't known). Returns how many pools have them.
+    """
+
+    for pool in pool_info:
+        pool.coordinates = coordinates.get(pool.name)
+    return sum(1 for pool in pool_info if pool.coordinates is not None)
+
+
+def distance_matrix(coordinates):
+    """
+    Straight-line (great-circle) distance in km between every pair of (latitude, longitude), as an (n x n) array.
+    """
+
+    import numpy as np
+
+    lat_lon = np.radians(np.array(coordinates, dtype=np.float64).reshape(-1, 2))
+    lat, lon = lat_lon[:, 0], lat_lon[:, 1]
+
+    # haversine
+    a = np.sin((lat[:, None] - lat[None, :]) / 2) ** 2 + \
+        np.cos(lat[:, None]) * np.cos(lat[None, :]) * np.sin((lon[:, None] - lon[None, :]) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def date_table(pools_sessions, distances, k=ALTERNATIVES_K):
+    """
+    Build one date's table from a list of (pool, index of the pool in `distances`, sessions on that date).
+    Returns a map of (pool name, session) -> [(other pool, other session, km, minutes of overlap)], nearest first.
+    """
+
+    import numpy as np
+
+    if len(pools_sessions) < 2:
+        return dict()
+
+    # every session on the date, grouped by pool
+    owners, starts, ends, programs = [], [], [], []
+    program_codes = dict()
+    group_starts = []
+    for p, (_, _, times) in enumerate(pools_sessions):
+        group_starts.append(len(owners))
+        for start, end, program in times:
+            owners.append(p)
+            starts.append(to_minutes(start))
+            ends.append(to_minutes(end))
+            programs.append(program_codes.setdefault(program, len(program_codes)))
+
+    owners = np.array(owners)
+    starts, ends, programs = np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64), np.array(programs)
+    group_starts = np.array(group_starts)
+    n_sessions = len(owners)
+
+    pool_distances = distances[np.ix_([index for _, index, _ in pools_sessions],
+                                      [index for _, index, _ in pools_sessions])]
+
+    table = dict()
+    for block_start in range(0, n_sessions, ROWS_PER_BLOCK):
+        rows = slice(block_start, min(block_start + ROWS_PER_BLOCK, n_sessions))
+
+        # minutes each session in the block overlaps every session on the date (0 if they're at the same pool, or of
+        #   different programs)
+        overlap = np.minimum(ends[rows, None], ends[None, :]) - np.maximum(starts[rows, None], starts[None, :])
+        overlap[(programs[rows, None] != programs[None, :]) | (owners[rows, None] == owners[None, :])] = 0
+        np.maximum(overlap, 0, out=overlap)
+
+        # the best-overlapping session at each pool: pack overlap and (reversed) column into one number, so that a
+        #   single max per pool finds both (ties go to the earlier session)
+        packed = overlap * n_sessions + (n_sessions - 1 - np.arange(n_sessions))
+        best_packed = np.maximum.reduceat(packed, group_starts, axis=1)
+        best_overlap = best_packed // n_sessions
+        best_session = n_sessions - 1 - best_packed % n_sessions
+
+        # nearest first, then longest overlap. Pools without an overlapping session go last.
+        km = np.where(best_overlap > 0, pool_distances[owners[rows]], np.inf)
+        order = np.lexsort((-best_overlap, km), axis=1)[:, :k]
+
+        for i, ranked in enumerate(order):
+            row = block_start + i
+            pool, _, times = pools_sessions[owners[row]]
+            session = times[row - group_starts[owners[row]]]
+
+            alternatives = []
+            for p in ranked:
+                if best_overlap[i, p] <= 0:
+                    break
+                column = best_session[i, p]
+                other_pool, _, other_times = pools_sessions[p]
+                alternatives.append((other_pool, other_times[column - group_starts[p]], float(km[i, p]),
+                                     int(best_overlap[i, p])))
+
+            if len(alternatives) > 0:
+                table[(pool.name, session)] = alternatives
+
+    return table
+
+
+class NearbyAlternatives:
+    """
+    Alternatives for every session in the pool info. Each date's table is built the first time it's needed.
+    Only pools with coordinates are included (see add_coordinates()).
+    """
+
+    def __init__(self, pool_info, k=ALTERNATIVES_K):
+        self.pools = [pool for pool in pool_info if getattr(pool, 'coordinates', None) is not None]
+        self.k = k
+        self.distances = distance_matrix([pool.coordinates for pool in self.pools])
+        self.tables = dict()
+
+    def table(self, date):
+        if date not in self.tables:
+            self.tables[date] = date_table([(pool, i, pool.availabilities[date]) for i, pool in enumerate(self.pools)
+                                            if date in pool.availabilities], self.distances, self.k)
+        return self.tables[date]
+
+    def for_session(self, pool, date, session):
+        """
+        The nearest pools with a session overlapping this one, as [(pool, session, km, minutes of overlap)].
+        """
+
+        return self.table(date).get((pool.name, session), [])
+
+    def dates(self):
+        return sorted({date for pool in self.pools for date in pool.availabilities})
+
+
+##### GEOCODING #####
+
+def geocode_addresses(addresses, api_key):
+    """
+    Map address -> (latitude, longitude), from MapQuest (the same API the page gets distances from).
+    Addresses it can't find are left out.
+    """
+
+    import requests
+
+    from pool_fetch import DEFAULT_TIMEOUT
+
+    addresses = list(addresses)
+    coordinates = dict()
+    for i in range(0, len(addresses), GEOCODE_BATCH_SIZE):
+        batch = addresses[i:i + GEOCODE_BATCH_SIZE]
+        response = requests.get(GEOCODE_URL, timeout=DEFAULT_TIMEOUT, params=[('key', api_key), ('maxResults', 1)] +
+                                [('location', f'{address}, Toronto ON') for address in batch])
+        response.raise_for_status()
+
+        for address, result in zip(batch, response.json()['results']):
+            if len(result['locations']) > 0:
+                lat_lng = result['locations'][0]['latLng']
+                coordinates[address] = (lat_lng['lat'], lat_lng['lng'])
+
+    return coordinates
+
+
+def geocode_pools(pool_info, api_key, fname=COORDINATES_FNAME):
+    """
+    Look up the coordinates of every pool that has an address but isn't in the coordinates file yet, and add them to it.
+    Returns how many were added.
+    """
+
+    coordinates = load_coordinates(fname)
+    missing = {pool.address: pool.name for pool in pool_info if pool.name not in coordinates and pool.address}
+
+    found = geocode_addresses(missing, api_key)
+    for address, lat_lon in found.items():
+        coordinates[missing[address]] = lat_lon
+    for address in set(missing) - set(found):
+        print(f'WARN: Could not find coordinates of {missing[address]} ({address}).')
+
+    tmp_fname = f'{fname}.tmp'
+    with open(tmp_fname, 'w') as f:
+        json.dump({name: list(lat_lon) for name, lat_lon in sorted(coordinates.items())}, f, indent=2)
+    os.replace(tmp_fname, fname)
+
+    return len(found)
+
+
+def main(argv=None):
+    import generate_pages_v3 as v3
+
+    arg_parser = argparse.ArgumentParser(description=f'Fill in {COORDINATES_FNAME} for the nearby-pool tables.')
+    arg_parser.add_argument('--geocode', action='store_true', required=True,
+                            help="look up the coordinates of pools that aren't in the file yet")
+    arg_parser.add_argument('--key', required=True, help='MapQuest API key')
+    arg_parser.add_argument('--cache', default=v3.CACHE_FNAME, help='pool info to read (default: %(default)s)')
+    arg_parser.add_argument('--coordinates', default=COORDINATES_FNAME, help='file to fill in (default: %(default)s)')
+    args = arg_parser.parse_args(argv)
+
+    added = geocode_pools(v3.load_pool_info(args.cache), args.key, args.coordinates)
+    print(f'INFO: Added coordinates of {added} pools to {args.coordinates}.')
+
+
+if __name__ == '__main__':
+    main()
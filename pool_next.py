@@ -0,0 +1,95 @@
+"""
+"What opens next?" lookup tables, in Toronto time.
+
+For each date, every session is listed in order of start time, along with where each 15-minute bucket of the day starts in
+that list. Finding the pools that open next from some time is then a matter of jumping to that time's bucket and reading
+forwards, instead of working out (and sorting by) every pool's next session.
+
+Usage:
+    from pool_next import NextOpenings, toronto_now
+
+    date, minutes = toronto_now()
+    for pool, session in NextOpenings(pool_info).after(date, minutes)[:5]:
+        ...
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from pool_slots import SLOT_MINUTES, SLOTS_PER_DAY, to_minutes
+
+# Where the pools (and their schedules) are
+TORONTO = ZoneInfo('America/Toronto')
+
+
+def toronto_now():
+    """
+    Returns (today's date at midnight, minutes since midnight), in Toronto, wherever this is running.
+    """
+
+    now = datetime.now(TORONTO)
+    return datetime(now.year, now.month, now.day), now.hour * 60 + now.minute
+
+
+def date_table(pools_sessions):
+    """
+    Build one date's table from a list of (pool, sessions on that date).
+    Returns (list of (start in minutes, pool, session) sorted by start, list of where each bucket starts in it).
+    """
+
+    order = sorted(((to_minutes(session.start), i, pool, session)
+                    for i, (pool, sessions) in enumerate(pools_sessions) for session in sessions),
+                   key=lambda entry: entry[:2])
+    order = [(start, pool, session) for start, _, pool, session in order]
+
+    # bucket b starts at the first session starting at or after b * 15 minutes
+    buckets = []
+    i = 0
+    for bucket in range(SLOTS_PER_DAY):
+        while i < len(order) and order[i][0] < bucket * SLOT_MINUTES:
+            i += 1
+        buckets.append(i)
+
+    return order, buckets
+
+
+class NextOpenings:
+    """
+    Next-opening tables for every date in the pool info. Each date's table is built the first time it's needed.
+    """
+
+    def __init__(self, pool_info):
+        self.pool_info = pool_info
+        self.tables = dict()
+
+    def table(self, date):
+        if date not in self.tables:
+            self.tables[date] = date_table([(pool, pool.availabilities[date]) for pool in self.pool_info
+                                            if date in pool.availabilities])
+        return self.tables[date]
+
+    def after(self, date, minutes, programs=None):
+        """
+        Pools with a session starting at or after `minutes` on this date, soonest first (each pool once, with its next
+        session). programs optionally limits it to sessions of those programs (see program_matches()).
+        """
+
+        # imported here, since generate_pages_v3 imports this module
+        from generate_pages_v3 import program_matches
+
+        order, buckets = self.table(date)
+        if minutes >= SLOTS_PER_DAY * SLOT_MINUTES:
+            return []
+
+        results = []
+        seen = set()
+        for start, pool, session in order[buckets[max(minutes, 0) // SLOT_MINUTES]:]:
+            # the bucket can start a few minutes before `minutes`
+            if start < minutes or id(pool) in seen:
+                continue
+            if programs and not program_matches(session.program, programs):
+                continue
+            seen.add(id(pool))
+            results.append((pool, session))
+
+        return results
@@ -0,0 +1,178 @@
+"""
+Pool schedules as weekly rules plus exceptions, instead of every date separately.
+
+Most pools do the same thing every week for the whole season (e.g. Leisure Swim, Tuesdays 7:30-8:30pm, June 4 to
+August 27), so a season's schedule is a few rules instead of a few hundred dates. Dates that don't follow the rules
+(holidays, one-off sessions, a week off) are kept as exceptions: that date's sessions, in full.
+
+RecurringSchedule is a drop-in for the map of date -> sessions that Pool.availabilities used to be. Each date's
+sessions are worked out from the rules when they're asked for.
+
+Usage:
+    from pool_recurrence import RecurringSchedule
+
+    pool.availabilities = RecurringSchedule.from_dates(pool.availabilities)
+    pool.availabilities[datetime(2019, 6, 4)]  # [Session(...), ...], same as before
+    pool.availabilities.rules                  # [Rule(weekday=1, start=..., end=..., program=..., first=..., last=...)]
+"""
+
+from collections.abc import MutableMapping
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+# Shortest run of weeks that's worth a rule
+MIN_RULE_WEEKS = 2
+
+# How many weeks in a row a rule can skip (e.g. a holiday), which are then exceptions, before it's split in two
+MAX_GAP_WEEKS = 1
+
+ONE_WEEK = timedelta(days=7)
+
+# Program of sessions scraped before sessions had one (all of them came from the leisure page)
+DEFAULT_PROGRAM = 'Leisure Swim'
+
+
+# A single session at a pool, e.g. Leisure Swim from 1:30pm to 3:45pm. Times are since midnight.
+#   It lives here rather than in generate_pages_v3.py, which is run as __main__ and would otherwise have its own copy.
+class Session(NamedTuple):
+    start: timedelta
+    end: timedelta
+    program: str = DEFAULT_PROGRAM
+
+
+class Rule(NamedTuple):
+    weekday: int  # Monday is 0, like datetime.weekday()
+    start: timedelta
+    end: timedelta
+    program: str
+    first: datetime  # first and last date it happens on (both on `weekday`)
+    last: datetime
+
+    def dates(self):
+        date = self.first
+        while date <= self.last:
+            yield date
+            date += ONE_WEEK
+
+    def clip(self, first: datetime = None, last: datetime = None):
+        """
+        The same rule, but only on dates from first to last (either can be None). None if that leaves no dates.
+        """
+
+        rule = self
+        if first is not None and rule.first < first:
+            rule = rule._replace(first=rule.first + ONE_WEEK * -(-(first - rule.first).days // 7))
+        if last is not None and rule.last > last:
+            rule = rule._replace(last=rule.last - ONE_WEEK * -(-(rule.last - last).days // 7))
+        return rule if rule.first <= rule.last else None
+
+
+def find_rules(availabilities):
+    """
+    Every weekly rule in a map of date -> sessions: each session that happens on the same weekday, at the same time,
+    at least MIN_RULE_WEEKS weeks in a row (skipping at most MAX_GAP_WEEKS at a time).
+    """
+
+    # (weekday, start, end, program) -> dates it's on
+    occurrences = dict()
+    for date, times in availabilities.items():
+        for start, end, program in times:
+            occurrences.setdefault((date.weekday(), start, end, program), set()).add(date)
+
+    rules = []
+    for (weekday, start, end, program), dates in occurrences.items():
+        dates = sorted(dates)
+
+        run = [dates[0]]
+        for date in dates[1:] + [None]:
+            if date is not None and date - run[-1] <= ONE_WEEK * (MAX_GAP_WEEKS + 1):
+                run.append(date)
+                continue
+
+            if len(run) >= MIN_RULE_WEEKS:
+                rules.append(Rule(weekday, start, end, program, run[0], run[-1]))
+            run = [date]
+
+    return sorted(rules)
+
+
+class RecurringSchedule(MutableMapping):
+    """
+    Map of date -> sessions (sorted by start, then end), stored as weekly rules plus exceptions.
+    Dates without any sessions aren't in it.
+    """
+
+    def __init__(self, rules=(), exceptions=None):
+        self.rules = sorted(rules)
+
+        # map date -> that date's sessions, for dates that don't match the rules ([] if it has none at all)
+        self.exceptions = dict(exceptions or dict())
+
+    @classmethod
+    def from_dates(cls, availabilities):
+        """
+        Compress a map of date -> sessions. Expanding it again gives back exactly the same sessions, sorted (the same
+        way expand() sorts them, so that sessions listed in another order don't all end up as exceptions).
+        """
+
+        schedule = cls(find_rules(availabilities))
+
+        for date in set(availabilities) | set(schedule.rule_dates()):
+            times = sorted(availabilities.get(date, []))
+            if schedule.expand(date) != times:
+                schedule.exceptions[date] = times
+
+        return schedule
+
+    def clip(self, first: datetime = None, last: datetime = None):
+        """
+        Only the dates from first to last (either can be None), e.g. to drop dates that have passed.
+        """
+
+        rules = [rule.clip(first, last) for rule in self.rules]
+        exceptions = {date: times for date, times in self.exceptions.items()
+                      if (first is None or date >= first) and (last is None or date <= last)}
+        return RecurringSchedule([rule for rule in rules if rule is not None], exceptions)
+
+    def expand(self, date):
+        """
+        Sessions the rules say a date has (ignoring exceptions).
+        """
+
+        weekday = date.weekday()
+        times = [Session(rule.start, rule.end, rule.program) for rule in self.rules
+                 if rule.weekday == weekday and rule.first <= date <= rule.last]
+        times.sort()
+        return times
+
+    def rule_dates(self):
+        return {date for rule in self.rules for date in rule.dates()}
+
+    def __getitem__(self, date):
+        times = self.exceptions[date] if date in self.exceptions else self.expand(date)
+        if len(times) == 0:
+            raise KeyError(date)
+        return times
+
+    def __setitem__(self, date, times):
+        self.exceptions[date] = sorted(times)
+
+    def __delitem__(self, date):
+        if date not in self:
+            raise KeyError(date)
+        self.exceptions[date] = []
+
+    def __iter__(self):
+        dates = {date for date in self.rule_dates() if date not in self.exceptions}
+        dates.update(date for date, times in self.exceptions.items() if len(times) > 0)
+        return iter(sorted(dates))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, date):
+        times = self.exceptions[date] if date in self.exceptions else self.expand(date)
+        return len(times) > 0
+
+    def __repr__(self):
+        return f'RecurringSchedule({len(self.rules)} rules, {len(self.exceptions)} exceptions)'
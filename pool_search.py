@@ -0,0 +1,151 @@
+"""
+Search index over pool names, addresses and types, for filtering pools by name as you type (on the page, and with
+pools.py --name).
+
+Each pool's fields are boiled down to lowercase words (see search_text()), and every trigram (3-letter chunk, spaces
+included) in them points at the pools that have it. A search for some text only looks at the pools that have all of its
+trigrams, then checks that the text is really in one of their fields. A fuzzy search (for typos) ranks pools by how many
+of its trigrams they have instead.
+
+The generator writes the index next to the page (search-index.json), and pools.py reads the same file, so both search
+exactly the same way (see searchPools() in pools-v3.js).
+
+Usage:
+    from pool_search import SearchIndex
+
+    index = SearchIndex.from_pools(pool_info)
+    index.search('york')                          # ['York Recreation Centre', 'East York Community Centre']
+    index.search('wallace emmerson', fuzzy=True)  # ['Wallace Emerson Community Centre']
+"""
+
+import json
+import os
+import re
+from typing import List
+
+from pool_matching import classify_pool_name, trigrams
+
+# Fraction of a query's trigrams a pool needs to have to count as a fuzzy match
+FUZZY_THRESHOLD = 0.6
+
+SEARCH_INDEX_VERSION = 1
+
+
+def search_text(text):
+    """
+    e.g. "Albert Campbell C.I." --> "albert campbell c i"
+    """
+
+    return ' '.join(re.split(r'[^a-z0-9]+', str(text).lower())).strip()
+
+
+def pool_fields(pool):
+    """
+    The text a pool can be found by: name, classified name, address and type.
+    """
+
+    pool_type = getattr(pool.type, 'value', pool.type)
+    return [search_text(field) for field in (pool.name, pool.classified_name or classify_pool_name(pool.name),
+                                             pool.address or '', pool_type or '')]
+
+
+class SearchIndex:
+    def __init__(self, names: List[str], fields: List[List[str]]):
+        self.names = names
+        self.fields = fields
+
+        # trigram -> positions (in self.names) of the pools that have it in any of their fields
+        self.postings = dict()
+        for i, texts in enumerate(fields):
+            for trigram in set().union(*(trigrams(text, pad=False) for text in texts)):
+                self.postings.setdefault(trigram, []).append(i)
+
+    @classmethod
+    def from_pools(cls, pool_info):
+        pools = sorted(pool_info, key=lambda pool: pool.name)
+        return cls([pool.name for pool in pools], [pool_fields(pool) for pool in pools])
+
+    def to_json(self):
+        return {
+            'version': SEARCH_INDEX_VERSION,
+            'names': self.names,
+            'fields': self.fields,
+            'postings': {trigram: self.postings[trigram] for trigram in sorted(self.postings)},
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        if data.get('version') != SEARCH_INDEX_VERSION:
+            raise ValueError(f'search index is version {data.get("version")}, expected {SEARCH_INDEX_VERSION}')
+
+        index = cls.__new__(cls)
+        index.names = data['names']
+        index.fields = data['fields']
+        index.postings = data['postings']
+        return index
+
+    def save(self, fname):
+        tmp_fname = f'{fname}.tmp'
+        with open(tmp_fname, 'w') as f:
+            json.dump(self.to_json(), f, separators=(',', ':'))
+        os.replace(tmp_fname, fname)
+
+    def search(self, query, fuzzy=False, threshold=FUZZY_THRESHOLD):
+        """
+        Names of the pools that have the query in their name, classified name, address or type: pools whose name starts
+        with it first, then the rest, by name.
+        With fuzzy=True, pools that have enough of the query's trigrams (e.g. with a typo) come after those.
+        """
+
+        query = search_text(query)
+        if query == '':
+            return list(self.names)
+
+        query_trigrams = trigrams(query, pad=False)
+        if len(query_trigrams) > 0:
+            # only the pools that have every trigram of the query can have it
+            candidates = None
+            for trigram in query_trigrams:
+                postings = self.postings.get(trigram, ())
+                candidates = set(postings) if candidates is None else candidates.intersection(postings)
+                if len(candidates) == 0:
+                    break
+        else:
+            # too short for a trigram
+            candidates = range(len(self.names))
+
+        hits = [i for i in candidates if any(query in field for field in self.fields[i])]
+        hits.sort(key=lambda i: (not self.fields[i][0].startswith(query), i))
+        results = [self.names[i] for i in hits]
+
+        if fuzzy and len(query_trigrams) > 0:
+            shared = dict()
+            for trigram in query_trigrams:
+                for i in self.postings.get(trigram, ()):
+                    shared[i] = shared.get(i, 0) + 1
+
+            found = set(hits)
+            close = [(-count, i) for i, count in shared.items()
+                     if i not in found and count / len(query_trigrams) >= threshold]
+            results.extend(self.names[i] for _, i in sorted(close))
+
+        return results
+
+
+def load_search_index(pool_info, fname):
+    """
+    The index the generator wrote, if it's for these pools. Otherwise (e.g. pool info from the archive), one built
+    from them, which only takes a few milliseconds.
+    """
+
+    pools = sorted(pool_info, key=lambda pool: pool.name)
+
+    try:
+        with open(fname, 'r') as f:
+            index = SearchIndex.from_json(json.load(f))
+    except (FileNotFoundError, ValueError, KeyError):
+        return SearchIndex.from_pools(pools)
+
+    if index.names != [pool.name for pool in pools] or index.fields != [pool_fields(pool) for pool in pools]:
+        return SearchIndex.from_pools(pools)
+    return index
@@ -0,0 +1,141 @@
+"""
+15-minute time slot bitmaps, for answering "is it open at 6pm" or "is it open any time between 6 and 8pm" with a couple
+of bitwise operations instead of looping over sessions.
+
+A day has 96 slots. Bit i of a pool's mask for a date is set if any of its sessions that day overlaps slot i
+(00:00 + 15 * i minutes, for 15 minutes). Masks are plain ints, and are split into three 32-bit words (lowest slots first)
+for the page, since JS can only do bitwise operations on 32 bits at a time.
+
+Usage:
+    from pool_slots import SlotTable, window_mask
+
+    pool.slots[date] & window_mask(timedelta(hours=18), timedelta(hours=20))  # non-zero if open any time from 6 to 8pm
+
+    table = SlotTable.for_date(pool_info, date)  # every pool at once (needs numpy)
+    table.names[table.overlaps(timedelta(hours=18), timedelta(hours=20))]
+"""
+
+from datetime import timedelta
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+WORD_BITS = 32
+WORDS_PER_DAY = SLOTS_PER_DAY // WORD_BITS
+WORD_MASK = (1 << WORD_BITS) - 1
+
+
+def to_minutes(time: timedelta):
+    return int(time.total_seconds()) // 60
+
+
+def window_mask(start: timedelta, end: timedelta):
+    """
+    Mask of every slot that start..end overlaps.
+
+    Examples:
+        6pm - 8pm       --> slots 72 to 79
+        6:10pm - 6:20pm --> slots 72 and 73
+    """
+
+    first_slot = max(to_minutes(start) // SLOT_MINUTES, 0)
+    # end is exclusive, so a window ending right on a slot boundary doesn't touch the next slot
+    last_slot = min(-(-to_minutes(end) // SLOT_MINUTES), SLOTS_PER_DAY)
+
+    if last_slot <= first_slot:
+        return 0
+    return ((1 << (last_slot - first_slot)) - 1) << first_slot
+
+
+def slot_mask(time: timedelta):
+    """
+    Mask of the slot that a time of day is in.
+    """
+
+    return 1 << min(max(to_minutes(time) // SLOT_MINUTES, 0), SLOTS_PER_DAY - 1)
+
+
+def sessions_mask(times):
+    """
+    Mask of every slot that any of these sessions ((start, end, ...) tuples) overlaps.
+    """
+
+    mask = 0
+    for time in times:
+        mask |= window_mask(time[0], time[1])
+    return mask
+
+
+def to_words(mask: int):
+    """
+    Split a mask into 32-bit words, lowest slots first (what the page gets).
+    """
+
+    return [(mask >> (WORD_BITS * i)) & WORD_MASK for i in range(WORDS_PER_DAY)]
+
+
+def from_words(words):
+    mask = 0
+    for i, word in enumerate(words):
+        mask |= int(word) << (WORD_BITS * i)
+    return mask
+
+
+def pool_slots(availabilities):
+    """
+    Map date -> mask, from a pool's map of date -> sessions.
+    """
+
+    return {date: sessions_mask(times) for date, times in availabilities.items()}
+
+
+class SlotTable:
+    """
+    Every pool's mask on one date, as an (n pools x 3 words) uint32 array, so that a question can be asked of all of them
+    at once. Each question returns a boolean array, in the same order as `names`.
+    """
+
+    def __init__(self, names, masks):
+        import numpy as np
+
+        self.names = np.array(names, dtype=object)
+        self.words = np.array([to_words(mask) for mask in masks], dtype=np.uint32).reshape(-1, WORDS_PER_DAY)
+
+    @classmethod
+    def for_date(cls, pool_info, date):
+        """
+        Table of the pools that have any sessions on this date.
+        """
+
+        pools = [pool for pool in pool_info if pool.slots.get(date)]
+        return cls([pool.name for pool in pools], [pool.slots[date] for pool in pools])
+
+    def _matches(self, mask, all_slots):
+        import numpy as np
+
+        window = np.array(to_words(mask), dtype=np.uint32)
+        hits = self.words & window
+        if all_slots:
+            return (hits == window).all(axis=1)
+        return (hits != 0).any(axis=1)
+
+    def open_at(self, time: timedelta):
+        """
+        Pools open at some point during the slot this time is in.
+        """
+
+        return self._matches(slot_mask(time), all_slots=False)
+
+    def overlaps(self, start: timedelta, end: timedelta):
+        """
+        Pools open at any point between start and end.
+        """
+
+        return self._matches(window_mask(start, end), all_slots=False)
+
+    def open_in_every_slot(self, start: timedelta, end: timedelta):
+        """
+        Pools that have a session in every slot between start and end (e.g. to swim the whole time).
+        A session that only covers part of a slot still counts for it, so this is only exact to the nearest 15 minutes.
+        """
+
+        return self._matches(window_mask(start, end), all_slots=True)
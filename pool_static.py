@@ -0,0 +1,142 @@
+"""
+One static page per date (dates/YYYY-MM-DD.html), with that date's cards already in it, sorted by name (the page's
+default order). They show the schedule as soon as the HTML arrives: the data and pools-v3.js are deferred to the end
+of the page, and once they've loaded the page takes over the cards as usual (see renderVisibleCards() in pools-v3.js).
+
+Pages are rendered by a process pool, since a season is a couple hundred of them, and only rewritten if they changed.
+The generator only renders the dates whose months changed (see _gen_v3()), the rest are left as they are.
+
+Usage:
+    from pool_static import write_date_pages
+
+    write_date_pages('pool-browser/v3/dates', page_template, date_pools)
+"""
+
+import os
+from html import escape
+
+from pool_metrics import metrics
+
+# How many processes to render pages with (0 means one per CPU), and how many pages it takes to be worth starting them
+STATIC_WORKERS = 0
+MIN_PAGES_PER_WORKER = 16
+
+
+def time_text(start, end):
+    """
+    Same as timeToText() in pools-v3.js, so the cards don't change once the page takes over.
+
+    Example:
+        300, 330 --> 5:00 - 5:30am
+    """
+
+    start_text = f'{start // 60}:{start % 60:02}'
+    end_text = f'{end // 60}:{end % 60:02}'
+
+    if end / 60 >= 12:
+        end_text += 'pm'
+        if start / 60 < 12:
+            start_text += 'am'
+    else:
+        end_text += 'am'
+
+    return f'{start_text} - {end_text}'
+
+
+def card_html(name, classified_name, times):
+    """
+    A pool's card, the same as createPoolCard() in pools-v3.js makes it (with every program's sessions).
+    """
+
+    html = f"<div class='pool-card'><name class='pool-name'>{escape(name)}</name>"
+    html += f"<a class='pool-ics' href='ics/pools/{escape(classified_name, quote=True)}.ics'>calendar</a>"
+    for start, end, program in times:
+        html += f"<div class='pool-time'>{time_text(start, end)} ({escape(program)})</div>"
+    html += "</div>"
+    return html
+
+
+def date_page(page_template, date, pools, previous_date=None, next_date=None):
+    """
+    A date's page: page_template with its cards, sorted by name. pools is a list of (name, classified name, sessions as
+    (start, end, program) in minutes), for the pools open that date.
+    """
+
+    links = []
+    if previous_date is not None:
+        links.append(f"<a href='dates/{previous_date}.html'>&larr; {previous_date}</a>")
+    if next_date is not None:
+        links.append(f"<a href='dates/{next_date}.html'>{next_date} &rarr;</a>")
+
+    cards = ''.join(card_html(name, classified_name, times) for name, classified_name, times in sorted(pools))
+
+    html = page_template
+    html = html.replace("{{ date_links }}", f"<div class='date-links'>{' '.join(links)}</div>")
+    html = html.replace("{{ holder_attributes }}", f" data-date='{date}' data-static")
+    html = html.replace("{{ cards }}", cards)
+    return html
+
+
+def write_date_page(fname, page_template, date, pools, previous_date, next_date):
+    """
+    Write one date's page, unless it's already exactly that. Returns how many bytes were written (0 if none).
+    """
+
+    html = date_page(page_template, date, pools, previous_date, next_date)
+
+    try:
+        with open(fname, 'r') as f:
+            if f.read() == html:
+                return 0
+    except FileNotFoundError:
+        pass
+
+    tmp_fname = f'{fname}.{os.getpid()}.tmp'
+    with open(tmp_fname, 'w') as f:
+        f.write(html)
+    os.replace(tmp_fname, fname)
+
+    return len(html.encode())
+
+
+def _write_date_page(args):
+    return write_date_page(*args)
+
+
+def write_date_pages(folder, page_template, date_pools, workers=STATIC_WORKERS, dates=None):
+    """
+    Write a page per date into folder, and delete the pages of dates that aren't in the schedule anymore.
+    date_pools maps formatted date -> pools open that date (see date_page()), for the dates to render.
+    dates is every formatted date that has a page (for the links either side), if that's more than date_pools has.
+    Returns how many pages were (re)written.
+    """
+
+    os.makedirs(folder, exist_ok=True)
+
+    dates = sorted(dates if dates is not None else date_pools)
+    pages = [(os.path.join(folder, f'{date}.html'), page_template, date, date_pools[date],
+              dates[i - 1] if i > 0 else None, dates[i + 1] if i + 1 < len(dates) else None)
+             for i, date in enumerate(dates) if date in date_pools]
+
+    workers = workers or os.cpu_count()
+    workers = min(workers, len(pages) // MIN_PAGES_PER_WORKER)
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            written = list(executor.map(_write_date_page, pages, chunksize=max(1, len(pages) // (workers * 4))))
+    else:
+        written = [write_date_page(*page) for page in pages]
+
+    # delete dates that are gone
+    page_dates = set(dates)
+    for fname in os.listdir(folder):
+        if fname.endswith('.html') and fname[:-len('.html')] not in page_dates:
+            os.remove(os.path.join(folder, fname))
+
+    changed = sum(1 for size in written if size > 0)
+    metrics.set('pools_static_pages_written', changed)
+    metrics.set('pools_static_pages_unchanged', len(dates) - changed)
+    metrics.set('pools_static_bytes_written', sum(written))
+
+    return changed
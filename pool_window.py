@@ -0,0 +1,125 @@
+"""
+Optional rolling window over the cached schedules (pools-v3.pkl), so that a season of nightly scrapes doesn't pile up
+dates that have passed: with --keep-days N, the cache, the page's date select and its data files only go back N days.
+Without it, every date is kept and each scrape replaces the cache.
+
+Each scrape is merged into the cache rather than replacing it. toronto.ca only lists the weeks from now on, so the
+scrape is taken as is from its first date on, and the cache's dates before that (that are still in the window) are
+kept. Anything older than the window is evicted, including whole pools that have nothing left in it.
+
+Usage:
+    from pool_window import evict_past, merge_scrape, window_start
+
+    since = window_start(keep_days=7)
+    pool_info = merge_scrape(cached_pool_info, scraped_pool_info, since)
+    evict_past(pool_info, since)  # e.g. on a cache hit, a few days later
+"""
+
+from datetime import datetime, timedelta
+
+from pool_metrics import metrics
+from pool_recurrence import RecurringSchedule
+
+# How many days back window_start() goes, unless told otherwise
+KEEP_DAYS = 7
+
+
+def window_start(keep_days=KEEP_DAYS, today: datetime = None):
+    """
+    First date in the window: keep_days before today (in Toronto, unless given).
+    """
+
+    if today is None:
+        from pool_next import toronto_now
+
+        today, _ = toronto_now()
+    return datetime(today.year, today.month, today.day) - timedelta(days=keep_days)
+
+
+def _schedule(pool):
+    schedule = pool.availabilities
+    return schedule if isinstance(schedule, RecurringSchedule) else RecurringSchedule.from_dates(schedule)
+
+
+def evict_past(pool_info, since: datetime):
+    """
+    WARN: Destructive function.
+
+    Drop every date before since from each pool, and the pools that leaves without any dates (in place).
+    Returns how many dates were dropped.
+    """
+
+    evicted = 0
+    emptied = set()
+    for pool in pool_info:
+        schedule = _schedule(pool)
+        clipped = schedule.clip(first=since)
+
+        dropped = len(schedule) - len(clipped)
+        if dropped > 0:
+            pool.availabilities = clipped
+            pool.slots = {date: mask for date, mask in pool.slots.items() if date >= since}
+            evicted += dropped
+            if len(clipped) == 0:
+                emptied.add(pool.name)
+
+    pool_info[:] = [pool for pool in pool_info if pool.name not in emptied]
+
+    metrics.set('pools_window_dates_evicted', evicted)
+    return evicted
+
+
+def merge_scrape(cached_info, scraped_info, since: datetime):
+    """
+    The scraped pools, plus the cached dates from since up to the scrape's first date. Cached pools that aren't in the
+    scrape anymore are kept while they have dates in the window. Both lists are left alone.
+    Returns the merged pool info (scraped pools first, in the same order).
+    """
+
+    scraped_dates = [date for pool in scraped_info for date in pool.availabilities]
+    if len(scraped_dates) == 0:
+        return list(scraped_info)
+    scrape_start = min(scraped_dates)
+
+    if since >= scrape_start:
+        return list(scraped_info)
+
+    # the cache's dates that the scrape doesn't cover anymore
+    kept = dict()
+    for pool in cached_info:
+        dates = _schedule(pool).clip(first=since, last=scrape_start - timedelta(days=1))
+        if len(dates) > 0:
+            kept[pool.name] = (pool, dates)
+
+    merged = []
+    merged_dates = 0
+    for pool in scraped_info:
+        if pool.name in kept:
+            _, dates = kept.pop(pool.name)
+            pool = _with_dates(pool, dates)
+            merged_dates += len(dates)
+        merged.append(pool)
+
+    # closed (or renamed) since, but still in the window
+    for pool, dates in kept.values():
+        merged.append(_with_dates(pool, dates, replace=True))
+        merged_dates += len(dates)
+
+    metrics.set('pools_window_dates_merged', merged_dates)
+    return merged
+
+
+def _with_dates(pool, dates: RecurringSchedule, replace=False):
+    """
+    A copy of the pool with dates added to its schedule (or instead of it, if replace).
+    """
+
+    import copy
+
+    availabilities = dict() if replace else dict(pool.availabilities.items())
+    availabilities.update(dates.items())
+
+    pool = copy.copy(pool)
+    pool.availabilities = RecurringSchedule.from_dates(availabilities)
+    pool.update_slots()
+    return pool
@@ -1,236 +1,530 @@
-import pickle
+"""
+Query pool schedules from the command line.
+
+Reads the cached snapshot written by generate_pages_v3.py (pools-v3.pkl), and only imports the scraping stack
+(requests/bs4) if that snapshot doesn't exist yet or --refresh is passed. The rest of the pool modules are imported by
+the commands that need them, since starting up is most of the time a query takes.
+
+Examples:
+    python pools.py query --date 2019-06-01
+    python pools.py query --date "June 1" --from 6pm --to 8pm --type "indoor pool"
+    python pools.py query --date today --name york --json
+    python pools.py query --date tomorrow --program lane
+    python pools.py next                                   # what opens next, from now (in Toronto)
+    python pools.py next --date 2019-06-05 --at 5pm --limit 3
+    python pools.py query --date 2019-06-05 --as-of 2019-06-01   # as scraped on June 1 (from the archive)
+    python pools.py history --name "York Recreation Centre"      # how its schedule changed between scrapes
+    python pools.py nearby --date 2019-06-05 --name york --at 6pm  # nearest other pools open at the same time
+    python pools.py export sessions.csv sessions.parquet         # every session as a table, for analysis
+"""
+
+import argparse
+import json
 import re
+import sys
 import time
-from datetime import timedelta
-from enum import Enum, unique
+from datetime import datetime, timedelta
 from typing import Tuple, List
 
-import requests
-from bs4 import BeautifulSoup
-from dateutil import parser
+# When pools.py was loaded, before any of the pool modules are imported, so --timing includes importing them
+START_TIME = time.perf_counter()
+
+# Formats accepted by --date. Formats without a year match that month/day in any year.
+DATE_FORMATS_WITH_YEAR = ['%Y-%m-%d', '%B %d %Y', '%b %d %Y']
+DATE_FORMATS_WITHOUT_YEAR = ['%B %d', '%b %d']
+
+
+def main(argv=None):
+    import generate_pages_v3 as v3
+    from pool_nearby import ALTERNATIVES_K, COORDINATES_FNAME
+
+    arg_parser = argparse.ArgumentParser(prog='pools', description="Browse Toronto's drop-in pool hours.")
+    subparsers = arg_parser.add_subparsers(dest='command', required=True)
+
+    # options every command has
+    common_parser = argparse.ArgumentParser(add_help=False)
+    common_parser.add_argument('--program', action='append', dest='programs',
+                               help='only sessions of this program, e.g. lane (case-insensitive, can be repeated)')
+    common_parser.add_argument('--json', action='store_true', help='print results as JSON')
+    common_parser.add_argument('--cache', default=v3.CACHE_FNAME, help='snapshot to read (default: %(default)s)')
+    common_parser.add_argument('--refresh', action='store_true', help='re-scrape toronto.ca instead of reading cache')
+    common_parser.add_argument('--timing', action='store_true', help='print elapsed time to stderr')
+    common_parser.add_argument('--archive', default=v3.ARCHIVE_FOLDER, help='archive of past scrapes to read '
+                                                                             '(default: %(default)s)')
+    common_parser.add_argument('--as-of', metavar='TIMESTAMP',
+                               help='use the last scrape archived at or before this, e.g. 2019-06-01 or '
+                                    '2019-06-01T12:00, instead of the latest one')
+
+    # options for finding pools by name
+    search_parser = argparse.ArgumentParser(add_help=False)
+    search_parser.add_argument('--fuzzy', action='store_true',
+                               help='with --name, also list pools with a similar name/address (e.g. for typos)')
+    search_parser.add_argument('--search-index', default=f'{v3.PAGES_FOLDER}/v3/{v3.SEARCH_INDEX_FNAME}',
+                               help='search index written by the generator (default: %(default)s, built on the fly '
+                                    "if it's missing or out of date)")
+
+    query_parser = subparsers.add_parser('query', help='list pools open on a date',
+                                         parents=[common_parser, search_parser])
+    query_parser.add_argument('--date', required=True, type=date_arg, help='e.g. 2019-06-01, "June 1", today, tomorrow')
+    query_parser.add_argument('--from', dest='from_time', type=parse_clock,
+                              help='only sessions still open at/after this time (e.g. 6pm)')
+    query_parser.add_argument('--to', dest='to_time', type=parse_clock,
+                              help='only sessions starting before this time (e.g. 8:30pm)')
+    query_parser.add_argument('--type', dest='pool_type', choices=[pool_type.value for pool_type in v3.PoolType])
+    query_parser.add_argument('--name', help='only pools whose name, address or type contains this (case-insensitive)')
+
+    next_parser = subparsers.add_parser('next', help='list pools by which opens next', parents=[common_parser])
+    next_parser.add_argument('--date', type=date_arg,
+                             help='e.g. 2019-06-01, "June 1", tomorrow (default: today, in Toronto)')
+    next_parser.add_argument('--at', type=parse_clock,
+                             help='from this time on, e.g. 5pm (default: now in Toronto if --date is today, otherwise '
+                                  'midnight)')
+    next_parser.add_argument('--limit', type=int, default=10, help='how many pools to list (default: %(default)s)')
+
+    history_parser = subparsers.add_parser('history', help="show how a pool's schedule changed between scrapes",
+                                           parents=[common_parser])
+    history_parser.add_argument('--name', required=True, help='pool name (as on the schedule page)')
+
+    nearby_parser = subparsers.add_parser('nearby', help="list the nearest pools open at the same time as a pool's "
+                                                         "sessions", parents=[common_parser, search_parser])
+    nearby_parser.add_argument('--date', required=True, type=date_arg,
+                               help='e.g. 2019-06-01, "June 1", today, tomorrow')
+    nearby_parser.add_argument('--name', required=True,
+                               help='pools whose name, address or type contains this (case-insensitive)')
+    nearby_parser.add_argument('--at', type=parse_clock,
+                               help='only its session open at this time, e.g. 6pm (default: every session)')
+    nearby_parser.add_argument('--limit', type=int, default=ALTERNATIVES_K,
+                               help='how many pools to list for each session (default: %(default)s)')
+    nearby_parser.add_argument('--coordinates', default=COORDINATES_FNAME,
+                               help='pool coordinates to measure distances with (default: %(default)s)')
+
+    export_parser = subparsers.add_parser('export', help='write every session as a table (CSV, Parquet or .npz)',
+                                          parents=[common_parser])
+    export_parser.add_argument('outputs', nargs='*', metavar='FILE',
+                               help='files to write, by extension: .csv, .parquet (needs pyarrow) or .npz (default: '
+                                    'sessions.csv, and sessions.parquet if pyarrow is installed, otherwise sessions.npz)')
+
+    args = arg_parser.parse_args(argv)
+
+    if args.command == 'history':
+        from pool_archive import Archive
+
+        print_history(Archive(args.archive).history(args.name), args.programs, args.json)
+    elif args.command == 'nearby':
+        from pool_nearby import add_coordinates, load_coordinates
+        from pool_search import load_search_index
+
+        pool_info = load_pool_info_for(args)
+        add_coordinates(pool_info, load_coordinates(args.coordinates))
+        results = find_alternatives(pool_info, args.date, args.name, at=args.at, programs=args.programs, k=args.limit,
+                                    fuzzy=args.fuzzy, search_index=load_search_index(pool_info, args.search_index))
+
+        if args.json:
+            print_alternatives_json(results)
+        else:
+            print_alternatives(results)
+    elif args.command == 'export':
+        from pool_export import EXPORT_FORMATS
+
+        for fname in args.outputs:
+            if not fname.lower().endswith(tuple(EXPORT_FORMATS)):
+                export_parser.error(f'cannot export to {fname}, expected one of {", ".join(EXPORT_FORMATS)}')
+        export(load_pool_info_for(args), args.outputs, args.programs, args.json)
+    else:
+        pool_info = load_pool_info_for(args)
 
-# URL of leisure pool schedules
-url = 'https://www.toronto.ca/data/parks/prd/swimming/dropin/leisure/index.html'
+        if args.command == 'query':
+            from pool_search import load_search_index
 
-# Days of week as displayed on the webpage
-days_of_wk = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
+            results = find_pools_on(args.date, pool_info, from_time=args.from_time, to_time=args.to_time,
+                                    pool_type=args.pool_type,
+                                    name=args.name,
+                                    programs=args.programs,
+                                    fuzzy=args.fuzzy,
+                                    search_index=load_search_index(pool_info, args.search_index) if args.name else None)
+        else:
+            results = find_next_openings(pool_info, date=args.date, at=args.at, programs=args.programs)[:args.limit]
 
-# Where to cache website results after first get
-cache_fname = 'pools.pkl'
+        if args.json:
+            print_pools_json(results)
+        else:
+            print_pools(results)
 
+    if args.timing:
+        print(f'took {(time.perf_counter() - START_TIME) * 1000:.1f}ms', file=sys.stderr)
 
-@unique
-class TimeType(Enum):
-    AM = 1
-    PM = 2
 
+def load_pool_info_for(args):
+    """
+    Pool info from the archive if --as-of was passed, otherwise from the cache (or toronto.ca).
+    """
 
-# Modify this to get the pool info for any day
-def main():
-    pool_info = get_pool_info()
-    find_pools_on("June 1", pool_info)
+    if args.as_of is not None:
+        from pool_archive import Archive
 
+        return Archive(args.archive).snapshot(args.as_of)
 
-# Print pools open on this date
-def find_pools_on(date: str, pool_info):
-    available_on_date: List[Tuple[str, str]] = []
+    return load_or_fetch_pool_info(args.cache, args.refresh)
 
-    date = parser.parse(date)
-    for pool in pool_info:
-        for availability in pool.availabilities:
-            date2, time2 = availability
 
-            if date.day == date2.day and date.month == date2.month:
-                # Found a pool that's available today! Save it into a list first.
-                available_on_date.append((pool.name, time2))
+def load_or_fetch_pool_info(fname=None, refresh=False):
+    """
+    Read the cached snapshot (pools-v3.pkl unless fname is given). Only scrape toronto.ca (and import the scraping
+    stack) if there's no snapshot.
+    """
 
-    # Now that we have a list of available pools, sort them by how long they're open, then by start time
-    available_on_date.sort(key=lambda name_and_timerange: timerange_sorter(name_and_timerange[1]), reverse=True)
+    import generate_pages_v3 as v3
 
-    for name, time2 in available_on_date:
-        print(name)
-        print(time2)
-        print()
+    fname = fname or v3.CACHE_FNAME
+    if not refresh:
+        try:
+            return v3.load_pool_info(fname)
+        except FileNotFoundError:
+            pass
 
+    pool_info = v3.get_pool_info(refresh=True)
+    if fname != v3.CACHE_FNAME:
+        v3.save_pool_info(pool_info, fname)
+    return pool_info
 
-def split_timeranges(timeranges: str):
+
+def parse_date(date_str: str):
     """
-    If you have multiple timeranges in one string, e.g. 5am-6pm8-9pm, split them into their own timeranges with this f.
+    Read a date from the command line.
+    Returns a (datetime, has_year) tuple. If there's no year, only the month and day should be compared.
+
+    Examples:
+        2019-06-01  --> (datetime(2019, 6, 1), True)
+        June 1      --> (datetime(1900, 6, 1), False)
+        today       --> (today at midnight, True)
     """
-    return re.findall(r".*?-.*?(?:am|pm)", timeranges)
 
+    from pool_next import toronto_now
 
-def timerange_sorter(timerange):
-    # We want to sort first by length (largest to smallest, so it will be called with reverse=true)
-    #                 then  by start time (since it's called reverse=true, we will sort by 24-starttime instead.
+    date_str = date_str.strip()
 
-    # THIS IS OLD CODE FOR MULTIPLE TIMERANGES MESHED INTO ONE PLACE
-    # if we get multiple timeranges, split them up first, then choose the one with longest length
-    # starts_and_ends = [read_timerange(tr) for tr in split_timeranges(timerange)]
-    # starts_and_ends.sort(key=lambda start_and_end: start_and_end[1] - start_and_end[0], reverse=True)
-    # start, end = starts_and_ends[0]
+    today, _ = toronto_now()
+    if date_str.lower() == 'today':
+        return today, True
+    if date_str.lower() == 'tomorrow':
+        return today + timedelta(days=1), True
 
-    start, end = read_timerange(timerange)
-    length = end - start
-    reverse_start_time = timedelta(hours=24) - start
-    return length, reverse_start_time
+    for fmt in DATE_FORMATS_WITH_YEAR:
+        try:
+            return datetime.strptime(date_str, fmt), True
+        except ValueError:
+            pass
 
+    for fmt in DATE_FORMATS_WITHOUT_YEAR:
+        try:
+            return datetime.strptime(date_str, fmt), False
+        except ValueError:
+            pass
 
-# A pool.
-class Pool:
-    def __init__(self, name):
-        self.name = name
-        self.availabilities = []
+    raise argparse.ArgumentTypeError(f'cannot read date {date_str!r}, try something like 2019-06-01 or "June 1"')
 
-    def add_availability(self, date, time):
-        self.availabilities.append((date, time))
 
+def date_arg(date_str: str):
+    """
+    For --date: check that it can be read, so that a typo is a usage error. It's kept as text, since "today" means
+    today in Toronto when the query runs.
+    """
 
-# Caching
-def load_pool_info():
-    with open(cache_fname, 'rb') as p:
-        return pickle.load(p)
+    parse_date(date_str)
+    return date_str
 
 
-# Caching
-def save_pool_info(pool_info):
-    with open(cache_fname, 'wb') as p:
-        pickle.dump(pool_info, p)
+def parse_clock(time_str: str):
+    """
+    Read a time of day from the command line (e.g. --from), and convert it to a timedelta since midnight.
 
+    Examples:
+        6pm      --> timedelta(hours=18)
+        6:30am   --> timedelta(hours=6, minutes=30)
+        18:30    --> timedelta(hours=18, minutes=30)
+    """
+
+    match = re.fullmatch(r'\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*', time_str.lower())
+    if match is None:
+        raise argparse.ArgumentTypeError(f'cannot read time {time_str!r}, try something like 6pm or 18:30')
+
+    hours, minutes, am_pm = match.groups()
+    hours = int(hours)
+    minutes = int(minutes or 0)
+
+    # 12am is midnight, 12pm is noon
+    if am_pm is not None:
+        hours = hours % 12 + (12 if am_pm == 'pm' else 0)
 
-def get_pool_info():
+    return timedelta(hours=hours, minutes=minutes)
+
+
+def find_pool_names(pool_info: 'List[v3.Pool]', name: str, fuzzy=False, search_index: 'SearchIndex' = None):
     """
-    Download pool schedules from toronto.ca.
+    Names of the pools whose name, address or type contains `name` (or something similar to it, if fuzzy).
     """
 
-    # cache
-    try:
-        return load_pool_info()
-    except:
-        pass
+    if search_index is None:
+        from pool_search import SearchIndex
 
-    pool_info_response = requests.get(url)
+        search_index = SearchIndex.from_pools(pool_info)
+    return set(search_index.search(name, fuzzy))
 
-    if pool_info_response.status_code != 200:
-        print(f"Error: Not 200, but {pool_info_response.status_code} instead.")
 
-    soup = BeautifulSoup(pool_info_response.content)
+def find_pools_on(date: str, pool_info: 'List[v3.Pool]', from_time=None, to_time=None, pool_type=None, name=None,
+                  programs=None, fuzzy=False, search_index: 'SearchIndex' = None):
+    """
+    Find pools open on this date, optionally filtered by time window, pool type, name and program.
+    name matches part of a pool's name, address or type (or a similar one, if fuzzy), see pool_search.py.
+    Returns a list of (pool, session), sorted by how long they're open, then by start time.
+    """
 
-    pools = soup.select('div.pfrListing')
-    pool_objs = []
+    import generate_pages_v3 as v3
+    from pool_slots import window_mask
 
-    for pool in pools:
-        name = pool.h2.a.text
-        pool_obj = Pool(name)
+    available_on_date: List[Tuple[v3.Pool, v3.Session]] = []
 
-        rows = pool.select('table tbody tr')
-        for row in rows:
-            # Make sure it's for Leisure Swim
-            sched_type = row.select_one('.coursenamemobiletable > strong').text
-            if 'leisure' not in sched_type.lower():
-                continue
+    date, has_year = parse_date(date)
+    names = find_pool_names(pool_info, name, fuzzy, search_index) if name else None
 
-            # Find the daterange (ex: May 26 to June 1) (Goes Sun-Sat)
-            daterange = row.select_one('td > strong').text
+    # 15-minute slots the time window touches, to skip pools/dates that are closed the whole time without looking at
+    #   every session
+    window = None
+    if from_time is not None or to_time is not None:
+        window = window_mask(from_time or timedelta(0), to_time or timedelta(days=1))
 
-            # Find start date
-            from_date = daterange[:daterange.index(' to ')]
-            date = parser.parse(from_date)
+    for pool in pool_info:
+        if pool_type is not None and (pool.type is None or pool.type.value != pool_type):
+            continue
+        if names is not None and pool.name not in names:
+            continue
 
-            # See if any day within 7 days of start date has time scheduled.
-            for day in days_of_wk:
-                timeranges = row.find("td", {"data-info": day}).text.strip()
+        for date2, times in pool.availabilities.items():
+            if has_year and date != date2:
+                continue
+            if not has_year and (date.day != date2.day or date.month != date2.month):
+                continue
+            if window is not None and pool.slots.get(date2, 0) & window == 0:
+                continue
 
-                # if time scheduled on that day, add to our Pool's info
-                if len(timeranges) > 0:
-                    # split timeranges apart, then add each one! Trust, it's good for later.
-                    # e.g. if the time is 5-7pm,      it'll just add that
-                    #  but if it's        3-5pm6-8pm, it'll add 3-5pm and 6-8pm separately
-                    for timerange in split_timeranges(timeranges):
-                        pool_obj.add_availability(date, timerange)
+            for session in times:
+                if programs and not v3.program_matches(session.program, programs):
+                    continue
 
-                # add 1 day so our day of wk matches up in next loop
-                date += timedelta(days=1)
+                # Skip sessions that don't overlap the requested window
+                if from_time is not None and session.end <= from_time:
+                    continue
+                if to_time is not None and session.start >= to_time:
+                    continue
 
-        pool_objs.append(pool_obj)
+                # Found a pool that's available today! Save it into a list first.
+                available_on_date.append((pool, session))
 
-    # cache
-    save_pool_info(pool_objs)
+    # Now that we have a list of available pools, sort them by how long they're open, then by start time
+    available_on_date.sort(key=lambda pool_session: (pool_session[1].start - pool_session[1].end,
+                                                     pool_session[1].start))
 
-    return pool_objs
+    return available_on_date
 
 
-def read_timerange(timerange):
+def find_next_openings(pool_info: 'List[v3.Pool]', date: str = None, at: timedelta = None, programs=None):
+    """
+    Find which pools open next on a date (default: today), from a time (default: now if it's today, otherwise
+    midnight), in Toronto time. Optionally only counts sessions of some programs.
+    Returns a list of (pool, next session), soonest first.
     """
-    Read time that a pool is open, and returns a start/end timedelta.
 
-    Examples:
-        12:30 - 8pm
-        12 - 8pm
-        10:30 - 11:30am
-        11:30am - 8pm
-        10:30am - 12pm
+    from pool_next import NextOpenings, toronto_now
+
+    today, now_minutes = toronto_now()
+
+    if date is None:
+        date = today
+    else:
+        date, has_year = parse_date(date)
+        if not has_year:
+            # pick the latest year that has this month/day in the schedule (or this year, if none do)
+            years = [date2.year for pool in pool_info for date2 in pool.availabilities
+                     if (date2.month, date2.day) == (date.month, date.day)]
+            date = date.replace(year=max(years, default=today.year))
+
+    if at is not None:
+        minutes = int(at.total_seconds()) // 60
+    elif date == today:
+        minutes = now_minutes
+    else:
+        minutes = 0
+
+    return NextOpenings(pool_info).after(date, minutes, programs)
+
+
+def find_alternatives(pool_info: 'List[v3.Pool]', date: str, name: str, at: timedelta = None, programs=None,
+                      k=None, fuzzy=False, search_index: 'SearchIndex' = None):
+    """
+    For each session at the pools matching `name` on a date (optionally only the one open at `at`), the nearest other
+    pools with a session of the same program at the same time (k of them, ALTERNATIVES_K by default). Pools need
+    coordinates (see pool_nearby.py).
+    Returns a list of (pool, session, [(other pool, other session, km, minutes of overlap), ...]), by start time.
     """
 
-    AM_TEXT = "am"
-    PM_TEXT = "pm"
+    import generate_pages_v3 as v3
+    from pool_nearby import ALTERNATIVES_K, NearbyAlternatives
 
-    timerange_split = timerange.split(" - ")
+    date, has_year = parse_date(date)
+    names = find_pool_names(pool_info, name, fuzzy, search_index)
 
-    # ensure we only have a single timerange
-    assert len(timerange_split) == 2
+    alternatives = NearbyAlternatives(pool_info, ALTERNATIVES_K if k is None else k)
 
-    # backup in case I decide to remove previous assert
-    if len(timerange_split) > 2:
-        # we have more than two timeranges that this pool is open at, bug, just do 1 min
-        return timedelta(minutes=1), timedelta(minutes=2)
+    results = []
+    for pool in pool_info:
+        if pool.name not in names:
+            continue
 
-    start_text, end_text = timerange_split
-    assert AM_TEXT in end_text or PM_TEXT in end_text
+        for date2 in pool.availabilities:
+            if has_year and date != date2:
+                continue
+            if not has_year and (date.day != date2.day or date.month != date2.month):
+                continue
 
-    # If end has "am"
-    if AM_TEXT in end_text:
-        # - start has no "am", and they're both "am"
-        return parse_time(start_text, TimeType.AM), parse_time(end_text, TimeType.AM)
+            for session in pool.availabilities[date2]:
+                if programs and not v3.program_matches(session.program, programs):
+                    continue
+                if at is not None and not session.start <= at < session.end:
+                    continue
+                results.append((pool, session, alternatives.for_session(pool, date2, session)))
 
-    # If end has "pm"
-    if PM_TEXT in end_text:
-        # If start has "am", it's "am", else it's "pm"
-        if AM_TEXT in start_text:
-            return parse_time(start_text, TimeType.AM), parse_time(end_text, TimeType.PM)
-        else:
-            return parse_time(start_text, TimeType.PM), parse_time(end_text, TimeType.PM)
+    results.sort(key=lambda result: (result[1].start, result[0].name))
+    return results
 
 
-def parse_time(time_str, type: TimeType):
+def timedelta_to_text(td: timedelta):
     """
-    Read a time (in the format that you see on toronto.ca), and convert it to a timedelta
-
     Example:
-        12:30, pm    --> timedelta(hours=12, minutes=30)
-        8pm, pm      --> timedelta(hours=20)
-        12, pm       --> timedelta(hours=12)
-        10:30, am    --> timedelta(hours=10, minutes=30)
-        11:30am, am  --> timedelta(hours=11, minutes=30)
+        timedelta(hours=18, minutes=30) --> 6:30pm
     """
 
-    # Remove "am" or "pm" if exists
-    time_str = re.sub(r"(am|pm)", "", time_str)
+    hours, minutes = divmod(int(td.total_seconds()) // 60, 60)
+    am_pm = 'am' if hours < 12 else 'pm'
+    hours = hours % 12 or 12
+    return f'{hours}:{minutes:02}{am_pm}'
+
+
+def export(pool_info: 'List[v3.Pool]', outputs: List[str], programs=None, as_json=False):
+    from pool_export import columnar_extension, export_sessions
 
-    # Split into hours and minutes
-    if ":" in time_str:
-        hours, minutes = time_str.split(":")
-        hours = int(hours)
-        minutes = int(minutes)
+    if len(outputs) == 0:
+        outputs = ['sessions.csv', f'sessions{columnar_extension()}']
+
+    counts = dict()
+    for fname in outputs:
+        if fname.lower().endswith('.parquet') and columnar_extension() != '.parquet':
+            print(f"WARNING: pyarrow isn't installed, writing {fname[:-len('.parquet')]}.npz instead of {fname}.",
+                  file=sys.stderr)
+            fname = fname[:-len('.parquet')] + '.npz'
+            if fname in counts:
+                continue
+        counts[fname] = export_sessions(pool_info, fname, programs)
+
+    if as_json:
+        print(json.dumps(counts, indent=2))
     else:
-        hours = int(time_str)
-        minutes = 0
+        for fname, count in counts.items():
+            print(f'{fname}: {count} sessions')
 
-    # If it's PM, add 12 hours to make it 24-hour time, unless it's 12pm.
-    if type == TimeType.PM and hours != 12:
-        hours += 12
 
-    return timedelta(hours=hours, minutes=minutes)
+def print_pools(results):
+    for pool, session in results:
+        print(pool.name)
+        print(f'{timedelta_to_text(session.start)} - {timedelta_to_text(session.end)} ({session.program})')
+        print()
+
+
+def print_alternatives(results):
+    for pool, session, alternatives in results:
+        print(f'{pool.name}, {timedelta_to_text(session.start)} - {timedelta_to_text(session.end)} ({session.program})')
+        if getattr(pool, 'coordinates', None) is None:
+            print('  (no coordinates for this pool, see pool_nearby.py)')
+        elif len(alternatives) == 0:
+            print('  (no other pools open at the same time)')
+        for other, other_session, km, _ in alternatives:
+            print(f'  {other.name} ({km:.1f}km): {timedelta_to_text(other_session.start)} - '
+                  f'{timedelta_to_text(other_session.end)}')
+        print()
+
+
+def print_history(history, programs=None, as_json=False):
+    """
+    Print every archived version of a pool, with which sessions were added/removed since the version before it.
+    """
+
+    import generate_pages_v3 as v3
+
+    def sessions_of(pool):
+        return {(date, session) for date, times in pool.availabilities.items() for session in times
+                if not programs or v3.program_matches(session.program, programs)}
+
+    def session_text(date, session):
+        return f'{date:%Y-%m-%d} {timedelta_to_text(session.start)} - {timedelta_to_text(session.end)} ' \
+               f'({session.program})'
+
+    changes = []
+    previous = set()
+    for timestamp, pool in history:
+        sessions = sessions_of(pool)
+        changes.append((timestamp, len(sessions), sorted(sessions - previous), sorted(previous - sessions)))
+        previous = sessions
+
+    if as_json:
+        print(json.dumps([{
+            'timestamp': timestamp,
+            'sessions': count,
+            'added': [session_text(date, session) for date, session in added],
+            'removed': [session_text(date, session) for date, session in removed],
+        } for timestamp, count, added, removed in changes], indent=2))
+        return
+
+    for timestamp, count, added, removed in changes:
+        print(f'{timestamp}: {count} sessions ({len(added)} added, {len(removed)} removed)')
+        for date, session in added:
+            print(f'  + {session_text(date, session)}')
+        for date, session in removed:
+            print(f'  - {session_text(date, session)}')
+        print()
+
+
+def print_pools_json(results):
+    print(json.dumps([{
+        'name': pool.name,
+        'start': int(session.start.total_seconds()) // 60,
+        'end': int(session.end.total_seconds()) // 60,
+        'program': session.program,
+        'address': pool.address,
+        'type': pool.type.value if pool.type is not None else None,
+        'phone': pool.phone,
+        # empty unless the pool info was enriched (see pool_enrich.py)
+        'amenities': getattr(pool, 'amenities', []),
+        'accessibility': getattr(pool, 'accessibility', []),
+        'closures': getattr(pool, 'closures', []),
+    } for pool, session in results], indent=2))
+
+
+def print_alternatives_json(results):
+    def minutes(td):
+        return int(td.total_seconds()) // 60
+
+    print(json.dumps([{
+        'name': pool.name,
+        'start': minutes(session.start),
+        'end': minutes(session.end),
+        'program': session.program,
+        'alternatives': [{
+            'name': other.name,
+            'start': minutes(other_session.start),
+            'end': minutes(other_session.end),
+            'km': round(km, 2),
+            'overlap': overlap,
+        } for other, other_session, km, overlap in alternatives],
+    } for pool, session, alternatives in results], indent=2))
 
 
 if __name__ == '__main__':